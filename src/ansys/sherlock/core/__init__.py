@@ -22,23 +22,42 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-"""PySherlock client library."""
+"""PySherlock client library.
 
-# Version
-# ------------------------------------------------------------------------------
+The version, the logger and the submodules are only loaded on first access, so that
+importing one module of PySherlock does not import the others.
+"""
 
-try:
-    import importlib.metadata as importlib_metadata
-except ModuleNotFoundError:  # pragma: no cover
-    import importlib_metadata  # type: ignore
+import threading
 
-__version__ = importlib_metadata.version(__name__.replace(".", "-"))
-"""PySherlock version."""
+from ansys.sherlock.core.utils.lazy_import import import_submodule
 
-# Ease import statements
-# ------------------------------------------------------------------------------
+_LOCK = threading.Lock()
 
-from ansys.sherlock.core.pysherlock_logging import Logger
 
-LOG = Logger("sherlock")
-"""PySherlock logger."""
+def __getattr__(name: str):
+    """Load the version, the logger or a submodule on first access."""
+    if name not in ("__version__", "LOG"):
+        return import_submodule(__name__, name)
+    with _LOCK:
+        if name in globals():
+            return globals()[name]
+        if name == "__version__":
+            # PySherlock version.
+            try:
+                import importlib.metadata as importlib_metadata
+            except ModuleNotFoundError:  # pragma: no cover
+                import importlib_metadata  # type: ignore
+
+            value = importlib_metadata.version(__name__.replace(".", "-"))
+        else:
+            # PySherlock logger.
+            from ansys.sherlock.core.pysherlock_logging import Logger
+
+            value = Logger("sherlock")
+        globals()[name] = value
+        return value
+
+
+def __dir__():
+    return sorted(set(globals()) | {"__version__", "LOG"})
@@ -23,7 +23,10 @@
 # SOFTWARE.
 
 """Module containing all analysis capabilities."""
-from typing import Optional
+
+from concurrent.futures import ThreadPoolExecutor
+import time
+from typing import Optional, Union
 
 from ansys.api.sherlock.v0 import (
     SherlockAnalysisService_pb2,
@@ -31,6 +34,7 @@ from ansys.api.sherlock.v0 import (
     SherlockCommonService_pb2,
 )
 import grpc
+import pydantic
 
 from ansys.sherlock.core import LOG
 from ansys.sherlock.core.errors import (
@@ -52,6 +56,9 @@ from ansys.sherlock.core.grpc_stub import GrpcStub
 from ansys.sherlock.core.types.analysis_types import (
     ElementOrder,
     ModelSource,
+    RunAnalysisJob,
+    RunAnalysisJobResult,
+    RunAnalysisManyResult,
     RunAnalysisRequestAnalysisType,
     RunStrainMapAnalysisRequestAnalysisType,
     UpdateComponentFailureMechanismPropsRequest,
@@ -68,6 +75,8 @@ from ansys.sherlock.core.types.analysis_types import (
 )
 from ansys.sherlock.core.utils.version_check import require_version
 
+DEFAULT_MAX_CONCURRENT_ANALYSES = 4
+
 
 class Analysis(GrpcStub):
     """Contains all analysis capabilities."""
@@ -76,6 +85,7 @@ class Analysis(GrpcStub):
         """Initialize a gRPC stub for the Sherlock Analysis service."""
         super().__init__(channel, server_version)
         self.stub = SherlockAnalysisService_pb2_grpc.SherlockAnalysisServiceStub(channel)
+        self.max_concurrent_analyses = DEFAULT_MAX_CONCURRENT_ANALYSES
         self.FIELD_NAMES = {
             "analysisTemp": "analysis_temp",
             "analysisTemp (optional)": "analysis_temp",
@@ -120,7 +130,7 @@ class Analysis(GrpcStub):
     @staticmethod
     def _add_analyses(
         request: SherlockAnalysisService_pb2.RunAnalysisRequest,
-        analyses: list[tuple[RunAnalysisRequestAnalysisType, tuple[str, str]]],
+        analyses: list[tuple[RunAnalysisRequestAnalysisType, list[tuple[str, list[str]]]]],
     ):
         """Add analyses."""
         for a in analyses:
@@ -138,7 +148,7 @@ class Analysis(GrpcStub):
         self,
         project: str,
         cca_name: str,
-        analyses: list[tuple[RunAnalysisRequestAnalysisType, tuple[str, str]]],
+        analyses: list[tuple[RunAnalysisRequestAnalysisType, list[tuple[str, list[str]]]]],
     ) -> int:
         """Run one or more Sherlock analyses.
 
@@ -152,19 +162,19 @@ class Analysis(GrpcStub):
             Name of the CCA.
         analyses: list of ``elements``
 
-            - elements: list[tuple[RunAnalysisRequestAnalysisType, tuple[str, str]]]
-                Tuples (``type``, ``event``)
+            - elements: list[tuple[RunAnalysisRequestAnalysisType, list[tuple[str, list[str]]]]]
+                Tuples (``analysis_type``, ``events``)
 
                 - analysis_type: RunAnalysisRequestAnalysisType
                     Type of analysis to run.
 
-                - event: list[tuple[str, str]]
-                    Tuples (``phase_name``, ``event_name``)
+                - events: list[tuple[str, list[str]]]
+                    Tuples (``phase_name``, ``event_names``)
 
                     - phase_name: str
                         Name of the life cycle phase.
-                    - event_name: str
-                        Name of the life cycle event.
+                    - event_names: list[str]
+                        Names of the life cycle events.
 
         Returns
         -------
@@ -231,6 +241,117 @@ class Analysis(GrpcStub):
             LOG.error(str(e))
             raise e
 
+    @require_version()
+    def run_analysis_many(
+        self,
+        jobs: list[
+            Union[
+                RunAnalysisJob,
+                tuple[
+                    str,
+                    str,
+                    list[tuple[RunAnalysisRequestAnalysisType, list[tuple[str, list[str]]]]],
+                ],
+            ]
+        ],
+        max_concurrency: Optional[int] = None,
+    ) -> RunAnalysisManyResult:
+        """Run the analyses of several CCAs concurrently.
+
+        Available Since: 2021R1
+
+        Each job is run with :meth:`run_analysis`. A job that fails does not stop the other
+        jobs; its error is recorded in its result instead.
+
+        Parameters
+        ----------
+        jobs: list[RunAnalysisJob | tuple[str, str, list]]
+            Jobs to run, either as ``RunAnalysisJob`` objects or as tuples
+            (``project``, ``cca_name``, ``analyses``) taking the arguments of
+            :meth:`run_analysis`.
+        max_concurrency: int, optional
+            Maximum number of jobs running at the same time. The default is ``None``, in
+            which case ``max_concurrent_analyses`` of this connection is used.
+
+        Returns
+        -------
+        RunAnalysisManyResult
+            Return code, error, and timing of every job, in the order of ``jobs``.
+
+        Examples
+        --------
+        >>> from ansys.sherlock.core import launcher
+        >>> sherlock, install_dir = launcher.launch_and_connect(transport_mode="wnua")
+        >>> natural_freq = [
+        >>>     (RunAnalysisRequestAnalysisType.NATURAL_FREQ, [("Phase 1", ["Harmonic Event"])])
+        >>> ]
+        >>> result = sherlock.analysis.run_analysis_many(
+        >>>     [
+        >>>         ("Test", "Card 1", natural_freq),
+        >>>         ("Test", "Card 2", natural_freq),
+        >>>     ],
+        >>>     max_concurrency=2,
+        >>> )
+        >>> for failure in result.failed:
+        >>>     print(failure.job.cca_name, failure.error)
+        """
+        try:
+            if not isinstance(jobs, list):
+                raise SherlockRunAnalysisError("Jobs argument is invalid.")
+            if max_concurrency is None:
+                max_concurrency = self.max_concurrent_analyses
+            if not isinstance(max_concurrency, int) or max_concurrency < 1:
+                raise SherlockRunAnalysisError("Maximum concurrency must be a positive integer.")
+            parsed_jobs = []
+            for i, job in enumerate(jobs):
+                if isinstance(job, RunAnalysisJob):
+                    parsed_jobs.append(job)
+                elif isinstance(job, tuple) and len(job) == 3:
+                    parsed_jobs.append(
+                        RunAnalysisJob(project=job[0], cca_name=job[1], analyses=job[2])
+                    )
+                else:
+                    raise SherlockRunAnalysisError(f"Job {i} is invalid.")
+        except pydantic.ValidationError as e:
+            LOG.error(str(e))
+            raise SherlockRunAnalysisError(f"Job {i} is invalid.")
+        except SherlockRunAnalysisError as e:
+            LOG.error(str(e))
+            raise e
+
+        def run(job: RunAnalysisJob) -> RunAnalysisJobResult:
+            start_time = time.time()
+            start = time.perf_counter()
+            return_code = None
+            error = None
+            try:
+                return_code = self.run_analysis(job.project, job.cca_name, job.analyses)
+            except (SherlockRunAnalysisError, SherlockNoGrpcConnectionException) as e:
+                error = str(e)
+            except grpc.RpcError as e:
+                error = f"{e.code()}: {e.details()}" if isinstance(e, grpc.Call) else str(e)
+                LOG.error(error)
+            except Exception as e:
+                # Any other error, such as a malformed job or a deadline, only fails this job.
+                error = f"{type(e).__name__}: {e}"
+                LOG.error(error)
+            return RunAnalysisJobResult(
+                job=job,
+                return_code=return_code,
+                error=error,
+                start_time=start_time,
+                elapsed=time.perf_counter() - start,
+            )
+
+        start = time.perf_counter()
+        workers = min(max_concurrency, len(parsed_jobs)) or 1
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="pysherlock-run") as pool:
+            results = list(pool.map(run, parsed_jobs))
+
+        return RunAnalysisManyResult(
+            results=results, max_concurrency=workers, elapsed=time.perf_counter() - start
+        )
+
     @require_version()
     def get_harmonic_vibe_input_fields(
         self, model_source: Optional[ModelSource] = None
@@ -404,7 +525,7 @@ class Analysis(GrpcStub):
         if not self._is_connection_up():
             raise SherlockNoGrpcConnectionException()
 
-        response = self.stub.updateHarmonicVibeProps(request)
+        response = self._send_bulk(self.stub.updateHarmonicVibeProps, request)
 
         try:
             if response.value == -1:
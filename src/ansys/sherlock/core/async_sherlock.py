@@ -0,0 +1,242 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for calling the Sherlock APIs from asyncio code.
+
+:class:`ThreadedAsyncSherlock` is a thread-offload wrapper: each of its coroutines runs the
+blocking method of the facade of :class:`ansys.sherlock.core.sherlock.Sherlock` on a pool of
+worker threads, so the methods keep their validation, return values and exceptions, and
+awaits the result without blocking the event loop. The RPCs of the worker threads are sent
+on a ``grpc.aio`` channel owned by the event loop, through
+:class:`ansys.sherlock.core.utils.aio_bridge.AioBridgeChannel`. The blocking facades must
+therefore not be called from the event loop thread, which raises a ``RuntimeError``.
+
+Methods returning a stream of responses, whose names start with ``iter_``, return an
+asynchronous iterator to consume with ``async for``.
+"""
+
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import AbstractContextManager
+import contextvars
+import functools
+from typing import Optional
+
+import grpc
+
+from ansys.sherlock.core.grpc_stub import GrpcStub
+from ansys.sherlock.core.sherlock import Sherlock
+from ansys.sherlock.core.utils.aio_bridge import AioBridgeChannel
+from ansys.sherlock.core.utils.metrics import MetricsRegistry
+
+DEFAULT_MAX_CONCURRENT_CALLS = 32
+
+_END = object()
+
+
+class _AsyncResponseStream:
+    """Asynchronous iterator over the responses of a streaming method run on worker threads."""
+
+    def __init__(self, executor: ThreadPoolExecutor, method, args: tuple, kwargs: dict):
+        self._executor = executor
+        self._context = contextvars.copy_context()
+        self._start = functools.partial(method, *args, **kwargs)
+        self._stream = None
+
+    async def _run(self, fn, *args):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(
+            self._executor, functools.partial(self._context.run, fn, *args)
+        )
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self._stream is None:
+            self._stream = iter(await self._run(self._start))
+        response = await self._run(next, self._stream, _END)
+        if response is _END:
+            raise StopAsyncIteration
+        return response
+
+    async def aclose(self):
+        """Cancel the call if it is still running."""
+        cancel = getattr(self._stream, "cancel", None)
+        if cancel is not None:
+            cancel()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+        return False
+
+
+class ThreadedAsyncFacade:
+    """Exposes every public method of a service facade as a coroutine function.
+
+    Each coroutine runs the blocking method of the wrapped facade on a worker thread, so the
+    coroutines accept the same arguments, return the same values, and raise the same
+    exceptions as the blocking methods. Methods whose names start with ``iter_`` return an
+    asynchronous iterator over the responses instead.
+    """
+
+    def __init__(self, facade: GrpcStub, executor: ThreadPoolExecutor):
+        """Initialize the facade."""
+        self._facade = facade
+        self._executor = executor
+
+    def __getattr__(self, name: str):
+        """Return the coroutine function wrapping a public method of the facade."""
+        attribute = getattr(self._facade, name)
+        if name.startswith("_") or not callable(attribute):
+            return attribute
+
+        if name.startswith("iter_"):
+
+            @functools.wraps(attribute)
+            def method(*args, **kwargs):
+                return _AsyncResponseStream(self._executor, attribute, args, kwargs)
+
+        else:
+
+            @functools.wraps(attribute)
+            async def method(*args, **kwargs):
+                loop = asyncio.get_running_loop()
+                context = contextvars.copy_context()
+                return await loop.run_in_executor(
+                    self._executor, functools.partial(context.run, attribute, *args, **kwargs)
+                )
+
+        self.__dict__[name] = method
+        return method
+
+    def __dir__(self):
+        """List the attributes of the wrapped facade."""
+        return sorted(set(super().__dir__()) | set(dir(self._facade)))
+
+
+class _LazyThreadedAsyncFacade:
+    """Facade constructed on first access to an attribute of a ThreadedAsyncSherlock object."""
+
+    def __init__(self):
+        self.name = None
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, sherlock: Optional["ThreadedAsyncSherlock"], owner: Optional[type] = None):
+        if sherlock is None:
+            return self
+        facade = ThreadedAsyncFacade(getattr(sherlock._sherlock, self.name), sherlock._executor)
+        return sherlock.__dict__.setdefault(self.name, facade)
+
+
+class ThreadedAsyncSherlock:
+    """Sherlock connection object for asyncio code, running the blocking APIs on threads.
+
+    Each facade exposes the methods of its blocking counterpart in
+    :class:`ansys.sherlock.core.sherlock.Sherlock` as coroutine functions, run on up to
+    ``max_concurrent_calls`` worker threads, so that several requests can be in flight at
+    the same time. See :mod:`ansys.sherlock.core.async_sherlock`.
+
+    Parameters
+    ----------
+    channel: grpc.aio.Channel
+        Asyncio channel connected to Sherlock.
+    server_version: int
+        Version of the Sherlock server.
+    max_concurrent_calls: int, optional
+        Maximum number of methods that run at the same time. The default is ``32``.
+    loop: asyncio.AbstractEventLoop, optional
+        Event loop that owns the channel. The default is ``None``, in which case the
+        running event loop is used.
+    blocking_channel: AioBridgeChannel, optional
+        Blocking channel sending its RPCs through ``channel``. The default is ``None``, in
+        which case one is created.
+    sherlock: Sherlock, optional
+        Blocking connection whose methods are run, on a channel sending its RPCs through
+        ``blocking_channel``, such as one with interceptors. The default is ``None``, in
+        which case a connection using ``blocking_channel`` directly is created.
+    """
+
+    common = _LazyThreadedAsyncFacade()
+    model = _LazyThreadedAsyncFacade()
+    project = _LazyThreadedAsyncFacade()
+    lifecycle = _LazyThreadedAsyncFacade()
+    layer = _LazyThreadedAsyncFacade()
+    stackup = _LazyThreadedAsyncFacade()
+    parts = _LazyThreadedAsyncFacade()
+    analysis = _LazyThreadedAsyncFacade()
+
+    def __init__(
+        self,
+        channel: grpc.aio.Channel,
+        server_version: int,
+        max_concurrent_calls: int = DEFAULT_MAX_CONCURRENT_CALLS,
+        loop: Optional[asyncio.AbstractEventLoop] = None,
+        blocking_channel: Optional[AioBridgeChannel] = None,
+        sherlock: Optional[Sherlock] = None,
+    ):
+        """Initialize the connection object."""
+        self.channel = channel
+        self.blocking_channel = blocking_channel or AioBridgeChannel(
+            channel, loop or asyncio.get_running_loop()
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_concurrent_calls, thread_name_prefix="pysherlock-async"
+        )
+        # Blocking facades, constructed on first use, run by the asyncio facades.
+        self._sherlock = sherlock or Sherlock(self.blocking_channel, server_version)
+
+    def metrics(self) -> Optional[MetricsRegistry]:
+        """Return the metrics of the connection, or ``None`` if they are not enabled.
+
+        See :meth:`ansys.sherlock.core.sherlock.Sherlock.metrics`.
+        """
+        return self._sherlock.metrics()
+
+    def deadline(self, seconds: float) -> AbstractContextManager:
+        """Return a context manager giving the calls awaited in its block a deadline.
+
+        See :meth:`ansys.sherlock.core.sherlock.Sherlock.deadline`.
+        """
+        return self._sherlock.deadline(seconds)
+
+    async def close(self):
+        """Close the gRPC channel and stop the worker threads."""
+        self.blocking_channel.unsubscribe_all()
+        await self.channel.close()
+        self._executor.shutdown(wait=False)
+
+    async def __aenter__(self):
+        """Enter the asynchronous runtime context of the connection."""
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        """Close the connection when leaving the asynchronous runtime context."""
+        await self.close()
+        return False
@@ -0,0 +1,453 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for queuing mutating API calls and sending them together.
+
+Setting up a project takes hundreds of mutating calls, such as creating life phases, adding
+events and profiles, or updating the layers of a stackup. A :class:`Batch` records these
+calls instead of sending them. Each call is validated when it is recorded, exactly as when
+it is sent directly, so that invalid arguments raise at once. When the batch is flushed, the
+requests are sent with several RPCs in flight at the same time.
+
+The order of the calls is kept where it matters. Each request applies to a scope, made of
+its project and, when the request has them, its CCA and layer or its life phase and event.
+A call is only sent once every earlier call whose scope contains its scope, or is contained
+in it, is done. A life phase is thus created before its events are added, and an event is
+added before its profiles. A call is skipped if one of the calls it waits for fails.
+
+Calls that only read data, such as listing the CCAs of a project, are not recorded and
+return their result at once.
+"""
+
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+import contextvars
+import copy
+from fnmatch import fnmatchcase
+import threading
+import time
+from typing import TYPE_CHECKING, Callable, Optional
+
+from google.protobuf.message import Message
+import grpc
+from pydantic import BaseModel
+
+from ansys.sherlock.core.utils.chunking import merge_responses
+from ansys.sherlock.core.utils.retries import IDEMPOTENT_METHODS
+
+if TYPE_CHECKING:
+    from ansys.sherlock.core.sherlock import Sherlock
+
+SCOPE_FIELDS = ("ccaName", "layer", "phaseName", "eventName")
+"""Request fields giving the scope of a mutating call within its project, outermost first."""
+
+
+class BatchCallResult(BaseModel):
+    """Contains the outcome of one call of a :class:`Batch`."""
+
+    index: int
+    """Position of the call in the batch."""
+    method: str
+    """Name of the API method, for example ``"Lifecycle.create_life_phase"``."""
+    return_code: Optional[int] = None
+    """Status code of the response, or ``None`` if the call was not sent or its RPC failed."""
+    error: Optional[str] = None
+    """Message of the error of the call, or ``None`` if the call succeeded."""
+    skipped: bool = False
+    """Whether the call was not sent because a call it waited for failed."""
+    elapsed: float = 0.0
+    """Time (in seconds) taken by the RPCs of the call."""
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the call succeeded."""
+        return self.error is None and not self.skipped
+
+
+class _Rpc:
+    """Mutating RPC recorded by a batch, sent when the batch is flushed."""
+
+    def __init__(self, method: str, request: Message, serializer, deserializer):
+        self.method = method
+        self.request = request
+        self.serializer = serializer
+        self.deserializer = deserializer
+
+
+class _RecordingMultiCallable:
+    """Multi-callable recording the requests of a mutating RPC instead of sending them."""
+
+    def __init__(self, batch: "Batch", method: str, serializer, deserializer):
+        self._batch = batch
+        self._method = method
+        self._serializer = serializer
+        self._deserializer = deserializer
+
+    def __call__(self, request, **kwargs):
+        recorded = type(request)()
+        recorded.CopyFrom(request)
+        self._batch._record(_Rpc(self._method, recorded, self._serializer, self._deserializer))
+        # An empty response reports success, so the method returns as if it was sent.
+        return self._deserializer(b"")
+
+    def with_call(self, request, **kwargs):
+        return self(request, **kwargs), None
+
+    def future(self, request, **kwargs):
+        future = Future()
+        future.set_result(self(request, **kwargs))
+        return future
+
+
+class _UnbatchableMultiCallable:
+    """Multi-callable of a mutating streaming RPC, which batches do not support."""
+
+    def __init__(self, method: str):
+        self._method = method
+
+    def __call__(self, *args, **kwargs):
+        raise ValueError(f"The streaming RPC {self._method} cannot be batched.")
+
+    with_call = future = __call__
+
+
+class _RecordingChannel(grpc.Channel):
+    """Channel sending the RPCs that read data and recording the others."""
+
+    def __init__(self, batch: "Batch", channel: grpc.Channel):
+        self._batch = batch
+        self._channel = channel
+        self._reads: dict[str, bool] = {}
+
+    def _is_read(self, method: str) -> bool:
+        read = self._reads.get(method)
+        if read is None:
+            name = method.lstrip("/")
+            read = self._reads[method] = any(
+                fnmatchcase(name, pattern) for pattern in IDEMPOTENT_METHODS
+            )
+        return read
+
+    def unary_unary(
+        self, method, request_serializer=None, response_deserializer=None, *args, **kwargs
+    ):
+        if self._is_read(method):
+            return self._channel.unary_unary(
+                method, request_serializer, response_deserializer, *args, **kwargs
+            )
+        return _RecordingMultiCallable(
+            self._batch, method, request_serializer, response_deserializer
+        )
+
+    def unary_stream(self, method, *args, **kwargs):
+        if self._is_read(method):
+            return self._channel.unary_stream(method, *args, **kwargs)
+        return _UnbatchableMultiCallable(method)
+
+    def stream_unary(self, method, *args, **kwargs):
+        return _UnbatchableMultiCallable(method)
+
+    def stream_stream(self, method, *args, **kwargs):
+        return _UnbatchableMultiCallable(method)
+
+    def subscribe(self, callback, try_to_connect=False):
+        self._channel.subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        self._channel.unsubscribe(callback)
+
+    def close(self):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        return False
+
+
+def _scope(request: Message) -> tuple[tuple[str, str], ...]:
+    """Return the scope of a request, its project followed by the values of ``SCOPE_FIELDS``.
+
+    Fields missing from the request are taken from its repeated items, such as the thermal
+    profiles of a request adding profiles, when all the items share the same value. The scope
+    stops at the first field that changes, such as the name of a renamed life phase.
+    """
+    fields = request.DESCRIPTOR.fields_by_name
+    if "project" not in fields:
+        return ()
+    scope = [("project", request.project)]
+    items = [
+        item
+        for field in request.DESCRIPTOR.fields
+        if field.message_type is not None and field.is_repeated
+        for item in getattr(request, field.name)
+    ]
+    for name in SCOPE_FIELDS:
+        new_name = f"new{name[0].upper()}{name[1:]}"
+        if new_name in fields and getattr(request, new_name):
+            break
+        if name in fields:
+            scope.append((name, getattr(request, name)))
+            continue
+        values = {getattr(item, name) for item in items if name in item.DESCRIPTOR.fields_by_name}
+        if len(values) == 1 and len(items) == sum(
+            name in item.DESCRIPTOR.fields_by_name for item in items
+        ):
+            scope.append((name, values.pop()))
+        elif values:
+            break
+    return tuple(scope)
+
+
+def _common_prefix(scopes: list[tuple]) -> tuple:
+    prefix = scopes[0]
+    for scope in scopes[1:]:
+        length = 0
+        while length < min(len(prefix), len(scope)) and prefix[length] == scope[length]:
+            length += 1
+        prefix = prefix[:length]
+    return prefix
+
+
+def _overlap(first: tuple, second: tuple) -> bool:
+    """Return whether one scope contains the other."""
+    length = min(len(first), len(second))
+    return first[:length] == second[:length]
+
+
+def _return_code(response: Message) -> Optional[Message]:
+    fields = response.DESCRIPTOR.fields_by_name
+    if "returnCode" in fields:
+        return response.returnCode
+    if "value" in fields and "message" in fields:
+        return response
+    return None
+
+
+class _BatchCall:
+    """Call recorded by a batch."""
+
+    def __init__(self, index: int, method: str, rpcs: list[_Rpc], dependencies: list[int]):
+        self.index = index
+        self.method = method
+        self.rpcs = rpcs
+        self.scope = _common_prefix([_scope(rpc.request) for rpc in rpcs])
+        self.dependencies = dependencies
+        self.future: Future = Future()
+
+
+class _BatchFacade:
+    """Service facade of a batch, recording the mutating calls of the facade of a connection."""
+
+    def __init__(self, batch: "Batch", facade):
+        self._batch = batch
+        self._facade = facade
+        self._recorder = copy.copy(facade)
+        self._recorder.stub = type(facade.stub)(_RecordingChannel(batch, facade.channel))
+        self._recorder._metrics = None
+
+    def __getattr__(self, name: str):
+        method = getattr(self._recorder, name)
+        if name.startswith("_") or not callable(method):
+            return method
+        qualified_name = f"{type(self._facade).__name__}.{name}"
+
+        def record(*args, **kwargs):
+            return self._batch._add(qualified_name, method, args, kwargs)
+
+        record.__name__ = name
+        record.__doc__ = method.__doc__
+        return record
+
+
+class Batch:
+    """Mutating API calls recorded to be sent together.
+
+    Use :meth:`ansys.sherlock.core.sherlock.Sherlock.batch` to create a batch. Its facades,
+    such as ``batch.lifecycle``, have the methods of the facades of the connection. A
+    mutating call validates its arguments, records its requests and returns a
+    ``concurrent.futures.Future`` of its :class:`BatchCallResult`. A call that only reads
+    data is sent at once and returns its result. Leaving the ``with`` block flushes the batch,
+    unless an exception was raised in the block, in which case the recorded calls are
+    discarded.
+
+    Parameters
+    ----------
+    sherlock: Sherlock
+        Connection sending the calls.
+    max_in_flight: int, optional
+        Maximum number of calls sent at the same time. The default is ``8``.
+    """
+
+    def __init__(self, sherlock: "Sherlock", max_in_flight: int = 8):
+        """Initialize an empty batch."""
+        if max_in_flight < 1:
+            raise ValueError("max_in_flight must be at least 1.")
+        self.max_in_flight = max_in_flight
+        self.results: list[BatchCallResult] = []
+        self._sherlock = sherlock
+        self._calls: list[_BatchCall] = []
+        self._facades: dict[str, _BatchFacade] = {}
+        self._recording: Optional[list[_Rpc]] = None
+        self._lock = threading.RLock()
+
+    def __getattr__(self, name: str) -> _BatchFacade:
+        """Return the batch facade of a service, such as ``lifecycle``."""
+        if name.startswith("_"):
+            raise AttributeError(f"'{type(self).__name__}' object has no attribute '{name}'")
+        facade = self._facades.get(name)
+        if facade is None:
+            facade = self._facades[name] = _BatchFacade(self, getattr(self._sherlock, name))
+        return facade
+
+    @property
+    def pending(self) -> int:
+        """Number of recorded calls that have not been sent yet."""
+        return len(self._calls)
+
+    def _record(self, rpc: _Rpc):
+        if self._recording is None:
+            raise RuntimeError("Requests can only be recorded by the calls of a batch.")
+        self._recording.append(rpc)
+
+    def _add(self, name: str, method: Callable, args: tuple, kwargs: dict):
+        """Validate and record a call, or return the result of a call that only reads data."""
+        with self._lock:
+            self._recording = []
+            try:
+                result = method(*args, **kwargs)
+                rpcs = self._recording
+            finally:
+                self._recording = None
+            if not rpcs:
+                return result
+            index = len(self._calls)
+            call = _BatchCall(index, name, rpcs, [])
+            call.dependencies = [
+                earlier.index for earlier in self._calls if _overlap(earlier.scope, call.scope)
+            ]
+            self._calls.append(call)
+            return call.future
+
+    def _send(self, call: _BatchCall) -> BatchCallResult:
+        channel = self._sherlock._channel
+        start = time.perf_counter()
+        try:
+            responses = [
+                channel.unary_unary(rpc.method, rpc.serializer, rpc.deserializer)(rpc.request)
+                for rpc in call.rpcs
+            ]
+        except grpc.RpcError as e:
+            return BatchCallResult(
+                index=call.index,
+                method=call.method,
+                error=e.details() or str(e.code()),
+                elapsed=time.perf_counter() - start,
+            )
+        elapsed = time.perf_counter() - start
+        response = merge_responses(responses)
+        return_code = _return_code(response)
+        if return_code is None:
+            return BatchCallResult(index=call.index, method=call.method, elapsed=elapsed)
+        error = None
+        if return_code.value == -1:
+            errors = getattr(response, "errors", None)
+            error = return_code.message or "\n".join(str(e) for e in errors or ()) or "Failed"
+        return BatchCallResult(
+            index=call.index,
+            method=call.method,
+            return_code=return_code.value,
+            error=error,
+            elapsed=elapsed,
+        )
+
+    def flush(self) -> list[BatchCallResult]:
+        """Send the recorded calls and wait for their results.
+
+        The calls are sent from worker threads of the batch, so that flushing a batch from a
+        call running in the background, such as one of
+        :meth:`ansys.sherlock.core.sherlock.Sherlock.submit`, cannot wait for a worker it
+        occupies.
+
+        Returns
+        -------
+        list[BatchCallResult]
+            Results of the calls, in the order in which they were recorded.
+        """
+        with self._lock:
+            calls, self._calls = self._calls, []
+        results: dict[int, BatchCallResult] = {}
+        waiting = list(calls)
+        in_flight: dict[Future, _BatchCall] = {}
+        context = contextvars.copy_context()
+        with ThreadPoolExecutor(
+            self.max_in_flight, thread_name_prefix="pysherlock-batch"
+        ) as executor:
+            while waiting or in_flight:
+                for call in list(waiting):
+                    if len(in_flight) >= self.max_in_flight:
+                        break
+                    if any(index not in results for index in call.dependencies):
+                        continue
+                    waiting.remove(call)
+                    if all(results[index].succeeded for index in call.dependencies):
+                        in_flight[executor.submit(context.copy().run, self._send, call)] = call
+                    else:
+                        results[call.index] = BatchCallResult(
+                            index=call.index,
+                            method=call.method,
+                            error="A call it depends on failed.",
+                            skipped=True,
+                        )
+                        call.future.set_result(results[call.index])
+                if not in_flight:
+                    continue
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    call = in_flight.pop(future)
+                    try:
+                        results[call.index] = future.result()
+                    except Exception as e:
+                        results[call.index] = BatchCallResult(
+                            index=call.index, method=call.method, error=str(e)
+                        )
+                    call.future.set_result(results[call.index])
+        batch_results = [results[call.index] for call in calls]
+        self.results.extend(batch_results)
+        return batch_results
+
+    def __enter__(self) -> "Batch":
+        """Enter the runtime context of the batch."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Flush the batch, or discard it if the block raised an exception."""
+        if exc_type is None:
+            self.flush()
+        else:
+            with self._lock:
+                for call in self._calls:
+                    call.future.cancel()
+                self._calls = []
+        return False
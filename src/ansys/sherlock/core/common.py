@@ -102,7 +102,7 @@ class Common(GrpcStub):
             exit_message = SherlockCommonService_pb2.ExitRequest()
             exit_message.closeSherlockClient = close_sherlock_client
             response = self.stub.exit(exit_message)
-            LOG.info(str(response))
+            LOG.info("%s", response)
         except SherlockCommonServiceError as err:
             LOG.error("Exit error: ", str(err))
 
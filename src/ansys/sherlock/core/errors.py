@@ -25,9 +25,10 @@
 """pysherlock specific errors."""
 
 from builtins import Exception
-from typing import Optional
+from typing import TYPE_CHECKING, Optional
 
-from ansys.api.sherlock.v0 import SherlockPartsService_pb2
+if TYPE_CHECKING:
+    from ansys.api.sherlock.v0 import SherlockPartsService_pb2
 
 LOCALHOST = "127.0.0.1"
 SHERLOCK_DEFAULT_PORT = 9090
@@ -1035,7 +1036,7 @@ class SherlockUpdatePartsListPropertiesError(Exception):
         self,
         message: Optional[str] = None,
         update_errors: Optional[
-            list[SherlockPartsService_pb2.UpdatePartsListPropertiesResponse.PartPropertyError]
+            list["SherlockPartsService_pb2.UpdatePartsListPropertiesResponse.PartPropertyError"]
         ] = None,
     ):
         """Initialize error message."""
@@ -1381,3 +1382,32 @@ class SherlockListLifeCycleEventsError(Exception):
     def __str__(self):
         """Format error message."""
         return f"List life cycle events error: {self.message}"
+
+
+class SherlockRequestTooLargeError(Exception):
+    """Contains the error raised when a request cannot be split under the message size limit."""
+
+    def __init__(self, message):
+        """Initialize error message."""
+        self.message = message
+
+    def __str__(self):
+        """Format error message."""
+        return f"Request too large error: {self.message}"
+
+
+class SherlockDeadlineExceededError(Exception):
+    """Contains the error raised when an RPC does not complete before its deadline."""
+
+    def __init__(self, method: str, elapsed: float, timeout: float):
+        """Initialize error message."""
+        self.method = method
+        self.elapsed = elapsed
+        self.timeout = timeout
+
+    def __str__(self):
+        """Format error message."""
+        return (
+            f"Deadline exceeded error: {self.method} did not complete within "
+            f"{self.timeout:g} seconds ({self.elapsed:.3f} seconds elapsed)"
+        )
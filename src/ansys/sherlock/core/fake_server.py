@@ -0,0 +1,519 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module providing an in-process stand-in for the Sherlock gRPC server.
+
+The fake server implements every service of ``ansys.api.sherlock.v0`` generically from the
+service descriptors. Each RPC returns an empty response, which Sherlock uses to report
+success, unless a response, a handler or a failure is configured for it. It is meant for
+exercising and timing the client end to end without a Sherlock installation.
+
+The server can also run in a separate process::
+
+    python -m ansys.sherlock.core.fake_server --port 9090 --latency 0.01
+"""
+
+import argparse
+from concurrent import futures
+from fnmatch import fnmatchcase
+import importlib
+import random
+import subprocess
+import sys
+import threading
+import time
+from typing import Callable, Iterable, Optional, Union
+
+from google.protobuf import message_factory
+from google.protobuf.message import Message
+import grpc
+
+from ansys.sherlock.core.utils.chunking import MAX_MESSAGE_LENGTH
+
+SERVICE_MODULES = (
+    "SherlockAnalysisService_pb2",
+    "SherlockCommonService_pb2",
+    "SherlockLayerService_pb2",
+    "SherlockLifeCycleService_pb2",
+    "SherlockModelService_pb2",
+    "SherlockPartsService_pb2",
+    "SherlockProjectService_pb2",
+    "SherlockStackupService_pb2",
+)
+"""Modules of ``ansys.api.sherlock.v0`` whose services are implemented."""
+
+DEFAULT_RELEASE_VERSION = "2025 R2"
+"""Release reported by ``getSherlockInfo`` unless another response is configured."""
+
+Handler = Callable[[Message, grpc.ServicerContext], Union[Message, Iterable[Message]]]
+"""Function implementing an RPC. Server-streaming RPCs return an iterable of responses."""
+
+
+class _Rule:
+    """Behavior configured for the RPCs matching a pattern."""
+
+    def __init__(self, pattern: str, **settings):
+        self.pattern = pattern
+        self.settings = settings
+
+
+class _Failure:
+    """Failure injected into the RPCs matching a pattern."""
+
+    def __init__(
+        self,
+        code: Optional[grpc.StatusCode],
+        message: str,
+        probability: float,
+        times: Optional[int],
+    ):
+        self.code = code
+        self.message = message
+        self.probability = probability
+        self.remaining = times
+
+
+class FakeSherlockServer:
+    """Stand-in Sherlock gRPC server running in the current process.
+
+    RPCs are configured by pattern. A pattern is matched with ``fnmatch`` against the name
+    of the RPC in the ``"Service/method"`` form, for example
+    ``"SherlockPartsService/updatePartsLocations"`` or ``"SherlockPartsService/*"``. When
+    several settings of the same kind match an RPC, the last one configured wins.
+
+    Parameters
+    ----------
+    port: int, optional
+        Port to listen on. The default is ``0``, in which case a free port is picked.
+    host: str, optional
+        Address to listen on. The default is ``"127.0.0.1"``.
+    max_workers: int, optional
+        Number of threads serving the RPCs, which is the maximum number of RPCs served
+        concurrently. The default is ``16``.
+    latency: float, optional
+        Seconds every RPC waits before responding. The default is ``0``.
+    stream_size: int, optional
+        Number of responses sent by server-streaming RPCs. The default is ``1``.
+    release_version: str, optional
+        Release reported by ``getSherlockInfo``. The default is ``"2025 R2"``.
+    seed: int, optional
+        Seed of the random generator deciding probabilistic failures.
+
+    Examples
+    --------
+    >>> from ansys.sherlock.core import launcher
+    >>> from ansys.sherlock.core.fake_server import FakeSherlockServer
+    >>> with FakeSherlockServer(latency=0.005) as server:
+    >>>     server.inject_failure("SherlockPartsService/*", probability=0.1)
+    >>>     sherlock = launcher.connect(port=server.port, transport_mode="insecure")
+    >>>     sherlock.parts.update_parts_list(...)
+    >>>     print(server.call_count("SherlockPartsService/*"))
+    """
+
+    def __init__(
+        self,
+        port: int = 0,
+        host: str = "127.0.0.1",
+        max_workers: int = 16,
+        latency: float = 0.0,
+        stream_size: int = 1,
+        release_version: str = DEFAULT_RELEASE_VERSION,
+        seed: Optional[int] = None,
+    ):
+        """Create the server without starting it."""
+        self.host = host
+        self.port = port
+        self.max_workers = max_workers
+        self._rules: list[_Rule] = [
+            _Rule("*", latency=latency, stream_size=stream_size),
+            _Rule(
+                "SherlockCommonService/getSherlockInfo",
+                response=self._message_class("SherlockCommonService/getSherlockInfo", output=True)(
+                    releaseVersion=release_version
+                ),
+            ),
+        ]
+        self._failures: list[tuple[str, _Failure]] = []
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._calls: dict[str, int] = {}
+        self._in_flight = 0
+        self.max_in_flight = 0
+        """Largest number of RPCs served at the same time."""
+        self._server: Optional[grpc.Server] = None
+
+    @staticmethod
+    def _methods():
+        """Yield the descriptor of every RPC implemented by the server."""
+        for module_name in SERVICE_MODULES:
+            module = importlib.import_module(f"ansys.api.sherlock.v0.{module_name}")
+            for service in module.DESCRIPTOR.services_by_name.values():
+                for method in service.methods:
+                    yield service, method
+
+    @classmethod
+    def _message_class(cls, name: str, output: bool) -> type[Message]:
+        for service, method in cls._methods():
+            if f"{service.full_name}/{method.name}" == name:
+                descriptor = method.output_type if output else method.input_type
+                return message_factory.GetMessageClass(descriptor)
+        raise KeyError(f"Unknown RPC: {name}")
+
+    def start(self) -> int:
+        """Start serving.
+
+        Returns
+        -------
+        int
+            Port the server listens on.
+        """
+        options = [
+            ("grpc.max_send_message_length", MAX_MESSAGE_LENGTH),
+            ("grpc.max_receive_message_length", MAX_MESSAGE_LENGTH),
+        ]
+        server = grpc.server(futures.ThreadPoolExecutor(self.max_workers), options=options)
+        handlers: dict[str, dict[str, grpc.RpcMethodHandler]] = {}
+        for service, method in self._methods():
+            handlers.setdefault(service.full_name, {})[method.name] = self._method_handler(
+                f"{service.full_name}/{method.name}", method
+            )
+        server.add_generic_rpc_handlers(
+            [
+                grpc.method_handlers_generic_handler(name, methods)
+                for name, methods in handlers.items()
+            ]
+        )
+        self.port = server.add_insecure_port(f"{self.host}:{self.port}")
+        server.start()
+        self._server = server
+        return self.port
+
+    def stop(self, grace: Optional[float] = None):
+        """Stop serving and cancel the RPCs in progress after ``grace`` seconds."""
+        if self._server is not None:
+            self._server.stop(grace).wait()
+            self._server = None
+
+    def __enter__(self) -> "FakeSherlockServer":
+        """Start the server."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Stop the server."""
+        self.stop()
+
+    @property
+    def address(self) -> str:
+        """Address of the server, in the ``"host:port"`` form."""
+        return f"{self.host}:{self.port}"
+
+    def set_latency(self, pattern: str, seconds: float):
+        """Make the matching RPCs wait ``seconds`` before responding."""
+        self._add_rule(pattern, latency=seconds)
+
+    def set_stream_size(self, pattern: str, count: int):
+        """Make the matching server-streaming RPCs send ``count`` responses."""
+        self._add_rule(pattern, stream_size=count)
+
+    def set_response(
+        self, pattern: str, response: Union[Message, dict, Callable[[Message], Message]]
+    ):
+        """Configure the response of the matching RPCs.
+
+        Parameters
+        ----------
+        pattern: str
+            Pattern of the RPC names.
+        response: Message | dict | Callable[[Message], Message]
+            Response to send, fields used to build the response of each matching RPC, or
+            function building the response from the request. Server-streaming RPCs send it
+            ``stream_size`` times.
+        """
+        self._add_rule(pattern, response=response)
+
+    def set_handler(self, pattern: str, handler: Handler):
+        """Implement the matching RPCs with a function.
+
+        The handler receives the request and the ``grpc.ServicerContext``, and replaces
+        the configured response and stream size. Latency and failures still apply.
+        """
+        self._add_rule(pattern, handler=handler)
+
+    def inject_failure(
+        self,
+        pattern: str,
+        code: Optional[grpc.StatusCode] = grpc.StatusCode.UNAVAILABLE,
+        message: str = "Injected failure",
+        probability: float = 1.0,
+        times: Optional[int] = None,
+    ):
+        """Make the matching RPCs fail.
+
+        Parameters
+        ----------
+        pattern: str
+            Pattern of the RPC names.
+        code: grpc.StatusCode, optional
+            Status the RPCs fail with. If ``None``, the RPCs succeed but respond with a
+            return code of ``-1`` and ``message``, the way Sherlock reports invalid
+            requests. The default is ``grpc.StatusCode.UNAVAILABLE``.
+        message: str, optional
+            Details of the status, or message of the return code.
+        probability: float, optional
+            Probability of each matching RPC failing. The default is ``1``.
+        times: int, optional
+            Number of failures to inject before the RPCs succeed again. The default is
+            ``None``, in which case there is no limit.
+        """
+        with self._lock:
+            self._failures.append((pattern, _Failure(code, message, probability, times)))
+
+    def clear_failures(self):
+        """Remove every injected failure."""
+        with self._lock:
+            self._failures.clear()
+
+    def call_count(self, pattern: str = "*") -> int:
+        """Return the number of RPCs received whose name matches a pattern."""
+        with self._lock:
+            return sum(count for name, count in self._calls.items() if fnmatchcase(name, pattern))
+
+    def reset_counts(self):
+        """Reset the call counts and ``max_in_flight``."""
+        with self._lock:
+            self._calls.clear()
+            self.max_in_flight = self._in_flight
+
+    def _add_rule(self, pattern: str, **settings):
+        with self._lock:
+            self._rules.append(_Rule(pattern, **settings))
+
+    def _setting(self, name: str, key: str):
+        for rule in reversed(self._rules):
+            if key in rule.settings and fnmatchcase(name, rule.pattern):
+                return rule.settings[key]
+        return None
+
+    def _take_failure(self, name: str) -> Optional[_Failure]:
+        with self._lock:
+            for pattern, failure in reversed(self._failures):
+                if not fnmatchcase(name, pattern) or failure.remaining == 0:
+                    continue
+                if self._random.random() >= failure.probability:
+                    return None
+                if failure.remaining is not None:
+                    failure.remaining -= 1
+                return failure
+        return None
+
+    def _begin(self, name: str):
+        with self._lock:
+            self._calls[name] = self._calls.get(name, 0) + 1
+            self._in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self._in_flight)
+
+    def _end(self):
+        with self._lock:
+            self._in_flight -= 1
+
+    def _respond(self, name, response_class, request, context):
+        """Apply latency and failures, and return the configured response."""
+        latency = self._setting(name, "latency")
+        if latency:
+            time.sleep(latency)
+
+        failure = self._take_failure(name)
+        if failure is not None and failure.code is not None:
+            context.abort(failure.code, failure.message)
+
+        handler = self._setting(name, "handler")
+        if handler is not None:
+            return handler(request, context), failure
+
+        response = self._setting(name, "response")
+        if callable(response):
+            response = response(request)
+        elif isinstance(response, dict):
+            response = response_class(**response)
+        return (response if response is not None else response_class()), failure
+
+    @staticmethod
+    def _fail_return_code(response: Message, message: str) -> Message:
+        failed = type(response)()
+        failed.CopyFrom(response)
+        return_code = failed if "value" in failed.DESCRIPTOR.fields_by_name else None
+        if return_code is None and "returnCode" in failed.DESCRIPTOR.fields_by_name:
+            return_code = failed.returnCode
+        if return_code is not None:
+            return_code.value = -1
+            return_code.message = message
+        return failed
+
+    def _method_handler(self, name: str, method) -> grpc.RpcMethodHandler:
+        request_class = message_factory.GetMessageClass(method.input_type)
+        response_class = message_factory.GetMessageClass(method.output_type)
+
+        if method.server_streaming:
+
+            def serve_stream(request, context):
+                self._begin(name)
+                try:
+                    response, failure = self._respond(name, response_class, request, context)
+                    if self._setting(name, "handler") is not None:
+                        responses = response
+                    else:
+                        responses = [response] * self._setting(name, "stream_size")
+                    for response in responses:
+                        if failure is not None:
+                            response = self._fail_return_code(response, failure.message)
+                        yield response
+                finally:
+                    self._end()
+
+            return grpc.unary_stream_rpc_method_handler(
+                serve_stream,
+                request_deserializer=request_class.FromString,
+                response_serializer=response_class.SerializeToString,
+            )
+
+        def serve(request, context):
+            self._begin(name)
+            try:
+                response, failure = self._respond(name, response_class, request, context)
+                if failure is not None:
+                    response = self._fail_return_code(response, failure.message)
+                return response
+            finally:
+                self._end()
+
+        return grpc.unary_unary_rpc_method_handler(
+            serve,
+            request_deserializer=request_class.FromString,
+            response_serializer=response_class.SerializeToString,
+        )
+
+
+class FakeSherlockProcess:
+    """Fake Sherlock server running in a child process.
+
+    The child process serves until :meth:`stop` is called. Only the settings available
+    on the command line of the module can be configured.
+
+    Parameters
+    ----------
+    port: int, optional
+        Port to listen on. The default is ``0``, in which case a free port is picked.
+    latency: float, optional
+        Seconds every RPC waits before responding. The default is ``0``.
+    stream_size: int, optional
+        Number of responses sent by server-streaming RPCs. The default is ``1``.
+    max_workers: int, optional
+        Number of threads serving the RPCs. The default is ``16``.
+    release_version: str, optional
+        Release reported by ``getSherlockInfo``. The default is ``"2025 R2"``.
+    """
+
+    def __init__(
+        self,
+        port: int = 0,
+        latency: float = 0.0,
+        stream_size: int = 1,
+        max_workers: int = 16,
+        release_version: str = DEFAULT_RELEASE_VERSION,
+    ):
+        """Start the child process and wait until it listens."""
+        self.process = subprocess.Popen(
+            [
+                sys.executable,
+                "-m",
+                __name__,
+                "--port",
+                str(port),
+                "--latency",
+                str(latency),
+                "--stream-size",
+                str(stream_size),
+                "--max-workers",
+                str(max_workers),
+                "--release-version",
+                release_version,
+            ],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+            text=True,
+        )
+        line = self.process.stdout.readline()
+        if not line:
+            self.process.wait()
+            raise RuntimeError("The fake Sherlock server process did not start.")
+        self.port = int(line)
+
+    def stop(self, timeout: float = 10.0):
+        """Stop the child process."""
+        if self.process.poll() is None:
+            # Closing stdin asks the child process to stop
+            self.process.stdin.close()
+            try:
+                self.process.wait(timeout)
+            except subprocess.TimeoutExpired:
+                self.process.kill()
+                self.process.wait()
+        self.process.stdout.close()
+
+    def __enter__(self) -> "FakeSherlockProcess":
+        """Return the running process."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Stop the child process."""
+        self.stop()
+
+
+def main(argv: Optional[list[str]] = None):
+    """Run a fake Sherlock server until the standard input is closed."""
+    parser = argparse.ArgumentParser(description="Stand-in Sherlock gRPC server.")
+    parser.add_argument("--port", type=int, default=0)
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--stream-size", type=int, default=1)
+    parser.add_argument("--max-workers", type=int, default=16)
+    parser.add_argument("--release-version", default=DEFAULT_RELEASE_VERSION)
+    args = parser.parse_args(argv)
+
+    server = FakeSherlockServer(
+        port=args.port,
+        host=args.host,
+        max_workers=args.max_workers,
+        latency=args.latency,
+        stream_size=args.stream_size,
+        release_version=args.release_version,
+    )
+    with server:
+        print(server.port, flush=True)
+        sys.stdin.read()
+
+
+if __name__ == "__main__":
+    main()
@@ -24,22 +24,58 @@
 
 """Module for shared methods for the gRPC stubs."""
 
+from typing import Optional
+
 from ansys.api.sherlock.v0 import SherlockCommonService_pb2, SherlockCommonService_pb2_grpc
 import grpc
 
+from ansys.sherlock.core.utils.chunking import MAX_MESSAGE_LENGTH, send_chunked
+from ansys.sherlock.core.utils.connection_state import (
+    ConnectionStateTracker,
+    get_connection_state_tracker,
+)
+from ansys.sherlock.core.utils.enumeration_cache import ENUMERATION_CACHE
+
 
 class GrpcStub:
     """Provides the gRPC stub."""
 
+    max_request_bytes = MAX_MESSAGE_LENGTH
+    """Maximum size (in bytes) of each request sent by the bulk methods."""
+    bulk_pipeline_depth = 1
+    """Maximum number of chunks of a bulk request in flight at the same time."""
+    _metrics = None
+
     def __init__(self, channel: grpc.Channel, server_version: int):
         """Initialize the gRPC stub."""
         self.channel = channel
         self._server_version = server_version
+        self._health_stub = None
+
+    @property
+    def connection_state(self) -> ConnectionStateTracker:
+        """Connectivity tracker shared by all stubs using the same channel."""
+        return get_connection_state_tracker(self.channel)
 
     def _is_connection_up(self):
+        return self.connection_state.is_connection_up(self._check_connection)
+
+    def _check_connection(self) -> bool:
+        """Send a health-check RPC to Sherlock."""
+        if self._health_stub is None:
+            self._health_stub = SherlockCommonService_pb2_grpc.SherlockCommonServiceStub(
+                self.channel
+            )
         try:
-            stub = SherlockCommonService_pb2_grpc.SherlockCommonServiceStub(self.channel)
-            stub.check(SherlockCommonService_pb2.HealthCheckRequest())
+            self._health_stub.check(SherlockCommonService_pb2.HealthCheckRequest())
             return True
         except grpc.RpcError:
             return False
+
+    def _get_enumeration(self, name: str) -> Optional[list[str]]:
+        """Return an enumeration list from the cache shared by all Sherlock connections."""
+        return ENUMERATION_CACHE.get(name, self.channel, self._server_version)
+
+    def _send_bulk(self, method, request):
+        """Send a bulk request, split in chunks if it exceeds ``max_request_bytes``."""
+        return send_chunked(method, request, self.max_request_bytes, self.bulk_pipeline_depth)
@@ -23,19 +23,40 @@
 # SOFTWARE.
 
 """Module for launching Sherlock locally or connecting to a local instance with gRPC."""
+
+import asyncio
 import errno
+import functools
 import os
 import shlex
 import socket
-from typing import Optional
+from typing import Optional, Union
+import uuid
 
 import grpc
 
 from ansys.sherlock.core import LOG
+from ansys.sherlock.core.async_sherlock import DEFAULT_MAX_CONCURRENT_CALLS, ThreadedAsyncSherlock
 from ansys.sherlock.core.common import Common
 from ansys.sherlock.core.errors import SherlockCannotUsePortError, SherlockConnectionError
 from ansys.sherlock.core.sherlock import Sherlock
+from ansys.sherlock.core.utils.aio_bridge import AioBridgeChannel
+from ansys.sherlock.core.utils.channel_pool import ChannelPool, get_channel_options
+from ansys.sherlock.core.utils.chunking import MAX_MESSAGE_LENGTH
+from ansys.sherlock.core.utils.compression import (
+    CompressionInterceptor,
+    CompressionPolicy,
+    get_compression_policy,
+)
+from ansys.sherlock.core.utils.connection_state import get_connection_state_tracker
 from ansys.sherlock.core.utils.cyberchannel import create_channel
+from ansys.sherlock.core.utils.deadlines import DeadlineInterceptor, DeadlinePolicy
+from ansys.sherlock.core.utils.enumeration_cache import ENUMERATION_CACHE
+from ansys.sherlock.core.utils.instance_registry import InstanceRecord, get_instance_registry
+from ansys.sherlock.core.utils.metrics import MetricsInterceptor, MetricsRegistry
+from ansys.sherlock.core.utils.read_cache import ReadCache, ReadCacheInterceptor
+from ansys.sherlock.core.utils.retries import RetryInterceptor, RetryPolicy
+from ansys.sherlock.core.utils.single_flight import SingleFlightInterceptor, SingleFlightPolicy
 from ansys.sherlock.core.utils.version_check import _EARLIEST_SUPPORTED_VERSION
 
 ANSYS_GRPC_CERTIFICATES = "ANSYS_GRPC_CERTIFICATES"
@@ -43,6 +64,7 @@ LOCALHOST = "127.0.0.1"
 SHERLOCK_DEFAULT_PORT = 9090
 SHERLOCK_UDS_SERVICE = "sherlock-grpc"
 DEFAULT_CONNECT_TIMEOUT = 120
+_MAX_PORT = 65535
 sherlock_cmd_args = []
 
 
@@ -69,6 +91,8 @@ def launch(
     certs_dir: str = None,
     uds_dir: str = None,
     uds_id: str = None,
+    register: bool = True,
+    registry_dir: Optional[str] = None,
 ) -> str:
     r"""Launch Sherlock using the specified host and port for the gRPC connection.
 
@@ -99,6 +123,12 @@ def launch(
         Directory for the UDS socket file. Default is "$HOME/.conn".
     uds_id: str, optional
         Identifier for the UDS socket file name. Default is no identifier.
+    register: bool, optional
+        Whether to record the instance in the instance registry, so that :func:`acquire`
+        can attach to it later. Default is ``True``.
+    registry_dir: str, optional
+        Directory of the instance registry. Default is the ``PYSHERLOCK_INSTANCE_REGISTRY``
+        environment variable, or "$HOME/.pysherlock/instances".
 
     Returns
     -------
@@ -122,7 +152,7 @@ def launch(
         raise e
 
     try:
-        sherlock_launch_cmd, _server_version, ansys_install_path = _get_sherlock_exe_path(
+        sherlock_launch_cmd, server_version, ansys_install_path = _get_sherlock_exe_path(
             year=year, release_number=release_number
         )
         args = [sherlock_launch_cmd]
@@ -149,14 +179,28 @@ def launch(
         if sherlock_command_args:
             args.extend(shlex.split(sherlock_command_args))
 
-        LOG.info(f"Command arguments: {args}")
+        LOG.info("Command arguments: %s", args)
         # subprocess is used safely here to launch a trusted local executable (Sherlock).
         # Input arguments are internally constructed and shell=False prevents injection.
-        subprocess.Popen(args, shell=False)  # nosec B603
-
+        process = subprocess.Popen(args, shell=False)  # nosec B603
+
+        if register:
+            _register_instance(
+                InstanceRecord(
+                    pid=process.pid,
+                    transport_mode=transport_mode,
+                    port=None if transport_mode == "uds" else port,
+                    uds_dir=uds_dir,
+                    uds_id=uds_id,
+                    certs_dir=certs_dir,
+                    server_version=server_version,
+                    single_project_path=single_project_path,
+                ),
+                registry_dir,
+            )
         return ansys_install_path
     except Exception as e:
-        LOG.error(f"Error launching Sherlock. {e}")
+        LOG.error("Error launching Sherlock. %s", e)
         raise e
 
 
@@ -172,6 +216,7 @@ def launch_and_connect(
     certs_dir: str = None,
     uds_dir: str = None,
     uds_id: str = None,
+    retry_policy: Optional[RetryPolicy] = None,
 ) -> tuple[Sherlock, str]:
     """
     Launch Sherlock, start gRPC on a given host and port, and wait until connected to Sherlock.
@@ -214,6 +259,10 @@ def launch_and_connect(
         Directory for the UDS socket file. Default is "$HOME/.conn".
     uds_id: str, optional
         Identifier for the UDS socket file name. Default is no identifier.
+    retry_policy: RetryPolicy, optional
+        Retries of the read-only RPCs that fail because Sherlock is temporarily
+        unavailable. Default is ``None``, in which case no RPC is retried. See
+        :func:`connect` for details.
 
     Returns
     -------
@@ -245,10 +294,11 @@ def launch_and_connect(
             transport_mode=transport_mode,
             uds_dir=uds_dir,
             uds_id=uds_id,
+            retry_policy=retry_policy,
         )
         return sherlock, ansys_install_path
     except Exception as e:
-        LOG.error(f"Error connecting to Sherlock after launch: {e}")
+        LOG.error("Error connecting to Sherlock after launch: %s", e)
         raise RuntimeError(f"Error connecting to Sherlock after launch: {e}")
 
 
@@ -259,6 +309,18 @@ def connect(
     certs_dir: str = None,
     uds_dir: str = None,
     uds_id: str = None,
+    health_check_ttl: Optional[float] = None,
+    prefetch_enumerations: bool = False,
+    enable_metrics: bool = False,
+    default_deadline: Optional[float] = None,
+    method_deadlines: Optional[dict[str, Optional[float]]] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    compression: Union[None, str, CompressionPolicy] = None,
+    channel_pool_size: int = 1,
+    channel_pool_strategy: str = "least_outstanding",
+    coalesced_methods: Optional[tuple[str, ...]] = None,
+    read_cache: Optional[ReadCache] = None,
+    enumeration_cache_dir: Optional[str] = None,
 ) -> Sherlock:
     r"""Connect to a local instance of Sherlock.
 
@@ -280,6 +342,61 @@ def connect(
         Directory for the UDS socket file.
     uds_id : str, optional
         Optional ID for the UDS socket file.
+    health_check_ttl : float, optional
+        Number of seconds a known state of the gRPC channel is trusted before a
+        health-check request is sent to Sherlock again. ``0`` sends a health-check request
+        before every API call. Default is 30 seconds.
+    prefetch_enumerations : bool, optional
+        Whether to fetch all the enumeration lists used to validate arguments, such as the
+        life cycle types or conductor materials, in parallel once connected. The lists are
+        cached for every connection to the same server and version. Default is ``False``.
+    enable_metrics : bool, optional
+        Whether to record the call counts, latencies and message sizes of every RPC and
+        API call. The metrics are returned by :meth:`Sherlock.metrics`. Default is
+        ``False``, in which case nothing is recorded.
+    default_deadline : float, optional
+        Time (in seconds) within which each RPC must complete, except the long-running
+        ones such as running analyses or importing and exporting files. Default is ``None``,
+        in which case the RPCs have no deadline.
+    method_deadlines : dict[str, float], optional
+        Time (in seconds) within which the RPCs matching each pattern must complete, or
+        ``None`` for no deadline. Patterns are matched against the name of the RPC in the
+        ``"Service/method"`` form, for example ``"SherlockAnalysisService/runAnalysis"``.
+        See :class:`ansys.sherlock.core.utils.deadlines.DeadlinePolicy` for details.
+    retry_policy : RetryPolicy, optional
+        Retries of the read-only RPCs, such as listing the CCAs or the conductor layers,
+        that fail because Sherlock is temporarily unavailable. ``RetryPolicy()`` attempts
+        these RPCs up to 4 times with an exponential backoff. Default is ``None``, in which
+        case no RPC is retried. See :class:`ansys.sherlock.core.utils.retries.RetryPolicy`
+        for details.
+    compression : str | CompressionPolicy, optional
+        Compression of the large requests, which speeds up sending bulk requests to a
+        server on another host. ``"gzip"`` or ``"deflate"`` compresses the requests of 64 KiB
+        or more with that algorithm. A
+        :class:`ansys.sherlock.core.utils.compression.CompressionPolicy` sets another
+        threshold. Default is ``None``, in which case requests are not compressed.
+    channel_pool_size : int, optional
+        Number of HTTP/2 connections to Sherlock over which the RPCs are spread. Several
+        connections speed up sending many calls at the same time from several threads.
+        Default is ``1``.
+    channel_pool_strategy : str, optional
+        How the connection of each RPC is picked when ``channel_pool_size`` is more than
+        ``1``: ``"least_outstanding"``, the connection with the fewest RPCs in flight, or
+        ``"round_robin"``. Default is ``"least_outstanding"``.
+    coalesced_methods : tuple[str, ...], optional
+        Patterns of the read-only RPCs whose identical requests, sent at the same time from
+        several threads, share one RPC. Patterns are matched against the name of the RPC in
+        the ``"Service/method"`` form, and mutating RPCs are never coalesced: ``("*",)``
+        coalesces every read. Default is ``None``, in which case no request is coalesced.
+    read_cache : ReadCache, optional
+        Cache answering the queries repeated for the same project, such as the layer count of
+        a stackup, until an RPC changes the project. Default is ``None``, in which case every
+        query is sent to Sherlock.
+    enumeration_cache_dir : str, optional
+        Directory where the enumeration lists of the server are persisted, so that later
+        processes connecting to the same server and version do not request them again.
+        Default is ``None``, in which case the directory of the process-wide
+        enumeration cache is used, if any.
 
     Returns
     -------
@@ -294,7 +411,8 @@ def connect(
     >>> sherlock = launcher.connect(port=9092, timeout=60, transport_mode="wnua")
     """
     try:
-        channel = _connect_grpc_channel(
+        open_channel = functools.partial(
+            _connect_grpc_channel,
             host=LOCALHOST,
             port=port,
             uds_dir=uds_dir,
@@ -302,7 +420,33 @@ def connect(
             transport_mode=transport_mode,
             certs_dir=certs_dir,
         )
-        _wait_for_sherlock_grpc_ready(channel, timeout)
+        if channel_pool_size > 1:
+            channels = [
+                open_channel(grpc_options=get_channel_options(index))
+                for index in range(channel_pool_size)
+            ]
+            for pooled_channel in channels:
+                _wait_for_sherlock_grpc_ready(pooled_channel, timeout)
+            channel = ChannelPool(channels, channel_pool_strategy)
+        else:
+            channel = open_channel()
+            _wait_for_sherlock_grpc_ready(channel, timeout)
+        channel, metrics, deadlines = _intercept_channel(
+            channel,
+            enable_metrics,
+            default_deadline,
+            method_deadlines,
+            retry_policy,
+            compression,
+            coalesced_methods,
+            read_cache,
+        )
+        get_connection_state_tracker(channel, ttl=health_check_ttl)
+        ENUMERATION_CACHE.register_channel(
+            channel,
+            _get_server_address(port, transport_mode, uds_dir, uds_id),
+            enumeration_cache_dir,
+        )
 
         # Create Common without version since the version is unknown
         common = Common(channel=channel, server_version=None)
@@ -310,19 +454,378 @@ def connect(
         try:
             sherlock_info = common.get_sherlock_info()
             if sherlock_info is not None:
-                LOG.info(f"Connected to Sherlock version: {sherlock_info.releaseVersion}")
+                LOG.info("Connected to Sherlock version: %s", sherlock_info.releaseVersion)
+                server_version = _convert_to_server_version(sherlock_info.releaseVersion)
+        except grpc.RpcError as e:
+            error_message = e.details() if e.details() else "Unknown error occurred."
+            LOG.error("Server validation error: %s", error_message)
+            raise SherlockConnectionError(message=error_message)
+
+        if prefetch_enumerations:
+            ENUMERATION_CACHE.prefetch_all(channel, server_version)
+
+        return Sherlock(
+            channel=channel,
+            server_version=server_version,
+            metrics=metrics,
+            deadlines=deadlines,
+            read_cache=read_cache,
+        )
+    except Exception as e:
+        LOG.error("Error encountered connecting to Sherlock: %s", e)
+        raise e
+
+
+def _intercept_channel(
+    channel: grpc.Channel,
+    enable_metrics: bool,
+    default_deadline: Optional[float],
+    method_deadlines: Optional[dict[str, Optional[float]]],
+    retry_policy: Optional[RetryPolicy],
+    compression: Union[None, str, CompressionPolicy],
+    coalesced_methods: Optional[tuple[str, ...]],
+    read_cache: Optional[ReadCache],
+) -> tuple[grpc.Channel, Optional[MetricsRegistry], DeadlinePolicy]:
+    """Install the client interceptors enabled by the options of :func:`connect`.
+
+    Returns
+    -------
+    tuple[grpc.Channel, MetricsRegistry | None, DeadlinePolicy]
+        Intercepted channel, registry of the metrics if they are enabled, and deadlines.
+    """
+    metrics = None
+    if enable_metrics:
+        metrics = MetricsRegistry()
+        channel = grpc.intercept_channel(channel, MetricsInterceptor(metrics))
+    compression_policy = get_compression_policy(compression)
+    if compression_policy is not None:
+        channel = grpc.intercept_channel(
+            channel, CompressionInterceptor(compression_policy, metrics)
+        )
+    if retry_policy is not None:
+        channel = grpc.intercept_channel(channel, RetryInterceptor(retry_policy, metrics))
+    if coalesced_methods:
+        channel = grpc.intercept_channel(
+            channel, SingleFlightInterceptor(SingleFlightPolicy(coalesced_methods), metrics)
+        )
+    if read_cache is not None:
+        channel = grpc.intercept_channel(channel, ReadCacheInterceptor(read_cache))
+    deadlines = DeadlinePolicy(default_deadline, method_deadlines)
+    channel = grpc.intercept_channel(channel, DeadlineInterceptor(deadlines))
+    return channel, metrics, deadlines
+
+
+async def connect_async(
+    port: int = SHERLOCK_DEFAULT_PORT,
+    timeout=DEFAULT_CONNECT_TIMEOUT,
+    transport_mode: str = "mtls",
+    certs_dir: str = None,
+    uds_dir: str = None,
+    uds_id: str = None,
+    max_concurrent_calls: int = DEFAULT_MAX_CONCURRENT_CALLS,
+    health_check_ttl: Optional[float] = None,
+    prefetch_enumerations: bool = False,
+    enable_metrics: bool = False,
+    default_deadline: Optional[float] = None,
+    method_deadlines: Optional[dict[str, Optional[float]]] = None,
+    retry_policy: Optional[RetryPolicy] = None,
+    compression: Union[None, str, CompressionPolicy] = None,
+    coalesced_methods: Optional[tuple[str, ...]] = None,
+    read_cache: Optional[ReadCache] = None,
+    enumeration_cache_dir: Optional[str] = None,
+) -> ThreadedAsyncSherlock:
+    r"""Connect to a local instance of Sherlock from asyncio code.
+
+    The API methods of the returned object are coroutine functions running the blocking
+    methods on worker threads, whose RPCs are sent on an asyncio gRPC channel. See
+    :mod:`ansys.sherlock.core.async_sherlock`.
+
+    Available Since: 2025R2
+
+    Parameters
+    ----------
+    port: int, optional
+        Port number for the connection (ignored if transport_mode is "uds").
+        Default is 9090.
+    timeout: int, optional
+        Maximum time (in seconds) to wait for the connection to Sherlock to be established.
+        Default is 120 seconds.
+    transport_mode : str, optional
+        See :func:`launch_and_connect` for usage.
+    certs_dir: str, optional
+        Directory containing the mTLS certificates. Default is "./certs".
+    uds_dir : str, optional
+        Directory for the UDS socket file.
+    uds_id : str, optional
+        Optional ID for the UDS socket file.
+    max_concurrent_calls : int, optional
+        Maximum number of API calls that run at the same time, which is the number of
+        worker threads. Default is 32.
+    health_check_ttl : float, optional
+        See :func:`connect`. Default is 30 seconds.
+    prefetch_enumerations : bool, optional
+        See :func:`connect`. Default is ``False``.
+    enable_metrics : bool, optional
+        See :func:`connect`. The metrics are returned by
+        :meth:`ThreadedAsyncSherlock.metrics`. Default is ``False``.
+    default_deadline : float, optional
+        See :func:`connect`. Default is ``None``, in which case the RPCs have no deadline.
+    method_deadlines : dict[str, float], optional
+        See :func:`connect`.
+    retry_policy : RetryPolicy, optional
+        See :func:`connect`. Default is ``None``, in which case no RPC is retried.
+    compression : str | CompressionPolicy, optional
+        See :func:`connect`. Default is ``None``, in which case requests are not compressed.
+    coalesced_methods : tuple[str, ...], optional
+        See :func:`connect`. Default is ``None``, in which case no request is coalesced.
+    read_cache : ReadCache, optional
+        See :func:`connect`. Default is ``None``, in which case every query is sent to
+        Sherlock.
+    enumeration_cache_dir : str, optional
+        See :func:`connect`.
+
+    Returns
+    -------
+    ThreadedAsyncSherlock
+        The instance of Sherlock, with coroutine versions of every API.
+
+    Examples
+    --------
+    >>> import asyncio
+    >>> from ansys.sherlock.core import launcher
+    >>> async def main():
+    >>>     sherlock = await launcher.connect_async(port=9092, transport_mode="wnua")
+    >>>     conductor_layers, laminate_layers = await asyncio.gather(
+    >>>         sherlock.stackup.list_conductor_layers("Test"),
+    >>>         sherlock.stackup.list_laminate_layers("Test"),
+    >>>     )
+    >>>     await sherlock.close()
+    >>> asyncio.run(main())
+    """
+    try:
+        channel = _connect_grpc_channel(
+            host=LOCALHOST,
+            port=port,
+            uds_dir=uds_dir,
+            uds_id=uds_id,
+            transport_mode=transport_mode,
+            certs_dir=certs_dir,
+            aio=True,
+        )
+        LOG.info("Waiting for Sherlock gRPC service to start...")
+        try:
+            await asyncio.wait_for(channel.channel_ready(), timeout)
+        except asyncio.TimeoutError:
+            raise SherlockConnectionError(message="Error starting gRPC service")
+
+        loop = asyncio.get_running_loop()
+        bridge = AioBridgeChannel(channel, loop)
+        blocking_channel, metrics, deadlines = _intercept_channel(
+            bridge,
+            enable_metrics,
+            default_deadline,
+            method_deadlines,
+            retry_policy,
+            compression,
+            coalesced_methods,
+            read_cache,
+        )
+        get_connection_state_tracker(blocking_channel, ttl=health_check_ttl)
+        ENUMERATION_CACHE.register_channel(
+            blocking_channel,
+            _get_server_address(port, transport_mode, uds_dir, uds_id),
+            enumeration_cache_dir,
+        )
+
+        # Create Common without version since the version is unknown
+        common = Common(channel=blocking_channel, server_version=None)
+        server_version = None
+        try:
+            sherlock_info = await loop.run_in_executor(None, common.get_sherlock_info)
+            if sherlock_info is not None:
+                LOG.info("Connected to Sherlock version: %s", sherlock_info.releaseVersion)
                 server_version = _convert_to_server_version(sherlock_info.releaseVersion)
         except grpc.RpcError as e:
+            bridge.unsubscribe_all()
             error_message = e.details() if e.details() else "Unknown error occurred."
-            LOG.error(f"Server validation error: {error_message}")
+            LOG.error("Server validation error: %s", error_message)
             raise SherlockConnectionError(message=error_message)
 
-        return Sherlock(channel=channel, server_version=server_version)
+        if prefetch_enumerations:
+            await loop.run_in_executor(
+                None, ENUMERATION_CACHE.prefetch_all, blocking_channel, server_version
+            )
+
+        sherlock = Sherlock(
+            channel=blocking_channel,
+            server_version=server_version,
+            metrics=metrics,
+            deadlines=deadlines,
+            read_cache=read_cache,
+        )
+        return ThreadedAsyncSherlock(
+            channel,
+            server_version,
+            max_concurrent_calls=max_concurrent_calls,
+            blocking_channel=bridge,
+            sherlock=sherlock,
+        )
     except Exception as e:
-        LOG.error(f"Error encountered connecting to Sherlock: {str(e)}")
+        LOG.error("Error encountered connecting to Sherlock: %s", e)
         raise e
 
 
+def acquire(
+    year: Optional[int] = None,
+    release_number: Optional[int] = None,
+    transport_mode: str = "mtls",
+    single_project_path: str = "",
+    certs_dir: str = None,
+    uds_dir: str = None,
+    sherlock_command_args: str = "",
+    first_port: int = SHERLOCK_DEFAULT_PORT,
+    timeout: int = DEFAULT_CONNECT_TIMEOUT,
+    attach_timeout: float = 5,
+    launch_if_missing: bool = True,
+    registry_dir: Optional[str] = None,
+) -> Sherlock:
+    r"""Connect to a running instance of Sherlock, launching one only if none is available.
+
+    The instances recorded by :func:`launch` in the instance registry are tried, newest
+    Sherlock version first. The first one that matches the requested version, transport mode
+    and single project, and that answers a health check, is returned. Records of processes
+    that are no longer running are removed from the registry. Instances are shared, not
+    leased: several processes may be connected to the same instance.
+
+    Available Since: 2025R2
+
+    Parameters
+    ----------
+    year: int, optional
+        4-digit year of the Sherlock release. If not provided, any version matches and the
+        latest installed version is launched.
+    release_number: int, optional
+        Release number of Sherlock. If not provided, any release of ``year`` matches.
+    transport_mode: str, optional
+        See :func:`launch_and_connect` for usage.
+    single_project_path : str, optional
+        Path to the Sherlock project of an instance in the single-project mode. If not
+        provided, only instances that are not in the single-project mode match.
+    certs_dir: str, optional
+        Directory containing the mTLS certificates. Default is the directory recorded for
+        the instance, or "./certs".
+    uds_dir: str, optional
+        Directory for the UDS socket file of a launched instance. Default is "$HOME/.conn".
+    sherlock_command_args : str, optional
+        Additional command arguments for launching Sherlock.
+    first_port: int, optional
+        First port tried for a launched instance. Default is 9090.
+    timeout: int, optional
+        Maximum time (in seconds) to wait for a launched instance to accept connections.
+        Default is 120 seconds.
+    attach_timeout: float, optional
+        Maximum time (in seconds) to wait for each running instance to accept connections.
+        Default is 5 seconds.
+    launch_if_missing: bool, optional
+        Whether to launch an instance when no running instance is available. Default is
+        ``True``.
+    registry_dir: str, optional
+        Directory of the instance registry. Default is the ``PYSHERLOCK_INSTANCE_REGISTRY``
+        environment variable, or "$HOME/.pysherlock/instances".
+
+    Returns
+    -------
+    Sherlock
+        The instance of Sherlock.
+
+    Examples
+    --------
+    >>> from ansys.sherlock.core import launcher
+    >>> sherlock = launcher.acquire(year=2026, release_number=1, transport_mode="wnua")
+    """
+    server_version = None
+    if year is not None:
+        two_digit_year = _extract_sherlock_version_year(year)
+        server_version = (
+            two_digit_year if release_number is None else int(f"{two_digit_year}{release_number}")
+        )
+    registry = get_instance_registry(registry_dir)
+    for record in registry.find(transport_mode, server_version, single_project_path):
+        sherlock = _attach(record, certs_dir, attach_timeout)
+        if sherlock is not None:
+            return sherlock
+
+    if not launch_if_missing:
+        raise SherlockConnectionError(message="No running Sherlock instance is available")
+    port = SHERLOCK_DEFAULT_PORT
+    uds_id = None
+    if transport_mode == "uds":
+        uds_id = f"acquire-{uuid.uuid4().hex[:12]}"
+    else:
+        port = _find_available_port(first_port)
+    LOG.info("No running Sherlock instance is available, launching one")
+    launch(
+        port=port,
+        single_project_path=single_project_path,
+        sherlock_command_args=sherlock_command_args,
+        year=year,
+        release_number=release_number,
+        transport_mode=transport_mode,
+        certs_dir=certs_dir,
+        uds_dir=uds_dir,
+        uds_id=uds_id,
+        registry_dir=registry_dir,
+    )
+    return connect(
+        port=port,
+        timeout=timeout,
+        transport_mode=transport_mode,
+        certs_dir=certs_dir,
+        uds_dir=uds_dir,
+        uds_id=uds_id,
+    )
+
+
+def _attach(record: InstanceRecord, certs_dir: Optional[str], timeout: float) -> Optional[Sherlock]:
+    # Connect to a registered instance and check that it answers.
+    try:
+        sherlock = connect(
+            port=record.port or SHERLOCK_DEFAULT_PORT,
+            timeout=timeout,
+            transport_mode=record.transport_mode,
+            certs_dir=certs_dir or record.certs_dir,
+            uds_dir=record.uds_dir,
+            uds_id=record.uds_id,
+        )
+    except Exception as e:
+        LOG.warning("Skipping unreachable Sherlock instance %s: %s", record.key, e)
+        return None
+    if not sherlock.common.check():
+        LOG.warning("Skipping unhealthy Sherlock instance %s", record.key)
+        sherlock.common.channel.close()
+        return None
+    LOG.info("Attached to running Sherlock instance %s", record.key)
+    return sherlock
+
+
+def _register_instance(record: InstanceRecord, registry_dir: Optional[str] = None):
+    # A registry that cannot be written must not prevent launching Sherlock.
+    try:
+        get_instance_registry(registry_dir).register(record)
+    except (OSError, TypeError, ValueError) as e:
+        LOG.warning("Could not record the Sherlock instance in the registry: %s", e)
+
+
+def _find_available_port(first_port: int) -> int:
+    for port in range(first_port, _MAX_PORT + 1):
+        try:
+            _is_port_available(LOCALHOST, port)
+            return port
+        except SherlockCannotUsePortError:
+            continue
+    raise SherlockCannotUsePortError(first_port, "No available port left")
+
+
 def _convert_to_server_version(sherlock_release_version: str) -> int:
     # convert the version returned from Sherlock (e.g. "2025 R1")
     # to the version needed for the API (e.g. 251)
@@ -333,6 +836,16 @@ def _convert_to_server_version(sherlock_release_version: str) -> int:
     return server_version
 
 
+def _get_server_address(
+    port: int, transport_mode: str, uds_dir: str = None, uds_id: str = None
+) -> str:
+    # Identify the server a channel connects to, for sharing state between connections
+    if transport_mode == "uds":
+        socket_name = f"{SHERLOCK_UDS_SERVICE}-{uds_id}" if uds_id else SHERLOCK_UDS_SERVICE
+        return f"uds:{os.path.join(uds_dir or '~/.conn', socket_name)}"
+    return f"{LOCALHOST}:{port}"
+
+
 def _connect_grpc_channel(
     host: str = LOCALHOST,
     port: int = SHERLOCK_DEFAULT_PORT,
@@ -340,7 +853,9 @@ def _connect_grpc_channel(
     uds_id: str = None,
     transport_mode: str = "mtls",
     certs_dir: str = None,
-) -> grpc.Channel:
+    aio: bool = False,
+    grpc_options: Optional[list[tuple[str, object]]] = None,
+) -> grpc.Channel | grpc.aio.Channel:
     """
     Connect to Sherlock gRPC via UDS, TCP, or other transport modes.
 
@@ -358,10 +873,14 @@ def _connect_grpc_channel(
         Transport mode (e.g., "insecure", "wnua", "mtls", "uds").
     certs_dir: str, optional
         Directory containing the mTLS certificates. Default is "./certs".
+    aio: bool, optional
+        Whether to create an asyncio gRPC channel. Default is ``False``.
+    grpc_options: list[tuple[str, object]], optional
+        Additional gRPC channel options. Default is ``None``.
 
     Returns
     -------
-    grpc.Channel
+    grpc.Channel | grpc.aio.Channel
         A gRPC channel connected to Sherlock.
     """
     try:
@@ -374,14 +893,16 @@ def _connect_grpc_channel(
             uds_id=uds_id,
             certs_dir=certs_dir,
             grpc_options=[
-                ("grpc.max_send_message_length", 100 * 1024 * 1024),
-                ("grpc.max_receive_message_length", 100 * 1024 * 1024),
-            ],
+                ("grpc.max_send_message_length", MAX_MESSAGE_LENGTH),
+                ("grpc.max_receive_message_length", MAX_MESSAGE_LENGTH),
+            ]
+            + (grpc_options or []),
+            aio=aio,
         )
-        LOG.info(f"gRPC channel created successfully using transport mode: {transport_mode}")
+        LOG.info("gRPC channel created successfully using transport mode: %s", transport_mode)
         return channel
     except Exception as e:
-        LOG.error(f"Failed to create gRPC channel with mode '{transport_mode}': {e}")
+        LOG.error("Failed to create gRPC channel with mode '%s': %s", transport_mode, e)
         raise
 
 
@@ -394,15 +915,28 @@ def _wait_for_sherlock_grpc_ready(channel, timeout):
         raise SherlockConnectionError(message="Error starting gRPC service")
 
 
-def _get_base_ansys(
-    year: Optional[int] = None, release_number: Optional[int] = None
-) -> tuple[str, int]:
-    supported_installed_versions = {
+def _get_installed_roots() -> dict[str, str]:
+    # Installation directories containing Sherlock, by AWP_ROOT environment variable
+    return {
         env_key: path
         for env_key, path in os.environ.items()
         if env_key.startswith("AWP_ROOT") and os.path.isfile(_get_sherlock_exe_file_path(path))
     }
 
+
+def _get_installed_versions() -> list[int]:
+    # Supported versions of Sherlock installed on this machine, newest first
+    versions = {_get_ansys_version_from_awp_root(key) for key in _get_installed_roots()}
+    return sorted(
+        (version for version in versions if version >= _EARLIEST_SUPPORTED_VERSION), reverse=True
+    )
+
+
+def _get_base_ansys(
+    year: Optional[int] = None, release_number: Optional[int] = None
+) -> tuple[str, int]:
+    supported_installed_versions = _get_installed_roots()
+
     sorted_installed_version_keys = sorted(supported_installed_versions, reverse=True)
 
     if year is not None:
@@ -426,7 +960,7 @@ def _get_base_ansys(
                         f"Sherlock {two_digit_year} {release_number} is not installed."
                     )
             except ValueError as e:
-                LOG.error(f"Error extracting Sherlock version year: {e}")
+                LOG.error("Error extracting Sherlock version year: %s", e)
                 raise e
     else:
         for key in sorted_installed_version_keys:
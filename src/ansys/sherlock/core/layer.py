@@ -23,6 +23,7 @@
 # SOFTWARE.
 
 """Module containing all layer management capabilities."""
+
 from ansys.api.sherlock.v0 import (
     SherlockCommonService_pb2,
     SherlockLayerService_pb2,
@@ -68,6 +69,7 @@ from ansys.sherlock.core.types.layer_types import (
     UpdatePottingRegionRequest,
     UpdateTestPointsRequest,
 )
+from ansys.sherlock.core.utils.streaming import ResponseStream
 from ansys.sherlock.core.utils.version_check import require_version
 
 
@@ -1917,6 +1919,8 @@ class Layer(GrpcStub):
         r"""
         Export one or more 2D Layer Viewer images from a project CCA.
 
+        Available Since: 2025R2
+
         Parameters
         ----------
         project : str
@@ -1994,6 +1998,42 @@ class Layer(GrpcStub):
         >>> ]
         >>> sherlock.layer.export_layer_image("Tutorial Project", "Card", export_layers)
         """
+        return list(self.iter_export_layer_image(project, cca_name, export_layers))
+
+    @require_version(252)
+    def iter_export_layer_image(
+        self, project: str, cca_name: str, export_layers: list[dict[str, bool | int | str | list]]
+    ) -> ResponseStream[SherlockLayerService_pb2.ExportLayerImageResponse]:
+        r"""
+        Export one or more 2D Layer Viewer images and iterate over the results as received.
+
+        Available Since: 2025R2
+
+        Parameters
+        ----------
+        project : str
+            Name of the Sherlock project.
+        cca_name : str
+            Name of the CCA.
+        export_layers : export_layer_image_info
+            List of parameters for the export image specified. See
+            :meth:`export_layer_image` for the content of each dictionary.
+
+        Returns
+        -------
+        ResponseStream[SherlockLayerService_pb2.ExportLayerImageResponse]
+            Stream yielding the status of each exported image as soon as the server sends it.
+            Call ``cancel()`` on it to stop reading the results early.
+
+        Examples
+        --------
+        >>> from ansys.sherlock.core import launcher
+        >>> sherlock, install_dir = launcher.launch_and_connect(transport_mode="wnua")
+        >>> for return_code in sherlock.layer.iter_export_layer_image(
+        >>>     "Tutorial Project", "Card", export_layers
+        >>> ):
+        >>>     print(return_code.message)
+        """
         try:
             if project == "":
                 raise SherlockExportLayerImageError(message="Project name is invalid.")
@@ -2071,10 +2111,7 @@ class Layer(GrpcStub):
                 project=project, ccaName=cca_name, exportLayers=export_layer_image_request
             )
 
-            responses = []
-            for response in self.stub.exportLayerImage(request):
-                responses.append(response)
-            return responses
+            return ResponseStream(self.stub.exportLayerImage(request))
 
         except SherlockExportLayerImageError as e:
             LOG.error(str(e))
@@ -2111,13 +2148,44 @@ class Layer(GrpcStub):
         >>> )
         >>> responses = layer.get_test_point_props(request)
         """
+        return list(self.iter_test_point_props(request))
+
+    @require_version(261)
+    def iter_test_point_props(
+        self, request: GetTestPointPropertiesRequest
+    ) -> ResponseStream[SherlockLayerService_pb2.GetTestPointPropertiesResponse]:
+        """Iterate over the properties of test points as they are received.
+
+        Available Since: 2026R1
+
+        Parameters
+        ----------
+        request: GetTestPointPropertiesRequest
+             Contains all the information needed to return the properties for one or more test
+             points.
+
+        Returns
+        -------
+        ResponseStream[SherlockLayerService_pb2.GetTestPointPropertiesResponse]
+            Stream yielding the properties of each test point as soon as the server sends them.
+            Call ``cancel()`` on it to stop the request early.
+
+        Examples
+        --------
+        >>> from ansys.sherlock.core.types.layer_types import GetTestPointPropertiesRequest
+        >>> from ansys.sherlock.core import launcher
+        >>> sherlock, install_dir = launcher.launch_and_connect(transport_mode="wnua")
+        >>> request = layer_types.GetTestPointPropertiesRequest(
+        >>>    project = "Test Point Test Project"
+        >>>    cca_name = "Main Board"
+        >>>    test_point_ids = "TP1,TP2"
+        >>> )
+        >>> with sherlock.layer.iter_test_point_props(request) as stream:
+        >>>     for test_point_props in stream:
+        >>>         print(test_point_props)
+        """
         get_test_point_props_request = request._convert_to_grpc()
-        responses = []
-        for get_test_point_props_response in self.stub.getTestPointProperties(
-            get_test_point_props_request
-        ):
-            responses.append(get_test_point_props_response)
-        return responses
+        return ResponseStream(self.stub.getTestPointProperties(get_test_point_props_request))
 
     @require_version(261)
     def get_ict_fixtures_props(
@@ -2350,4 +2418,4 @@ class Layer(GrpcStub):
         if not self._is_connection_up():
             raise SherlockNoGrpcConnectionException()
 
-        return self.stub.updateMountPoints(request._convert_to_grpc())
+        return self._send_bulk(self.stub.updateMountPoints, request._convert_to_grpc())
@@ -105,35 +105,21 @@ class Lifecycle(GrpcStub):
 
         Available Since: 2021R1
         """
-        if self._is_connection_up():
-            cycle_type_request = SherlockLifeCycleService_pb2.ListLCTypesRequest()
-            cycle_type_response = self.stub.listLifeCycleTypes(cycle_type_request)
-            if cycle_type_response.returnCode.value == 0:
-                self.CYCLE_TYPE_LIST = cycle_type_response.types
+        self.CYCLE_TYPE_LIST = self._get_enumeration("cycle_types")
 
     def _init_rv_profile_types(self):
         """Initialize the list for RV profile types.
 
         Available Since: 2023R1
         """
-        if self._is_connection_up():
-            rv_profile_request = SherlockLifeCycleService_pb2.ListRandomVibeProfileTypesRequest()
-            rv_profile_response = self.stub.listRandomVibeProfileTypes(rv_profile_request)
-            if rv_profile_response.returnCode.value == 0:
-                self.RV_PROFILE_TYPE_LIST = rv_profile_response.types
+        self.RV_PROFILE_TYPE_LIST = self._get_enumeration("rv_profile_types")
 
     def _init_harmonic_profile_types(self):
         """Initialize the list for harmonic profile types.
 
         Available Since: 2021R1
         """
-        if self._is_connection_up():
-            harmonic_profile_request = (
-                SherlockLifeCycleService_pb2.ListHarmonicProfileTypesRequest()
-            )
-            harmonic_profile_response = self.stub.listHarmonicProfileTypes(harmonic_profile_request)
-            if harmonic_profile_response.returnCode.value == 0:
-                self.HARMONIC_PROFILE_TYPE_LIST = harmonic_profile_response.types
+        self.HARMONIC_PROFILE_TYPE_LIST = self._get_enumeration("harmonic_profile_types")
 
     def _init_ampl_units(self):
         """Initialize the list for amplitude units.
@@ -141,22 +127,14 @@ class Lifecycle(GrpcStub):
         .. deprecated:: 2026 R1
 
         """
-        if self._is_connection_up():
-            ampl_unit_request = SherlockLifeCycleService_pb2.ListAmplUnitsRequest()
-            ampl_type_response = self.stub.listAmplUnits(ampl_unit_request)
-            if ampl_type_response.returnCode.value == 0:
-                self.AMPL_UNIT_LIST = ampl_type_response.amplUnits
+        self.AMPL_UNIT_LIST = self._get_enumeration("ampl_units")
 
     def _init_cycle_states(self):
         """Initialize the list for cycle states.
 
         Available Since: 2021R1
         """
-        if self._is_connection_up():
-            cycle_state_request = SherlockLifeCycleService_pb2.ListLCStatesRequest()
-            cycle_state_response = self.stub.listLifeCycleStates(cycle_state_request)
-            if cycle_state_response.returnCode.value == 0:
-                self.CYCLE_STATE_LIST = cycle_state_response.states
+        self.CYCLE_STATE_LIST = self._get_enumeration("cycle_states")
 
     def _init_load_units(self):
         """Initialize the list for load units.
@@ -164,22 +142,14 @@ class Lifecycle(GrpcStub):
         .. deprecated:: 2026 R1
 
         """
-        if self._is_connection_up():
-            load_unit_request = SherlockLifeCycleService_pb2.ListShockLoadUnitsRequest()
-            load_unit_response = self.stub.listShockLoadUnits(load_unit_request)
-            if load_unit_response.returnCode.value == 0:
-                self.LOAD_UNIT_LIST = load_unit_response.units
+        self.LOAD_UNIT_LIST = self._get_enumeration("load_units")
 
     def _init_shock_shapes(self):
         """Initialize the list for shock shapes.
 
         Available Since: 2021R1
         """
-        if self._is_connection_up():
-            shock_shape_request = SherlockLifeCycleService_pb2.ListShockPulsesRequest()
-            shock_shape_response = self.stub.listShockPulses(shock_shape_request)
-            if shock_shape_response.returnCode.value == 0:
-                self.SHOCK_SHAPE_LIST = shock_shape_response.shockPulse
+        self.SHOCK_SHAPE_LIST = self._get_enumeration("shock_shapes")
 
     @staticmethod
     def _check_load_direction_validity(load_direction: str):
@@ -1056,7 +1026,7 @@ class Lifecycle(GrpcStub):
                 entry.time = e[2]
                 entry.temp = e[3]
 
-        response = self.stub.addThermalProfiles(request)
+        response = self._send_bulk(self.stub.addThermalProfiles, request)
 
         return_code = response.returnCode
 
@@ -0,0 +1,502 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for describing the life cycle of a project and applying only what changed.
+
+A :class:`LifecycleSpec` describes the life phases of a project, their events and the
+profiles of the events, typically in a YAML file kept under version control. Instead of
+deleting and creating the whole life cycle again, :meth:`LifecycleSpec.apply` reads the
+life cycle of the project with ``list_life_cycle_events``, compares it with the
+specification and only sends the calls needed to go from one to the other:
+
+- Phases and events missing from the specification are deleted.
+- Phases and events missing from the project are created, with their events and profiles.
+- Phases whose description changed are updated, along with the durations and the cycles set
+  in the specification.
+- Events whose type or description changed are deleted and added again, since events
+  cannot be updated.
+
+Sherlock only reports the names and descriptions of the phases and events and the types of
+the events. The other fields of the phases and events are taken from the last specification
+applied, which :meth:`LifecycleSpec.apply` stores in the ``state_path`` file, so that applying
+the same specification again sends nothing. Without it, the durations and the cycles of an
+existing phase are sent whenever the specification sets them, and a warning lists the
+existing events whose properties or profiles are ignored, since events cannot be updated.
+Change the description of such an event to have it added again with them.
+"""
+
+import os
+from typing import TYPE_CHECKING, Any, Literal, Optional
+import warnings
+
+from pydantic import BaseModel
+
+from ansys.sherlock.core.types.lifecycle_types import (
+    DeleteEventRequest,
+    DeletePhaseRequest,
+    ListLifeCycleEventsRequest,
+    UpdateLifePhaseRequest,
+)
+from ansys.sherlock.core.utils.optional_dependencies import import_yaml
+
+if TYPE_CHECKING:
+    from ansys.sherlock.core.batch import BatchCallResult
+    from ansys.sherlock.core.sherlock import Sherlock
+
+EVENT_METHODS = {
+    "thermal": ("add_thermal_event", "add_thermal_profiles"),
+    "random_vibe": ("add_random_vibe_event", "add_random_vibe_profiles"),
+    "harmonic": ("add_harmonic_event", "add_harmonic_vibe_profiles"),
+    "shock": ("add_shock_event", "add_shock_profiles"),
+}
+"""Methods of :class:`ansys.sherlock.core.lifecycle.Lifecycle` adding the events and the
+profiles of each event type."""
+
+
+class EventSpec(BaseModel):
+    """Contains the description of a life cycle event."""
+
+    name: str
+    """Name of the event."""
+    type: Literal["thermal", "random_vibe", "harmonic", "shock"]
+    """Type of the event."""
+    description: str = ""
+    """Description of the event."""
+    properties: dict[str, Any] = {}
+    """Keyword arguments of the method adding the event, other than the project, the phase
+    name, the event name and the description. For example, ``num_of_cycles``, ``cycle_type``
+    and ``cycle_state`` for a thermal event."""
+    profiles: list[list] = []
+    """Profiles of the event, each given as the tuple of the method adding the profiles of the
+    event type without its first two elements, the phase name and the event name."""
+
+
+class PhaseSpec(BaseModel):
+    """Contains the description of a life phase."""
+
+    name: str
+    """Name of the life phase."""
+    description: str = ""
+    """Description of the life phase."""
+    duration: Optional[float] = None
+    """Duration of the life phase, required to create it."""
+    duration_units: Optional[str] = None
+    """Units of the duration, required to create the life phase."""
+    num_of_cycles: Optional[float] = None
+    """Number of cycles of the life phase, required to create it."""
+    cycle_type: Optional[str] = None
+    """Cycle type of the life phase, required to create it."""
+    events: list[EventSpec] = []
+    """Events of the life phase."""
+
+
+class PlanStep(BaseModel):
+    """Contains one call of a :class:`LifecyclePlan`."""
+
+    method: str
+    """Name of the method of :class:`ansys.sherlock.core.lifecycle.Lifecycle` to call."""
+    args: list[Any]
+    """Positional arguments of the call."""
+    kwargs: dict[str, Any] = {}
+    """Keyword arguments of the call."""
+    summary: str
+    """Description of the change made by the call."""
+
+
+class LifecyclePlan(BaseModel):
+    """Contains the calls changing the life cycle of a project into a specification."""
+
+    project: str
+    """Name of the Sherlock project."""
+    steps: list[PlanStep] = []
+    """Calls to send, in order."""
+    results: list[Any] = []
+    """Results of the calls, :class:`ansys.sherlock.core.batch.BatchCallResult` objects in the
+    order of the steps, once the plan is applied."""
+
+    def __str__(self) -> str:
+        """Return the plan, one change per line."""
+        if not self.steps:
+            return f"Life cycle of {self.project}: no changes."
+        lines = [f"Life cycle of {self.project}: {len(self.steps)} changes."]
+        lines.extend(f"  {step.summary} ({step.method})" for step in self.steps)
+        return "\n".join(lines)
+
+    def apply(self, sherlock: "Sherlock", max_in_flight: int = 8) -> list["BatchCallResult"]:
+        """Send the calls of the plan in a batch.
+
+        Parameters
+        ----------
+        sherlock: Sherlock
+            Connection to Sherlock.
+        max_in_flight: int, optional
+            Maximum number of calls sent at the same time. The default is ``8``.
+
+        Returns
+        -------
+        list[BatchCallResult]
+            Results of the calls, in the order of the steps.
+        """
+        with sherlock.batch(max_in_flight) as batch:
+            for step in self.steps:
+                getattr(batch.lifecycle, step.method)(*step.args, **step.kwargs)
+        self.results = batch.results
+        return self.results
+
+
+def _event_type(server_type: str) -> str:
+    """Return the event type of :class:`EventSpec` matching a type reported by Sherlock."""
+    normalized = "".join(c for c in server_type.lower() if c.isalpha())
+    for event_type, prefix in (
+        ("thermal", "thermal"),
+        ("random_vibe", "random"),
+        ("harmonic", "harmonic"),
+        ("shock", "shock"),
+        ("shock", "mechanicalshock"),
+    ):
+        if normalized.startswith(prefix):
+            return event_type
+    return normalized
+
+
+class LifecycleSpec(BaseModel):
+    """Contains the description of the life cycle of a project.
+
+    Examples
+    --------
+    >>> from ansys.sherlock.core import launcher
+    >>> from ansys.sherlock.core.lifecycle_spec import LifecycleSpec
+    >>> sherlock = launcher.connect(port=9092, transport_mode="wnua")
+    >>> spec = LifecycleSpec.from_yaml("life_cycle.yaml")
+    >>> spec.apply(sherlock, dry_run=True)
+    >>> plan = spec.apply(sherlock)
+    >>> print([result.succeeded for result in plan.results])
+    """
+
+    project: str
+    """Name of the Sherlock project."""
+    phases: list[PhaseSpec] = []
+    """Life phases of the project."""
+
+    @classmethod
+    def from_yaml(cls, path: str) -> "LifecycleSpec":
+        """Read a specification from a YAML file, which requires PyYAML.
+
+        Parameters
+        ----------
+        path: str
+            Path of the YAML file, holding the fields of :class:`LifecycleSpec`.
+
+        Returns
+        -------
+        LifecycleSpec
+            Specification read from the file.
+        """
+        yaml = import_yaml("LifecycleSpec.from_yaml")
+        with open(path, encoding="utf-8") as file:
+            return cls.model_validate(yaml.safe_load(file))
+
+    @classmethod
+    def read(cls, sherlock: "Sherlock", project: str) -> "LifecycleSpec":
+        """Read the life cycle of a project from Sherlock.
+
+        Only the names, the descriptions and the event types are set, since Sherlock does not
+        report the other properties.
+
+        Parameters
+        ----------
+        sherlock: Sherlock
+            Connection to Sherlock.
+        project: str
+            Name of the Sherlock project.
+
+        Returns
+        -------
+        LifecycleSpec
+            Life cycle of the project.
+        """
+        response = sherlock.lifecycle.list_life_cycle_events(
+            ListLifeCycleEventsRequest(project=project)
+        )
+        return cls(
+            project=project,
+            phases=[
+                PhaseSpec(
+                    name=phase.name,
+                    description=phase.description,
+                    events=[
+                        EventSpec.model_construct(
+                            name=event.name,
+                            type=_event_type(event.type),
+                            description=event.description,
+                            properties={},
+                            profiles=[],
+                        )
+                        for event in phase.lcEvents
+                    ],
+                )
+                for phase in response.lcPhases
+            ],
+        )
+
+    def diff(
+        self, current: "LifecycleSpec", last_applied: Optional["LifecycleSpec"] = None
+    ) -> LifecyclePlan:
+        """Return the calls changing a life cycle into this specification.
+
+        A warning is issued when the specification sets the properties or the profiles of
+        events that already exist, since they are not updated, unless they are those of the
+        last specification applied.
+
+        Parameters
+        ----------
+        current: LifecycleSpec
+            Current life cycle of the project, as returned by :meth:`read`.
+        last_applied: LifecycleSpec, optional
+            Last specification applied to the project, whose durations, cycles, event
+            properties and profiles complete those missing from ``current``. The default is
+            ``None``.
+
+        Returns
+        -------
+        LifecyclePlan
+            Calls to send, deletions first.
+        """
+        if last_applied is not None:
+            current = _complete(current, last_applied)
+        project = self.project
+        plan = LifecyclePlan(project=project)
+        current_phases = {phase.name: phase for phase in current.phases}
+        desired_phases = {phase.name: phase for phase in self.phases}
+        ignored = []
+
+        for name in current_phases:
+            if name not in desired_phases:
+                plan.steps.append(
+                    PlanStep(
+                        method="delete_phase",
+                        args=[DeletePhaseRequest(project=project, phase_name=name)],
+                        summary=f"Delete phase {name}",
+                    )
+                )
+
+        for phase in self.phases:
+            existing = current_phases.get(phase.name)
+            if existing is None:
+                self._add_phase(plan, phase)
+                continue
+            self._update_phase(plan, existing, phase)
+            current_events = {event.name: event for event in existing.events}
+            desired_events = {event.name: event for event in phase.events}
+            for name, event in current_events.items():
+                desired = desired_events.get(name)
+                if desired is None or (desired.type, desired.description) != (
+                    event.type,
+                    event.description,
+                ):
+                    plan.steps.append(
+                        PlanStep(
+                            method="delete_event",
+                            args=[
+                                DeleteEventRequest(
+                                    project=project, phase_name=phase.name, event_name=name
+                                )
+                            ],
+                            summary=f"Delete event {name} of phase {phase.name}",
+                        )
+                    )
+            for event in phase.events:
+                existing_event = current_events.get(event.name)
+                if existing_event is None or (event.type, event.description) != (
+                    existing_event.type,
+                    existing_event.description,
+                ):
+                    self._add_event(plan, phase.name, event)
+                elif (event.properties, event.profiles) not in (
+                    ({}, []),
+                    (existing_event.properties, existing_event.profiles),
+                ):
+                    ignored.append(f"{phase.name}/{event.name}")
+        if ignored:
+            warnings.warn(
+                "The properties and the profiles of existing events are not updated: "
+                + ", ".join(ignored),
+                stacklevel=2,
+            )
+        return plan
+
+    def _update_phase(self, plan: LifecyclePlan, existing: PhaseSpec, phase: PhaseSpec):
+        # Sherlock does not report the durations and the cycles of a phase, so they are sent
+        # whenever the specification sets them and they are not known to be unchanged.
+        changes = {
+            f"new_{field}": getattr(phase, field)
+            for field in ("duration", "duration_units", "num_of_cycles", "cycle_type")
+            if getattr(phase, field) is not None
+            and getattr(phase, field) != getattr(existing, field)
+        }
+        if existing.description != phase.description:
+            changes["new_description"] = phase.description
+        if not changes:
+            return
+        plan.steps.append(
+            PlanStep(
+                method="update_life_phase",
+                args=[
+                    UpdateLifePhaseRequest(project=self.project, phase_name=phase.name, **changes)
+                ],
+                summary=f"Update the {', '.join(name[4:] for name in changes)} of phase "
+                f"{phase.name}",
+            )
+        )
+
+    def _add_phase(self, plan: LifecyclePlan, phase: PhaseSpec):
+        required = ("duration", "duration_units", "num_of_cycles", "cycle_type")
+        missing = [field for field in required if getattr(phase, field) is None]
+        if missing:
+            raise ValueError(f"Phase {phase.name} cannot be created without {', '.join(missing)}.")
+        plan.steps.append(
+            PlanStep(
+                method="create_life_phase",
+                args=[
+                    self.project,
+                    phase.name,
+                    phase.duration,
+                    phase.duration_units,
+                    phase.num_of_cycles,
+                    phase.cycle_type,
+                    phase.description,
+                ],
+                summary=f"Create phase {phase.name}",
+            )
+        )
+        for event in phase.events:
+            self._add_event(plan, phase.name, event)
+
+    def _add_event(self, plan: LifecyclePlan, phase_name: str, event: EventSpec):
+        add_event, add_profiles = EVENT_METHODS[event.type]
+        plan.steps.append(
+            PlanStep(
+                method=add_event,
+                args=[self.project, phase_name, event.name],
+                kwargs={**event.properties, "description": event.description},
+                summary=f"Add {event.type} event {event.name} to phase {phase_name}",
+            )
+        )
+        if event.profiles:
+            plan.steps.append(
+                PlanStep(
+                    method=add_profiles,
+                    args=[
+                        self.project,
+                        [(phase_name, event.name, *profile) for profile in event.profiles],
+                    ],
+                    summary=f"Add {len(event.profiles)} profiles to event {event.name}",
+                )
+            )
+
+    def apply(
+        self,
+        sherlock: "Sherlock",
+        dry_run: bool = False,
+        max_in_flight: int = 8,
+        state_path: Optional[str] = None,
+    ) -> LifecyclePlan:
+        """Change the life cycle of the project into this specification.
+
+        Parameters
+        ----------
+        sherlock: Sherlock
+            Connection to Sherlock.
+        dry_run: bool, optional
+            Whether to only print the calls that would be sent. The default is ``False``.
+        max_in_flight: int, optional
+            Maximum number of calls sent at the same time. The default is ``8``.
+        state_path: str, optional
+            Path of the JSON file holding the last specification applied to the project,
+            typically kept next to the specification. It is read to only send what changed
+            since, and written once every call succeeded. The default is ``None``, in which
+            case the durations and the cycles of existing phases are always sent.
+
+        Returns
+        -------
+        LifecyclePlan
+            Calls sent, with their ``results``, or that would be sent for a dry run.
+        """
+        last_applied = None
+        if state_path is not None and os.path.exists(state_path):
+            with open(state_path, encoding="utf-8") as file:
+                last_applied = LifecycleSpec.model_validate_json(file.read())
+            if last_applied.project != self.project:
+                last_applied = None
+        plan = self.diff(LifecycleSpec.read(sherlock, self.project), last_applied)
+        if dry_run:
+            print(plan)
+            return plan
+        plan.apply(sherlock, max_in_flight)
+        if state_path is not None and all(result.succeeded for result in plan.results):
+            with open(state_path, "w", encoding="utf-8") as file:
+                file.write(self.model_dump_json(indent=2))
+        return plan
+
+
+def _complete(current: LifecycleSpec, last_applied: LifecycleSpec) -> LifecycleSpec:
+    """Return a life cycle read from Sherlock with the fields it lacks from the last spec.
+
+    A field is taken from the last specification applied only for the phases and events that
+    Sherlock still reports, with the same description and event type.
+    """
+    applied_phases = {phase.name: phase for phase in last_applied.phases}
+    phases = []
+    for phase in current.phases:
+        applied = applied_phases.get(phase.name)
+        if applied is None or applied.description != phase.description:
+            phases.append(phase)
+            continue
+        applied_events = {event.name: event for event in applied.events}
+        events = []
+        for event in phase.events:
+            applied_event = applied_events.get(event.name)
+            if applied_event is not None and (applied_event.type, applied_event.description) == (
+                event.type,
+                event.description,
+            ):
+                event = event.model_copy(
+                    update={
+                        "properties": applied_event.properties,
+                        "profiles": applied_event.profiles,
+                    }
+                )
+            events.append(event)
+        phases.append(
+            phase.model_copy(
+                update={
+                    "duration": applied.duration,
+                    "duration_units": applied.duration_units,
+                    "num_of_cycles": applied.num_of_cycles,
+                    "cycle_type": applied.cycle_type,
+                    "events": events,
+                }
+            )
+        )
+    return current.model_copy(update={"phases": phases})
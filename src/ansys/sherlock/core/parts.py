@@ -24,6 +24,8 @@
 
 """Module containing all parts management capabilities."""
 
+from operator import itemgetter
+
 from ansys.api.sherlock.v0 import (
     SherlockCommonService_pb2,
     SherlockPartsService_pb2,
@@ -45,6 +47,7 @@ from ansys.sherlock.core.errors import (
 )
 from ansys.sherlock.core.grpc_stub import GrpcStub
 from ansys.sherlock.core.types.common_types import TableDelimiter
+from ansys.sherlock.core.types.parts_table import PartsTable
 from ansys.sherlock.core.types.parts_types import (
     AVLDescription,
     AVLPartNum,
@@ -54,6 +57,7 @@ from ansys.sherlock.core.types.parts_types import (
     PartsListSearchDuplicationMode,
     UpdatePadPropertiesRequest,
 )
+from ansys.sherlock.core.utils.streaming import ResponseStream
 from ansys.sherlock.core.utils.version_check import require_version
 
 
@@ -92,6 +96,8 @@ class Parts(GrpcStub):
 
         if len(part_locations) == 0:
             raise SherlockUpdatePartsLocationsError(message="Part location properties are missing.")
+        if self._part_loc_columns_are_valid(part_locations):
+            return
         for i, part in enumerate(part_locations):
             if len(part) != 7:
                 raise SherlockUpdatePartsLocationsError(
@@ -156,27 +162,56 @@ class Parts(GrpcStub):
                         message=f"Invalid part location {i}: Location mirrored is invalid."
                     )
 
+    def _part_loc_columns_are_valid(
+        self, part_locations: list[tuple[str, str, str, str, str, str, str]]
+    ) -> bool:
+        """Return whether every part location is valid, checking one column at a time.
+
+        Each column is checked in one pass, and the rotations are only parsed once per
+        distinct value. When this returns ``False``, the part locations are checked one by
+        one to report the first invalid one.
+        """
+        try:
+            if set(map(len, part_locations)) != {7}:
+                return False
+            ref_des, xs, ys, rotations, units, sides, mirrored = (
+                list(map(itemgetter(i), part_locations)) for i in range(7)
+            )
+            if "" in ref_des:
+                return False
+            if self.PART_LOCATION_UNITS is not None and not set(units) <= {
+                "",
+                *self.PART_LOCATION_UNITS,
+            }:
+                return False
+            if "" in units and any(
+                x != "" or y != "" for x, y, unit in zip(xs, ys, units) if unit == ""
+            ):
+                return False
+            for column in (xs, ys):
+                for _ in map(float, column if "" not in column else [v for v in column if v != ""]):
+                    pass
+            if any(r < -360 or r > 360 for r in map(float, set(rotations) - {""})):
+                return False
+            if self.BOARD_SIDES is not None and not set(sides) <= {"", *self.BOARD_SIDES}:
+                return False
+            return set(mirrored) <= {"", "True", "False"}
+        except (TypeError, ValueError):
+            return False
+
     def _init_location_units(self):
         """Initialize units for part location.
 
         Available since: 2022R1
         """
-        if self._is_connection_up():
-            part_location_request = SherlockPartsService_pb2.GetPartLocationUnitsRequest()
-            part_location_response = self.stub.getPartLocationUnits(part_location_request)
-            if part_location_response.returnCode.value == 0:
-                self.PART_LOCATION_UNITS = part_location_response.units
+        self.PART_LOCATION_UNITS = self._get_enumeration("part_location_units")
 
     def _init_board_sides(self):
         """Initialize board sides.
 
         Available Since: 2022R1
         """
-        if self._is_connection_up():
-            board_sides_request = SherlockPartsService_pb2.GetBoardSidesRequest()
-            board_sides_response = self.stub.getBoardSides(board_sides_request)
-            if board_sides_response.returnCode.value == 0:
-                self.BOARD_SIDES = board_sides_response.boardSides
+        self.BOARD_SIDES = self._get_enumeration("board_sides")
 
     @require_version()
     def update_parts_list(
@@ -356,7 +391,7 @@ class Parts(GrpcStub):
 
         self._add_part_loc_request(request, part_loc)
 
-        response = self.stub.updatePartsLocations(request)
+        response = self._send_bulk(self.stub.updatePartsLocations, request)
 
         return_code = response.returnCode
 
@@ -710,10 +745,73 @@ class Parts(GrpcStub):
         >>> )
         >>> print(f"{part_properties}")
         """
+        return list(self.iter_parts_list_properties(request))
+
+    @require_version(252)
+    def iter_parts_list_properties(
+        self, request: GetPartsListPropertiesRequest
+    ) -> ResponseStream[SherlockPartsService_pb2.GetPartsListPropertiesResponse]:
+        """Iterate over the properties of parts in the parts list as they are received.
+
+        Available Since: 2025R2
+
+        Parameters
+        ----------
+        request: GetPartsListPropertiesRequest
+            Contains the information needed to retrieve the properties of parts in the parts list.
+
+        Returns
+        -------
+        ResponseStream[SherlockPartsService_pb2.GetPartsListPropertiesResponse]
+            Stream yielding the properties of each part as soon as the server sends them.
+            Call ``cancel()`` on it to stop the request early.
+
+        Examples
+        --------
+        >>> from ansys.sherlock.core.types.parts_types import (GetPartsListPropertiesRequest)
+        >>> from ansys.sherlock.core import launcher
+        >>> sherlock, install_dir = launcher.launch_and_connect(transport_mode="wnua")
+        >>> with sherlock.parts.iter_parts_list_properties(
+        >>>     GetPartsListPropertiesRequest(project="Test", cca_name="Card")
+        >>> ) as stream:
+        >>>     for part_properties in stream:
+        >>>         print(f"{part_properties}")
+        """
         if not self._is_connection_up():
             raise SherlockNoGrpcConnectionException()
 
-        return list(self.stub.getPartsListProperties(request._convert_to_grpc()))
+        return ResponseStream(self.stub.getPartsListProperties(request._convert_to_grpc()))
+
+    @require_version(252)
+    def get_parts_table(self, request: GetPartsListPropertiesRequest) -> PartsTable:
+        """Return the properties of parts in the parts list as a columnar table.
+
+        Available Since: 2025R2
+
+        The responses are added to the table as they are received, so the whole list of
+        responses is never held in memory.
+
+        Parameters
+        ----------
+        request: GetPartsListPropertiesRequest
+            Contains the information needed to retrieve the properties of parts in the parts list.
+
+        Returns
+        -------
+        PartsTable
+            Table with one column per property and one row per part.
+
+        Examples
+        --------
+        >>> from ansys.sherlock.core.types.parts_types import (GetPartsListPropertiesRequest)
+        >>> from ansys.sherlock.core import launcher
+        >>> sherlock, install_dir = launcher.launch_and_connect(transport_mode="wnua")
+        >>> table = sherlock.parts.get_parts_table(
+        >>>     GetPartsListPropertiesRequest(project="Test", cca_name="Card")
+        >>> )
+        >>> records = table.to_numpy()
+        """
+        return PartsTable.from_responses(self.iter_parts_list_properties(request))
 
     @require_version(241)
     def update_parts_from_AVL(
@@ -932,7 +1030,7 @@ class Parts(GrpcStub):
                         property_obj.name = prop_dict["name"]
                         property_obj.value = prop_dict["value"]
 
-            response = self.stub.updatePartsListProperties(request)
+            response = self._send_bulk(self.stub.updatePartsListProperties, request)
 
             return_code = response.returnCode
 
@@ -1078,12 +1176,51 @@ class Parts(GrpcStub):
         >>>     message={res.returnCode.message},\
         >>>     reference_designators={res.reference_designators}")
         """
+        return list(self.iter_update_pad_properties(request))
+
+    @require_version(252)
+    def iter_update_pad_properties(
+        self,
+        request: UpdatePadPropertiesRequest,
+    ) -> ResponseStream[SherlockPartsService_pb2.UpdatePadPropertiesResponse]:
+        r"""Update pad properties for one or more parts and iterate over the results as received.
+
+        Available Since: 2025R2
+
+        Parameters
+        ----------
+        request: UpdatePadPropertiesRequest
+            Contains all the information needed to update the pad properties for one or more parts
+            in a project's CCA.
+
+        Returns
+        -------
+        ResponseStream[SherlockPartsService_pb2.UpdatePadPropertiesResponse]
+            Stream yielding the status of each pad properties update as soon as the server sends
+            it. Call ``cancel()`` on it to stop reading the results early.
+
+        Examples
+        --------
+        >>> from ansys.sherlock.core.types.parts_types import (
+        >>>     UpdatePadPropertiesRequest,
+        >>> )
+        >>> from ansys.sherlock.core import launcher
+        >>> sherlock, install_dir = launcher.launch_and_connect(transport_mode="wnua")
+        >>> request = UpdatePadPropertiesRequest(
+        >>>     project="Assembly Tutorial",
+        >>>     cca_name="Main Board",
+        >>>     reference_designators=["U1", "R2", "C3"]
+        >>> )
+        >>> for res in sherlock.parts.iter_update_pad_properties(request):
+        >>>     print(f"Return code: value={res.returnCode.value},\
+        >>>     message={res.returnCode.message}")
+        """
         if not self._is_connection_up():
             raise SherlockNoGrpcConnectionException()
 
         update_request = request._convert_to_grpc()
 
-        return list(self.stub.updatePadProperties(update_request))
+        return ResponseStream(self.stub.updatePadProperties(update_request))
 
     @require_version(252)
     def delete_parts_from_parts_list(
@@ -1127,12 +1264,51 @@ class Parts(GrpcStub):
         >>>     message={res.returnCode.message},\
         >>>     reference designator={res.reference_designators}")
         """
+        return list(self.iter_delete_parts_from_parts_list(request))
+
+    @require_version(252)
+    def iter_delete_parts_from_parts_list(
+        self,
+        request: DeletePartsFromPartsListRequest,
+    ) -> ResponseStream[SherlockPartsService_pb2.DeletePartsFromPartsListResponse]:
+        r"""Delete parts from the parts list and iterate over the results as received.
+
+        Available Since: 2025R2
+
+        Parameters
+        ----------
+        request: DeletePartsFromPartsListRequest
+            Contains all the information needed to delete parts from the
+            parts list in a project's CCA.
+
+        Returns
+        -------
+        ResponseStream[SherlockPartsService_pb2.DeletePartsFromPartsListResponse]
+            Stream yielding the status of each delete operation as soon as the server sends it.
+            Call ``cancel()`` on it to stop reading the results early.
+
+        Examples
+        --------
+        >>> from ansys.sherlock.core.types.parts_types import (
+        >>>     DeletePartsFromPartsListRequest,
+        >>> )
+        >>> from ansys.sherlock.core import launcher
+        >>> sherlock, install_dir = launcher.launch_and_connect(transport_mode="wnua")
+        >>> request = DeletePartsFromPartsListRequest(
+        >>>     project="Assembly Tutorial",
+        >>>     cca_name="Main Board",
+        >>>     reference_designators=["U1", "R2", "C3"],
+        >>> )
+        >>> for res in sherlock.parts.iter_delete_parts_from_parts_list(request):
+        >>>     print(f"Return code: value={res.returnCode.value},\
+        >>>     message={res.returnCode.message}")
+        """
         if not self._is_connection_up():
             raise SherlockNoGrpcConnectionException()
 
         delete_request = request._convert_to_grpc()
 
-        return list(self.stub.deletePartsFromPartsList(delete_request))
+        return ResponseStream(self.stub.deletePartsFromPartsList(delete_request))
 
     @require_version(261)
     def import_parts_to_avl(
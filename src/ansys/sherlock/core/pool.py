@@ -0,0 +1,490 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for distributing work across several Sherlock instances."""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+import os
+import shutil
+import tempfile
+import threading
+import time
+from typing import Callable, Iterator, Optional
+
+import grpc
+
+from ansys.sherlock.core import LOG, launcher
+from ansys.sherlock.core.errors import (
+    SherlockCannotUsePortError,
+    SherlockConnectionError,
+    SherlockNoGrpcConnectionException,
+)
+from ansys.sherlock.core.sherlock import Sherlock
+from ansys.sherlock.core.utils.cyberchannel import determine_uds_folder
+from ansys.sherlock.core.utils.instance_registry import (
+    InstanceRecord,
+    InstanceRegistry,
+    _terminate_process,
+)
+
+_MAX_PORT = 65535
+
+
+class _PoolInstance:
+    """State of one Sherlock instance of the pool."""
+
+    def __init__(self, port: Optional[int], uds_id: Optional[str], launched: bool):
+        self.port = port
+        self.uds_id = uds_id
+        self.launched = launched
+        self.record: Optional[InstanceRecord] = None
+        self.sherlock: Optional[Sherlock] = None
+        self.retired: list[Sherlock] = []
+        self.active_leases = 0
+        self.completed_jobs = 0
+        self.restarts = 0
+        self.healthy = False
+        self.restarting = False
+
+    def __repr__(self):
+        address = f"uds_id={self.uds_id}" if self.uds_id else f"port={self.port}"
+        return (
+            f"<SherlockPool instance {address} healthy={self.healthy} "
+            f"active_leases={self.active_leases}>"
+        )
+
+
+class SherlockPool:
+    """Pool of Sherlock instances that hands out leased connections and runs jobs.
+
+    The pool either launches its instances with :func:`ansys.sherlock.core.launcher.launch`
+    or attaches to instances that are already running. Leases go to the healthy instance
+    with the fewest active leases. An instance that fails its health check is evicted from
+    the pool and, if the pool launched it, its process is terminated and it is restarted in
+    the background. The instances launched by the pool are recorded in a private registry
+    instead of the instance registry, so that :func:`ansys.sherlock.core.launcher.acquire`
+    never attaches to them.
+
+    Parameters
+    ----------
+    size: int, optional
+        Number of instances to launch. Ignored when ``ports`` or ``uds_ids`` are given.
+        The default is ``2``.
+    ports: list[int], optional
+        Ports of the instances. If not provided and ``launch`` is ``True``, available ports
+        are picked from ``first_port`` upward.
+    uds_ids: list[str], optional
+        UDS identifiers of the instances when ``transport_mode`` is ``"uds"``. If not
+        provided and ``launch`` is ``True``, unused identifiers are generated.
+    launch: bool, optional
+        Whether the pool launches the instances. If ``False``, the pool attaches to
+        instances already running on ``ports`` or ``uds_ids``. The default is ``True``.
+    first_port: int, optional
+        First port tried when picking ports automatically. The default is ``9090``.
+    transport_mode: str, optional
+        See :func:`ansys.sherlock.core.launcher.launch_and_connect` for usage.
+    certs_dir: str, optional
+        Directory containing the mTLS certificates. Default is "./certs".
+    uds_dir: str, optional
+        Directory for the UDS socket files. Default is "$HOME/.conn".
+    single_project_path : str, optional
+        Path to the Sherlock project if invoking Sherlock in the single-project mode.
+    sherlock_command_args : str, optional
+        Additional command arguments for launching Sherlock.
+    year: int, optional
+        4-digit year of the Sherlock release to launch.
+    release_number: int, optional
+        Release number of Sherlock to launch.
+    timeout: int, optional
+        Maximum time (in seconds) to wait for each instance to accept connections.
+        The default is ``120``.
+    max_leases_per_instance: int, optional
+        Maximum number of leases held on one instance at the same time. The default is ``1``.
+
+    Examples
+    --------
+    >>> from ansys.sherlock.core.pool import SherlockPool
+    >>> def run(sherlock, project):
+    >>>     return sherlock.project.list_ccas(project)
+    >>> with SherlockPool(size=4, transport_mode="wnua") as pool:
+    >>>     futures = [pool.submit(run, project) for project in ["Test1", "Test2", "Test3"]]
+    >>>     results = [future.result() for future in futures]
+    """
+
+    def __init__(
+        self,
+        size: int = 2,
+        ports: Optional[list[int]] = None,
+        uds_ids: Optional[list[str]] = None,
+        launch: bool = True,
+        first_port: int = launcher.SHERLOCK_DEFAULT_PORT,
+        transport_mode: str = "mtls",
+        certs_dir: str = None,
+        uds_dir: str = None,
+        single_project_path: str = "",
+        sherlock_command_args: str = "",
+        year: Optional[int] = None,
+        release_number: Optional[int] = None,
+        timeout: int = launcher.DEFAULT_CONNECT_TIMEOUT,
+        max_leases_per_instance: int = 1,
+    ):
+        """Launch or attach to the instances of the pool."""
+        self.transport_mode = transport_mode
+        self.certs_dir = certs_dir
+        self.uds_dir = uds_dir
+        self.single_project_path = single_project_path
+        self.sherlock_command_args = sherlock_command_args
+        self.year = year
+        self.release_number = release_number
+        self.timeout = timeout
+        self.max_leases_per_instance = max_leases_per_instance
+        self._condition = threading.Condition()
+        self._closed = False
+        self._exit_sherlock = True
+        self._restart_threads: list[threading.Thread] = []
+        # Private registry recording the pid of each instance launched, to terminate it.
+        self._registry_dir = tempfile.mkdtemp(prefix="pysherlock-pool-") if launch else None
+        self._registry = InstanceRegistry(self._registry_dir) if launch else None
+
+        if transport_mode == "uds":
+            if uds_ids is None:
+                if not launch:
+                    raise ValueError("uds_ids are required to attach to running instances.")
+                uds_ids = self._pick_uds_ids(size)
+            self.instances = [_PoolInstance(None, uds_id, launch) for uds_id in uds_ids]
+        else:
+            if ports is None:
+                if not launch:
+                    raise ValueError("ports are required to attach to running instances.")
+                ports = self._pick_ports(size, first_port)
+            self.instances = [_PoolInstance(port, None, launch) for port in ports]
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=len(self.instances) * max_leases_per_instance,
+            thread_name_prefix="pysherlock-pool",
+        )
+        with ThreadPoolExecutor(max_workers=len(self.instances)) as starter:
+            errors = [
+                error
+                for error in starter.map(self._start_instance, self.instances)
+                if error is not None
+            ]
+        if len(errors) == len(self.instances):
+            self.close(exit_sherlock=False)
+            raise SherlockConnectionError(
+                message=f"No Sherlock instance could be started: {errors}"
+            )
+
+    @staticmethod
+    def _pick_ports(size: int, first_port: int, exclude: tuple[int, ...] = ()) -> list[int]:
+        ports = []
+        port = first_port
+        while len(ports) < size:
+            if port > _MAX_PORT:
+                raise SherlockCannotUsePortError(port, "No available port left")
+            if port not in exclude:
+                try:
+                    launcher._is_port_available(launcher.LOCALHOST, port)
+                    ports.append(port)
+                except SherlockCannotUsePortError:
+                    pass
+            port += 1
+        return ports
+
+    def _pick_uds_ids(self, size: int) -> list[str]:
+        uds_folder = determine_uds_folder(self.uds_dir)
+        uds_ids = []
+        index = 0
+        while len(uds_ids) < size:
+            uds_id = f"pool-{os.getpid()}-{index}"
+            socket_name = f"{launcher.SHERLOCK_UDS_SERVICE}-{uds_id}.sock"
+            if not (uds_folder / socket_name).exists():
+                uds_ids.append(uds_id)
+            index += 1
+        return uds_ids
+
+    def _start_instance(self, instance: _PoolInstance) -> Optional[Exception]:
+        """Launch an instance if needed and connect to it."""
+        try:
+            if instance.launched:
+                launcher.launch(
+                    port=instance.port or launcher.SHERLOCK_DEFAULT_PORT,
+                    single_project_path=self.single_project_path,
+                    sherlock_command_args=self.sherlock_command_args,
+                    year=self.year,
+                    release_number=self.release_number,
+                    transport_mode=self.transport_mode,
+                    certs_dir=self.certs_dir,
+                    uds_dir=self.uds_dir,
+                    uds_id=instance.uds_id,
+                    registry_dir=self._registry_dir,
+                )
+                instance.record = self._find_record(instance)
+                with self._condition:
+                    if self._closed:
+                        raise SherlockConnectionError(message="The Sherlock pool is closed.")
+            sherlock = launcher.connect(
+                port=instance.port or launcher.SHERLOCK_DEFAULT_PORT,
+                timeout=self.timeout,
+                transport_mode=self.transport_mode,
+                certs_dir=self.certs_dir,
+                uds_dir=self.uds_dir,
+                uds_id=instance.uds_id,
+            )
+        except Exception as e:
+            LOG.error("Error starting pool instance %s: %s", instance, e)
+            # Terminate the process, which may still be starting, so that it does not leak.
+            self._terminate(instance)
+            with self._condition:
+                instance.restarting = False
+                self._condition.notify_all()
+            return e
+
+        with self._condition:
+            closed = self._closed
+            if not closed:
+                instance.sherlock = sherlock
+                instance.healthy = True
+            instance.restarting = False
+            self._condition.notify_all()
+        if closed:
+            # The pool was closed while the instance was starting, so close() skipped it.
+            if instance.launched and self._exit_sherlock:
+                try:
+                    sherlock.common.exit(close_sherlock_client=True)
+                except Exception:
+                    self._terminate(instance)
+            _close_channel(sherlock)
+        return None
+
+    def _find_record(self, instance: _PoolInstance) -> Optional[InstanceRecord]:
+        return next(
+            (
+                r
+                for r in self._registry.records()
+                if (r.uds_id == instance.uds_id if instance.uds_id else r.port == instance.port)
+            ),
+            None,
+        )
+
+    def _terminate(self, instance: _PoolInstance):
+        """Terminate the process of an instance launched by the pool, if it is known."""
+        record, instance.record = instance.record, None
+        if record is not None:
+            _terminate_process(record.pid)
+            self._registry.unregister(record)
+
+    def _is_healthy(self, instance: _PoolInstance) -> bool:
+        try:
+            return instance.sherlock is not None and instance.sherlock.common.check()
+        except Exception:
+            return False
+
+    def _evict(self, instance: _PoolInstance):
+        """Remove an unhealthy instance from rotation and restart it if it was launched."""
+        with self._condition:
+            if not instance.healthy:
+                return
+            instance.healthy = False
+            LOG.warning("Evicting unhealthy Sherlock instance %s", instance)
+            if not instance.launched or self._closed:
+                self._condition.notify_all()
+                return
+            instance.restarting = True
+            instance.restarts += 1
+            retired, instance.sherlock = instance.sherlock, None
+            if instance.active_leases:
+                # Other leases may still use the connection, so it is closed once they end.
+                instance.retired.append(retired)
+                retired = None
+        _close_channel(retired)
+        # The process may hang rather than exit, so terminate it before launching another.
+        self._terminate(instance)
+        with self._condition:
+            if self._closed:
+                instance.restarting = False
+                self._condition.notify_all()
+                return
+            # The restart thread is tracked so that close() waits for it.
+            thread = threading.Thread(
+                target=self._restart, args=(instance,), name="pysherlock-pool-restart", daemon=True
+            )
+            self._restart_threads = [t for t in self._restart_threads if t.is_alive()]
+            self._restart_threads.append(thread)
+            thread.start()
+
+    def _restart(self, instance: _PoolInstance):
+        with self._condition:
+            if self._closed:
+                instance.restarting = False
+                self._condition.notify_all()
+                return
+        if instance.port is not None:
+            try:
+                launcher._is_port_available(launcher.LOCALHOST, instance.port)
+            except SherlockCannotUsePortError:
+                # The dead instance still holds its port, so move to another one.
+                ports = [other.port for other in self.instances]
+                instance.port = self._pick_ports(1, instance.port + 1, tuple(ports))[0]
+        self._start_instance(instance)
+
+    def _acquire(self, timeout: Optional[float]) -> _PoolInstance:
+        deadline = None if timeout is None else time.monotonic() + timeout
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise SherlockConnectionError(message="The Sherlock pool is closed.")
+                candidates = [
+                    instance
+                    for instance in self.instances
+                    if instance.healthy and instance.active_leases < self.max_leases_per_instance
+                ]
+                if candidates:
+                    instance = min(candidates, key=lambda i: (i.active_leases, i.completed_jobs))
+                    instance.active_leases += 1
+                    return instance
+                if not any(instance.healthy or instance.restarting for instance in self.instances):
+                    raise SherlockConnectionError(message="No healthy Sherlock instance left.")
+                remaining = None if deadline is None else deadline - time.monotonic()
+                if remaining is not None and remaining <= 0:
+                    raise SherlockConnectionError(
+                        message="Timed out waiting for an available Sherlock instance."
+                    )
+                self._condition.wait(remaining)
+
+    def _release(self, instance: _PoolInstance):
+        retired = []
+        with self._condition:
+            instance.active_leases -= 1
+            instance.completed_jobs += 1
+            if not instance.active_leases:
+                retired, instance.retired = instance.retired, []
+            self._condition.notify_all()
+        for sherlock in retired:
+            _close_channel(sherlock)
+
+    @contextmanager
+    def lease(self, timeout: Optional[float] = None) -> Iterator[Sherlock]:
+        """Lease the least-loaded healthy instance of the pool.
+
+        Parameters
+        ----------
+        timeout: float, optional
+            Maximum time (in seconds) to wait for an instance. The default is ``None``,
+            in which case the call waits until an instance is available.
+
+        Yields
+        ------
+        Sherlock
+            Connection to the leased instance.
+        """
+        while True:
+            instance = self._acquire(timeout)
+            if self._is_healthy(instance):
+                break
+            self._release(instance)
+            self._evict(instance)
+
+        try:
+            yield instance.sherlock
+        except (grpc.RpcError, SherlockNoGrpcConnectionException):
+            if not self._is_healthy(instance):
+                self._evict(instance)
+            raise
+        finally:
+            self._release(instance)
+
+    def submit(self, job: Callable[..., object], *args, **kwargs) -> Future:
+        """Schedule a job on the least-loaded healthy instance.
+
+        Parameters
+        ----------
+        job: Callable[..., object]
+            Callable receiving a :class:`ansys.sherlock.core.sherlock.Sherlock` connection
+            followed by ``args`` and ``kwargs``.
+
+        Returns
+        -------
+        concurrent.futures.Future
+            Future holding the return value of the job.
+        """
+
+        def run():
+            with self.lease() as sherlock:
+                return job(sherlock, *args, **kwargs)
+
+        return self._executor.submit(run)
+
+    def close(self, exit_sherlock: bool = True):
+        """Stop scheduling jobs and release the instances.
+
+        Parameters
+        ----------
+        exit_sherlock: bool, optional
+            Whether to close the Sherlock clients that the pool launched. The default is
+            ``True``.
+        """
+        with self._condition:
+            self._closed = True
+            self._exit_sherlock = exit_sherlock
+            self._condition.notify_all()
+            restart_threads, self._restart_threads = self._restart_threads, []
+        self._executor.shutdown(wait=True)
+        for thread in restart_threads:
+            thread.join()
+        for instance in self.instances:
+            for retired in instance.retired:
+                _close_channel(retired)
+            instance.retired = []
+            if instance.sherlock is None:
+                continue
+            if exit_sherlock and instance.launched and instance.healthy:
+                try:
+                    instance.sherlock.common.exit(close_sherlock_client=True)
+                except Exception as e:
+                    LOG.warning("Error closing pool instance %s: %s", instance, e)
+            _close_channel(instance.sherlock)
+            instance.healthy = False
+        if self._registry_dir is not None:
+            shutil.rmtree(self._registry_dir, ignore_errors=True)
+            self._registry_dir = None
+
+    def __enter__(self):
+        """Enter the runtime context of the pool."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Close the pool when leaving the runtime context."""
+        self.close()
+        return False
+
+
+def _close_channel(sherlock: Optional[Sherlock]):
+    if sherlock is None:
+        return
+    try:
+        sherlock.common.channel.close()
+    except Exception:
+        pass
@@ -22,15 +22,36 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-"""PySherlock logger."""
+"""PySherlock logger.
+
+By default, records are only written to the standard output, by the thread that logs them.
+Writing them to a log file, such as ``PySherlock.log``, is opt-in, and the file is only
+created when the first record is written. The level, the log file and whether the records
+are written by a background thread are set with :meth:`Logger.configure`, or with the
+``PYSHERLOCK_LOG_LEVEL``, ``PYSHERLOCK_LOG_FILE`` and ``PYSHERLOCK_LOG_QUEUE`` environment
+variables.
+"""
+
+import atexit
 from datetime import datetime
 import logging
-from logging.handlers import TimedRotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, TimedRotatingFileHandler
+import os
+import queue
 import sys
+import threading
+from typing import Optional, Union
 
 LOG_LEVEL = logging.DEBUG
 FILE_NAME = "PySherlock.log"
 
+LOG_LEVEL_ENV_VAR = "PYSHERLOCK_LOG_LEVEL"
+"""Environment variable setting the default level, for example ``"WARNING"``."""
+LOG_FILE_ENV_VAR = "PYSHERLOCK_LOG_FILE"
+"""Environment variable setting the default log file, for example ``"PySherlock.log"``."""
+LOG_QUEUE_ENV_VAR = "PYSHERLOCK_LOG_QUEUE"
+"""Environment variable enabling the background thread by default when set to ``"1"``."""
+
 # Formatting
 STDOUT_MSG_FORMAT = logging.Formatter("%(levelname)s - %(module)s - %(funcName)s - %(message)s")
 FILE_MSG_FORMAT = STDOUT_MSG_FORMAT
@@ -40,38 +61,197 @@ LEVEL - INSTANCE NAME - MODULE - FUNCTION - MESSAGE
 """
 DEFAULT_FILE_HEADER = DEFAULT_STDOUT_HEADER
 
-NEW_SESSION_HEADER = f"""
+
+def _new_session_header() -> str:
+    return f"""
 ===============================================================================
        NEW SESSION - {datetime.now().strftime("%m/%d/%Y, %H:%M:%S")}
 ==============================================================================="""
 
 
+class _DeferredFileHandler(TimedRotatingFileHandler):
+    """Log file rotated at midnight, only opened when the first record is written."""
+
+    def __init__(self, file_name: str):
+        super().__init__(file_name, when="midnight", delay=True)
+        self.setFormatter(FILE_MSG_FORMAT)
+        self._session_started = False
+
+    def _open(self):
+        stream = super()._open()
+        if not self._session_started:
+            stream.write(_new_session_header())
+            stream.write(DEFAULT_FILE_HEADER)
+            self._session_started = True
+        return stream
+
+
 def _get_console_handler():
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(STDOUT_MSG_FORMAT)
     return console_handler
 
 
-def _get_file_handler():
-    file_handler = TimedRotatingFileHandler(FILE_NAME, when="midnight")
-    file_handler.setFormatter(STDOUT_MSG_FORMAT)
-    file_handler.stream.write(NEW_SESSION_HEADER)
-    file_handler.stream.write(DEFAULT_FILE_HEADER)
-    return file_handler
+def _get_file_handler(file_name: str = FILE_NAME):
+    return _DeferredFileHandler(file_name)
+
+
+def _env_flag(name: str) -> bool:
+    return os.environ.get(name, "").strip().lower() in ("1", "true", "yes", "on")
 
 
 class Logger:
-    """Provides the PySherlock logger."""
+    """Provides the PySherlock logger.
 
-    def __init__(self, logger_name: str):
+    Parameters
+    ----------
+    logger_name: str
+        Name of the underlying :class:`logging.Logger`.
+    level: int or str, optional
+        Level of the logger. The default is ``None``, in which case the level is read from
+        the ``PYSHERLOCK_LOG_LEVEL`` environment variable, or is ``DEBUG``.
+    file_name: str, optional
+        Path of the log file. The default is ``None``, in which case the path is read from
+        the ``PYSHERLOCK_LOG_FILE`` environment variable, or no log file is written. An
+        empty string disables the log file.
+    console: bool, optional
+        Whether to write the records to the standard output. The default is ``True``.
+    use_queue: bool, optional
+        Whether the records are put on a queue and written by a background thread, so that
+        logging never waits for the console or the disk. The default is ``None``, in which
+        case it is enabled by the ``PYSHERLOCK_LOG_QUEUE`` environment variable.
+    """
+
+    def __init__(
+        self,
+        logger_name: str,
+        level: Optional[Union[int, str]] = None,
+        file_name: Optional[str] = None,
+        console: bool = True,
+        use_queue: Optional[bool] = None,
+    ):
         """Initialize logger."""
         self.logger = logging.getLogger(logger_name)
-        self.logger.setLevel(LOG_LEVEL)
-        self.logger.addHandler(_get_console_handler())
-        self.logger.addHandler(_get_file_handler())
+        self._lock = threading.Lock()
+        self._handlers = []
+        self._listener = None
+        self._queue_handler = None
+        self._stop_registered = False
         self.debug = self.logger.debug
         self.info = self.logger.info
         self.warning = self.logger.warning
         self.error = self.logger.error
         self.critical = self.logger.critical
         self.log = self.logger.log
+        self.configure(
+            level=os.environ.get(LOG_LEVEL_ENV_VAR, LOG_LEVEL) if level is None else level,
+            file_name=(os.environ.get(LOG_FILE_ENV_VAR, "") if file_name is None else file_name),
+            console=console,
+            use_queue=_env_flag(LOG_QUEUE_ENV_VAR) if use_queue is None else use_queue,
+        )
+
+    def configure(
+        self,
+        level: Optional[Union[int, str]] = None,
+        file_name: Optional[str] = None,
+        console: Optional[bool] = None,
+        use_queue: Optional[bool] = None,
+    ):
+        """Change the level or the targets of the logger.
+
+        Parameters
+        ----------
+        level: int or str, optional
+            Level of the logger, for example ``logging.WARNING`` or ``"DEBUG"``. Messages
+            below this level are discarded before they are formatted. The default is
+            ``None``, in which case the level is unchanged.
+        file_name: str, optional
+            Path of the log file, which is only created when the first record is written. An
+            empty string disables the log file. The default is ``None``, in which case the
+            log file is unchanged.
+        console: bool, optional
+            Whether to write the records to the standard output. The default is ``None``, in
+            which case this is unchanged.
+        use_queue: bool, optional
+            Whether the records are put on a queue and written by a background thread. The
+            default is ``None``, in which case this is unchanged.
+
+        Examples
+        --------
+        >>> import logging
+        >>> from ansys.sherlock.core import LOG
+        >>> LOG.configure(level=logging.DEBUG, file_name="/var/log/pysherlock.log", use_queue=True)
+        """
+        with self._lock:
+            if level is not None:
+                self.logger.setLevel(level.upper() if isinstance(level, str) else level)
+            if file_name is not None:
+                self._file_name = file_name
+            if console is not None:
+                self._console = console
+            if use_queue is not None:
+                self._use_queue = use_queue
+            if file_name is not None or console is not None or use_queue is not None:
+                self._install_handlers()
+
+    def is_enabled(self, level: int) -> bool:
+        """Return whether messages of a level are logged.
+
+        Parameters
+        ----------
+        level: int
+            Level of the messages, for example ``logging.DEBUG``.
+
+        Returns
+        -------
+        bool
+            ``True`` if the messages are logged, in which case building an expensive message
+            is worth it.
+        """
+        return self.logger.isEnabledFor(level)
+
+    def flush(self):
+        """Write the queued records, if any, and flush the targets."""
+        with self._lock:
+            if self._listener is not None:
+                self._listener.stop()
+                self._listener.start()
+            for handler in self._handlers:
+                handler.flush()
+
+    def close(self):
+        """Write the queued records, if any, and close the targets."""
+        with self._lock:
+            self._remove_handlers()
+
+    def _install_handlers(self):
+        self._remove_handlers()
+        if self._console:
+            self._handlers.append(_get_console_handler())
+        if self._file_name:
+            self._handlers.append(_get_file_handler(self._file_name))
+        if self._use_queue:
+            records = queue.SimpleQueue()
+            self._listener = QueueListener(records, *self._handlers)
+            self._listener.start()
+            self._queue_handler = QueueHandler(records)
+            self.logger.addHandler(self._queue_handler)
+            if not self._stop_registered:
+                atexit.register(self.close)
+                self._stop_registered = True
+        else:
+            for handler in self._handlers:
+                self.logger.addHandler(handler)
+
+    def _remove_handlers(self):
+        if self._queue_handler is not None:
+            self.logger.removeHandler(self._queue_handler)
+            self._queue_handler = None
+        if self._listener is not None:
+            # Stopping the listener writes the records left in the queue.
+            self._listener.stop()
+            self._listener = None
+        for handler in self._handlers:
+            self.logger.removeHandler(handler)
+            handler.close()
+        self._handlers = []
@@ -22,30 +22,218 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-"""Module for the gRPC connection object."""
+"""Module for the gRPC connection object.
+
+The service facades of a connection are only constructed when they are first used, and
+their modules, which import the protobuf modules and the types of each service, are only
+imported then. Processes only using a few services do not pay for importing the others.
+"""
+
+from concurrent.futures import Future
+from contextlib import AbstractContextManager
+import importlib
+from typing import TYPE_CHECKING, Callable, Optional
 
 import grpc
 
-from ansys.sherlock.core.analysis import Analysis
-from ansys.sherlock.core.common import Common
-from ansys.sherlock.core.layer import Layer
-from ansys.sherlock.core.lifecycle import Lifecycle
-from ansys.sherlock.core.model import Model
-from ansys.sherlock.core.parts import Parts
-from ansys.sherlock.core.project import Project
-from ansys.sherlock.core.stackup import Stackup
+from ansys.sherlock.core.utils.futures import submit
+from ansys.sherlock.core.utils.metrics import MetricsRegistry
+
+if TYPE_CHECKING:
+    from ansys.sherlock.core.batch import Batch
+    from ansys.sherlock.core.utils.deadlines import DeadlinePolicy
+    from ansys.sherlock.core.utils.read_cache import ReadCache
+
+
+class _LazyFacade:
+    """Service facade constructed on first access to an attribute of a Sherlock object.
+
+    The facade replaces the descriptor in the instance dictionary, so later accesses are
+    plain attribute lookups.
+    """
+
+    def __init__(self, module: str, class_name: str):
+        self.module = module
+        self.class_name = class_name
+        self.name = None
+
+    def __set_name__(self, owner: type, name: str):
+        self.name = name
+
+    def __get__(self, sherlock: Optional["Sherlock"], owner: Optional[type] = None):
+        if sherlock is None:
+            return self
+        facade_class = getattr(importlib.import_module(self.module), self.class_name)
+        facade = facade_class(sherlock._channel, sherlock._server_version)
+        if sherlock._metrics is not None:
+            facade._metrics = sherlock._metrics
+        # Another thread may have constructed the facade in the meantime.
+        return sherlock.__dict__.setdefault(self.name, facade)
 
 
 class Sherlock:
     """Sherlock gRPC connection object."""
 
-    def __init__(self, channel: grpc.Channel, server_version: int):
+    common = _LazyFacade("ansys.sherlock.core.common", "Common")
+    """Common service, :class:`ansys.sherlock.core.common.Common`."""
+    model = _LazyFacade("ansys.sherlock.core.model", "Model")
+    """Model service, :class:`ansys.sherlock.core.model.Model`."""
+    project = _LazyFacade("ansys.sherlock.core.project", "Project")
+    """Project service, :class:`ansys.sherlock.core.project.Project`."""
+    lifecycle = _LazyFacade("ansys.sherlock.core.lifecycle", "Lifecycle")
+    """Life cycle service, :class:`ansys.sherlock.core.lifecycle.Lifecycle`."""
+    layer = _LazyFacade("ansys.sherlock.core.layer", "Layer")
+    """Layer service, :class:`ansys.sherlock.core.layer.Layer`."""
+    stackup = _LazyFacade("ansys.sherlock.core.stackup", "Stackup")
+    """Stackup service, :class:`ansys.sherlock.core.stackup.Stackup`."""
+    parts = _LazyFacade("ansys.sherlock.core.parts", "Parts")
+    """Parts service, :class:`ansys.sherlock.core.parts.Parts`."""
+    analysis = _LazyFacade("ansys.sherlock.core.analysis", "Analysis")
+    """Analysis service, :class:`ansys.sherlock.core.analysis.Analysis`."""
+
+    def __init__(
+        self,
+        channel: grpc.Channel,
+        server_version: int,
+        metrics: Optional[MetricsRegistry] = None,
+        deadlines: Optional["DeadlinePolicy"] = None,
+        read_cache: Optional["ReadCache"] = None,
+    ):
         """Initialize Sherlock gRPC connection object."""
-        self.common = Common(channel, server_version)
-        self.model = Model(channel, server_version)
-        self.project = Project(channel, server_version)
-        self.lifecycle = Lifecycle(channel, server_version)
-        self.layer = Layer(channel, server_version)
-        self.stackup = Stackup(channel, server_version)
-        self.parts = Parts(channel, server_version)
-        self.analysis = Analysis(channel, server_version)
+        self._channel = channel
+        self._server_version = server_version
+        self._metrics = metrics
+        self._deadlines = deadlines
+        self._read_cache = read_cache
+
+    @property
+    def deadlines(self) -> Optional["DeadlinePolicy"]:
+        """Deadlines of the RPCs of this connection, which can be changed at any time.
+
+        ``None`` if the connection was not created with
+        :func:`ansys.sherlock.core.launcher.connect`.
+        """
+        return self._deadlines
+
+    @property
+    def read_cache(self) -> Optional["ReadCache"]:
+        """Cache of the project queries of this connection, with its hit and miss statistics.
+
+        ``None`` if the connection was not created with a ``read_cache``. See
+        :class:`ansys.sherlock.core.utils.read_cache.ReadCache`.
+        """
+        return self._read_cache
+
+    def batch(self, max_in_flight: int = 8) -> "Batch":
+        """Return a batch recording mutating API calls, sent together when it is flushed.
+
+        Each call is validated when it is recorded. Leaving the ``with`` block sends the
+        calls, with several of them in flight at the same time, while keeping the order of
+        the calls on the same project, CCA, life phase or event. See
+        :class:`ansys.sherlock.core.batch.Batch`.
+
+        Parameters
+        ----------
+        max_in_flight: int, optional
+            Maximum number of calls sent at the same time. The default is ``8``.
+
+        Returns
+        -------
+        Batch
+            Batch of calls, whose ``results`` list the outcome of each call once flushed.
+
+        Examples
+        --------
+        >>> from ansys.sherlock.core import launcher
+        >>> sherlock = launcher.connect(port=9092, transport_mode="wnua")
+        >>> with sherlock.batch() as batch:
+        >>>     batch.lifecycle.create_life_phase("Test", "Phase", 1.5, "sec", 4.0, "COUNT")
+        >>>     batch.lifecycle.add_thermal_event(
+        >>>         "Test", "Phase", "Event", 4.0, "PER YEAR", "STORAGE"
+        >>>     )
+        >>> print([result.succeeded for result in batch.results])
+        """
+        from ansys.sherlock.core.batch import Batch
+
+        return Batch(self, max_in_flight)
+
+    def deadline(self, seconds: float) -> AbstractContextManager:
+        """Return a context manager sharing a time budget between the API calls in a block.
+
+        Every RPC sent in the block, streaming RPCs included, must complete before the
+        budget is exhausted. Otherwise, it raises
+        :class:`ansys.sherlock.core.errors.SherlockDeadlineExceededError`.
+
+        Parameters
+        ----------
+        seconds: float
+            Time (in seconds) within which the API calls of the block must complete. A block
+            nested in another one cannot extend the deadline of the outer block.
+
+        Returns
+        -------
+        AbstractContextManager
+            Context manager applying the deadline.
+
+        Examples
+        --------
+        >>> from ansys.sherlock.core import launcher
+        >>> sherlock = launcher.connect(port=9092, transport_mode="wnua")
+        >>> with sherlock.deadline(30):
+        >>>     sherlock.project.list_ccas("Test")
+        >>>     sherlock.stackup.list_conductor_layers("Test")
+        """
+        from ansys.sherlock.core.utils.deadlines import deadline
+
+        return deadline(seconds)
+
+    def metrics(self) -> Optional[MetricsRegistry]:
+        """Return the metrics recorded for this connection.
+
+        Returns
+        -------
+        MetricsRegistry
+            Registry of the per-method call counts, latencies and message sizes, which can
+            be exported with ``to_json()`` or ``to_prometheus()``. ``None`` if the
+            connection was not created with ``enable_metrics=True``.
+
+        Examples
+        --------
+        >>> from ansys.sherlock.core import launcher
+        >>> sherlock = launcher.connect(port=9092, transport_mode="wnua", enable_metrics=True)
+        >>> sherlock.project.list_ccas("Test")
+        >>> print(sherlock.metrics().snapshot()["api"]["Project.list_ccas"]["calls"])
+        """
+        return self._metrics
+
+    def submit(self, fn: Callable, *args, **kwargs) -> Future:
+        """Run an API method in the background and return the future of its result.
+
+        The result goes through the same checks, and raises the same exceptions, as when the
+        method is called directly. The method runs on worker threads shared by every
+        connection of the process.
+
+        Parameters
+        ----------
+        fn: Callable
+            Method to run, for example ``sherlock.stackup.list_conductor_layers``.
+        *args
+            Positional arguments of the method.
+        **kwargs
+            Keyword arguments of the method.
+
+        Returns
+        -------
+        Future
+            Future of the value returned or the exception raised by the method.
+
+        Examples
+        --------
+        >>> from ansys.sherlock.core import launcher
+        >>> sherlock = launcher.connect(port=9092, transport_mode="wnua")
+        >>> conductor = sherlock.submit(sherlock.stackup.list_conductor_layers, "Test")
+        >>> laminate = sherlock.submit(sherlock.stackup.list_laminate_layers, "Test")
+        >>> thermal = sherlock.submit(sherlock.project.list_thermal_maps, "Test")
+        >>> print(conductor.result(), laminate.result(), thermal.result())
+        """
+        return submit(fn, *args, **kwargs)
@@ -23,6 +23,7 @@
 # SOFTWARE.
 
 """Module containing all stackup management capabilities."""
+
 from typing import Optional
 
 from ansys.api.sherlock.v0 import SherlockStackupService_pb2, SherlockStackupService_pb2_grpc
@@ -69,69 +70,37 @@ class Stackup(GrpcStub):
         .. deprecated:: 2026 R1
 
         """
-        if self._is_connection_up():
-            laminate_thickness_unit_request = (
-                SherlockStackupService_pb2.ListLaminateThicknessUnitsRequest()
-            )
-            laminate_thickness_unit_response = self.stub.listLaminateThicknessUnits(
-                laminate_thickness_unit_request
-            )
-            if laminate_thickness_unit_response.returnCode.value == 0:
-                self.LAMINATE_THICKNESS_UNIT_LIST = laminate_thickness_unit_response.unit
+        self.LAMINATE_THICKNESS_UNIT_LIST = self._get_enumeration("laminate_thickness_units")
 
     def _init_laminate_material_manufacturers(self):
         """Initialize list of laminate material manufacturers.
 
         Available Since: 2021R1
         """
-        if self._is_connection_up():
-            laminate_material_manufacturer_request = (
-                SherlockStackupService_pb2.ListLaminateMaterialsManufacturersRequest()
-            )
-            laminate_material_manufacturer_response = self.stub.listLaminateMaterialsManufacturers(
-                laminate_material_manufacturer_request
-            )
-            if laminate_material_manufacturer_response.returnCode.value == 0:
-                self.LAMINATE_MATERIAL_MANUFACTURER_LIST = (
-                    laminate_material_manufacturer_response.manufacturer
-                )
+        self.LAMINATE_MATERIAL_MANUFACTURER_LIST = self._get_enumeration(
+            "laminate_material_manufacturers"
+        )
 
     def _init_conductor_materials(self):
         """Initialize list of conductor materials.
 
         Available Since: 2021R1
         """
-        if self._is_connection_up():
-            conductor_materials_request = SherlockStackupService_pb2.ListConductorMaterialsRequest()
-            conductor_materials_response = self.stub.listConductorMaterials(
-                conductor_materials_request
-            )
-            if conductor_materials_response.returnCode.value == 0:
-                self.CONDUCTOR_MATERIAL_LIST = conductor_materials_response.conductorMaterial
+        self.CONDUCTOR_MATERIAL_LIST = self._get_enumeration("conductor_materials")
 
     def _init_construction_styles(self):
         """Initialize list of construction styles.
 
         Available Since: 2021R1
         """
-        if self._is_connection_up():
-            construction_style_request = SherlockStackupService_pb2.ListConstructionStylesRequest()
-            construction_style_response = self.stub.listConstructionStyles(
-                construction_style_request
-            )
-            if construction_style_response.returnCode.value == 0:
-                self.CONSTRUCTION_STYLE_LIST = construction_style_response.constructionStyle
+        self.CONSTRUCTION_STYLE_LIST = self._get_enumeration("construction_styles")
 
     def _init_fiber_materials(self):
         """Initialize list of fiber materials.
 
         Available Since: 2021R1
         """
-        if self._is_connection_up():
-            fiber_material_request = SherlockStackupService_pb2.ListFiberMaterialsRequest()
-            fiber_material_response = self.stub.listFiberMaterials(fiber_material_request)
-            if fiber_material_response.returnCode.value == 0:
-                self.FIBER_MATERIAL_LIST = fiber_material_response.fiberMaterial
+        self.FIBER_MATERIAL_LIST = self._get_enumeration("fiber_materials")
 
     def _check_pcb_material_validity(self, manufacturer: str, grade: str, material: str):
         """Check PCB arguments to see if they are valid.
@@ -0,0 +1,651 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for the standby daemon that keeps pre-warmed Sherlock instances ready.
+
+Starting Sherlock takes tens of seconds, which dominates the duration of short jobs. The
+:class:`StandbyDaemon` launches a number of idle instances per installed Sherlock version
+ahead of time and waits until they accept connections. A job then asks the daemon for an
+instance over a local socket with :func:`connect_standby` or :func:`request_instance`, and
+the daemon launches a replacement in the background. An instance handed out belongs to the
+job, which is responsible for closing it.
+
+Every request carries a random token that the daemon writes to a file only its user can
+read, so that other users of the machine cannot take instances from the daemon.
+
+The daemon can be run from the command line::
+
+    python -m ansys.sherlock.core.standby --size 2 --transport-mode uds
+"""
+
+import argparse
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import asdict
+import hmac
+import json
+import os
+import secrets
+import shutil
+import signal
+import socket
+import socketserver
+import tempfile
+import threading
+import time
+from typing import Optional
+import uuid
+
+from ansys.sherlock.core import LOG, launcher
+from ansys.sherlock.core.errors import SherlockCannotUsePortError, SherlockConnectionError
+from ansys.sherlock.core.sherlock import Sherlock
+from ansys.sherlock.core.utils.instance_registry import (
+    InstanceRecord,
+    InstanceRegistry,
+    _terminate_process,
+    _version_matches,
+)
+
+DEFAULT_STANDBY_PORT = 9089
+"""Default local port on which the daemon hands out instances."""
+
+DEFAULT_TOKEN_DIR = os.path.join(os.path.expanduser("~"), ".pysherlock", "standby")
+"""Default directory of the files holding the tokens of the daemons, one per port."""
+
+
+def _token_path(port: int, token_dir: Optional[str] = None) -> str:
+    return os.path.join(token_dir or DEFAULT_TOKEN_DIR, f"{port}.token")
+
+
+def _write_token(path: str, token: str):
+    """Write a token to a file that only the current user can read."""
+    os.makedirs(os.path.dirname(path), mode=0o700, exist_ok=True)
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+    # Create the file with its final permissions, so that the token is never readable by
+    # other users, even for a moment.
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_EXCL, 0o600)
+    with os.fdopen(fd, "w") as file:
+        file.write(token)
+
+
+def _read_token(port: int, token_dir: Optional[str] = None) -> str:
+    with open(_token_path(port, token_dir)) as file:
+        return file.read().strip()
+
+
+class _RequestHandler(socketserver.StreamRequestHandler):
+    """Answers one JSON request, sent as one line, with one JSON line."""
+
+    def handle(self):
+        daemon: StandbyDaemon = self.server.daemon
+        try:
+            request = json.loads(self.rfile.readline())
+            token = str(request.get("token", "")).encode("utf-8")
+            if not hmac.compare_digest(token, daemon._token.encode("utf-8")):
+                response = {"error": "The token of the request is invalid"}
+            elif request.get("command") == "acquire":
+                record = daemon.acquire(request.get("version"), request.get("timeout"))
+                response = {"instance": asdict(record)}
+            elif request.get("command") == "status":
+                response = {"status": daemon.status()}
+            else:
+                response = {"error": f"Unknown command: {request.get('command')}"}
+        except Exception as e:
+            response = {"error": str(e)}
+        self.wfile.write(json.dumps(response).encode("utf-8") + b"\n")
+
+
+class _Server(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, address: tuple[str, int], daemon: "StandbyDaemon"):
+        self.daemon = daemon
+        super().__init__(address, _RequestHandler)
+
+
+class StandbyDaemon:
+    """Keeps idle Sherlock instances warm and hands them out over a local socket.
+
+    Parameters
+    ----------
+    size: int, optional
+        Number of idle instances kept ready per Sherlock version. The default is ``1``.
+    versions: list[int], optional
+        Sherlock versions to keep ready, such as ``[261, 252]``. The default is ``None``, in
+        which case every supported version installed on this machine is kept ready.
+    transport_mode: str, optional
+        Transport mode of the instances: ``"uds"``, ``"mtls"``, ``"insecure"`` or
+        ``"wnua"``. See :func:`ansys.sherlock.core.launcher.launch_and_connect` for usage.
+    single_project_path: str, optional
+        Path to the Sherlock project that every instance opens in the single-project mode.
+        The default is ``""``, in which case the instances are not in the single-project
+        mode.
+    sherlock_command_args: str, optional
+        Additional command arguments for launching Sherlock.
+    certs_dir: str, optional
+        Directory containing the mTLS certificates. Default is "./certs".
+    uds_dir: str, optional
+        Directory for the UDS socket files. Default is "$HOME/.conn".
+    first_port: int, optional
+        First port tried for the instances. The default is ``9090``.
+    timeout: int, optional
+        Maximum time (in seconds) to wait for each instance to accept connections.
+        The default is ``120``.
+    host: str, optional
+        Address on which the daemon hands out instances. The default is ``"127.0.0.1"``.
+    port: int, optional
+        Port on which the daemon hands out instances. ``0`` picks an available port.
+        The default is ``9089``.
+    retry_delay: float, optional
+        Time (in seconds) to wait before launching again after an instance failed to start.
+        The default is ``10``.
+    token_dir: str, optional
+        Directory of the file holding the token that the requests must carry, which only
+        the current user can read. The default is ``None``, in which case
+        ``~/.pysherlock/standby`` is used.
+
+    Examples
+    --------
+    >>> from ansys.sherlock.core.standby import StandbyDaemon, connect_standby
+    >>> with StandbyDaemon(size=2, transport_mode="uds") as daemon:
+    >>>     sherlock = connect_standby(port=daemon.port)
+    >>>     sherlock.project.list_ccas("Test")
+    >>>     sherlock.common.exit(close_sherlock_client=True)
+    """
+
+    def __init__(
+        self,
+        size: int = 1,
+        versions: Optional[list[int]] = None,
+        transport_mode: str = "mtls",
+        single_project_path: str = "",
+        sherlock_command_args: str = "",
+        certs_dir: str = None,
+        uds_dir: str = None,
+        first_port: int = launcher.SHERLOCK_DEFAULT_PORT,
+        timeout: int = launcher.DEFAULT_CONNECT_TIMEOUT,
+        host: str = launcher.LOCALHOST,
+        port: int = DEFAULT_STANDBY_PORT,
+        retry_delay: float = 10.0,
+        token_dir: str = None,
+    ):
+        """Initialize the daemon without launching anything."""
+        if transport_mode not in ("uds", "mtls", "insecure", "wnua"):
+            raise ValueError(f"Unsupported transport mode: {transport_mode}")
+        self.size = size
+        self.versions = list(versions) if versions else launcher._get_installed_versions()
+        if not self.versions:
+            raise ValueError("Could not find any installed version of Sherlock.")
+        self.transport_mode = transport_mode
+        self.single_project_path = single_project_path
+        self.sherlock_command_args = sherlock_command_args
+        self.certs_dir = certs_dir
+        self.uds_dir = uds_dir
+        self.first_port = first_port
+        self.timeout = timeout
+        self.host = host
+        self.port = port
+        self.retry_delay = retry_delay
+        self.token_dir = token_dir
+        self._token = secrets.token_hex(32)
+        self._token_path: Optional[str] = None
+        # Private registry recording the pid and version of each instance launched, created
+        # by start() and removed once the daemon is stopped and no instance is starting.
+        self._registry_dir: Optional[str] = None
+        self._registry: Optional[InstanceRegistry] = None
+        self._condition = threading.Condition()
+        self._idle: dict[int, deque[InstanceRecord]] = {v: deque() for v in self.versions}
+        self._starting: dict[int, int] = {v: 0 for v in self.versions}
+        self._launching = 0
+        self._handed_out = 0
+        self._failures = 0
+        self._ports: set[int] = set()
+        self._closed = False
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._server: Optional[_Server] = None
+
+    def start(self) -> int:
+        """Start handing out instances and launch the idle instances in the background.
+
+        Returns
+        -------
+        int
+            Port on which the daemon hands out instances.
+        """
+        self._registry_dir = tempfile.mkdtemp(prefix="pysherlock-standby-")
+        self._registry = InstanceRegistry(self._registry_dir)
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.size * len(self.versions), thread_name_prefix="pysherlock-standby"
+        )
+        self._server = _Server((self.host, self.port), self)
+        self.port = self._server.server_address[1]
+        self._token_path = _token_path(self.port, self.token_dir)
+        _write_token(self._token_path, self._token)
+        threading.Thread(
+            target=self._server.serve_forever, name="pysherlock-standby-server", daemon=True
+        ).start()
+        for version in self.versions:
+            self._fill(version)
+        LOG.info("Standby daemon listening on %s:%s", self.host, self.port)
+        return self.port
+
+    def acquire(self, version: Optional[int] = None, timeout: Optional[float] = None):
+        """Hand out an idle instance, waiting until one is ready if needed.
+
+        Parameters
+        ----------
+        version: int, optional
+            Sherlock version of the instance, such as ``261``. A two-digit version matches
+            every release of that year. The default is ``None``, in which case an instance
+            of the newest version available is handed out.
+        timeout: float, optional
+            Maximum time (in seconds) to wait for an instance. The default is ``None``, in
+            which case the connection timeout of the daemon is used.
+
+        Returns
+        -------
+        InstanceRecord
+            Instance handed out, which belongs to the caller from now on.
+        """
+        versions = [v for v in self.versions if _version_matches(v, version)]
+        if not versions:
+            raise SherlockConnectionError(message=f"Sherlock {version} is not kept on standby")
+        deadline = time.monotonic() + (self.timeout if timeout is None else timeout)
+        with self._condition:
+            while True:
+                if self._closed:
+                    raise SherlockConnectionError(message="The standby daemon is stopped")
+                record = self._pop_idle(versions)
+                if record is not None:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    raise SherlockConnectionError(
+                        message="No standby Sherlock instance became ready in time"
+                    )
+                self._condition.wait(remaining)
+            self._handed_out += 1
+        self._registry.unregister(record)
+        LOG.info("Handing out standby Sherlock instance %s", record.key)
+        self._fill(record.server_version)
+        return record
+
+    def status(self) -> dict:
+        """Return the number of idle and starting instances of each version.
+
+        Returns
+        -------
+        dict
+            ``"versions"`` maps each version to its numbers of ``"idle"`` and ``"starting"``
+            instances. ``"handed_out"`` and ``"failures"`` count the instances handed out
+            and the launches that failed.
+        """
+        with self._condition:
+            return {
+                "versions": {
+                    str(version): {
+                        "idle": len(self._idle[version]),
+                        "starting": self._starting[version],
+                    }
+                    for version in self.versions
+                },
+                "handed_out": self._handed_out,
+                "failures": self._failures,
+            }
+
+    def stop(self, exit_instances: bool = True):
+        """Stop handing out instances and close the idle instances.
+
+        Parameters
+        ----------
+        exit_instances: bool, optional
+            Whether to close the idle Sherlock instances. The default is ``True``.
+        """
+        with self._condition:
+            self._closed = True
+            idle = [record for records in self._idle.values() for record in records]
+            for records in self._idle.values():
+                records.clear()
+            self._condition.notify_all()
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+        if self._token_path is not None:
+            try:
+                os.remove(self._token_path)
+            except OSError:
+                pass
+            self._token_path = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+        if exit_instances:
+            for record in idle:
+                self._exit(record)
+        with self._condition:
+            # An instance still starting needs the registry to be closed once started.
+            if self._launching == 0:
+                self._remove_registry()
+
+    def _remove_registry(self):
+        if self._registry_dir is not None:
+            shutil.rmtree(self._registry_dir, ignore_errors=True)
+            self._registry_dir = None
+
+    def __enter__(self):
+        """Start the daemon when entering the runtime context."""
+        self.start()
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Stop the daemon when leaving the runtime context."""
+        self.stop()
+        return False
+
+    def _pop_idle(self, versions: list[int]) -> Optional[InstanceRecord]:
+        running = None
+        for version in sorted(versions, reverse=True):
+            idle = self._idle[version]
+            while idle:
+                if running is None:
+                    running = {record.key for record in self._registry.records()}
+                record = idle.popleft()
+                self._ports.discard(record.port)
+                if record.key in running:
+                    return record
+                LOG.warning("Standby Sherlock instance %s exited while idle", record.key)
+                self._fill_locked(version)
+        return None
+
+    def _fill(self, version: int):
+        with self._condition:
+            self._fill_locked(version)
+
+    def _fill_locked(self, version: int):
+        while not self._closed and len(self._idle[version]) + self._starting[version] < self.size:
+            self._starting[version] += 1
+            self._executor.submit(self._warm, version)
+
+    def _next_address(self) -> tuple[Optional[int], Optional[str]]:
+        if self.transport_mode == "uds":
+            return None, f"standby-{uuid.uuid4().hex[:12]}"
+        with self._condition:
+            port = self.first_port
+            while True:
+                if port not in self._ports:
+                    try:
+                        launcher._is_port_available(launcher.LOCALHOST, port)
+                        self._ports.add(port)
+                        return port, None
+                    except SherlockCannotUsePortError:
+                        pass
+                port += 1
+                if port > launcher._MAX_PORT:
+                    raise SherlockCannotUsePortError(self.first_port, "No available port left")
+
+    def _warm(self, version: int):
+        """Launch an instance of a version and wait until it accepts connections."""
+        with self._condition:
+            if self._closed:
+                self._starting[version] -= 1
+                return
+            self._launching += 1
+        record = None
+        try:
+            record = self._launch(version)
+        finally:
+            with self._condition:
+                self._launching -= 1
+                if record is None:
+                    self._starting[version] -= 1
+                    self._fill_locked(version)
+                if self._closed and self._launching == 0:
+                    self._remove_registry()
+
+    def _launch(self, version: int) -> Optional[InstanceRecord]:
+        """Launch an instance, returning its record once ready or ``None`` if it failed."""
+        port, uds_id = None, None
+        launched = False
+        try:
+            port, uds_id = self._next_address()
+            launcher.launch(
+                port=port or launcher.SHERLOCK_DEFAULT_PORT,
+                single_project_path=self.single_project_path,
+                sherlock_command_args=self.sherlock_command_args,
+                year=2000 + version // 10,
+                release_number=version % 10,
+                transport_mode=self.transport_mode,
+                certs_dir=self.certs_dir,
+                uds_dir=self.uds_dir,
+                uds_id=uds_id,
+                registry_dir=self._registry_dir,
+            )
+            launched = True
+            sherlock = launcher.connect(
+                port=port or launcher.SHERLOCK_DEFAULT_PORT,
+                timeout=self.timeout,
+                transport_mode=self.transport_mode,
+                certs_dir=self.certs_dir,
+                uds_dir=self.uds_dir,
+                uds_id=uds_id,
+            )
+            sherlock.common.channel.close()
+            record = self._find_record(port, uds_id)
+            if record is None:
+                raise SherlockConnectionError(message="The instance exited after starting")
+        except Exception as e:
+            LOG.error("Error starting standby Sherlock %s: %s", version, e)
+            if launched:
+                # Terminate the process, which may still be starting, before launching again.
+                record = self._find_record(port, uds_id)
+                if record is not None:
+                    _terminate_process(record.pid)
+                    self._registry.unregister(record)
+            with self._condition:
+                self._failures += 1
+                self._ports.discard(port)
+                # Wait before launching again, unless the daemon is stopped meanwhile.
+                self._condition.wait_for(lambda: self._closed, self.retry_delay)
+            return None
+
+        with self._condition:
+            if not self._closed:
+                self._starting[version] -= 1
+                self._idle[version].append(record)
+                self._condition.notify_all()
+                return record
+        self._exit(record)
+        return None
+
+    def _find_record(self, port: Optional[int], uds_id: Optional[str]) -> Optional[InstanceRecord]:
+        return next(
+            (
+                r
+                for r in self._registry.records()
+                if (r.uds_id == uds_id if uds_id else r.port == port)
+            ),
+            None,
+        )
+
+    def _exit(self, record: InstanceRecord):
+        try:
+            sherlock = launcher.connect(
+                port=record.port or launcher.SHERLOCK_DEFAULT_PORT,
+                timeout=5,
+                transport_mode=record.transport_mode,
+                certs_dir=self.certs_dir,
+                uds_dir=record.uds_dir,
+                uds_id=record.uds_id,
+            )
+            try:
+                sherlock.common.exit(close_sherlock_client=True)
+            finally:
+                sherlock.common.channel.close()
+        except Exception as e:
+            LOG.warning("Error closing standby Sherlock instance %s: %s", record.key, e)
+        self._registry.unregister(record)
+
+
+def request_instance(
+    version: Optional[int] = None,
+    port: int = DEFAULT_STANDBY_PORT,
+    host: str = launcher.LOCALHOST,
+    timeout: float = launcher.DEFAULT_CONNECT_TIMEOUT,
+    token_dir: str = None,
+) -> InstanceRecord:
+    """Ask a standby daemon for an idle Sherlock instance.
+
+    Parameters
+    ----------
+    version: int, optional
+        Sherlock version of the instance, such as ``261``. The default is ``None``, in which
+        case an instance of the newest version available is handed out.
+    port: int, optional
+        Port of the daemon. The default is ``9089``.
+    host: str, optional
+        Address of the daemon. The default is ``"127.0.0.1"``.
+    timeout: float, optional
+        Maximum time (in seconds) to wait for an instance. The default is ``120``.
+    token_dir: str, optional
+        Directory of the token file of the daemon. The default is ``None``, in which case
+        ``~/.pysherlock/standby`` is used.
+
+    Returns
+    -------
+    InstanceRecord
+        Instance handed out, which the caller is responsible for closing.
+    """
+    try:
+        token = _read_token(port, token_dir)
+    except OSError as e:
+        raise SherlockConnectionError(message=f"Error reading the token of the standby daemon: {e}")
+    request = {"command": "acquire", "version": version, "timeout": timeout, "token": token}
+    try:
+        with socket.create_connection((host, port), timeout=timeout + 5) as connection:
+            connection.sendall(json.dumps(request).encode("utf-8") + b"\n")
+            with connection.makefile("rb") as reader:
+                response = json.loads(reader.readline())
+    except (OSError, ValueError) as e:
+        raise SherlockConnectionError(message=f"Error contacting the standby daemon: {e}")
+    if "error" in response:
+        raise SherlockConnectionError(message=response["error"])
+    return InstanceRecord(**response["instance"])
+
+
+def connect_standby(
+    version: Optional[int] = None,
+    port: int = DEFAULT_STANDBY_PORT,
+    host: str = launcher.LOCALHOST,
+    timeout: float = launcher.DEFAULT_CONNECT_TIMEOUT,
+    certs_dir: str = None,
+    token_dir: str = None,
+) -> Sherlock:
+    """Ask a standby daemon for an idle Sherlock instance and connect to it.
+
+    Parameters
+    ----------
+    version: int, optional
+        Sherlock version of the instance, such as ``261``. The default is ``None``, in which
+        case an instance of the newest version available is handed out.
+    port: int, optional
+        Port of the daemon. The default is ``9089``.
+    host: str, optional
+        Address of the daemon. The default is ``"127.0.0.1"``.
+    timeout: float, optional
+        Maximum time (in seconds) to wait for an instance. The default is ``120``.
+    certs_dir: str, optional
+        Directory containing the mTLS certificates. Default is the directory of the daemon.
+    token_dir: str, optional
+        Directory of the token file of the daemon. The default is ``None``, in which case
+        ``~/.pysherlock/standby`` is used.
+
+    Returns
+    -------
+    Sherlock
+        The instance of Sherlock, which the caller is responsible for closing.
+
+    Examples
+    --------
+    >>> from ansys.sherlock.core.standby import connect_standby
+    >>> sherlock = connect_standby(version=261)
+    """
+    record = request_instance(version, port, host, timeout, token_dir)
+    return launcher.connect(
+        port=record.port or launcher.SHERLOCK_DEFAULT_PORT,
+        timeout=timeout,
+        transport_mode=record.transport_mode,
+        certs_dir=certs_dir or record.certs_dir,
+        uds_dir=record.uds_dir,
+        uds_id=record.uds_id,
+    )
+
+
+def main(argv: Optional[list[str]] = None):
+    """Run a standby daemon until it is interrupted."""
+    parser = argparse.ArgumentParser(description="Keep pre-warmed Sherlock instances ready.")
+    parser.add_argument("--size", type=int, default=1)
+    parser.add_argument("--version", type=int, action="append", dest="versions")
+    parser.add_argument(
+        "--transport-mode", default="mtls", choices=["uds", "mtls", "insecure", "wnua"]
+    )
+    parser.add_argument("--single-project-path", default="")
+    parser.add_argument("--sherlock-command-args", default="")
+    parser.add_argument("--certs-dir")
+    parser.add_argument("--uds-dir")
+    parser.add_argument("--first-port", type=int, default=launcher.SHERLOCK_DEFAULT_PORT)
+    parser.add_argument("--timeout", type=int, default=launcher.DEFAULT_CONNECT_TIMEOUT)
+    parser.add_argument("--host", default=launcher.LOCALHOST)
+    parser.add_argument("--port", type=int, default=DEFAULT_STANDBY_PORT)
+    parser.add_argument("--token-dir")
+    args = parser.parse_args(argv)
+
+    daemon = StandbyDaemon(
+        size=args.size,
+        versions=args.versions,
+        transport_mode=args.transport_mode,
+        single_project_path=args.single_project_path,
+        sherlock_command_args=args.sherlock_command_args,
+        certs_dir=args.certs_dir,
+        uds_dir=args.uds_dir,
+        first_port=args.first_port,
+        timeout=args.timeout,
+        host=args.host,
+        port=args.port,
+        token_dir=args.token_dir,
+    )
+    stopped = threading.Event()
+    signal.signal(signal.SIGTERM, lambda signum, frame: stopped.set())
+    with daemon:
+        print(daemon.port, flush=True)
+        try:
+            stopped.wait()
+        except KeyboardInterrupt:
+            pass
+
+
+if __name__ == "__main__":
+    main()
@@ -23,4 +23,14 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-"""PySherlock client library constants for enumerated types."""
+"""PySherlock client library constants for enumerated types.
+
+The modules of the types of each service are imported on first access.
+"""
+
+from ansys.sherlock.core.utils.lazy_import import import_submodule
+
+
+def __getattr__(name: str):
+    """Import a module of types on first access."""
+    return import_submodule(__name__, name)
@@ -677,3 +677,60 @@ class UpdatePottingRegionsPropsRequest(BaseModel):
         for analysis in self.analyses:
             request.analyses.append(analysis._convert_to_grpc())
         return request
+
+
+class RunAnalysisJob(BaseModel):
+    """Contains the arguments of one ``run_analysis`` call of a ``run_analysis_many`` request."""
+
+    project: str
+    """Name of the Sherlock project."""
+    cca_name: str
+    """Name of the CCA."""
+    analyses: list
+    """Tuples (``analysis_type``, ``events``) of the analyses to run, as in ``run_analysis``."""
+
+
+class RunAnalysisJobResult(BaseModel):
+    """Contains the outcome of one job of a ``run_analysis_many`` request."""
+
+    job: RunAnalysisJob
+    """Job that was run."""
+    return_code: Optional[int] = None
+    """Status code of the response, or ``None`` if the job failed."""
+    error: Optional[str] = None
+    """Message of the error raised by the job, or ``None`` if the job succeeded."""
+    start_time: float
+    """Time (in seconds since the epoch) at which the job started."""
+    elapsed: float
+    """Time (in seconds) taken by the job."""
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the job succeeded."""
+        return self.error is None
+
+
+class RunAnalysisManyResult(BaseModel):
+    """Contains the outcome of every job of a ``run_analysis_many`` request."""
+
+    results: list[RunAnalysisJobResult]
+    """Results of the jobs, in the order in which the jobs were given."""
+    max_concurrency: int
+    """Maximum number of jobs that ran at the same time."""
+    elapsed: float
+    """Time (in seconds) taken by all the jobs."""
+
+    @property
+    def succeeded(self) -> list[RunAnalysisJobResult]:
+        """Results of the jobs that succeeded."""
+        return [result for result in self.results if result.succeeded]
+
+    @property
+    def failed(self) -> list[RunAnalysisJobResult]:
+        """Results of the jobs that failed."""
+        return [result for result in self.results if not result.succeeded]
+
+    @property
+    def all_succeeded(self) -> bool:
+        """Whether every job succeeded."""
+        return all(result.succeeded for result in self.results)
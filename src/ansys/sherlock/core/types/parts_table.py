@@ -0,0 +1,451 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module containing a columnar table of parts list properties."""
+
+from array import array
+import math
+from typing import Callable, Iterable, Optional, Union
+
+from ansys.api.sherlock.v0 import SherlockPartsService_pb2
+
+from ansys.sherlock.core.utils.optional_dependencies import import_numpy
+
+REF_DES_COLUMN = "ref_des"
+"""Name of the column holding the reference designators."""
+
+_MISSING = -1
+
+
+def _optional_numpy():
+    """Return NumPy, which speeds up filtering and grouping, or ``None`` if it is not installed."""
+    try:
+        return import_numpy("PartsTable")
+    except ImportError:
+        return None
+
+
+class _Column:
+    """Column of string values stored as codes into a table of interned categories.
+
+    Whether the column is numeric is decided once per category rather than once per row, so
+    converting a column to ``float64`` costs one ``float()`` call per distinct value.
+
+    The columns taken from a column share its categories until one of them adds a new
+    category, so that splitting a table does not copy the categories of every column.
+
+    The codes are copied before growing while a NumPy view of them is alive, so that the
+    view keeps the rows it was created with.
+    """
+
+    def __init__(self):
+        self.categories: list[str] = []
+        self.index: dict[str, int] = {}
+        self.codes = array("i")
+        self._values: Optional[array] = None
+        self._parsed = False
+        self._category_floats: Optional[list[float]] = None
+        self._shared = False
+
+    def _code(self, value: Optional[str]) -> int:
+        if value is None:
+            return _MISSING
+        code = self.index.get(value)
+        if code is None:
+            if self._shared:
+                self.categories = list(self.categories)
+                self.index = dict(self.index)
+                self._shared = False
+            code = len(self.categories)
+            self.index[value] = code
+            self.categories.append(value)
+            self._parsed = False
+        return code
+
+    def _extend(self, codes: list[int]):
+        try:
+            self.codes.extend(codes)
+        except BufferError:
+            self.codes = array("i", self.codes)
+            self.codes.extend(codes)
+        self._values = None
+
+    def append(self, value: Optional[str]):
+        self._extend([self._code(value)])
+
+    def replace_last(self, value: Optional[str]):
+        """Replace the value of the last row, which no NumPy view holds yet."""
+        self.codes[-1] = self._code(value)
+        self._values = None
+
+    def pad(self, length: int):
+        if len(self.codes) < length:
+            self._extend([_MISSING] * (length - len(self.codes)))
+
+    def _category_values(self) -> Optional[list[float]]:
+        """Return the float value of every category, or ``None`` if one is not numeric."""
+        if not self._parsed:
+            values = []
+            for category in self.categories:
+                if category.strip() == "":
+                    values.append(math.nan)
+                    continue
+                try:
+                    values.append(float(category))
+                except ValueError:
+                    values = None
+                    break
+            self._category_floats = values
+            self._parsed = True
+        return self._category_floats
+
+    @property
+    def numeric(self) -> bool:
+        return self._category_values() is not None
+
+    @property
+    def values(self) -> array:
+        """Return the column as a ``float64`` array. Only valid for numeric columns."""
+        if self._values is None:
+            category_values = self._category_values() + [math.nan]  # Code -1 selects NaN
+            self._values = array("d", [category_values[code] for code in self.codes])
+        return self._values
+
+    def take(self, codes: array) -> "_Column":
+        """Return a column with other codes, sharing the categories of this column."""
+        column = _Column()
+        column.categories = self.categories
+        column.index = self.index
+        column.codes = codes
+        column._parsed = self._parsed
+        column._category_floats = self._category_floats
+        column._shared = self._shared = True
+        return column
+
+
+class PartsTable:
+    """Columnar table of the properties of the parts of a parts list.
+
+    Each property is stored as one column keyed by the property name. Values are interned
+    into a table of categories with one ``int32`` code per part, and columns whose values
+    are all numbers are exposed as ``float64`` arrays. Parts that do not have a property
+    get a missing value, which is ``None`` for string columns and ``NaN`` for numeric
+    columns.
+
+    NumPy is not required to build or query the table. It is only needed by
+    :meth:`column_array` and :meth:`to_numpy`.
+
+    Examples
+    --------
+    >>> from ansys.sherlock.core.types.parts_types import GetPartsListPropertiesRequest
+    >>> from ansys.sherlock.core import launcher
+    >>> sherlock, install_dir = launcher.launch_and_connect(transport_mode="wnua")
+    >>> table = sherlock.parts.get_parts_table(
+    >>>     GetPartsListPropertiesRequest(project="Test", cca_name="Card")
+    >>> )
+    >>> heavy = table.filter("mass", lambda mass: mass > 1.0)
+    >>> for package, parts in heavy.groupby("package").items():
+    >>>     print(package, parts.num_rows)
+    """
+
+    def __init__(self):
+        """Initialize an empty table."""
+        self._columns: dict[str, _Column] = {REF_DES_COLUMN: _Column()}
+        self._num_rows = 0
+        self.errors: list[SherlockPartsService_pb2.GetPartsListPropertiesResponse] = []
+        """Responses that reported an error instead of the properties of a part."""
+
+    @classmethod
+    def from_responses(
+        cls, responses: Iterable[SherlockPartsService_pb2.GetPartsListPropertiesResponse]
+    ) -> "PartsTable":
+        """Build a table from the responses of ``get_parts_list_properties``.
+
+        Parameters
+        ----------
+        responses: Iterable[SherlockPartsService_pb2.GetPartsListPropertiesResponse]
+            Responses to add, for example the stream returned by
+            ``Parts.iter_parts_list_properties``. They are consumed one at a time.
+
+        Returns
+        -------
+        PartsTable
+            Table with one row per part.
+        """
+        table = cls()
+        table.extend(responses)
+        return table
+
+    def append(self, response: SherlockPartsService_pb2.GetPartsListPropertiesResponse):
+        """Add the properties of one part to the table.
+
+        Responses whose return code is ``-1`` are added to :attr:`errors` instead. When a
+        response repeats a property, the last value is kept.
+        """
+        if response.returnCode.value == -1:
+            self.errors.append(response)
+            return
+
+        row = self._num_rows
+        self._columns[REF_DES_COLUMN].append(response.refDes)
+        for prop in response.properties:
+            column = self._columns.get(prop.name)
+            if column is None:
+                column = self._columns[prop.name] = _Column()
+            if len(column.codes) > row:
+                column.replace_last(prop.value)
+                continue
+            column.pad(row)
+            column.append(prop.value)
+        self._num_rows += 1
+
+    def extend(self, responses: Iterable[SherlockPartsService_pb2.GetPartsListPropertiesResponse]):
+        """Add the properties of several parts to the table."""
+        for response in responses:
+            self.append(response)
+
+    @property
+    def num_rows(self) -> int:
+        """Number of parts in the table."""
+        return self._num_rows
+
+    @property
+    def column_names(self) -> list[str]:
+        """Names of the columns, starting with the reference designators."""
+        return list(self._columns)
+
+    def _column(self, name: str) -> _Column:
+        try:
+            column = self._columns[name]
+        except KeyError:
+            raise KeyError(f"Unknown column: {name}")
+        column.pad(self._num_rows)
+        return column
+
+    def is_numeric(self, name: str) -> bool:
+        """Return whether every value of a column is a number or missing."""
+        return name != REF_DES_COLUMN and self._column(name).numeric
+
+    def categories(self, name: str) -> list[str]:
+        """Return the distinct values of a column in order of first appearance."""
+        return list(self._column(name).categories)
+
+    def codes(self, name: str) -> array:
+        """Return the ``int32`` category codes of a column. Missing values have code ``-1``."""
+        return self._column(name).codes
+
+    def column(self, name: str) -> Union[array, list[Optional[str]]]:
+        """Return the values of a column.
+
+        Parameters
+        ----------
+        name: str
+            Name of the column.
+
+        Returns
+        -------
+        array.array | list[str | None]
+            ``float64`` array for numeric columns, list of strings otherwise.
+        """
+        column = self._column(name)
+        if self.is_numeric(name):
+            return column.values
+        categories = column.categories + [None]
+        return [categories[code] for code in column.codes]
+
+    def column_array(self, name: str):
+        """Return a column as a NumPy array.
+
+        Numeric columns are returned as ``float64`` values, decoded from the category codes
+        once and cached until parts are added to the table. Other columns are returned as a
+        view on the ``int32`` category codes of the table, without copying. Use
+        :meth:`categories` to decode them. Both arrays are read-only and keep their values
+        when parts are added to the table.
+
+        Parameters
+        ----------
+        name: str
+            Name of the column.
+
+        Returns
+        -------
+        numpy.ndarray
+            Values or codes of the column.
+        """
+        numpy = import_numpy("PartsTable.column_array")
+        column = self._column(name)
+        if self.is_numeric(name):
+            data = numpy.frombuffer(column.values, dtype=numpy.float64)
+        else:
+            data = numpy.frombuffer(column.codes, dtype=numpy.int32)
+        data.flags.writeable = False
+        return data
+
+    def to_numpy(self, columns: Optional[list[str]] = None, decode_categories: bool = True):
+        """Export the table to a NumPy structured array.
+
+        Parameters
+        ----------
+        columns: list[str], optional
+            Columns to export. The default is ``None``, in which case all columns are
+            exported.
+        decode_categories: bool, optional
+            Whether string columns are exported as strings. If ``False``, they are exported
+            as ``int32`` category codes. The default is ``True``.
+
+        Returns
+        -------
+        numpy.ndarray
+            Structured array with one field per column and one record per part.
+        """
+        numpy = import_numpy("PartsTable.to_numpy")
+        names = self.column_names if columns is None else columns
+        fields = []
+        for name in names:
+            data = self.column_array(name)
+            if not self.is_numeric(name) and decode_categories:
+                categories = numpy.array(self._column(name).categories + [""], dtype=str)
+                data = categories[data]
+            fields.append((name, data))
+
+        records = numpy.empty(self._num_rows, dtype=[(name, data.dtype) for name, data in fields])
+        for name, data in fields:
+            records[name] = data
+        return records
+
+    def _take(self, rows) -> "PartsTable":
+        numpy = _optional_numpy()
+        table = PartsTable()
+        columns = {}
+        for name in self._columns:
+            column = self._column(name)
+            if numpy is not None:
+                codes = numpy.frombuffer(column.codes, dtype=numpy.int32)[rows]
+                columns[name] = column.take(array("i", codes.tobytes()))
+            else:
+                columns[name] = column.take(array("i", [column.codes[row] for row in rows]))
+        table._columns = columns
+        table._num_rows = len(rows)
+        return table
+
+    def filter(self, name: str, predicate: Callable[[Union[float, str]], bool]) -> "PartsTable":
+        """Return the parts whose value in a column satisfies a predicate.
+
+        The predicate is evaluated once per distinct value of the column, and the parts are
+        selected from the category codes, with a NumPy mask when NumPy is installed. Parts
+        with a missing value are never selected.
+
+        Parameters
+        ----------
+        name: str
+            Name of the column.
+        predicate: Callable[[float | str], bool]
+            Function receiving a value of the column. It receives ``float`` values for
+            numeric columns and ``str`` values otherwise.
+
+        Returns
+        -------
+        PartsTable
+            New table with the selected parts.
+        """
+        column = self._column(name)
+        if self.is_numeric(name):
+            selected = [
+                not math.isnan(value) and bool(predicate(value))
+                for value in column._category_values()
+            ]
+        else:
+            selected = [bool(predicate(category)) for category in column.categories]
+        selected.append(False)  # Code -1 selects the last entry
+
+        numpy = _optional_numpy()
+        if numpy is not None:
+            mask = numpy.array(selected, dtype=bool)[
+                numpy.frombuffer(column.codes, dtype=numpy.int32)
+            ]
+            return self._take(numpy.flatnonzero(mask))
+        return self._take([row for row, code in enumerate(column.codes) if selected[code]])
+
+    def groupby(self, name: str) -> dict[Optional[Union[float, str]], "PartsTable"]:
+        """Split the table by the values of a column.
+
+        The rows of the groups are found from the category codes in one pass, sorting them
+        with NumPy when it is installed.
+
+        Parameters
+        ----------
+        name: str
+            Name of the column.
+
+        Returns
+        -------
+        dict[float | str | None, PartsTable]
+            Table of the parts sharing each value, in order of first appearance. Parts with
+            a missing value are grouped under ``None``.
+        """
+        column = self._column(name)
+        codes = column.codes
+        if self.is_numeric(name):
+            # Distinct strings such as "1" and "1.0" share one numeric key, and blank values
+            # are grouped with the missing ones: their codes are merged into the first code
+            # of their key.
+            keys = [None if math.isnan(key) else key for key in column._category_values()]
+            first_codes: dict[Optional[float], int] = {None: _MISSING}
+            merged = [first_codes.setdefault(key, code) for code, key in enumerate(keys)]
+            merged.append(_MISSING)
+        else:
+            keys = list(column.categories)
+            merged = None
+        keys.append(None)  # Code -1 selects the last entry
+
+        numpy = _optional_numpy()
+        if numpy is None:
+            if merged is not None:
+                codes = [merged[code] for code in codes]
+            groups: dict[int, list[int]] = {}
+            for row, code in enumerate(codes):
+                groups.setdefault(code, []).append(row)
+            return {keys[code]: self._take(rows) for code, rows in groups.items()}
+
+        codes = numpy.frombuffer(codes, dtype=numpy.int32)
+        if merged is not None:
+            codes = numpy.array(merged, dtype=numpy.int32)[codes]
+        order = numpy.argsort(codes, kind="stable")
+        group_codes, starts = numpy.unique(codes[order], return_index=True)
+        ends = numpy.append(starts[1:], len(order))
+        # The stable sort keeps the rows of each group in order, so the first row of a group
+        # is at its start.
+        first_rows = order[starts]
+        return {
+            keys[int(group_codes[group])]: self._take(order[starts[group] : ends[group]])
+            for group in numpy.argsort(first_rows)
+        }
+
+    def __len__(self) -> int:
+        """Return the number of parts in the table."""
+        return self._num_rows
+
+    def __repr__(self) -> str:
+        """Return a summary of the table."""
+        return f"<PartsTable rows={self._num_rows} columns={len(self._columns)}>"
@@ -0,0 +1,363 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for running the blocking service facades over an asyncio gRPC channel.
+
+:class:`AioBridgeChannel` implements the blocking :class:`grpc.Channel` interface on top of a
+:class:`grpc.aio.Channel`. Every RPC is started and awaited on the event loop that owns the
+asyncio channel, while the calling worker thread waits for its result. This lets the
+existing facades, with their request validation and return code handling, run unchanged
+from worker threads while all the network I/O is multiplexed on one asyncio channel.
+
+The bridge has the ``with_call`` and ``future`` methods and the errors of a blocking
+channel, so the client interceptors of :mod:`ansys.sherlock.core.utils` can be installed on
+it with ``grpc.intercept_channel``.
+"""
+
+import asyncio
+import concurrent.futures
+from typing import Any, Callable, Optional
+
+import grpc
+
+
+class _BridgeRpcError(grpc.RpcError, grpc.Call, grpc.Future):
+    """Failed RPC of the bridge, raised like the errors of a blocking channel."""
+
+    def __init__(self, code: grpc.StatusCode, details: str, initial=(), trailing=()):
+        super().__init__(details)
+        self._code = code
+        self._details = details
+        self._initial_metadata = initial
+        self._trailing_metadata = trailing
+
+    @classmethod
+    def from_aio(cls, error: grpc.aio.AioRpcError) -> "_BridgeRpcError":
+        return cls(
+            error.code(), error.details(), error.initial_metadata(), error.trailing_metadata()
+        )
+
+    def __str__(self):
+        return f"<_BridgeRpcError of RPC that terminated with {self._code}: {self._details}>"
+
+    def result(self, timeout=None):
+        raise self
+
+    def exception(self, timeout=None):
+        return self
+
+    def traceback(self, timeout=None):
+        return self.__traceback__
+
+    def add_done_callback(self, fn):
+        fn(self)
+
+    def cancel(self):
+        return False
+
+    def cancelled(self):
+        return False
+
+    def running(self):
+        return False
+
+    def done(self):
+        return True
+
+    def is_active(self):
+        return False
+
+    def time_remaining(self):
+        return None
+
+    def add_callback(self, callback):
+        return False
+
+    def initial_metadata(self):
+        return self._initial_metadata
+
+    def trailing_metadata(self):
+        return self._trailing_metadata
+
+    def code(self):
+        return self._code
+
+    def details(self):
+        return self._details
+
+
+class _CompletedCall(grpc.Call):
+    """Status of an RPC of the bridge that succeeded."""
+
+    def __init__(self, code: grpc.StatusCode, details: str, initial, trailing):
+        self._code = code
+        self._details = details
+        self._initial_metadata = initial
+        self._trailing_metadata = trailing
+
+    def is_active(self):
+        return False
+
+    def time_remaining(self):
+        return None
+
+    def cancel(self):
+        return False
+
+    def add_callback(self, callback):
+        return False
+
+    def initial_metadata(self):
+        return self._initial_metadata
+
+    def trailing_metadata(self):
+        return self._trailing_metadata
+
+    def code(self):
+        return self._code
+
+    def details(self):
+        return self._details
+
+
+class AioBridgeChannel(grpc.Channel):
+    """Blocking gRPC channel that sends its RPCs through an asyncio gRPC channel.
+
+    Parameters
+    ----------
+    channel: grpc.aio.Channel
+        Asyncio channel connected to Sherlock.
+    loop: asyncio.AbstractEventLoop
+        Event loop that owns the asyncio channel.
+    """
+
+    def __init__(self, channel: grpc.aio.Channel, loop: asyncio.AbstractEventLoop):
+        """Initialize the bridge channel."""
+        self.aio_channel = channel
+        self.loop = loop
+        self._subscriptions: dict[Callable, concurrent.futures.Future] = {}
+
+    def run(self, coroutine) -> Any:
+        """Run a coroutine on the event loop of the channel and wait for its result.
+
+        Parameters
+        ----------
+        coroutine: Coroutine
+            Coroutine to run.
+
+        Returns
+        -------
+        Any
+            Result of the coroutine.
+        """
+        try:
+            running_loop = asyncio.get_running_loop()
+        except RuntimeError:
+            running_loop = None
+        if running_loop is self.loop:
+            coroutine.close()
+            raise RuntimeError(
+                "Blocking gRPC calls cannot be made from the event loop thread. "
+                "Use the methods of ThreadedAsyncSherlock instead."
+            )
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop).result()
+
+    def submit(self, coroutine) -> concurrent.futures.Future:
+        """Schedule a coroutine on the event loop of the channel without waiting for it."""
+        return asyncio.run_coroutine_threadsafe(coroutine, self.loop)
+
+    def subscribe(self, callback: Callable, try_to_connect: bool = False):
+        """Subscribe to the connectivity state changes of the asyncio channel."""
+
+        async def watch():
+            state = self.aio_channel.get_state(try_to_connect)
+            while True:
+                callback(state)
+                if state == grpc.ChannelConnectivity.SHUTDOWN:
+                    return
+                await self.aio_channel.wait_for_state_change(state)
+                state = self.aio_channel.get_state()
+
+        self._subscriptions[callback] = self.submit(watch())
+
+    def unsubscribe(self, callback: Callable):
+        """Unsubscribe from the connectivity state changes of the asyncio channel."""
+        future = self._subscriptions.pop(callback, None)
+        if future is not None:
+            future.cancel()
+
+    def unary_unary(
+        self, method, request_serializer=None, response_deserializer=None, *args, **kwargs
+    ):
+        """Create a blocking callable for a unary-unary method."""
+        return _UnaryUnaryMultiCallable(
+            self,
+            self.aio_channel.unary_unary(
+                method, request_serializer, response_deserializer, *args, **kwargs
+            ),
+        )
+
+    def unary_stream(
+        self, method, request_serializer=None, response_deserializer=None, *args, **kwargs
+    ):
+        """Create a blocking callable for a unary-stream method."""
+        return _UnaryStreamMultiCallable(
+            self,
+            self.aio_channel.unary_stream(
+                method, request_serializer, response_deserializer, *args, **kwargs
+            ),
+        )
+
+    def stream_unary(
+        self, method, request_serializer=None, response_deserializer=None, *args, **kwargs
+    ):
+        """Create a blocking callable for a stream-unary method."""
+        return _UnaryUnaryMultiCallable(
+            self,
+            self.aio_channel.stream_unary(
+                method, request_serializer, response_deserializer, *args, **kwargs
+            ),
+        )
+
+    def stream_stream(
+        self, method, request_serializer=None, response_deserializer=None, *args, **kwargs
+    ):
+        """Create a blocking callable for a stream-stream method."""
+        return _UnaryStreamMultiCallable(
+            self,
+            self.aio_channel.stream_stream(
+                method, request_serializer, response_deserializer, *args, **kwargs
+            ),
+        )
+
+    def unsubscribe_all(self):
+        """Cancel every connectivity subscription."""
+        for callback in list(self._subscriptions):
+            self.unsubscribe(callback)
+
+    def close(self):
+        """Close the asyncio channel."""
+        self.unsubscribe_all()
+        self.run(self.aio_channel.close())
+
+    def __enter__(self):
+        """Enter the runtime context of the channel."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Close the channel when leaving the runtime context."""
+        self.close()
+        return False
+
+
+class _UnaryUnaryMultiCallable:
+    """Blocking callable of a method with one response, sending its calls through the bridge.
+
+    The request is a message for unary-unary methods and an iterator of messages for
+    stream-unary methods.
+    """
+
+    def __init__(self, bridge: AioBridgeChannel, callable_):
+        self._bridge = bridge
+        self._callable = callable_
+
+    async def _call(self, request, **kwargs):
+        call = self._callable(request, **kwargs)
+        try:
+            response = await call
+        except grpc.aio.AioRpcError as e:
+            raise _BridgeRpcError.from_aio(e) from None
+        status = _CompletedCall(
+            await call.code(),
+            await call.details(),
+            await call.initial_metadata(),
+            await call.trailing_metadata(),
+        )
+        return response, status
+
+    def __call__(self, request, timeout: Optional[float] = None, metadata=None, **kwargs):
+        return self.with_call(request, timeout=timeout, metadata=metadata, **kwargs)[0]
+
+    def with_call(self, request, timeout: Optional[float] = None, metadata=None, **kwargs):
+        return self._bridge.run(self._call(request, timeout=timeout, metadata=metadata, **kwargs))
+
+    def future(self, request, timeout: Optional[float] = None, metadata=None, **kwargs):
+        async def response():
+            return (await self._call(request, timeout=timeout, metadata=metadata, **kwargs))[0]
+
+        return self._bridge.submit(response())
+
+
+class _UnaryStreamMultiCallable:
+    """Blocking callable of a method with streamed responses, sending its calls through the bridge.
+
+    The request is a message for unary-stream methods and an iterator of messages for
+    stream-stream methods.
+    """
+
+    def __init__(self, bridge: AioBridgeChannel, callable_):
+        self._bridge = bridge
+        self._callable = callable_
+
+    def __call__(self, request, timeout: Optional[float] = None, metadata=None, **kwargs):
+        async def start():
+            return self._callable(request, timeout=timeout, metadata=metadata, **kwargs)
+
+        return _ResponseIterator(self._bridge, self._bridge.run(start()))
+
+
+class _ResponseIterator:
+    """Blocking iterator over the responses of an asyncio unary-stream or stream-stream call."""
+
+    def __init__(self, bridge: AioBridgeChannel, call: grpc.aio.Call):
+        self._bridge = bridge
+        self._call = call
+
+    def __iter__(self):
+        return self
+
+    async def _read(self):
+        try:
+            return await self._call.read()
+        except grpc.aio.AioRpcError as e:
+            raise _BridgeRpcError.from_aio(e) from None
+        except asyncio.CancelledError:
+            if not self._call.cancelled():
+                raise
+            raise _BridgeRpcError(grpc.StatusCode.CANCELLED, "Locally cancelled by application!")
+
+    def __next__(self):
+        response = self._bridge.run(self._read())
+        if response is grpc.aio.EOF:
+            raise StopIteration
+        return response
+
+    def cancel(self) -> bool:
+        """Cancel the call."""
+        self._bridge.loop.call_soon_threadsafe(self._call.cancel)
+        return True
+
+    def add_done_callback(self, fn: Callable):
+        """Call ``fn`` with the iterator once the call is done."""
+        self._bridge.loop.call_soon_threadsafe(self._call.add_done_callback, lambda _: fn(self))
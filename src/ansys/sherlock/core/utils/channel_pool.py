@@ -0,0 +1,221 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for spreading the RPCs to one server over several HTTP/2 connections.
+
+A gRPC channel multiplexes all its RPCs over one HTTP/2 connection, whose concurrent stream
+limit and single socket serialize the calls of many threads. :class:`ChannelPool` is a
+``grpc.Channel`` made of several channels connected to the same server, each created with
+distinct channel arguments so that gRPC does not share their connection. Each RPC is sent on
+one of them, picked round-robin or as the one with the fewest RPCs in flight, so the stubs,
+interceptors and facades of a connection work unchanged on a pool.
+"""
+
+import itertools
+import threading
+from typing import Callable
+
+import grpc
+
+CHANNEL_POOL_STRATEGIES = ("least_outstanding", "round_robin")
+"""Strategies picking the channel of each RPC."""
+
+
+def get_channel_options(index: int) -> list[tuple[str, object]]:
+    """Return the channel arguments giving the channel of a pool a connection of its own.
+
+    Parameters
+    ----------
+    index: int
+        Index of the channel in the pool.
+
+    Returns
+    -------
+    list[tuple[str, object]]
+        gRPC channel options.
+    """
+    return [("grpc.use_local_subchannel_pool", 1), ("pysherlock.channel_index", index)]
+
+
+class _PooledMultiCallable:
+    """Multi-callable sending each RPC on a channel of the pool."""
+
+    def __init__(self, pool: "ChannelPool", callables: list):
+        self._pool = pool
+        self._callables = callables
+
+    def _send(self, invoke: Callable, request, kwargs: dict):
+        index = self._pool._acquire()
+        try:
+            return invoke(self._callables[index], request, kwargs)
+        finally:
+            self._pool._release(index)
+
+    def _start(self, invoke: Callable, request, kwargs: dict):
+        # The RPC stays outstanding until the call it returns is done.
+        index = self._pool._acquire()
+        try:
+            call = invoke(self._callables[index], request, kwargs)
+        except BaseException:
+            self._pool._release(index)
+            raise
+        call.add_done_callback(lambda _: self._pool._release(index))
+        return call
+
+
+class _PooledUnaryUnary(_PooledMultiCallable, grpc.UnaryUnaryMultiCallable):
+    def __call__(self, request, **kwargs):
+        return self._send(lambda c, r, k: c(r, **k), request, kwargs)
+
+    def with_call(self, request, **kwargs):
+        return self._send(lambda c, r, k: c.with_call(r, **k), request, kwargs)
+
+    def future(self, request, **kwargs):
+        return self._start(lambda c, r, k: c.future(r, **k), request, kwargs)
+
+
+class _PooledUnaryStream(_PooledMultiCallable, grpc.UnaryStreamMultiCallable):
+    def __call__(self, request, **kwargs):
+        return self._start(lambda c, r, k: c(r, **k), request, kwargs)
+
+
+class _PooledStreamUnary(_PooledMultiCallable, grpc.StreamUnaryMultiCallable):
+    def __call__(self, request_iterator, **kwargs):
+        return self._send(lambda c, r, k: c(r, **k), request_iterator, kwargs)
+
+    def with_call(self, request_iterator, **kwargs):
+        return self._send(lambda c, r, k: c.with_call(r, **k), request_iterator, kwargs)
+
+    def future(self, request_iterator, **kwargs):
+        return self._start(lambda c, r, k: c.future(r, **k), request_iterator, kwargs)
+
+
+class _PooledStreamStream(_PooledMultiCallable, grpc.StreamStreamMultiCallable):
+    def __call__(self, request_iterator, **kwargs):
+        return self._start(lambda c, r, k: c(r, **k), request_iterator, kwargs)
+
+
+class ChannelPool(grpc.Channel):
+    """gRPC channel sending each RPC on one of several channels to the same server.
+
+    The connectivity reported to subscribers is the one of the first channel.
+
+    Parameters
+    ----------
+    channels: list[grpc.Channel]
+        Channels connected to the same server, each with a connection of its own. See
+        :func:`get_channel_options`.
+    strategy: str, optional
+        How the channel of each RPC is picked: ``"least_outstanding"``, the channel with the
+        fewest RPCs in flight, or ``"round_robin"``. The default is ``"least_outstanding"``.
+    """
+
+    def __init__(self, channels: list[grpc.Channel], strategy: str = "least_outstanding"):
+        """Initialize the pool."""
+        if not channels:
+            raise ValueError("A channel pool needs at least one channel.")
+        if strategy not in CHANNEL_POOL_STRATEGIES:
+            raise ValueError(f"Unsupported channel pool strategy: {strategy}")
+        self.channels = list(channels)
+        self.strategy = strategy
+        self._outstanding = [0] * len(self.channels)
+        self._calls = [0] * len(self.channels)
+        self._next = itertools.cycle(range(len(self.channels)))
+        self._lock = threading.Lock()
+
+    @property
+    def outstanding(self) -> list[int]:
+        """Number of RPCs in flight on each channel."""
+        with self._lock:
+            return list(self._outstanding)
+
+    @property
+    def calls(self) -> list[int]:
+        """Number of RPCs sent on each channel."""
+        with self._lock:
+            return list(self._calls)
+
+    def _acquire(self) -> int:
+        with self._lock:
+            index = next(self._next)
+            if self.strategy == "least_outstanding":
+                # Start from the round-robin position so that ties are spread evenly.
+                count = len(self._outstanding)
+                index = min(
+                    ((index + offset) % count for offset in range(count)),
+                    key=self._outstanding.__getitem__,
+                )
+            self._outstanding[index] += 1
+            self._calls[index] += 1
+            return index
+
+    def _release(self, index: int):
+        with self._lock:
+            self._outstanding[index] -= 1
+
+    def unary_unary(self, method, *args, **kwargs):
+        """Create a multi-callable for a unary-unary method."""
+        return _PooledUnaryUnary(
+            self, [c.unary_unary(method, *args, **kwargs) for c in self.channels]
+        )
+
+    def unary_stream(self, method, *args, **kwargs):
+        """Create a multi-callable for a unary-stream method."""
+        return _PooledUnaryStream(
+            self, [c.unary_stream(method, *args, **kwargs) for c in self.channels]
+        )
+
+    def stream_unary(self, method, *args, **kwargs):
+        """Create a multi-callable for a stream-unary method."""
+        return _PooledStreamUnary(
+            self, [c.stream_unary(method, *args, **kwargs) for c in self.channels]
+        )
+
+    def stream_stream(self, method, *args, **kwargs):
+        """Create a multi-callable for a stream-stream method."""
+        return _PooledStreamStream(
+            self, [c.stream_stream(method, *args, **kwargs) for c in self.channels]
+        )
+
+    def subscribe(self, callback, try_to_connect=False):
+        """Subscribe to the connectivity of the first channel."""
+        self.channels[0].subscribe(callback, try_to_connect=try_to_connect)
+
+    def unsubscribe(self, callback):
+        """Unsubscribe from the connectivity of the first channel."""
+        self.channels[0].unsubscribe(callback)
+
+    def close(self):
+        """Close every channel of the pool."""
+        for channel in self.channels:
+            channel.close()
+
+    def __enter__(self):
+        """Enter the runtime context of the pool."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Close every channel of the pool when leaving the runtime context."""
+        self.close()
+        return False
@@ -0,0 +1,198 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for splitting bulk requests that exceed the gRPC message size limit.
+
+Bulk requests carry their items in one repeated field. :func:`split_request` measures the
+items with ``ByteSize()`` and distributes them over as few requests as possible, each
+holding a copy of the other fields. :func:`send_chunked` sends those requests, one at a time
+or with several in flight, and merges the responses into one.
+"""
+
+from collections import deque
+from typing import Callable, Optional
+
+from google.protobuf.message import Message
+
+from ansys.sherlock.core.errors import SherlockRequestTooLargeError
+
+MAX_MESSAGE_LENGTH = 100 * 1024 * 1024
+"""Maximum size (in bytes) of the messages sent and received on a Sherlock channel."""
+
+BULK_REQUEST_FIELDS: dict[str, str] = {
+    "UpdateHarmonicVibePropsRequest": "harmonicVibeProperties",
+    "UpdateMountPointsRequest": "mountPointsProperties",
+    "AddThermalProfilesRequest": "thermalProfiles",
+    "UpdatePartsListPropertiesRequest": "partProperties",
+    "UpdatePartsLocationsRequest": "partLoc",
+}
+"""Repeated field holding the items of each bulk request type, keyed by message name."""
+
+
+def _varint_size(value: int) -> int:
+    size = 1
+    while value >= 0x80:
+        value >>= 7
+        size += 1
+    return size
+
+
+def split_request(
+    request: Message, max_bytes: int = MAX_MESSAGE_LENGTH, field: Optional[str] = None
+) -> list[Message]:
+    """Split a bulk request into requests of at most ``max_bytes`` bytes.
+
+    Parameters
+    ----------
+    request: Message
+        Request to split.
+    max_bytes: int, optional
+        Maximum size (in bytes) of each request. The default is the maximum message size of
+        the channel.
+    field: str, optional
+        Name of the repeated field to split. The default is ``None``, in which case the field
+        is looked up in ``BULK_REQUEST_FIELDS``.
+
+    Returns
+    -------
+    list[Message]
+        Requests holding consecutive items of the original request, in order. The original
+        request is returned as is when it is small enough.
+    """
+    if request.ByteSize() <= max_bytes:
+        return [request]
+
+    if field is None:
+        field = BULK_REQUEST_FIELDS[request.DESCRIPTOR.full_name]
+    items = getattr(request, field)
+    base = type(request)()
+    base.CopyFrom(request)
+    base.ClearField(field)
+    base_size = base.ByteSize()
+    tag_size = _varint_size(request.DESCRIPTOR.fields_by_name[field].number << 3)
+
+    chunks = []
+    start = 0
+    size = base_size
+    for i, item in enumerate(items):
+        item_size = item.ByteSize()
+        entry_size = tag_size + _varint_size(item_size) + item_size
+        if base_size + entry_size > max_bytes:
+            raise SherlockRequestTooLargeError(
+                f"Item {i} of {field} is {entry_size} bytes long, which exceeds the limit of "
+                f"{max_bytes} bytes."
+            )
+        if size + entry_size > max_bytes:
+            chunks.append((start, i))
+            start = i
+            size = base_size
+        size += entry_size
+    chunks.append((start, len(items)))
+
+    requests = []
+    for start, stop in chunks:
+        chunk = type(request)()
+        chunk.CopyFrom(base)
+        getattr(chunk, field).extend(items[start:stop])
+        requests.append(chunk)
+    return requests
+
+
+def merge_responses(responses: list[Message]) -> Message:
+    """Merge the responses to the requests of a split bulk request.
+
+    The return code of the merged response is the first failing return code, or the last
+    return code if every request succeeded. Repeated fields, such as the lists of errors,
+    are concatenated.
+
+    Parameters
+    ----------
+    responses: list[Message]
+        Responses to merge, all of the same type.
+
+    Returns
+    -------
+    Message
+        Merged response.
+    """
+    if len(responses) == 1:
+        return responses[0]
+
+    def return_code(response: Message) -> Message:
+        return (
+            response.returnCode if "returnCode" in response.DESCRIPTOR.fields_by_name else response
+        )
+
+    failed = [response for response in responses if return_code(response).value == -1]
+    merged = type(responses[0])()
+    return_code(merged).CopyFrom(return_code(failed[0] if failed else responses[-1]))
+    for field in merged.DESCRIPTOR.fields:
+        if field.is_repeated:
+            for response in responses:
+                getattr(merged, field.name).extend(getattr(response, field.name))
+    return merged
+
+
+def send_chunked(
+    method: Callable[[Message], Message],
+    request: Message,
+    max_bytes: int = MAX_MESSAGE_LENGTH,
+    pipeline_depth: int = 1,
+) -> Message:
+    """Send a bulk request in chunks under the message size limit and merge the responses.
+
+    Every chunk is sent, even after one fails, so that the merged response reports the
+    errors of all the items.
+
+    Parameters
+    ----------
+    method: Callable[[Message], Message]
+        Unary-unary method of a gRPC stub.
+    request: Message
+        Bulk request to send.
+    max_bytes: int, optional
+        Maximum size (in bytes) of each request. The default is the maximum message size of
+        the channel.
+    pipeline_depth: int, optional
+        Maximum number of chunks in flight at the same time. The default is ``1``, in which
+        case each chunk is sent once the previous one completes. With a larger value, the
+        server may process the chunks in any order.
+
+    Returns
+    -------
+    Message
+        Merged response.
+    """
+    requests = split_request(request, max_bytes)
+    if pipeline_depth <= 1 or len(requests) == 1 or not hasattr(method, "future"):
+        return merge_responses([method(chunk) for chunk in requests])
+
+    in_flight = deque()
+    responses = []
+    for chunk in requests:
+        if len(in_flight) >= pipeline_depth:
+            responses.append(in_flight.popleft().result())
+        in_flight.append(method.future(chunk))
+    responses.extend(future.result() for future in in_flight)
+    return merge_responses(responses)
@@ -0,0 +1,189 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for compressing the large requests sent to Sherlock.
+
+Compressing a request costs CPU time on both ends, which is only worth it for large requests
+over a slow link, such as a server on another host behind an SSH tunnel. The bulk requests
+of PySherlock, for example those updating the properties of many parts or adding thermal
+profiles, repeat the same unit strings and property names, and compress well.
+
+:class:`CompressionInterceptor` compresses a request only when its serialized size reaches
+the threshold of a :class:`CompressionPolicy`. :func:`measure_compression` reports the
+compressed size and the compression time of a message, to tune the threshold.
+"""
+
+import gzip
+import time
+from typing import Optional, Union
+import zlib
+
+from google.protobuf.message import Message
+import grpc
+
+from ansys.sherlock.core.utils.deadlines import _CallDetails
+from ansys.sherlock.core.utils.metrics import MetricsRegistry
+
+COMPRESSION_ALGORITHMS = {"gzip": grpc.Compression.Gzip, "deflate": grpc.Compression.Deflate}
+"""gRPC compression algorithms by name."""
+
+DEFAULT_COMPRESSION_THRESHOLD = 64 * 1024
+"""Default serialized size (in bytes) from which requests are compressed."""
+
+
+class CompressionPolicy:
+    """Compression of the requests of a connection.
+
+    Parameters
+    ----------
+    algorithm: str, optional
+        Compression algorithm, ``"gzip"`` or ``"deflate"``. The default is ``"gzip"``.
+    threshold: int, optional
+        Serialized size (in bytes) from which requests are compressed. The default is
+        ``65536``.
+    """
+
+    def __init__(self, algorithm: str = "gzip", threshold: int = DEFAULT_COMPRESSION_THRESHOLD):
+        """Initialize the policy."""
+        if algorithm not in COMPRESSION_ALGORITHMS:
+            raise ValueError(f"Unsupported compression algorithm: {algorithm}")
+        self.algorithm = algorithm
+        self.threshold = threshold
+
+    def compression_for(self, request_bytes: int) -> Optional[grpc.Compression]:
+        """Return the compression of a request.
+
+        Parameters
+        ----------
+        request_bytes: int
+            Serialized size of the request.
+
+        Returns
+        -------
+        grpc.Compression
+            Compression algorithm of the request, or ``None`` if it is sent uncompressed.
+        """
+        if request_bytes < self.threshold:
+            return None
+        return COMPRESSION_ALGORITHMS[self.algorithm]
+
+
+def get_compression_policy(
+    compression: Union[None, str, CompressionPolicy],
+) -> Optional[CompressionPolicy]:
+    """Return the policy for the ``compression`` argument of ``launcher.connect``.
+
+    Parameters
+    ----------
+    compression: str | CompressionPolicy, optional
+        ``None`` to disable the compression, the name of an algorithm to compress the
+        requests from the default threshold, or a policy.
+
+    Returns
+    -------
+    CompressionPolicy
+        Compression policy, or ``None`` if the requests are not compressed.
+    """
+    if compression is None or isinstance(compression, CompressionPolicy):
+        return compression
+    return CompressionPolicy(compression)
+
+
+def measure_compression(message: Message, algorithm: str = "gzip") -> dict:
+    """Compress a message the way gRPC does, and report the result.
+
+    Parameters
+    ----------
+    message: Message
+        Protobuf message, for example a request built by a bulk method.
+    algorithm: str, optional
+        Compression algorithm, ``"gzip"`` or ``"deflate"``. The default is ``"gzip"``.
+
+    Returns
+    -------
+    dict
+        ``"bytes"`` and ``"compressed_bytes"``, the serialized size of the message before
+        and after compression, ``"ratio"``, their quotient, and ``"seconds"``, the time
+        spent compressing the message.
+
+    Examples
+    --------
+    >>> from ansys.sherlock.core.utils.compression import measure_compression
+    >>> print(measure_compression(request._convert_to_grpc())["ratio"])
+    """
+    if algorithm not in COMPRESSION_ALGORITHMS:
+        raise ValueError(f"Unsupported compression algorithm: {algorithm}")
+    data = message.SerializeToString()
+    start = time.perf_counter()
+    compressed = gzip.compress(data) if algorithm == "gzip" else zlib.compress(data)
+    seconds = time.perf_counter() - start
+    return {
+        "bytes": len(data),
+        "compressed_bytes": len(compressed),
+        "ratio": len(compressed) / len(data) if data else 1.0,
+        "seconds": seconds,
+    }
+
+
+class CompressionInterceptor(grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor):
+    """gRPC client interceptor compressing the requests larger than a threshold.
+
+    Parameters
+    ----------
+    policy: CompressionPolicy
+        Compression of the requests.
+    metrics: MetricsRegistry, optional
+        Registry recording the compressed requests. The default is ``None``.
+    """
+
+    def __init__(self, policy: CompressionPolicy, metrics: Optional[MetricsRegistry] = None):
+        """Initialize the interceptor."""
+        self.policy = policy
+        self.metrics = metrics
+
+    def _compress(self, client_call_details, request):
+        if getattr(client_call_details, "compression", None) is not None:
+            return client_call_details
+        request_bytes = request.ByteSize()
+        compression = self.policy.compression_for(request_bytes)
+        if compression is None:
+            return client_call_details
+        if self.metrics is not None and self.metrics.enabled:
+            self.metrics.record_compression(client_call_details.method)
+        return _CallDetails(
+            client_call_details.method,
+            client_call_details.timeout,
+            client_call_details.metadata,
+            client_call_details.credentials,
+            client_call_details.wait_for_ready,
+            compression,
+        )
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        """Send a unary RPC, compressed if its request is large."""
+        return continuation(self._compress(client_call_details, request), request)
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        """Send a server-streaming RPC, compressed if its request is large."""
+        return continuation(self._compress(client_call_details, request), request)
@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for tracking the connectivity state of a gRPC channel.
+
+The tracker subscribes to the connectivity callbacks of a gRPC channel and remembers the
+last observed state. :class:`ansys.sherlock.core.grpc_stub.GrpcStub` consults it before
+every API call so that a health-check RPC only has to be sent to Sherlock when the state
+of the channel is unknown, stale, or indicates a failure.
+"""
+
+import threading
+import time
+from typing import Callable, Optional
+import weakref
+
+import grpc
+
+DEFAULT_HEALTH_CHECK_TTL = 30.0
+"""Number of seconds a known channel state is trusted before it is probed again."""
+
+_TRACKERS: "weakref.WeakKeyDictionary[grpc.Channel, ConnectionStateTracker]" = (
+    weakref.WeakKeyDictionary()
+)
+_TRACKERS_LOCK = threading.Lock()
+
+
+class ConnectionStateTracker:
+    """Tracks the connectivity state of a gRPC channel.
+
+    Parameters
+    ----------
+    channel: grpc.Channel
+        Channel to subscribe to.
+    ttl: float, optional
+        Number of seconds an observed state is trusted. A value of ``0`` makes every
+        check send a health-check RPC. The default is ``30``.
+    """
+
+    def __init__(self, channel: grpc.Channel, ttl: float = DEFAULT_HEALTH_CHECK_TTL):
+        """Initialize the tracker and subscribe to the channel connectivity."""
+        self.ttl = ttl
+        self.probes_performed = 0
+        self.probes_skipped = 0
+        self.probes_failed = 0
+        self._state: Optional[grpc.ChannelConnectivity] = None
+        self._updated_at = 0.0
+        self._lock = threading.Lock()
+        # The tracker must not reference the channel, since the channel is the weak key
+        # under which the tracker is shared.
+        channel.subscribe(self._on_state_change, try_to_connect=False)
+
+    @property
+    def state(self) -> Optional[grpc.ChannelConnectivity]:
+        """Last observed connectivity state, or ``None`` if no state was observed yet."""
+        return self._state
+
+    def _on_state_change(self, state: grpc.ChannelConnectivity):
+        with self._lock:
+            self._state = state
+            self._updated_at = time.monotonic()
+
+    def _is_fresh(self) -> bool:
+        return time.monotonic() - self._updated_at < self.ttl
+
+    def is_connection_up(self, probe: Callable[[], bool]) -> bool:
+        """Check whether the channel is connected to Sherlock.
+
+        The ``probe`` callable is only invoked when the last observed state is missing,
+        older than the TTL, or anything other than ``READY`` or ``SHUTDOWN``.
+
+        Parameters
+        ----------
+        probe: Callable[[], bool]
+            Callable that sends a health-check RPC and returns whether it succeeded.
+
+        Returns
+        -------
+        bool
+            Whether the channel is connected to Sherlock.
+        """
+        with self._lock:
+            if self._is_fresh():
+                if self._state == grpc.ChannelConnectivity.READY:
+                    self.probes_skipped += 1
+                    return True
+                if self._state == grpc.ChannelConnectivity.SHUTDOWN:
+                    self.probes_skipped += 1
+                    return False
+            self.probes_performed += 1
+
+        is_up = probe()
+
+        with self._lock:
+            if is_up:
+                self._state = grpc.ChannelConnectivity.READY
+                self._updated_at = time.monotonic()
+            else:
+                self.probes_failed += 1
+        return is_up
+
+    def invalidate(self):
+        """Forget the last observed state so that the next check sends a health-check RPC."""
+        with self._lock:
+            self._state = None
+            self._updated_at = 0.0
+
+    def stats(self) -> dict[str, int]:
+        """Return the health-check counters.
+
+        Returns
+        -------
+        dict[str, int]
+            Number of health-check RPCs performed, skipped, and failed.
+        """
+        with self._lock:
+            return {
+                "probes_performed": self.probes_performed,
+                "probes_skipped": self.probes_skipped,
+                "probes_failed": self.probes_failed,
+            }
+
+
+def get_connection_state_tracker(
+    channel: grpc.Channel, ttl: Optional[float] = None
+) -> ConnectionStateTracker:
+    """Return the tracker shared by all users of a gRPC channel.
+
+    Parameters
+    ----------
+    channel: grpc.Channel
+        Channel to track.
+    ttl: float, optional
+        Number of seconds an observed state is trusted. If provided, it replaces the TTL
+        of an existing tracker.
+
+    Returns
+    -------
+    ConnectionStateTracker
+        Tracker for the channel.
+    """
+    with _TRACKERS_LOCK:
+        tracker = _TRACKERS.get(channel)
+        if tracker is None:
+            tracker = ConnectionStateTracker(
+                channel, DEFAULT_HEALTH_CHECK_TTL if ttl is None else ttl
+            )
+            _TRACKERS[channel] = tracker
+        elif ttl is not None:
+            tracker.ttl = ttl
+        return tracker
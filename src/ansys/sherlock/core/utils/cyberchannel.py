@@ -76,7 +76,8 @@ def create_channel(
     certs_dir: str | Path | None = None,
     cert_files: CertificateFiles | None = None,
     grpc_options: list[tuple[str, object]] | None = None,
-) -> grpc.Channel:
+    aio: bool = False,
+) -> grpc.Channel | grpc.aio.Channel:
     """Create a gRPC channel based on the transport mode.
 
     Parameters
@@ -116,10 +117,13 @@ def create_channel(
         gRPC channel options to pass when creating the channel.
         Each option is a tuple of the form ("option_name", value).
         By default `None` and thus no extra options are added.
+    aio: bool
+        Whether to create an asyncio channel from the `grpc.aio` module.
+        By default `False`.
 
     Returns
     -------
-    grpc.Channel
+    grpc.Channel | grpc.aio.Channel
         The created gRPC channel
 
     """
@@ -138,15 +142,15 @@ def create_channel(
     match transport_mode.lower():
         case "insecure":
             transport_mode, host, port = check_host_port(transport_mode, host, port)
-            return create_insecure_channel(host, port, grpc_options)
+            return create_insecure_channel(host, port, grpc_options, aio)
         case "uds":
-            return create_uds_channel(uds_service, uds_dir, uds_id, grpc_options)
+            return create_uds_channel(uds_service, uds_dir, uds_id, grpc_options, aio)
         case "wnua":
             transport_mode, host, port = check_host_port(transport_mode, host, port)
-            return create_wnua_channel(host, port, grpc_options)
+            return create_wnua_channel(host, port, grpc_options, aio)
         case "mtls":
             transport_mode, host, port = check_host_port(transport_mode, host, port)
-            return create_mtls_channel(host, port, certs_dir, cert_files, grpc_options)
+            return create_mtls_channel(host, port, certs_dir, cert_files, grpc_options, aio)
         case _:
             raise ValueError(
                 f"Unknown transport mode: {transport_mode}. "
@@ -158,8 +162,11 @@ def create_channel(
 
 
 def create_insecure_channel(
-    host: str, port: int | str, grpc_options: list[tuple[str, object]] | None = None
-) -> grpc.Channel:
+    host: str,
+    port: int | str,
+    grpc_options: list[tuple[str, object]] | None = None,
+    aio: bool = False,
+) -> grpc.Channel | grpc.aio.Channel:
     """Create an insecure gRPC channel without TLS.
 
     Parameters
@@ -172,10 +179,13 @@ def create_insecure_channel(
         gRPC channel options to pass when creating the channel.
         Each option is a tuple of the form ("option_name", value).
         By default `None` and thus no extra options are added.
+    aio: bool
+        Whether to create an asyncio channel from the `grpc.aio` module.
+        By default `False`.
 
     Returns
     -------
-    grpc.Channel
+    grpc.Channel | grpc.aio.Channel
         The created gRPC channel
 
     """
@@ -185,7 +195,7 @@ def create_insecure_channel(
         "Consider using a secure connection."
     )
     logger.info(f"Connecting using INSECURE -> {target}")
-    return grpc.insecure_channel(target, options=grpc_options)
+    return _grpc_module(aio).insecure_channel(target, options=grpc_options)
 
 
 def create_uds_channel(
@@ -193,7 +203,8 @@ def create_uds_channel(
     uds_dir: str | Path | None = None,
     uds_id: str | None = None,
     grpc_options: list[tuple[str, object]] | None = None,
-) -> grpc.Channel:
+    aio: bool = False,
+) -> grpc.Channel | grpc.aio.Channel:
     """Create a gRPC channel using Unix Domain Sockets (UDS).
 
     Parameters
@@ -211,10 +222,13 @@ def create_uds_channel(
         gRPC channel options to pass when creating the channel.
         Each option is a tuple of the form ("option_name", value).
         By default `None` and thus only the default authority option is added.
+    aio: bool
+        Whether to create an asyncio channel from the `grpc.aio` module.
+        By default `False`.
 
     Returns
     -------
-    grpc.Channel
+    grpc.Channel | grpc.aio.Channel
         The created gRPC channel
 
     """
@@ -244,14 +258,15 @@ def create_uds_channel(
     if grpc_options:
         options.extend(grpc_options)
     logger.info(f"Connecting using UDS -> {target}")
-    return grpc.insecure_channel(target, options=options)
+    return _grpc_module(aio).insecure_channel(target, options=options)
 
 
 def create_wnua_channel(
     host: str,
     port: int | str,
     grpc_options: list[tuple[str, object]] | None = None,
-) -> grpc.Channel:
+    aio: bool = False,
+) -> grpc.Channel | grpc.aio.Channel:
     """Create a gRPC channel using Windows Named User Authentication (WNUA).
 
     Parameters
@@ -264,10 +279,13 @@ def create_wnua_channel(
         gRPC channel options to pass when creating the channel.
         Each option is a tuple of the form ("option_name", value).
         By default `None` and thus only the default authority option is added.
+    aio: bool
+        Whether to create an asyncio channel from the `grpc.aio` module.
+        By default `False`.
 
     Returns
     -------
-    grpc.Channel
+    grpc.Channel | grpc.aio.Channel
         The created gRPC channel
 
     """
@@ -286,7 +304,7 @@ def create_wnua_channel(
     if grpc_options:
         options.extend(grpc_options)
     logger.info(f"Connecting using WNUA -> {target}")
-    return grpc.insecure_channel(target, options=options)
+    return _grpc_module(aio).insecure_channel(target, options=options)
 
 
 def create_mtls_channel(
@@ -295,7 +313,8 @@ def create_mtls_channel(
     certs_dir: str | Path | None = None,
     cert_files: CertificateFiles | None = None,
     grpc_options: list[tuple[str, object]] | None = None,
-) -> grpc.Channel:
+    aio: bool = False,
+) -> grpc.Channel | grpc.aio.Channel:
     """Create a gRPC channel using Mutual TLS (mTLS).
 
     Parameters
@@ -317,10 +336,13 @@ def create_mtls_channel(
         gRPC channel options to pass when creating the channel.
         Each option is a tuple of the form ("option_name", value).
         By default `None` and thus no extra options are added.
+    aio: bool
+        Whether to create an asyncio channel from the `grpc.aio` module.
+        By default `False`.
 
     Returns
     -------
-    grpc.Channel
+    grpc.Channel | grpc.aio.Channel
         The created gRPC channel
 
     """
@@ -370,12 +392,17 @@ def create_mtls_channel(
 
     target = f"{host}:{port}"
     logger.info(f"Connecting using mTLS -> {target}")
-    return grpc.secure_channel(target, credentials, options=grpc_options)
+    return _grpc_module(aio).secure_channel(target, credentials, options=grpc_options)
 
 
 ######################################## HELPER FUNCTIONS ########################################
 
 
+def _grpc_module(aio: bool = False):
+    """Return the module providing the channel constructors."""
+    return grpc.aio if aio else grpc
+
+
 def version_tuple(version_str: str) -> tuple[int, ...]:
     """Convert a version string into a tuple of integers for comparison.
 
@@ -0,0 +1,335 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for the deadlines of the RPCs sent to Sherlock.
+
+The deadline of an RPC is the shortest of:
+
+* the deadline configured for its method in a :class:`DeadlinePolicy`, or the default
+  deadline of the policy, which does not apply to the long-running methods listed in
+  :data:`LONG_RUNNING_METHODS`;
+* the time remaining in the innermost :func:`deadline` block, which every RPC sent in the
+  block shares, streaming RPCs included.
+
+The deadlines are applied by :class:`DeadlineInterceptor`, and an RPC that does not complete
+in time raises :class:`ansys.sherlock.core.errors.SherlockDeadlineExceededError`.
+"""
+
+from collections import namedtuple
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from fnmatch import fnmatchcase
+import time
+from typing import Iterator, Optional
+
+import grpc
+
+from ansys.sherlock.core.errors import SherlockDeadlineExceededError
+
+LONG_RUNNING_METHODS = (
+    "SherlockAnalysisService/run*",
+    "SherlockProjectService/gen*Report",
+    "SherlockProjectService/import*",
+    "SherlockProjectService/export*",
+    "SherlockModelService/*",
+)
+"""Patterns of the RPCs that can run for minutes, to which the default deadline does not apply."""
+
+
+@dataclass(frozen=True)
+class _Deadline:
+    expires_at: float
+    started_at: float
+    seconds: float
+
+
+_CURRENT_DEADLINE: ContextVar[Optional[_Deadline]] = ContextVar("pysherlock_deadline", default=None)
+
+
+@contextmanager
+def deadline(seconds: float) -> Iterator[None]:
+    """Share a time budget between every RPC sent in a block.
+
+    Parameters
+    ----------
+    seconds: float
+        Time (in seconds) within which every RPC sent in the block must complete. A block
+        nested in another one cannot extend the deadline of the outer block.
+
+    Examples
+    --------
+    >>> from ansys.sherlock.core.utils.deadlines import deadline
+    >>> with deadline(30):
+    >>>     sherlock.project.list_ccas("Test")
+    >>>     sherlock.stackup.list_conductor_layers("Test")
+    """
+    now = time.monotonic()
+    current = _Deadline(now + seconds, now, seconds)
+    outer = _CURRENT_DEADLINE.get()
+    if outer is not None and outer.expires_at <= current.expires_at:
+        current = outer
+    token = _CURRENT_DEADLINE.set(current)
+    try:
+        yield
+    finally:
+        _CURRENT_DEADLINE.reset(token)
+
+
+def remaining_time() -> Optional[float]:
+    """Return the time (in seconds) left in the innermost :func:`deadline` block.
+
+    Returns
+    -------
+    float
+        Time left, which is negative once the deadline has passed. ``None`` outside of a
+        :func:`deadline` block.
+    """
+    current = _CURRENT_DEADLINE.get()
+    if current is None:
+        return None
+    return current.expires_at - time.monotonic()
+
+
+class DeadlinePolicy:
+    """Deadlines of the RPCs of a connection.
+
+    Parameters
+    ----------
+    default: float, optional
+        Deadline (in seconds) of the RPCs that have no deadline of their own, except the
+        long-running ones listed in :data:`LONG_RUNNING_METHODS`. The default is ``None``, in
+        which case these RPCs have no deadline.
+    per_method: dict[str, float], optional
+        Deadline (in seconds) of the RPCs matching each pattern, or ``None`` for no deadline.
+        A pattern is matched with ``fnmatch`` against the name of the RPC in the
+        ``"Service/method"`` form, for example ``"SherlockAnalysisService/runAnalysis"`` or
+        ``"SherlockPartsService/*"``. When several patterns match an RPC, the last one wins.
+    """
+
+    def __init__(
+        self,
+        default: Optional[float] = None,
+        per_method: Optional[dict[str, Optional[float]]] = None,
+    ):
+        """Initialize the policy."""
+        self._default = default
+        self._per_method = dict(per_method or {})
+        self._timeouts: dict[str, Optional[float]] = {}
+
+    @property
+    def default(self) -> Optional[float]:
+        """Deadline (in seconds) of the RPCs that have no deadline of their own."""
+        return self._default
+
+    @default.setter
+    def default(self, seconds: Optional[float]):
+        self._default = seconds
+        self._timeouts = {}
+
+    @property
+    def per_method(self) -> dict[str, Optional[float]]:
+        """Copy of the deadlines (in seconds) of the RPCs matching each pattern."""
+        return dict(self._per_method)
+
+    def set_method_deadline(self, pattern: str, seconds: Optional[float]):
+        """Set the deadline of the RPCs matching a pattern.
+
+        Parameters
+        ----------
+        pattern: str
+            Pattern matched against the name of the RPC in the ``"Service/method"`` form.
+        seconds: float, optional
+            Deadline (in seconds), or ``None`` for no deadline.
+        """
+        self._per_method.pop(pattern, None)
+        self._per_method[pattern] = seconds
+        self._timeouts = {}
+
+    def timeout_for(self, method: str) -> Optional[float]:
+        """Return the deadline configured for an RPC, regardless of any :func:`deadline` block.
+
+        Parameters
+        ----------
+        method: str
+            Name of the RPC, for example ``"/SherlockCommonService/check"``.
+
+        Returns
+        -------
+        float
+            Deadline in seconds, or ``None`` if the RPC has no deadline.
+        """
+        timeouts = self._timeouts
+        if method in timeouts:
+            return timeouts[method]
+        name = method.lstrip("/")
+        timeout = self._default
+        if any(fnmatchcase(name, pattern) for pattern in LONG_RUNNING_METHODS):
+            timeout = None
+        for pattern, seconds in self._per_method.items():
+            if fnmatchcase(name, pattern):
+                timeout = seconds
+        timeouts[method] = timeout
+        return timeout
+
+
+class _CallDetails(
+    namedtuple(
+        "_CallDetails",
+        ("method", "timeout", "metadata", "credentials", "wait_for_ready", "compression"),
+    ),
+    grpc.ClientCallDetails,
+):
+    pass
+
+
+class _Budget:
+    """Deadline applied to one RPC, used to report it once exceeded."""
+
+    def __init__(self, method: str, timeout: float, started_at: float, seconds: float):
+        self.method = method.lstrip("/")
+        self.timeout = timeout
+        self.started_at = started_at
+        self.seconds = seconds
+
+    def error(self) -> SherlockDeadlineExceededError:
+        return SherlockDeadlineExceededError(
+            self.method, time.monotonic() - self.started_at, self.seconds
+        )
+
+    def check(self, error: grpc.RpcError):
+        """Raise SherlockDeadlineExceededError if the RPC failed because of its deadline."""
+        if error.code() == grpc.StatusCode.DEADLINE_EXCEEDED:
+            raise self.error() from error
+
+
+class _DeadlineOutcome:
+    """Unary RPC whose result raises SherlockDeadlineExceededError once the deadline passes."""
+
+    def __init__(self, outcome, budget: _Budget):
+        self._outcome = outcome
+        self._budget = budget
+
+    def result(self, timeout: Optional[float] = None):
+        """Return the response, or raise the error of the RPC."""
+        try:
+            return self._outcome.result(timeout)
+        except grpc.RpcError as e:
+            self._budget.check(e)
+            raise
+
+    def exception(self, timeout: Optional[float] = None):
+        """Return the error of the RPC, if any."""
+        error = self._outcome.exception(timeout)
+        if isinstance(error, grpc.RpcError):
+            try:
+                self._budget.check(error)
+            except SherlockDeadlineExceededError as e:
+                return e
+        return error
+
+    def __getattr__(self, name: str):
+        # Delegate the grpc.Call and grpc.Future interfaces to the RPC
+        return getattr(self._outcome, name)
+
+
+class _DeadlineResponseStream:
+    """Response iterator raising SherlockDeadlineExceededError once the deadline passes."""
+
+    def __init__(self, call, budget: _Budget):
+        self._call = call
+        self._budget = budget
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            return next(self._call)
+        except grpc.RpcError as e:
+            self._budget.check(e)
+            raise
+
+    def __getattr__(self, name: str):
+        # Delegate the grpc.Call interface (code, details, cancel, ...) to the call
+        return getattr(self._call, name)
+
+
+class DeadlineInterceptor(grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor):
+    """gRPC client interceptor applying the deadlines of a :class:`DeadlinePolicy`.
+
+    Parameters
+    ----------
+    policy: DeadlinePolicy
+        Deadlines of the RPCs.
+    """
+
+    def __init__(self, policy: DeadlinePolicy):
+        """Initialize the interceptor."""
+        self.policy = policy
+
+    def _budget(self, client_call_details) -> Optional[_Budget]:
+        method = client_call_details.method
+        timeout = self.policy.timeout_for(method)
+        now = time.monotonic()
+        budget = None if timeout is None else _Budget(method, timeout, now, timeout)
+        current = _CURRENT_DEADLINE.get()
+        if current is not None:
+            remaining = current.expires_at - now
+            if budget is None or remaining < budget.timeout:
+                budget = _Budget(method, remaining, current.started_at, current.seconds)
+            if remaining <= 0:
+                raise budget.error()
+        if client_call_details.timeout is not None and (
+            budget is None or client_call_details.timeout < budget.timeout
+        ):
+            budget = _Budget(method, client_call_details.timeout, now, client_call_details.timeout)
+        return budget
+
+    @staticmethod
+    def _with_timeout(client_call_details, timeout: float) -> _CallDetails:
+        return _CallDetails(
+            client_call_details.method,
+            timeout,
+            client_call_details.metadata,
+            client_call_details.credentials,
+            client_call_details.wait_for_ready,
+            getattr(client_call_details, "compression", None),
+        )
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        """Send a unary RPC with its deadline."""
+        budget = self._budget(client_call_details)
+        if budget is None:
+            return continuation(client_call_details, request)
+        outcome = continuation(self._with_timeout(client_call_details, budget.timeout), request)
+        return _DeadlineOutcome(outcome, budget)
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        """Send a server-streaming RPC with a deadline covering all its responses."""
+        budget = self._budget(client_call_details)
+        if budget is None:
+            return continuation(client_call_details, request)
+        call = continuation(self._with_timeout(client_call_details, budget.timeout), request)
+        return _DeadlineResponseStream(call, budget)
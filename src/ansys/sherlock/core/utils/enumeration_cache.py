@@ -0,0 +1,403 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for the process-wide cache of enumeration lists returned by Sherlock.
+
+Several services validate their arguments against lists that Sherlock returns on request,
+such as the life cycle types or the conductor materials. These lists only depend on the
+Sherlock version, so they are cached per server address and server version and shared by
+every facade and every :class:`ansys.sherlock.core.sherlock.Sherlock` object in the process.
+The cache can optionally be persisted to a directory, for every server or per server, so
+that later processes can skip the requests altogether.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+import importlib
+import json
+import os
+import re
+import threading
+from typing import Optional
+import uuid
+import weakref
+
+import grpc
+
+
+@dataclass(frozen=True)
+class _Enumeration:
+    """Describes the RPC that returns an enumeration list.
+
+    The service and the request are given by name, so that the protobuf modules of a
+    service are only imported when one of its enumeration lists is requested.
+    """
+
+    service: str
+    method: str
+    request: str
+    field: str
+
+    @property
+    def stub_class(self) -> type:
+        """Class of the stub of the service."""
+        module = importlib.import_module(f"ansys.api.sherlock.v0.{self.service}_pb2_grpc")
+        return getattr(module, f"{self.service}Stub")
+
+    @property
+    def request_class(self) -> type:
+        """Class of the request of the RPC."""
+        module = importlib.import_module(f"ansys.api.sherlock.v0.{self.service}_pb2")
+        return getattr(module, self.request)
+
+
+ENUMERATIONS: dict[str, _Enumeration] = {
+    "cycle_types": _Enumeration(
+        "SherlockLifeCycleService",
+        "listLifeCycleTypes",
+        "ListLCTypesRequest",
+        "types",
+    ),
+    "rv_profile_types": _Enumeration(
+        "SherlockLifeCycleService",
+        "listRandomVibeProfileTypes",
+        "ListRandomVibeProfileTypesRequest",
+        "types",
+    ),
+    "harmonic_profile_types": _Enumeration(
+        "SherlockLifeCycleService",
+        "listHarmonicProfileTypes",
+        "ListHarmonicProfileTypesRequest",
+        "types",
+    ),
+    "ampl_units": _Enumeration(
+        "SherlockLifeCycleService",
+        "listAmplUnits",
+        "ListAmplUnitsRequest",
+        "amplUnits",
+    ),
+    "cycle_states": _Enumeration(
+        "SherlockLifeCycleService",
+        "listLifeCycleStates",
+        "ListLCStatesRequest",
+        "states",
+    ),
+    "load_units": _Enumeration(
+        "SherlockLifeCycleService",
+        "listShockLoadUnits",
+        "ListShockLoadUnitsRequest",
+        "units",
+    ),
+    "shock_shapes": _Enumeration(
+        "SherlockLifeCycleService",
+        "listShockPulses",
+        "ListShockPulsesRequest",
+        "shockPulse",
+    ),
+    "laminate_thickness_units": _Enumeration(
+        "SherlockStackupService",
+        "listLaminateThicknessUnits",
+        "ListLaminateThicknessUnitsRequest",
+        "unit",
+    ),
+    "laminate_material_manufacturers": _Enumeration(
+        "SherlockStackupService",
+        "listLaminateMaterialsManufacturers",
+        "ListLaminateMaterialsManufacturersRequest",
+        "manufacturer",
+    ),
+    "conductor_materials": _Enumeration(
+        "SherlockStackupService",
+        "listConductorMaterials",
+        "ListConductorMaterialsRequest",
+        "conductorMaterial",
+    ),
+    "construction_styles": _Enumeration(
+        "SherlockStackupService",
+        "listConstructionStyles",
+        "ListConstructionStylesRequest",
+        "constructionStyle",
+    ),
+    "fiber_materials": _Enumeration(
+        "SherlockStackupService",
+        "listFiberMaterials",
+        "ListFiberMaterialsRequest",
+        "fiberMaterial",
+    ),
+    "part_location_units": _Enumeration(
+        "SherlockPartsService",
+        "getPartLocationUnits",
+        "GetPartLocationUnitsRequest",
+        "units",
+    ),
+    "board_sides": _Enumeration(
+        "SherlockPartsService",
+        "getBoardSides",
+        "GetBoardSidesRequest",
+        "boardSides",
+    ),
+}
+"""Enumeration lists that can be cached, by name."""
+
+
+class EnumerationCache:
+    """Cache of enumeration lists keyed by server address and server version.
+
+    Channels created by :func:`ansys.sherlock.core.launcher.connect` are registered with the
+    address of the server, so that every connection to the same server shares one set of
+    lists. Lists fetched through an unregistered channel are only shared by the users of
+    that channel and are never persisted.
+
+    Parameters
+    ----------
+    persist_dir: str, optional
+        Directory where the lists are persisted as JSON files, unless another directory is
+        given when registering a channel. The default is ``None``, in which case the lists
+        are only kept in memory.
+    """
+
+    def __init__(self, persist_dir: Optional[str] = None):
+        """Initialize an empty cache."""
+        self.persist_dir = persist_dir
+        self.hits = 0
+        self.misses = 0
+        self._entries: dict[tuple[str, Optional[int]], dict[str, list[str]]] = {}
+        self._addresses: "weakref.WeakKeyDictionary[grpc.Channel, str]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._persist_dirs: dict[str, str] = {}
+        self._private_addresses: "weakref.WeakKeyDictionary[grpc.Channel, str]" = (
+            weakref.WeakKeyDictionary()
+        )
+        self._lock = threading.RLock()
+
+    def register_channel(
+        self, channel: grpc.Channel, address: str, persist_dir: Optional[str] = None
+    ):
+        """Associate a channel with the address of the server it is connected to.
+
+        Parameters
+        ----------
+        channel: grpc.Channel
+            Channel connected to Sherlock.
+        address: str
+            Address of the server, such as ``"127.0.0.1:9090"``.
+        persist_dir: str, optional
+            Directory where the lists of this server are persisted as JSON files. The
+            default is ``None``, in which case the directory of the cache is used.
+        """
+        with self._lock:
+            self._addresses[channel] = address
+            if persist_dir:
+                self._persist_dirs[address] = persist_dir
+
+    def _address(self, channel: grpc.Channel) -> tuple[str, bool]:
+        """Return the address of the channel and whether it was registered."""
+        with self._lock:
+            address = self._addresses.get(channel)
+            if address is not None:
+                return address, True
+            # Unregistered channels get a private key so they never share lists.
+            address = self._private_addresses.get(channel)
+            if address is None:
+                address = f"channel-{uuid.uuid4().hex}"
+                self._private_addresses[channel] = address
+            return address, False
+
+    def get(
+        self, name: str, channel: grpc.Channel, server_version: Optional[int]
+    ) -> Optional[list[str]]:
+        """Return an enumeration list, fetching it from Sherlock if it is not cached.
+
+        Parameters
+        ----------
+        name: str
+            Name of the enumeration. Must be a key of ``ENUMERATIONS``.
+        channel: grpc.Channel
+            Channel connected to Sherlock.
+        server_version: int, optional
+            Version of the Sherlock server.
+
+        Returns
+        -------
+        list[str], optional
+            Values of the enumeration, or ``None`` if Sherlock could not return them.
+        """
+        values, fetched = self._get(name, channel, server_version)
+        if fetched:
+            self._save_channel(channel, server_version)
+        return values
+
+    def _get(
+        self, name: str, channel: grpc.Channel, server_version: Optional[int]
+    ) -> tuple[Optional[list[str]], bool]:
+        """Return an enumeration list and whether it was fetched, without persisting it."""
+        address, registered = self._address(channel)
+        key = (address, server_version)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None and registered:
+                entry = self._load(key)
+            if entry is not None and name in entry:
+                self.hits += 1
+                return entry[name], False
+            self.misses += 1
+
+        values = _fetch(ENUMERATIONS[name], channel)
+        if values is None:
+            return None, False
+        with self._lock:
+            self._entries.setdefault(key, {})[name] = values
+        return values, True
+
+    def prefetch_all(
+        self, channel: grpc.Channel, server_version: Optional[int], max_workers: int = 8
+    ) -> dict[str, list[str]]:
+        """Fetch every enumeration list that is not cached yet in one parallel burst.
+
+        The lists fetched are persisted once, after the last one is returned.
+
+        Parameters
+        ----------
+        channel: grpc.Channel
+            Channel connected to Sherlock.
+        server_version: int, optional
+            Version of the Sherlock server.
+        max_workers: int, optional
+            Maximum number of concurrent requests. The default is ``8``.
+
+        Returns
+        -------
+        dict[str, list[str]]
+            Values of every enumeration that Sherlock returned, by name.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = {
+                name: executor.submit(self._get, name, channel, server_version)
+                for name in ENUMERATIONS
+            }
+            results = {name: future.result() for name, future in futures.items()}
+        if any(fetched for _, fetched in results.values()):
+            self._save_channel(channel, server_version)
+        return {name: values for name, (values, _) in results.items() if values is not None}
+
+    def invalidate(self, address: Optional[str] = None, server_version: Optional[int] = None):
+        """Remove cached lists from memory and from the persisted layer.
+
+        Parameters
+        ----------
+        address: str, optional
+            Only remove the lists of this server address. The default is ``None``,
+            in which case the lists of every server are removed.
+        server_version: int, optional
+            Only remove the lists of this server version. The default is ``None``,
+            in which case the lists of every version are removed.
+        """
+        with self._lock:
+            for key in list(self._entries):
+                if _matches(key, address, server_version):
+                    del self._entries[key]
+            persist_dirs = {self.persist_dir, *self._persist_dirs.values()}
+            for persist_dir in persist_dirs:
+                if not persist_dir or not os.path.isdir(persist_dir):
+                    continue
+                for file_name in os.listdir(persist_dir):
+                    if not (file_name.startswith("enumerations_") and file_name.endswith(".json")):
+                        continue
+                    path = os.path.join(persist_dir, file_name)
+                    try:
+                        with open(path, encoding="utf-8") as file:
+                            data = json.load(file)
+                        if _matches(
+                            (data["address"], data["server_version"]), address, server_version
+                        ):
+                            os.remove(path)
+                    except (OSError, ValueError, KeyError):
+                        continue
+
+    def _path(self, key: tuple[str, Optional[int]]) -> Optional[str]:
+        address, server_version = key
+        persist_dir = self._persist_dirs.get(address, self.persist_dir)
+        if not persist_dir or server_version is None:
+            return None
+        safe_address = re.sub(r"[^A-Za-z0-9.\-]", "_", address)
+        return os.path.join(persist_dir, f"enumerations_{safe_address}_{server_version}.json")
+
+    def _load(self, key: tuple[str, Optional[int]]) -> Optional[dict[str, list[str]]]:
+        path = self._path(key)
+        if path is None:
+            return None
+        try:
+            with open(path, encoding="utf-8") as file:
+                data = json.load(file)
+        except (OSError, ValueError):
+            return None
+        if data.get("address") != key[0]:
+            return None
+        entry = {name: list(values) for name, values in data.get("enumerations", {}).items()}
+        self._entries[key] = entry
+        return entry
+
+    def _save_channel(self, channel: grpc.Channel, server_version: Optional[int]):
+        address, registered = self._address(channel)
+        if registered:
+            with self._lock:
+                self._save((address, server_version))
+
+    def _save(self, key: tuple[str, Optional[int]]):
+        path = self._path(key)
+        if path is None or key not in self._entries:
+            return
+        data = {"address": key[0], "server_version": key[1], "enumerations": self._entries[key]}
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            with open(f"{path}.tmp", "w", encoding="utf-8") as file:
+                json.dump(data, file)
+            os.replace(f"{path}.tmp", path)
+        except OSError:
+            pass
+
+
+def _fetch(enumeration: _Enumeration, channel: grpc.Channel) -> Optional[list[str]]:
+    """Request an enumeration list from Sherlock."""
+    stub = enumeration.stub_class(channel)
+    try:
+        response = getattr(stub, enumeration.method)(enumeration.request_class())
+    except grpc.RpcError:
+        return None
+    if response.returnCode.value != 0:
+        return None
+    return list(getattr(response, enumeration.field))
+
+
+def _matches(
+    key: tuple[str, Optional[int]], address: Optional[str], server_version: Optional[int]
+) -> bool:
+    return (address is None or key[0] == address) and (
+        server_version is None or key[1] == server_version
+    )
+
+
+ENUMERATION_CACHE = EnumerationCache()
+"""Enumeration cache shared by every Sherlock connection in the process."""
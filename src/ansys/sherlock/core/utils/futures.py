@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for running API calls in the background and gathering their results later.
+
+:func:`submit` runs a function, typically a method of a service facade, on worker threads
+shared by every Sherlock connection of the process, and returns a
+``concurrent.futures.Future``. Since the whole method runs, its result goes through the same
+argument validation, return-code checks and exceptions as a blocking call. The context
+variables of the caller, such as the deadline of
+:meth:`ansys.sherlock.core.sherlock.Sherlock.deadline`, apply to the call.
+"""
+
+from concurrent.futures import Future, ThreadPoolExecutor
+import contextvars
+import threading
+from typing import Callable, Optional
+
+DEFAULT_MAX_WORKERS = 32
+"""Maximum number of background calls running at the same time."""
+
+_EXECUTOR: Optional[ThreadPoolExecutor] = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _EXECUTOR
+    if _EXECUTOR is None:
+        with _EXECUTOR_LOCK:
+            if _EXECUTOR is None:
+                _EXECUTOR = ThreadPoolExecutor(
+                    max_workers=DEFAULT_MAX_WORKERS, thread_name_prefix="pysherlock-submit"
+                )
+    return _EXECUTOR
+
+
+def submit(fn: Callable, *args, **kwargs) -> Future:
+    """Run a function in the background.
+
+    Parameters
+    ----------
+    fn: Callable
+        Function to run, for example ``sherlock.stackup.list_conductor_layers``.
+    *args
+        Positional arguments of the function.
+    **kwargs
+        Keyword arguments of the function.
+
+    Returns
+    -------
+    Future
+        Future of the value returned or the exception raised by the function.
+    """
+    context = contextvars.copy_context()
+    return _get_executor().submit(context.run, fn, *args, **kwargs)
@@ -0,0 +1,273 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for the registry of the Sherlock instances running on this machine.
+
+:func:`ansys.sherlock.core.launcher.launch` records every instance it starts as a JSON file
+in a well-known directory, so that :func:`ansys.sherlock.core.launcher.acquire`, in this or
+any later process, can attach to a running instance instead of starting a new one. Records
+of processes that are no longer running are removed when the registry is read.
+"""
+
+from dataclasses import asdict, dataclass, field
+import json
+import os
+import re
+import signal
+import sys
+import time
+from typing import Optional
+
+INSTANCE_REGISTRY_ENV_VAR = "PYSHERLOCK_INSTANCE_REGISTRY"
+"""Environment variable overriding the directory of the registry."""
+
+DEFAULT_REGISTRY_DIR = os.path.join(os.path.expanduser("~"), ".pysherlock", "instances")
+"""Default directory of the registry."""
+
+
+@dataclass
+class InstanceRecord:
+    """Sherlock instance recorded in the registry."""
+
+    pid: int
+    """Identifier of the Sherlock process."""
+    transport_mode: str
+    """gRPC transport mode of the instance."""
+    port: Optional[int] = None
+    """Port of the gRPC server, unless ``transport_mode`` is ``"uds"``."""
+    uds_dir: Optional[str] = None
+    """Directory of the UDS socket file."""
+    uds_id: Optional[str] = None
+    """Identifier of the UDS socket file name."""
+    certs_dir: Optional[str] = None
+    """Directory of the mTLS certificates."""
+    server_version: Optional[int] = None
+    """Version of Sherlock, such as ``261``."""
+    single_project_path: str = ""
+    """Project opened in the single-project mode, if any."""
+    started_at: float = field(default_factory=time.time)
+    """Time when the instance was launched, in seconds since the epoch."""
+
+    @property
+    def key(self) -> str:
+        """Identifier of the record in the registry."""
+        address = f"uds-{self.uds_id or 'default'}" if self.transport_mode == "uds" else self.port
+        return re.sub(r"[^A-Za-z0-9.\-]", "_", f"{self.pid}_{address}")
+
+
+class InstanceRegistry:
+    """Registry of the running Sherlock instances, stored as one JSON file per instance.
+
+    Parameters
+    ----------
+    directory: str, optional
+        Directory of the registry. The default is ``None``, in which case the directory is
+        read from the ``PYSHERLOCK_INSTANCE_REGISTRY`` environment variable, or is
+        ``~/.pysherlock/instances``.
+    """
+
+    def __init__(self, directory: Optional[str] = None):
+        """Initialize the registry."""
+        self.directory = directory or os.environ.get(
+            INSTANCE_REGISTRY_ENV_VAR, DEFAULT_REGISTRY_DIR
+        )
+
+    def register(self, record: InstanceRecord):
+        """Add or replace the record of an instance.
+
+        Parameters
+        ----------
+        record: InstanceRecord
+            Record of the instance.
+        """
+        os.makedirs(self.directory, exist_ok=True)
+        path = self._path(record.key)
+        # Write to a temporary file first so readers never see a partial record.
+        with open(f"{path}.tmp", "w", encoding="utf-8") as file:
+            json.dump(asdict(record), file)
+        os.replace(f"{path}.tmp", path)
+
+    def unregister(self, record: InstanceRecord):
+        """Remove the record of an instance.
+
+        Parameters
+        ----------
+        record: InstanceRecord
+            Record of the instance.
+        """
+        try:
+            os.remove(self._path(record.key))
+        except FileNotFoundError:
+            pass
+
+    def records(self) -> list[InstanceRecord]:
+        """Return the records of the running instances, removing those of exited processes.
+
+        Returns
+        -------
+        list[InstanceRecord]
+            Records of the instances whose process is running, most recent first.
+        """
+        if not os.path.isdir(self.directory):
+            return []
+        records = []
+        for file_name in os.listdir(self.directory):
+            if not (file_name.startswith("instance_") and file_name.endswith(".json")):
+                continue
+            path = os.path.join(self.directory, file_name)
+            try:
+                with open(path, encoding="utf-8") as file:
+                    record = InstanceRecord(**json.load(file))
+            except (OSError, ValueError, TypeError):
+                continue
+            if _is_process_running(record.pid):
+                records.append(record)
+            else:
+                self.unregister(record)
+        return sorted(records, key=lambda record: record.started_at, reverse=True)
+
+    def find(
+        self,
+        transport_mode: Optional[str] = None,
+        server_version: Optional[int] = None,
+        single_project_path: str = "",
+    ) -> list[InstanceRecord]:
+        """Return the records of the running instances matching the given options.
+
+        Parameters
+        ----------
+        transport_mode: str, optional
+            gRPC transport mode of the instances. The default is ``None``, in which case
+            every transport mode matches.
+        server_version: int, optional
+            Version of Sherlock, such as ``261``. A two-digit version matches every release
+            of that year. The default is ``None``, in which case every version matches.
+        single_project_path: str, optional
+            Project opened in the single-project mode. The default is ``""``, in which
+            case only instances that are not in the single-project mode match.
+
+        Returns
+        -------
+        list[InstanceRecord]
+            Matching records, newest Sherlock version first, then most recent first.
+        """
+        records = [
+            record
+            for record in self.records()
+            if (transport_mode is None or record.transport_mode == transport_mode)
+            and _version_matches(record.server_version, server_version)
+            and _same_path(record.single_project_path, single_project_path)
+        ]
+        return sorted(records, key=lambda record: record.server_version or 0, reverse=True)
+
+    def _path(self, key: str) -> str:
+        return os.path.join(self.directory, f"instance_{key}.json")
+
+
+def _version_matches(version: Optional[int], requested: Optional[int]) -> bool:
+    if requested is None:
+        return True
+    if version is None:
+        return False
+    if requested < 100:
+        return version // 10 == requested
+    return version == requested
+
+
+def _same_path(path: str, requested: str) -> bool:
+    if not path or not requested:
+        return not path and not requested
+    return os.path.normcase(os.path.abspath(path)) == os.path.normcase(os.path.abspath(requested))
+
+
+def _is_process_running(pid: int) -> bool:
+    """Return whether a process is running, without sending it any signal."""
+    if pid <= 0:
+        return False
+    if sys.platform == "win32":
+        import ctypes
+
+        process_query_limited_information = 0x1000
+        still_active = 259
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(process_query_limited_information, False, pid)
+        if not handle:
+            return False
+        try:
+            exit_code = ctypes.c_ulong()
+            if not kernel32.GetExitCodeProcess(handle, ctypes.byref(exit_code)):
+                return False
+            return exit_code.value == still_active
+        finally:
+            kernel32.CloseHandle(handle)
+    try:
+        # Signal 0 only checks that the process exists.
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        # The process exists but belongs to another user.
+        return True
+    return True
+
+
+def _terminate_process(pid: int):
+    """Terminate a process, doing nothing if it already exited."""
+    if pid <= 0:
+        return
+    if sys.platform == "win32":
+        import ctypes
+
+        process_terminate = 0x0001
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(process_terminate, False, pid)
+        if not handle:
+            return
+        try:
+            kernel32.TerminateProcess(handle, 1)
+        finally:
+            kernel32.CloseHandle(handle)
+        return
+    try:
+        os.kill(pid, signal.SIGTERM)
+    except (ProcessLookupError, PermissionError):
+        pass
+
+
+def get_instance_registry(directory: Optional[str] = None) -> InstanceRegistry:
+    """Return the registry of the Sherlock instances.
+
+    Parameters
+    ----------
+    directory: str, optional
+        Directory of the registry. The default is ``None``, in which case the directory is
+        read from the ``PYSHERLOCK_INSTANCE_REGISTRY`` environment variable, or is
+        ``~/.pysherlock/instances``.
+
+    Returns
+    -------
+    InstanceRegistry
+        Registry stored in the directory.
+    """
+    return InstanceRegistry(directory)
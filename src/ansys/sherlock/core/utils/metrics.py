@@ -0,0 +1,504 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for collecting client-side metrics of the calls sent to Sherlock.
+
+Two sources feed a :class:`MetricsRegistry`:
+
+* :class:`MetricsInterceptor`, a gRPC client interceptor recording every RPC sent on a
+  channel, including the health-check RPCs.
+* The ``require_version`` decorator, which records every call of a public API method when
+  the object it belongs to has a registry attached.
+
+Nothing is recorded, and the interceptor is not installed, unless metrics are enabled with
+``launcher.connect(enable_metrics=True)``.
+"""
+
+import bisect
+import json
+import threading
+import time
+from typing import Optional
+
+import grpc
+
+DEFAULT_LATENCY_BUCKETS = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+    300.0,
+)
+"""Upper bounds (in seconds) of the buckets of the latency histograms."""
+
+HEALTH_CHECK_METHOD = "/SherlockCommonService/check"
+"""Full name of the health-check RPC."""
+
+_PROMETHEUS_PREFIX = "pysherlock"
+
+
+class _Histogram:
+    """Histogram of latencies with fixed bucket bounds."""
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.sum = 0.0
+        self.count = 0
+
+    def observe(self, value: float):
+        self.counts[bisect.bisect_left(self.buckets, value)] += 1
+        self.sum += value
+        self.count += 1
+
+    def snapshot(self) -> dict:
+        return {
+            "buckets": list(self.buckets),
+            "counts": list(self.counts),
+            "sum": self.sum,
+            "count": self.count,
+        }
+
+
+class _MethodStats:
+    """Statistics of one RPC or API method."""
+
+    def __init__(self, buckets: tuple[float, ...]):
+        self.calls = 0
+        self.errors = 0
+        self.latency = _Histogram(buckets)
+        self.request_bytes = 0
+        self.response_bytes = 0
+        self.responses = 0
+        self.retries = 0
+        self.throttled_retries = 0
+        self.compressed_requests = 0
+        self.coalesced = 0
+
+    def snapshot(self, with_bytes: bool) -> dict:
+        stats = {"calls": self.calls, "errors": self.errors, "latency": self.latency.snapshot()}
+        if with_bytes:
+            stats["request_bytes"] = self.request_bytes
+            stats["response_bytes"] = self.response_bytes
+            stats["responses"] = self.responses
+            stats["retries"] = self.retries
+            stats["throttled_retries"] = self.throttled_retries
+            stats["compressed_requests"] = self.compressed_requests
+            stats["coalesced"] = self.coalesced
+        return stats
+
+
+class MetricsRegistry:
+    """Thread-safe store of the metrics recorded for one Sherlock connection.
+
+    Parameters
+    ----------
+    latency_buckets: tuple[float, ...], optional
+        Upper bounds (in seconds) of the buckets of the latency histograms. The default is
+        ``DEFAULT_LATENCY_BUCKETS``.
+
+    Examples
+    --------
+    >>> from ansys.sherlock.core import launcher
+    >>> sherlock = launcher.connect(port=9092, transport_mode="wnua", enable_metrics=True)
+    >>> sherlock.common.list_units("LENGTH")
+    >>> metrics = sherlock.metrics()
+    >>> print(metrics.to_prometheus())
+    """
+
+    def __init__(self, latency_buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS):
+        """Initialize an empty registry."""
+        self.enabled = True
+        """Whether calls are recorded. Set to ``False`` to pause the collection."""
+        self._buckets = tuple(sorted(latency_buckets))
+        self._rpc: dict[str, _MethodStats] = {}
+        self._api: dict[str, _MethodStats] = {}
+        self._lock = threading.Lock()
+
+    def record_rpc(
+        self,
+        method: str,
+        latency: float,
+        request_bytes: int,
+        response_bytes: int,
+        responses: int,
+        error: bool,
+    ):
+        """Record one RPC.
+
+        Parameters
+        ----------
+        method: str
+            Full name of the RPC, for example ``"/SherlockCommonService/check"``.
+        latency: float
+            Seconds between sending the request and receiving the last response.
+        request_bytes: int
+            Serialized size of the request.
+        response_bytes: int
+            Total serialized size of the responses.
+        responses: int
+            Number of responses received.
+        error: bool
+            Whether the RPC failed.
+        """
+        with self._lock:
+            stats = self._rpc.get(method)
+            if stats is None:
+                stats = self._rpc[method] = _MethodStats(self._buckets)
+            stats.calls += 1
+            stats.errors += error
+            stats.latency.observe(latency)
+            stats.request_bytes += request_bytes
+            stats.response_bytes += response_bytes
+            stats.responses += responses
+
+    def record_retry(self, method: str, throttled: bool = False):
+        """Record one retry of an RPC.
+
+        Parameters
+        ----------
+        method: str
+            Full name of the RPC, for example ``"/SherlockProjectService/listCCAs"``.
+        throttled: bool, optional
+            Whether the retry was skipped because the retry budget was exhausted.
+            The default is ``False``.
+        """
+        with self._lock:
+            stats = self._rpc.get(method)
+            if stats is None:
+                stats = self._rpc[method] = _MethodStats(self._buckets)
+            if throttled:
+                stats.throttled_retries += 1
+            else:
+                stats.retries += 1
+
+    def record_compression(self, method: str):
+        """Record one RPC sent with a compressed request.
+
+        Parameters
+        ----------
+        method: str
+            Full name of the RPC, for example ``"/SherlockPartsService/updatePartsList"``.
+        """
+        with self._lock:
+            stats = self._rpc.get(method)
+            if stats is None:
+                stats = self._rpc[method] = _MethodStats(self._buckets)
+            stats.compressed_requests += 1
+
+    def record_coalesced(self, method: str):
+        """Record one request that shared the RPC of an identical request in flight.
+
+        Parameters
+        ----------
+        method: str
+            Full name of the RPC, for example ``"/SherlockProjectService/listCCAs"``.
+        """
+        with self._lock:
+            stats = self._rpc.get(method)
+            if stats is None:
+                stats = self._rpc[method] = _MethodStats(self._buckets)
+            stats.coalesced += 1
+
+    def record_api_call(self, method: str, latency: float, error: bool):
+        """Record one call of an API method.
+
+        Parameters
+        ----------
+        method: str
+            Qualified name of the method, for example ``"Parts.update_parts_locations"``.
+        latency: float
+            Duration of the call in seconds.
+        error: bool
+            Whether the call raised an exception.
+        """
+        with self._lock:
+            stats = self._api.get(method)
+            if stats is None:
+                stats = self._api[method] = _MethodStats(self._buckets)
+            stats.calls += 1
+            stats.errors += error
+            stats.latency.observe(latency)
+
+    def reset(self):
+        """Discard all the recorded metrics."""
+        with self._lock:
+            self._rpc.clear()
+            self._api.clear()
+
+    def snapshot(self) -> dict:
+        """Return a copy of the recorded metrics.
+
+        Returns
+        -------
+        dict
+            Dictionary with the following keys:
+
+            - ``"rpc"``: statistics of each RPC, keyed by the full RPC name.
+            - ``"api"``: statistics of each API method, keyed by ``"Class.method"``.
+            - ``"health_check"``: number, failures and total duration of the health-check
+              RPCs, and their share of the time spent in all RPCs.
+        """
+        with self._lock:
+            rpc = {method: stats.snapshot(True) for method, stats in self._rpc.items()}
+            api = {method: stats.snapshot(False) for method, stats in self._api.items()}
+
+        total_seconds = sum(stats["latency"]["sum"] for stats in rpc.values())
+        check = rpc.get(HEALTH_CHECK_METHOD)
+        check_seconds = check["latency"]["sum"] if check else 0.0
+        return {
+            "rpc": rpc,
+            "api": api,
+            "health_check": {
+                "calls": check["calls"] if check else 0,
+                "errors": check["errors"] if check else 0,
+                "seconds": check_seconds,
+                "share": check_seconds / total_seconds if total_seconds else 0.0,
+            },
+        }
+
+    def to_json(self, indent: Optional[int] = None) -> str:
+        """Export the recorded metrics as JSON.
+
+        Parameters
+        ----------
+        indent: int, optional
+            Indentation passed to ``json.dumps``. The default is ``None``.
+
+        Returns
+        -------
+        str
+            JSON document with the content of :meth:`snapshot`.
+        """
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def to_prometheus(self) -> str:
+        """Export the recorded metrics in the Prometheus text exposition format.
+
+        Returns
+        -------
+        str
+            Counters and histograms prefixed with ``pysherlock_``.
+        """
+        snapshot = self.snapshot()
+        lines: list[str] = []
+        for kind, with_bytes in (("rpc", True), ("api", False)):
+            methods = snapshot[kind]
+            prefix = f"{_PROMETHEUS_PREFIX}_{kind}"
+            _add_counter(
+                lines, f"{prefix}_calls_total", f"Number of {kind} calls.", methods, "calls"
+            )
+            _add_counter(
+                lines,
+                f"{prefix}_errors_total",
+                f"Number of failed {kind} calls.",
+                methods,
+                "errors",
+            )
+            _add_histogram(
+                lines, f"{prefix}_latency_seconds", f"Latency of the {kind} calls.", methods
+            )
+            if with_bytes:
+                _add_counter(
+                    lines,
+                    f"{prefix}_request_bytes_total",
+                    "Serialized size of the requests.",
+                    methods,
+                    "request_bytes",
+                )
+                _add_counter(
+                    lines,
+                    f"{prefix}_response_bytes_total",
+                    "Serialized size of the responses.",
+                    methods,
+                    "response_bytes",
+                )
+                _add_counter(
+                    lines,
+                    f"{prefix}_retries_total",
+                    "Number of retries after a transient failure.",
+                    methods,
+                    "retries",
+                )
+                _add_counter(
+                    lines,
+                    f"{prefix}_throttled_retries_total",
+                    "Number of retries skipped because the retry budget was exhausted.",
+                    methods,
+                    "throttled_retries",
+                )
+                _add_counter(
+                    lines,
+                    f"{prefix}_compressed_requests_total",
+                    "Number of requests sent compressed.",
+                    methods,
+                    "compressed_requests",
+                )
+                _add_counter(
+                    lines,
+                    f"{prefix}_coalesced_total",
+                    "Number of requests that shared the RPC of an identical request.",
+                    methods,
+                    "coalesced",
+                )
+        return "\n".join(lines) + "\n"
+
+
+def _label(method: str) -> str:
+    escaped = method.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+    return f'method="{escaped}"'
+
+
+def _add_counter(lines: list[str], name: str, help_text: str, methods: dict, key: str):
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} counter")
+    for method, stats in methods.items():
+        lines.append(f"{name}{{{_label(method)}}} {stats[key]}")
+
+
+def _add_histogram(lines: list[str], name: str, help_text: str, methods: dict):
+    lines.append(f"# HELP {name} {help_text}")
+    lines.append(f"# TYPE {name} histogram")
+    for method, stats in methods.items():
+        label = _label(method)
+        latency = stats["latency"]
+        cumulative = 0
+        for bound, count in zip(latency["buckets"], latency["counts"]):
+            cumulative += count
+            lines.append(f'{name}_bucket{{{label},le="{bound}"}} {cumulative}')
+        lines.append(f'{name}_bucket{{{label},le="+Inf"}} {latency["count"]}')
+        lines.append(f"{name}_sum{{{label}}} {latency['sum']}")
+        lines.append(f"{name}_count{{{label}}} {latency['count']}")
+
+
+class _MeteredResponseStream:
+    """Response iterator of a server-streaming RPC recording the call once it ends."""
+
+    def __init__(self, call, registry: MetricsRegistry, method: str, start: float, size: int):
+        self._call = call
+        self._registry = registry
+        self._method = method
+        self._start = start
+        self._request_bytes = size
+        self._response_bytes = 0
+        self._responses = 0
+        self._recorded = False
+
+    def _record(self, error: bool):
+        if not self._recorded:
+            self._recorded = True
+            self._registry.record_rpc(
+                self._method,
+                time.perf_counter() - self._start,
+                self._request_bytes,
+                self._response_bytes,
+                self._responses,
+                error,
+            )
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        try:
+            response = next(self._call)
+        except StopIteration:
+            self._record(False)
+            raise
+        except grpc.RpcError:
+            self._record(True)
+            raise
+        self._responses += 1
+        self._response_bytes += response.ByteSize()
+        return response
+
+    def cancel(self):
+        """Cancel the RPC and record it as failed if it was still running."""
+        cancelled = self._call.cancel()
+        self._record(True)
+        return cancelled
+
+    def __getattr__(self, name: str):
+        # Delegate the grpc.Call interface (code, details, is_active, ...) to the call
+        return getattr(self._call, name)
+
+
+class MetricsInterceptor(grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor):
+    """gRPC client interceptor recording every RPC in a :class:`MetricsRegistry`.
+
+    Parameters
+    ----------
+    registry: MetricsRegistry
+        Registry receiving the metrics.
+    """
+
+    def __init__(self, registry: MetricsRegistry):
+        """Initialize the interceptor."""
+        self.registry = registry
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        """Record a unary RPC once it completes."""
+        registry = self.registry
+        if not registry.enabled:
+            return continuation(client_call_details, request)
+
+        method = client_call_details.method
+        start = time.perf_counter()
+        outcome = continuation(client_call_details, request)
+
+        def record(future):
+            latency = time.perf_counter() - start
+            try:
+                error = future.exception() is not None
+            except grpc.FutureCancelledError:
+                error = True
+            response_bytes = 0 if error else future.result().ByteSize()
+            registry.record_rpc(
+                method, latency, request.ByteSize(), response_bytes, int(not error), error
+            )
+
+        outcome.add_done_callback(record)
+        return outcome
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        """Record a server-streaming RPC once its last response is received."""
+        registry = self.registry
+        if not registry.enabled:
+            return continuation(client_call_details, request)
+
+        start = time.perf_counter()
+        call = continuation(client_call_details, request)
+        return _MeteredResponseStream(
+            call, registry, client_call_details.method, start, request.ByteSize()
+        )
@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for importing the optional dependencies of PySherlock."""
+
+
+def import_numpy(feature: str):
+    """Import NumPy, which is only needed by the array-based methods.
+
+    Parameters
+    ----------
+    feature: str
+        Name of the feature requiring NumPy, used in the error message.
+
+    Returns
+    -------
+    module
+        The ``numpy`` module.
+    """
+    try:
+        import numpy
+    except ImportError:
+        raise ImportError(
+            f"NumPy is required to use {feature}. Install it with 'pip install numpy'."
+        )
+    return numpy
+
+
+def import_yaml(feature: str):
+    """Import PyYAML, which is only needed to read YAML files.
+
+    Parameters
+    ----------
+    feature: str
+        Name of the feature requiring PyYAML, used in the error message.
+
+    Returns
+    -------
+    module
+        The ``yaml`` module.
+    """
+    try:
+        import yaml
+    except ImportError:
+        raise ImportError(
+            f"PyYAML is required to use {feature}. Install it with 'pip install pyyaml'."
+        )
+    return yaml
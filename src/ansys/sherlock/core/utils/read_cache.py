@@ -0,0 +1,462 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for caching the responses of the queries sent again and again for the same project.
+
+Scripts often ask Sherlock for the same project data several times, such as the CCAs of a
+project, the layer count of a stackup or the layers of a CCA. :class:`ReadCacheInterceptor`
+answers these queries from a :class:`ReadCache` while the project has not changed, instead
+of sending an RPC.
+
+Cached queries are grouped in families, listed in :data:`QUERY_FAMILIES`. Each RPC that is
+not a read, for example updating a conductor layer or adding a CCA, removes the entries of
+its project in the families it changes, listed in :data:`INVALIDATIONS`. RPCs missing from
+that table remove every entry of their project, so a new mutating RPC never leaves stale
+entries. Entries are also removed after a time to live and, when the cache is full, in
+least recently used order.
+"""
+
+from collections import OrderedDict
+from fnmatch import fnmatchcase
+import threading
+import time
+from typing import Optional
+
+import grpc
+
+from ansys.sherlock.core.utils.retries import IDEMPOTENT_METHODS
+
+QUERY_FAMILIES = {
+    "ccas": ("SherlockProjectService/listCCAs",),
+    "thermal_maps": ("SherlockProjectService/listThermalMaps",),
+    "strain_maps": ("SherlockProjectService/listStrainMaps",),
+    "stackup": (
+        "SherlockStackupService/listConductorLayers",
+        "SherlockStackupService/listLaminates",
+        "SherlockStackupService/getLayerCount",
+        "SherlockStackupService/getStackupProps",
+        "SherlockStackupService/getTotalConductorThickness",
+    ),
+    "layers": (
+        "SherlockLayerService/listLayers",
+        "SherlockLayerService/getMountPointsProperties",
+        "SherlockLayerService/getICTFixturesProperties",
+    ),
+    "life_cycle": (
+        "SherlockLifeCycleService/listLifeCycleEvents",
+        "SherlockLifeCycleService/listHarmonicEvents",
+        "SherlockLifeCycleService/listRandomVibeEvents",
+        "SherlockLifeCycleService/listShockEvents",
+    ),
+    "analysis_props": (
+        "SherlockAnalysisService/get*InputFields",
+        "SherlockAnalysisService/getPartsListValidationProps",
+    ),
+}
+"""Patterns of the cached unary RPCs, by query family."""
+
+INVALIDATIONS = {
+    "SherlockProjectService/addCCA": ("ccas",),
+    "SherlockProjectService/addStrainMap": ("strain_maps",),
+    "SherlockProjectService/*ThermalMaps": ("thermal_maps",),
+    "SherlockStackupService/*": ("stackup", "layers"),
+    "SherlockLayerService/*": ("layers",),
+    "SherlockLifeCycleService/*": ("life_cycle",),
+    "SherlockAnalysisService/update*": ("analysis_props",),
+    "SherlockAnalysisService/run*": (),
+    "SherlockPartsService/*": (),
+    "SherlockCommonService/*": (),
+    "SherlockProjectService/gen*Report": (),
+    "*/export*": (),
+    "*/save*": (),
+}
+"""Query families changed by the mutating RPCs, by pattern.
+
+The last pattern matching an RPC applies. Mutating RPCs matching no pattern, such as the
+imports of projects, change every family.
+"""
+
+
+class ReadCache:
+    """Cache of the responses of the project queries of a connection.
+
+    Entries are keyed by RPC and serialized request, which holds the project, the CCA and
+    the other arguments of the query. Queries without a project, such as the analysis input
+    fields, are only removed by the time to live, the size limit or :meth:`clear`.
+
+    Parameters
+    ----------
+    max_entries: int, optional
+        Maximum number of cached responses. The least recently used one is removed when the
+        cache is full. The default is ``1024``.
+    ttl: float, optional
+        Time (in seconds) during which a response is used. ``None`` keeps the responses until
+        they are invalidated or removed by the size limit. The default is ``300``.
+    query_families: dict[str, tuple[str, ...]], optional
+        Patterns of the cached RPCs, by query family, matched with ``fnmatch`` against the
+        name of the RPC in the ``"Service/method"`` form. RPCs that do not only read data are
+        never cached. The default is :data:`QUERY_FAMILIES`.
+    invalidations: dict[str, tuple[str, ...]], optional
+        Query families changed by the mutating RPCs, by pattern. The default is
+        :data:`INVALIDATIONS`.
+
+    Examples
+    --------
+    >>> from ansys.sherlock.core import launcher
+    >>> from ansys.sherlock.core.utils.read_cache import ReadCache
+    >>> sherlock = launcher.connect(port=9092, transport_mode="wnua", read_cache=ReadCache())
+    >>> sherlock.stackup.get_layer_count("Test", "Card")
+    >>> sherlock.stackup.get_layer_count("Test", "Card")
+    >>> print(sherlock.read_cache.stats()["hits"])
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 1024,
+        ttl: Optional[float] = 300.0,
+        query_families: dict[str, tuple[str, ...]] = QUERY_FAMILIES,
+        invalidations: dict[str, tuple[str, ...]] = INVALIDATIONS,
+    ):
+        """Initialize an empty cache."""
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.query_families = dict(query_families)
+        self.invalidations = dict(invalidations)
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidated = 0
+        self._entries: "OrderedDict[tuple[str, bytes], tuple]" = OrderedDict()
+        self._families: dict[str, Optional[str]] = {}
+        self._changes: dict[str, tuple[str, ...]] = {}
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    @property
+    def generation(self) -> int:
+        """Number of invalidations so far, used to discard responses older than one."""
+        return self._generation
+
+    def family_of(self, method: str) -> Optional[str]:
+        """Return the query family of an RPC.
+
+        Parameters
+        ----------
+        method: str
+            Name of the RPC, for example ``"/SherlockProjectService/listCCAs"``.
+
+        Returns
+        -------
+        str
+            Query family of the RPC, or ``None`` if its responses are not cached.
+        """
+        if method not in self._families:
+            name = method.lstrip("/")
+            family = None
+            if any(fnmatchcase(name, pattern) for pattern in IDEMPOTENT_METHODS):
+                family = next(
+                    (
+                        family
+                        for family, patterns in self.query_families.items()
+                        if any(fnmatchcase(name, pattern) for pattern in patterns)
+                    ),
+                    None,
+                )
+            self._families[method] = family
+        return self._families[method]
+
+    def changed_families(self, method: str) -> tuple[str, ...]:
+        """Return the query families changed by an RPC.
+
+        Parameters
+        ----------
+        method: str
+            Name of the RPC, for example ``"/SherlockStackupService/updateConductorLayer"``.
+
+        Returns
+        -------
+        tuple[str, ...]
+            Query families whose entries the RPC invalidates. Empty for the RPCs that only
+            read data.
+        """
+        changes = self._changes.get(method)
+        if changes is None:
+            name = method.lstrip("/")
+            changes = tuple(self.query_families)
+            if any(fnmatchcase(name, pattern) for pattern in IDEMPOTENT_METHODS):
+                changes = ()
+            else:
+                for pattern, families in self.invalidations.items():
+                    if fnmatchcase(name, pattern):
+                        changes = tuple(families)
+            self._changes[method] = changes
+        return changes
+
+    def get(self, key: tuple[str, bytes]):
+        """Return a cached response, or ``None`` if it is missing or expired.
+
+        Parameters
+        ----------
+        key: tuple[str, bytes]
+            Name of the RPC and serialized request.
+
+        Returns
+        -------
+        Message
+            Copy of the cached response, which the caller can modify.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry[3] is not None and entry[3] <= time.monotonic():
+                del self._entries[key]
+                self.expirations += 1
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            response = entry[2]
+        copy = type(response)()
+        copy.CopyFrom(response)
+        return copy
+
+    def put(self, key: tuple[str, bytes], project: Optional[str], response, generation: int):
+        """Cache a response, unless an invalidation happened since its request was sent.
+
+        Parameters
+        ----------
+        key: tuple[str, bytes]
+            Name of the RPC and serialized request.
+        project: str, optional
+            Project of the request, or ``None`` if the query does not depend on a project.
+        response: Message
+            Response of the RPC.
+        generation: int
+            :attr:`generation` when the request was sent.
+        """
+        family = self.family_of(key[0])
+        expires = None if self.ttl is None else time.monotonic() + self.ttl
+        with self._lock:
+            if generation != self._generation or self.max_entries <= 0:
+                return
+            self._entries[key] = (project, family, response, expires)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def invalidate(self, project: Optional[str] = None, families: Optional[tuple[str, ...]] = None):
+        """Remove the entries of a project.
+
+        Parameters
+        ----------
+        project: str, optional
+            Project whose entries are removed. The default is ``None``, in which case the
+            entries of every project are removed.
+        families: tuple[str, ...], optional
+            Query families whose entries are removed. The default is ``None``, in which case
+            the entries of every family are removed.
+        """
+        with self._lock:
+            self._generation += 1
+            for key, entry in list(self._entries.items()):
+                if entry[0] is None:
+                    continue
+                if project is not None and entry[0] != project:
+                    continue
+                if families is not None and entry[1] not in families:
+                    continue
+                del self._entries[key]
+                self.invalidated += 1
+
+    def clear(self):
+        """Remove every entry, including those of the queries without a project."""
+        with self._lock:
+            self._generation += 1
+            self._entries.clear()
+
+    def stats(self) -> dict:
+        """Return the statistics of the cache.
+
+        Returns
+        -------
+        dict
+            ``"entries"``, the number of cached responses, ``"hits"`` and ``"misses"``, the
+            number of queries answered from the cache or sent to Sherlock, ``"hit_ratio"``,
+            ``"evictions"``, ``"expirations"`` and ``"invalidated"``, the number of entries
+            removed by the size limit, the time to live and the mutating RPCs.
+        """
+        with self._lock:
+            queries = self.hits + self.misses
+            return {
+                "entries": len(self._entries),
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / queries if queries else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+                "invalidated": self.invalidated,
+            }
+
+
+def _project_of(request) -> Optional[str]:
+    """Return the project of a request, or ``None`` if it has none."""
+    project = getattr(request, "project", None)
+    return project or None
+
+
+class _CachedOutcome(grpc.Call, grpc.Future):
+    """Completed unary RPC whose response comes from the cache."""
+
+    def __init__(self, response):
+        self._response = response
+
+    def result(self, timeout=None):
+        return self._response
+
+    def exception(self, timeout=None):
+        return None
+
+    def traceback(self, timeout=None):
+        return None
+
+    def add_done_callback(self, fn):
+        fn(self)
+
+    def cancel(self):
+        return False
+
+    def cancelled(self):
+        return False
+
+    def running(self):
+        return False
+
+    def done(self):
+        return True
+
+    def is_active(self):
+        return False
+
+    def time_remaining(self):
+        return None
+
+    def add_callback(self, callback):
+        return False
+
+    def initial_metadata(self):
+        return ()
+
+    def trailing_metadata(self):
+        return ()
+
+    def code(self):
+        return grpc.StatusCode.OK
+
+    def details(self):
+        return ""
+
+
+class ReadCacheInterceptor(
+    grpc.UnaryUnaryClientInterceptor,
+    grpc.UnaryStreamClientInterceptor,
+    grpc.StreamUnaryClientInterceptor,
+    grpc.StreamStreamClientInterceptor,
+):
+    """gRPC client interceptor answering the project queries from a :class:`ReadCache`.
+
+    Parameters
+    ----------
+    cache: ReadCache
+        Cache of the responses.
+    """
+
+    def __init__(self, cache: ReadCache):
+        """Initialize the interceptor."""
+        self.cache = cache
+
+    def _invalidate(self, method: str, project: Optional[str]):
+        families = self.cache.changed_families(method)
+        if families:
+            self.cache.invalidate(project, families)
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        """Answer a query from the cache, or send a unary RPC."""
+        cache = self.cache
+        method = client_call_details.method
+        project = _project_of(request)
+        if cache.family_of(method) is None:
+            # Invalidate before and after the mutation, so that no query sent meanwhile
+            # leaves a response older than the mutation in the cache.
+            self._invalidate(method, project)
+            outcome = continuation(client_call_details, request)
+            outcome.add_done_callback(lambda _: self._invalidate(method, project))
+            return outcome
+
+        key = (method, request.SerializeToString(deterministic=True))
+        response = cache.get(key)
+        if response is not None:
+            return _CachedOutcome(response)
+        generation = cache.generation
+
+        def store(future):
+            try:
+                if future.exception() is not None:
+                    return
+            except grpc.FutureCancelledError:
+                return
+            response = future.result()
+            return_code = getattr(response, "returnCode", None)
+            # Failures, reported in the return code of the response, are not cached.
+            if return_code is None or return_code.value == 0:
+                cache.put(key, project, response, generation)
+
+        # Store the response once it arrives, without blocking RPCs sent with future().
+        outcome = continuation(client_call_details, request)
+        outcome.add_done_callback(store)
+        return outcome
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        """Send a server-streaming RPC, invalidating the queries it changes."""
+        project = _project_of(request)
+        self._invalidate(client_call_details.method, project)
+        call = continuation(client_call_details, request)
+        call.add_done_callback(lambda _: self._invalidate(client_call_details.method, project))
+        return call
+
+    def intercept_stream_unary(self, continuation, client_call_details, request_iterator):
+        """Send a client-streaming RPC, invalidating the queries it changes in every project."""
+        self._invalidate(client_call_details.method, None)
+        outcome = continuation(client_call_details, request_iterator)
+        outcome.add_done_callback(lambda _: self._invalidate(client_call_details.method, None))
+        return outcome
+
+    def intercept_stream_stream(self, continuation, client_call_details, request_iterator):
+        """Send a bidirectional RPC, invalidating the queries it changes in every project."""
+        self._invalidate(client_call_details.method, None)
+        call = continuation(client_call_details, request_iterator)
+        call.add_done_callback(lambda _: self._invalidate(client_call_details.method, None))
+        return call
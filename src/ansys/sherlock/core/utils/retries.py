@@ -0,0 +1,443 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for retrying the idempotent RPCs that fail with a transient error.
+
+While Sherlock is busy, RPCs can fail with ``UNAVAILABLE``. :class:`RetryInterceptor` sends
+the RPCs matching :data:`IDEMPOTENT_METHODS` again, after an exponential backoff with full
+jitter. A :class:`RetryBudget` shared by all the RPCs of a connection stops the retries
+while most attempts fail, so that a server that is down is not flooded with retries.
+
+Unary RPCs sent with ``future()`` are sent again from a done callback after the backoff, so
+that the future is returned at once. Server-streaming RPCs are only retried until their
+first response is received. Every retry is recorded in the
+:class:`ansys.sherlock.core.utils.metrics.MetricsRegistry` of the connection, if metrics are
+enabled.
+"""
+
+from fnmatch import fnmatchcase
+import random
+import threading
+import time
+from typing import Optional
+
+import grpc
+
+from ansys.sherlock.core.utils.deadlines import _CallDetails
+from ansys.sherlock.core.utils.metrics import MetricsRegistry
+
+IDEMPOTENT_METHODS = (
+    "*/get*",
+    "*/list*",
+    "SherlockCommonService/isSherlockClientLoading",
+)
+"""Patterns of the RPCs that only read data, which can safely be sent again."""
+
+
+class RetryBudget:
+    """Token bucket limiting the retries while most attempts fail.
+
+    Each failed attempt removes one token and each successful one adds ``token_ratio``
+    tokens. Retries are allowed only while more than half of the tokens remain.
+
+    Parameters
+    ----------
+    max_tokens: float, optional
+        Number of tokens in a full bucket. The default is ``10``.
+    token_ratio: float, optional
+        Number of tokens added by each successful attempt. The default is ``0.1``.
+    """
+
+    def __init__(self, max_tokens: float = 10.0, token_ratio: float = 0.1):
+        """Initialize a full bucket."""
+        self.max_tokens = max_tokens
+        self.token_ratio = token_ratio
+        self._tokens = max_tokens
+        self._lock = threading.Lock()
+
+    @property
+    def tokens(self) -> float:
+        """Number of tokens left."""
+        return self._tokens
+
+    def on_success(self):
+        """Record a successful attempt."""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.token_ratio)
+
+    def on_failure(self) -> bool:
+        """Record a failed attempt and return whether it can be retried."""
+        with self._lock:
+            self._tokens = max(0.0, self._tokens - 1)
+            return self._tokens > self.max_tokens / 2
+
+
+class RetryPolicy:
+    """Retries of the idempotent RPCs of a connection.
+
+    Parameters
+    ----------
+    max_attempts: int, optional
+        Maximum number of attempts of each RPC, the first one included. ``1`` disables the
+        retries. The default is ``4``.
+    initial_backoff: float, optional
+        Maximum time (in seconds) to wait before the first retry. The default is ``0.1``.
+    max_backoff: float, optional
+        Maximum time (in seconds) to wait before any retry. The default is ``5``.
+    backoff_multiplier: float, optional
+        Factor applied to the maximum wait after each retry. The default is ``2``.
+    retryable_codes: tuple[grpc.StatusCode, ...], optional
+        Status codes of the failures that are retried. The default is ``UNAVAILABLE`` only.
+    idempotent_methods: tuple[str, ...], optional
+        Patterns of the RPCs that are retried, matched with ``fnmatch`` against the name of
+        the RPC in the ``"Service/method"`` form. The default is :data:`IDEMPOTENT_METHODS`.
+    budget: RetryBudget, optional
+        Budget of the retries. The default is ``None``, in which case the policy has a
+        budget of its own, shared by every connection using the policy.
+    """
+
+    def __init__(
+        self,
+        max_attempts: int = 4,
+        initial_backoff: float = 0.1,
+        max_backoff: float = 5.0,
+        backoff_multiplier: float = 2.0,
+        retryable_codes: tuple[grpc.StatusCode, ...] = (grpc.StatusCode.UNAVAILABLE,),
+        idempotent_methods: tuple[str, ...] = IDEMPOTENT_METHODS,
+        budget: Optional[RetryBudget] = None,
+    ):
+        """Initialize the policy."""
+        self.max_attempts = max_attempts
+        self.initial_backoff = initial_backoff
+        self.max_backoff = max_backoff
+        self.backoff_multiplier = backoff_multiplier
+        self.retryable_codes = frozenset(retryable_codes)
+        self.idempotent_methods = tuple(idempotent_methods)
+        self.budget = budget or RetryBudget()
+        self._retryable: dict[str, bool] = {}
+
+    def is_retryable(self, method: str) -> bool:
+        """Return whether an RPC is retried.
+
+        Parameters
+        ----------
+        method: str
+            Name of the RPC, for example ``"/SherlockProjectService/listCCAs"``.
+
+        Returns
+        -------
+        bool
+            Whether the RPC is idempotent and retries are enabled.
+        """
+        retryable = self._retryable.get(method)
+        if retryable is None:
+            name = method.lstrip("/")
+            retryable = self._retryable[method] = self.max_attempts > 1 and any(
+                fnmatchcase(name, pattern) for pattern in self.idempotent_methods
+            )
+        return retryable
+
+    def backoff(self, retry: int) -> float:
+        """Return the time (in seconds) to wait before a retry.
+
+        Parameters
+        ----------
+        retry: int
+            Number of the retry, starting at ``1``.
+
+        Returns
+        -------
+        float
+            Random time between ``0`` and the maximum wait of the retry.
+        """
+        ceiling = self.initial_backoff * self.backoff_multiplier ** (retry - 1)
+        return random.uniform(0, min(self.max_backoff, ceiling))
+
+
+class _RetryingResponseStream:
+    """Response iterator sending a server-streaming RPC again until it yields a response."""
+
+    def __init__(self, interceptor: "RetryInterceptor", continuation, client_call_details, request):
+        self._interceptor = interceptor
+        self._continuation = continuation
+        self._details = client_call_details
+        self._request = request
+        self._start = time.monotonic()
+        self._attempt = 1
+        self._started = False
+        self._call = continuation(client_call_details, request)
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        while True:
+            try:
+                response = next(self._call)
+            except StopIteration:
+                if not self._started:
+                    self._interceptor.policy.budget.on_success()
+                raise
+            except grpc.RpcError as e:
+                if self._started or not self._interceptor._retry(
+                    self._details, e, self._attempt, self._start
+                ):
+                    raise
+                self._attempt += 1
+                self._call = self._continuation(
+                    _remaining(self._details, self._start), self._request
+                )
+                continue
+            if not self._started:
+                self._started = True
+                self._interceptor.policy.budget.on_success()
+            return response
+
+    def __getattr__(self, name: str):
+        # Delegate the grpc.Call interface (code, details, cancel, ...) to the last attempt
+        return getattr(self._call, name)
+
+
+class _RetryingFuture(grpc.Call, grpc.Future):
+    """Unary RPC sent with ``future()``, sent again from a done callback after a failure."""
+
+    def __init__(
+        self,
+        interceptor: "RetryInterceptor",
+        continuation,
+        client_call_details,
+        request,
+        outcome,
+        start: float,
+    ):
+        self._interceptor = interceptor
+        self._continuation = continuation
+        self._details = client_call_details
+        self._request = request
+        self._start = start
+        self._attempt = 1
+        self._outcome = outcome
+        self._timer: Optional[threading.Timer] = None
+        self._cancelled = False
+        self._done = threading.Event()
+        self._callbacks = []
+        self._lock = threading.Lock()
+        outcome.add_done_callback(self._on_attempt_done)
+
+    def _on_attempt_done(self, outcome):
+        try:
+            error = outcome.exception()
+        except grpc.FutureCancelledError:
+            self._finish()
+            return
+        if error is None:
+            self._interceptor.policy.budget.on_success()
+            self._finish()
+            return
+        delay = None
+        if isinstance(error, grpc.RpcError):
+            delay = self._interceptor._retry_delay(self._details, error, self._attempt, self._start)
+        with self._lock:
+            if delay is not None and not self._cancelled:
+                self._timer = threading.Timer(delay, self._send_again)
+                self._timer.daemon = True
+                self._timer.start()
+                return
+        self._finish()
+
+    def _send_again(self):
+        with self._lock:
+            if self._cancelled:
+                return
+            self._attempt += 1
+            self._outcome = self._continuation(
+                _remaining(self._details, self._start), self._request
+            )
+        self._outcome.add_done_callback(self._on_attempt_done)
+
+    def _finish(self):
+        with self._lock:
+            if self._done.is_set():
+                return
+            self._done.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for fn in callbacks:
+            fn(self)
+
+    def _wait(self, timeout):
+        if not self._done.wait(timeout):
+            raise grpc.FutureTimeoutError()
+        if self._cancelled:
+            raise grpc.FutureCancelledError()
+        return self._outcome
+
+    def result(self, timeout=None):
+        return self._wait(timeout).result()
+
+    def exception(self, timeout=None):
+        return self._wait(timeout).exception()
+
+    def traceback(self, timeout=None):
+        return self._wait(timeout).traceback()
+
+    def add_done_callback(self, fn):
+        with self._lock:
+            if not self._done.is_set():
+                self._callbacks.append(fn)
+                return
+        fn(self)
+
+    def cancel(self):
+        with self._lock:
+            if self._done.is_set():
+                return False
+            self._cancelled = True
+            timer, outcome = self._timer, self._outcome
+        if timer is not None:
+            timer.cancel()
+        outcome.cancel()
+        self._finish()
+        return True
+
+    def cancelled(self):
+        return self._cancelled
+
+    def running(self):
+        return not self._done.is_set()
+
+    def done(self):
+        return self._done.is_set()
+
+    def is_active(self):
+        return not self._done.is_set()
+
+    def time_remaining(self):
+        if self._details.timeout is None:
+            return None
+        return max(0.0, self._details.timeout - (time.monotonic() - self._start))
+
+    def add_callback(self, callback):
+        return self._outcome.add_callback(callback)
+
+    def initial_metadata(self):
+        return self._outcome.initial_metadata()
+
+    def trailing_metadata(self):
+        return self._wait(None).trailing_metadata()
+
+    def code(self):
+        return self._wait(None).code()
+
+    def details(self):
+        return self._wait(None).details()
+
+
+def _remaining(client_call_details, start: float):
+    """Return the call details with the part of the timeout left after the previous attempts."""
+    if client_call_details.timeout is None:
+        return client_call_details
+    return _CallDetails(
+        client_call_details.method,
+        client_call_details.timeout - (time.monotonic() - start),
+        client_call_details.metadata,
+        client_call_details.credentials,
+        client_call_details.wait_for_ready,
+        getattr(client_call_details, "compression", None),
+    )
+
+
+class RetryInterceptor(grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor):
+    """gRPC client interceptor retrying the idempotent RPCs of a :class:`RetryPolicy`.
+
+    Parameters
+    ----------
+    policy: RetryPolicy
+        Retries of the RPCs.
+    metrics: MetricsRegistry, optional
+        Registry recording the retries. The default is ``None``.
+    """
+
+    def __init__(self, policy: RetryPolicy, metrics: Optional[MetricsRegistry] = None):
+        """Initialize the interceptor."""
+        self.policy = policy
+        self.metrics = metrics
+
+    def _retry_delay(
+        self, client_call_details, error: grpc.RpcError, attempt: int, start: float
+    ) -> Optional[float]:
+        """Return the time to wait before retrying a failed attempt, or ``None``."""
+        policy = self.policy
+        if error.code() not in policy.retryable_codes:
+            return None
+        allowed = policy.budget.on_failure()
+        if attempt >= policy.max_attempts:
+            return None
+        method = client_call_details.method
+        if not allowed:
+            if self.metrics is not None and self.metrics.enabled:
+                self.metrics.record_retry(method, throttled=True)
+            return None
+        delay = policy.backoff(attempt)
+        timeout = client_call_details.timeout
+        if timeout is not None and time.monotonic() - start + delay >= timeout:
+            return None
+        if self.metrics is not None and self.metrics.enabled:
+            self.metrics.record_retry(method)
+        return delay
+
+    def _retry(self, client_call_details, error: grpc.RpcError, attempt: int, start: float):
+        """Wait before retrying a failed attempt, or return ``False`` if it cannot be retried."""
+        delay = self._retry_delay(client_call_details, error, attempt, start)
+        if delay is None:
+            return False
+        time.sleep(delay)
+        return True
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        """Send a unary RPC, again after a transient failure if it is idempotent."""
+        if not self.policy.is_retryable(client_call_details.method):
+            return continuation(client_call_details, request)
+        start = time.monotonic()
+        outcome = continuation(client_call_details, request)
+        if not outcome.done():
+            # Sent with future(): retry from a done callback rather than blocking the caller.
+            return _RetryingFuture(self, continuation, client_call_details, request, outcome, start)
+        attempt = 1
+        while True:
+            error = outcome.exception()
+            if error is None:
+                self.policy.budget.on_success()
+                return outcome
+            if not isinstance(error, grpc.RpcError) or not self._retry(
+                client_call_details, error, attempt, start
+            ):
+                return outcome
+            attempt += 1
+            outcome = continuation(_remaining(client_call_details, start), request)
+
+    def intercept_unary_stream(self, continuation, client_call_details, request):
+        """Send a server-streaming RPC, again after a transient failure if it is idempotent."""
+        if not self.policy.is_retryable(client_call_details.method):
+            return continuation(client_call_details, request)
+        return _RetryingResponseStream(self, continuation, client_call_details, request)
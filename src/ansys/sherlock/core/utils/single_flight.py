@@ -0,0 +1,285 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for sharing one RPC between identical read requests sent at the same time.
+
+When several threads send the same read request at the same moment, for example listing
+the CCAs of a project, :class:`SingleFlightInterceptor` only sends the first one to
+Sherlock. The others receive the same response, or the same error, once it arrives. No
+request blocks in the interceptor, so requests sent with ``future()`` return at once.
+Requests are identical when they call the same method with the same serialized request.
+
+Only unary RPCs that only read data are coalesced: a method is coalesced when it matches
+the patterns of a :class:`SingleFlightPolicy` and the read-only methods of
+:data:`ansys.sherlock.core.utils.retries.IDEMPOTENT_METHODS`, so that a mutating call is
+never shared, whatever the configuration.
+"""
+
+from fnmatch import fnmatchcase
+import threading
+import time
+from typing import Optional
+
+import grpc
+
+from ansys.sherlock.core.utils.metrics import MetricsRegistry
+from ansys.sherlock.core.utils.retries import IDEMPOTENT_METHODS
+
+
+class SingleFlightPolicy:
+    """Methods whose identical concurrent requests share one RPC.
+
+    Parameters
+    ----------
+    methods: tuple[str, ...], optional
+        Patterns of the coalesced RPCs, matched with ``fnmatch`` against the name of the RPC
+        in the ``"Service/method"`` form. Patterns matching mutating RPCs are ignored. The
+        default is :data:`ansys.sherlock.core.utils.retries.IDEMPOTENT_METHODS`, every read.
+        ``()`` disables the coalescing.
+    """
+
+    def __init__(self, methods: tuple[str, ...] = IDEMPOTENT_METHODS):
+        """Initialize the policy."""
+        self.methods = tuple(methods)
+        self._coalesced: dict[str, bool] = {}
+
+    def is_coalesced(self, method: str) -> bool:
+        """Return whether identical concurrent requests of an RPC share one RPC.
+
+        Parameters
+        ----------
+        method: str
+            Name of the RPC, for example ``"/SherlockProjectService/listCCAs"``.
+
+        Returns
+        -------
+        bool
+            Whether the RPC only reads data and matches a pattern of the policy.
+        """
+        coalesced = self._coalesced.get(method)
+        if coalesced is None:
+            name = method.lstrip("/")
+            coalesced = self._coalesced[method] = any(
+                fnmatchcase(name, pattern) for pattern in self.methods
+            ) and any(fnmatchcase(name, pattern) for pattern in IDEMPOTENT_METHODS)
+        return coalesced
+
+
+class _Flight:
+    """RPC in flight, shared by the identical requests sent meanwhile."""
+
+    def __init__(self):
+        self.done = threading.Event()
+        self.outcome = None
+        self.error: Optional[BaseException] = None
+        self._callbacks = []
+        self._lock = threading.Lock()
+
+    def add_done_callback(self, fn):
+        """Call ``fn`` once the RPC completes, at once if it has completed."""
+        with self._lock:
+            if not self.done.is_set():
+                self._callbacks.append(fn)
+                return
+        fn()
+
+    def land(self):
+        """Mark the RPC as completed and call the done callbacks."""
+        with self._lock:
+            self.done.set()
+            callbacks, self._callbacks = self._callbacks, []
+        for fn in callbacks:
+            fn()
+
+
+class _DeadlineExceededOutcome(grpc.RpcError, grpc.Call, grpc.Future):
+    """Unary RPC whose deadline passed while it waited for an identical RPC in flight."""
+
+    def result(self, timeout=None):
+        raise self
+
+    def exception(self, timeout=None):
+        return self
+
+    def traceback(self, timeout=None):
+        return None
+
+    def add_done_callback(self, fn):
+        fn(self)
+
+    def cancel(self):
+        return False
+
+    def cancelled(self):
+        return False
+
+    def running(self):
+        return False
+
+    def done(self):
+        return True
+
+    def is_active(self):
+        return False
+
+    def time_remaining(self):
+        return 0
+
+    def add_callback(self, callback):
+        return False
+
+    def initial_metadata(self):
+        return ()
+
+    def trailing_metadata(self):
+        return ()
+
+    def code(self):
+        return grpc.StatusCode.DEADLINE_EXCEEDED
+
+    def details(self):
+        return "Deadline Exceeded"
+
+
+class _SharedOutcome(grpc.Call, grpc.Future):
+    """Unary RPC of a request sharing an identical RPC in flight, with a deadline of its own."""
+
+    def __init__(self, flight: _Flight, timeout: Optional[float]):
+        self._flight = flight
+        self._deadline = None if timeout is None else time.monotonic() + timeout
+
+    def _outcome(self, timeout):
+        """Wait for the shared RPC and return its outcome."""
+        remaining = self.time_remaining()
+        expires = remaining is not None and (timeout is None or remaining <= timeout)
+        if not self._flight.done.wait(remaining if expires else timeout):
+            if expires:
+                return _DeadlineExceededOutcome()
+            raise grpc.FutureTimeoutError()
+        if self._flight.error is not None:
+            raise self._flight.error
+        return self._flight.outcome
+
+    def result(self, timeout=None):
+        return self._outcome(timeout).result()
+
+    def exception(self, timeout=None):
+        return self._outcome(timeout).exception()
+
+    def traceback(self, timeout=None):
+        return self._outcome(timeout).traceback()
+
+    def add_done_callback(self, fn):
+        self._flight.add_done_callback(lambda: fn(self))
+
+    def cancel(self):
+        return False
+
+    def cancelled(self):
+        return False
+
+    def running(self):
+        return not self._flight.done.is_set()
+
+    def done(self):
+        return self._flight.done.is_set()
+
+    def is_active(self):
+        return not self._flight.done.is_set()
+
+    def time_remaining(self):
+        if self._deadline is None:
+            return None
+        return max(0.0, self._deadline - time.monotonic())
+
+    def add_callback(self, callback):
+        return False
+
+    def initial_metadata(self):
+        return self._outcome(None).initial_metadata()
+
+    def trailing_metadata(self):
+        return self._outcome(None).trailing_metadata()
+
+    def code(self):
+        return self._outcome(None).code()
+
+    def details(self):
+        return self._outcome(None).details()
+
+
+class SingleFlightInterceptor(grpc.UnaryUnaryClientInterceptor):
+    """gRPC client interceptor sharing one RPC between identical concurrent read requests.
+
+    A request waiting for an RPC in flight keeps its own deadline: it fails with a
+    ``DEADLINE_EXCEEDED`` error if the RPC does not complete in time.
+
+    Parameters
+    ----------
+    policy: SingleFlightPolicy
+        Methods whose requests are coalesced.
+    metrics: MetricsRegistry, optional
+        Registry recording the requests that shared an RPC. The default is ``None``.
+    """
+
+    def __init__(self, policy: SingleFlightPolicy, metrics: Optional[MetricsRegistry] = None):
+        """Initialize the interceptor."""
+        self.policy = policy
+        self.metrics = metrics
+        self._flights: dict[tuple[str, bytes], _Flight] = {}
+        self._lock = threading.Lock()
+
+    def intercept_unary_unary(self, continuation, client_call_details, request):
+        """Send a unary RPC, or wait for an identical one in flight."""
+        method = client_call_details.method
+        if not self.policy.is_coalesced(method):
+            return continuation(client_call_details, request)
+
+        key = (method, request.SerializeToString(deterministic=True))
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if leader:
+                flight = self._flights[key] = _Flight()
+
+        if leader:
+            try:
+                flight.outcome = continuation(client_call_details, request)
+            except BaseException as e:
+                flight.error = e
+                self._land(key, flight)
+                raise
+            # The waiting requests receive the response once it arrives.
+            flight.outcome.add_done_callback(lambda _: self._land(key, flight))
+            return flight.outcome
+
+        if self.metrics is not None and self.metrics.enabled:
+            self.metrics.record_coalesced(method)
+        return _SharedOutcome(flight, client_call_details.timeout)
+
+    def _land(self, key: tuple[str, bytes], flight: _Flight):
+        """Stop sharing a completed RPC and release the requests waiting for it."""
+        with self._lock:
+            del self._flights[key]
+        flight.land()
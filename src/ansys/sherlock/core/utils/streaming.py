@@ -0,0 +1,112 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Module for iterating over the responses of server-streaming methods."""
+
+from typing import Generic, Iterator, TypeVar
+
+import grpc
+
+ResponseT = TypeVar("ResponseT")
+
+
+class ResponseStream(Generic[ResponseT]):
+    """Iterator over the responses of a server-streaming method as they arrive.
+
+    Responses are read from the channel only when the next one is requested, so a slow
+    consumer holds back the server through gRPC flow control instead of buffering the whole
+    result in memory. The call can be cancelled at any time with :meth:`cancel`, and it is
+    cancelled automatically when the stream is used as a context manager and left before
+    the last response.
+
+    Parameters
+    ----------
+    call: Iterator
+        Response iterator returned by the gRPC stub for a server-streaming method.
+    """
+
+    def __init__(self, call: Iterator[ResponseT]):
+        """Initialize the stream."""
+        self._call = call
+        self._done = False
+        self._cancelled = False
+        self.count = 0
+
+    def __iter__(self) -> "ResponseStream[ResponseT]":
+        """Return the stream itself."""
+        return self
+
+    def __next__(self) -> ResponseT:
+        """Wait for and return the next response."""
+        if self._done:
+            raise StopIteration
+        try:
+            response = next(self._call)
+        except StopIteration:
+            self._done = True
+            raise
+        except grpc.RpcError as e:
+            self._done = True
+            # Only a cancellation requested with cancel() ends the stream quietly. Any other
+            # status, including a cancellation by the server, is an error.
+            if (
+                self._cancelled
+                and isinstance(e, grpc.Call)
+                and e.code() == grpc.StatusCode.CANCELLED
+            ):
+                raise StopIteration
+            raise
+        self.count += 1
+        return response
+
+    @property
+    def done(self) -> bool:
+        """Whether the last response was read or the call was cancelled."""
+        return self._done
+
+    def cancel(self) -> bool:
+        """Cancel the call.
+
+        Returns
+        -------
+        bool
+            ``True`` if the call was still running and is now cancelled, ``False`` otherwise.
+        """
+        if self._done:
+            return False
+        self._done = True
+        self._cancelled = True
+        cancel = getattr(self._call, "cancel", None)
+        if cancel is not None:
+            cancel()
+        return True
+
+    def __enter__(self) -> "ResponseStream[ResponseT]":
+        """Enter the runtime context of the stream."""
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        """Cancel the call if responses are still pending."""
+        self.cancel()
+        return False
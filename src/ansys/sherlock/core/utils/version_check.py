@@ -23,7 +23,9 @@
 # SOFTWARE.
 
 """Module for version check done on api methods."""
+
 import functools
+import time
 
 from ansys.sherlock.core.errors import SherlockVersionError
 
@@ -43,6 +45,24 @@ SKIP_VERSION_CHECK = None
 #  0.9.0 : 25R2
 
 
+def _call(func, self, args, kwargs):
+    """Call an API method, recording it if metrics are collected for its object."""
+    metrics = getattr(self, "_metrics", None)
+    if metrics is None or not metrics.enabled:
+        return func(self, *args, **kwargs)
+
+    start = time.perf_counter()
+    error = True
+    try:
+        result = func(self, *args, **kwargs)
+        error = False
+        return result
+    finally:
+        metrics.record_api_call(
+            f"{type(self).__name__}.{func.__name__}", time.perf_counter() - start, error
+        )
+
+
 def require_version(min_version: int = _EARLIEST_SUPPORTED_VERSION, max_version: int = None):
     """Check version of server against expected version."""
 
@@ -59,7 +79,7 @@ def require_version(min_version: int = _EARLIEST_SUPPORTED_VERSION, max_version:
                 )
 
             if self._server_version == SKIP_VERSION_CHECK:
-                return func(self, *args, **kwargs)
+                return _call(func, self, args, kwargs)
 
             cur_version = int(self._server_version)
             nonlocal min_version
@@ -87,7 +107,7 @@ def require_version(min_version: int = _EARLIEST_SUPPORTED_VERSION, max_version:
                 )
 
             # If no issues have been raised call the wrapped function
-            return func(self, *args, **kwargs)
+            return _call(func, self, args, kwargs)
 
         return wrapper
 
@@ -0,0 +1,1687 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""Calls benchmarked for every public method of the facades.
+
+Each case builds the arguments of one call from a number of rows, so that methods taking
+or returning a variable number of items are benchmarked with small, medium and large
+payloads. The builders receive a function returning the path of an existing file, for
+methods checking their file arguments before sending the request.
+"""
+
+from dataclasses import dataclass
+from typing import Callable, Optional
+
+from ansys.api.sherlock.v0 import (
+    SherlockLayerService_pb2,
+    SherlockModelService_pb2,
+    SherlockPartsService_pb2,
+    SherlockProjectService_pb2,
+)
+from ansys.api.sherlock.v0 import SherlockAnalysisService_pb2 as AnalysisService
+from ansys.api.sherlock.v0.SherlockModelService_pb2 import GeometryType, PcbMaterialType
+
+from ansys.sherlock.core.types.analysis_types import (
+    ComponentFailureMechanism,
+    ElementOrder,
+    ModelSource,
+    PTHFatiguePropsAnalysis,
+    RunAnalysisRequestAnalysisType,
+    RunStrainMapAnalysisRequestAnalysisType,
+    SemiconductorWearoutAnalysis,
+    UpdateComponentFailureMechanismPropsRequest,
+    UpdateLeadModelingPropsAnalysis,
+    UpdateLeadModelingPropsRequest,
+    UpdateMechanicalPartsPropsAnalysis,
+    UpdateMechanicalPartsPropsRequest,
+    UpdateMountPointsPropsAnalysis,
+    UpdateMountPointsPropsRequest,
+    UpdatePcbModelingPropsRequestAnalysisType,
+    UpdatePcbModelingPropsRequestPcbMaterialModel,
+    UpdatePcbModelingPropsRequestPcbModelType,
+    UpdatePottingRegionsPropsAnalysis,
+    UpdatePottingRegionsPropsRequest,
+    UpdatePTHFatiguePropsRequest,
+    UpdatePTHFatiguePropsRequestAnalysisType,
+    UpdateSemiconductorWearoutAnalysisPropsRequest,
+    UpdateTraceModelingPropsAnalysis,
+    UpdateTraceModelingPropsRequest,
+)
+from ansys.sherlock.core.types.common_types import Measurement, TableDelimiter
+from ansys.sherlock.core.types.layer_types import (
+    CopyPottingRegionRequest,
+    DeletePottingRegionRequest,
+    GetICTFixturesPropertiesRequest,
+    GetMountPointsPropertiesRequest,
+    GetTestPointPropertiesRequest,
+    ICTFixtureProperties,
+    MountPointProperties,
+    PolygonalShape,
+    PottingRegion,
+    PottingRegionCopyData,
+    PottingRegionDeleteData,
+    PottingRegionUpdateData,
+    TestPointProperties,
+    UpdateICTFixturesRequest,
+    UpdateMountPointsRequest,
+    UpdatePottingRegionRequest,
+    UpdateTestPointsRequest,
+)
+from ansys.sherlock.core.types.lifecycle_types import (
+    DeleteEventRequest,
+    DeletePhaseRequest,
+    HarmonicVibeProfileCsvFileProperties,
+    ImportThermalSignalRequest,
+    ListLifeCycleEventsRequest,
+    LoadLifeCycleRequest,
+    RandomVibeProfileCsvFileProperties,
+    SaveHarmonicProfileRequest,
+    SaveLifeCycleRequest,
+    SaveRandomVibeProfileRequest,
+    SaveShockPulseProfileRequest,
+    SaveThermalProfileRequest,
+    ShockProfileDatasetCsvFileProperties,
+    ShockProfilePulsesCsvFileProperties,
+    ThermalProfileCsvFileProperties,
+    ThermalSignalFileProperties,
+    UpdateLifeCycleRequest,
+    UpdateLifePhaseRequest,
+)
+from ansys.sherlock.core.types.parts_types import (
+    AVLDescription,
+    AVLPartNum,
+    DeletePartsFromPartsListRequest,
+    GetPartsListPropertiesRequest,
+    ImportPartsToAVLRequest,
+    PartsListSearchDuplicationMode,
+    UpdatePadPropertiesRequest,
+)
+from ansys.sherlock.core.types.project_types import (
+    AddOutlineFileRequest,
+    BoardBounds,
+    CopperFile,
+    CopperGerberFile,
+    CsvExcelOutlineFile,
+    ImageBounds,
+    ImageFile,
+    ImportCopperFile,
+    ImportCopperFilesRequest,
+    ImportGDSIIRequest,
+    LegendBounds,
+    LegendOrientation,
+    OutlineFile,
+    OutlineFileType,
+    StrainMapsFileType,
+    ThermalBoardSide,
+    ThermalMapsFileType,
+)
+
+PAYLOAD_ROWS = {"small": 1, "medium": 100, "large": 10_000}
+"""Number of rows of each payload size."""
+
+PROJECT = "Tutorial Project"
+CCA = "Main Board"
+QUADRATIC = AnalysisService.ElementOrder.Quadratic
+MECHANICAL_PARTS_ANALYSIS = AnalysisService.UpdateMechanicalPartsPropsRequest.Analysis
+
+Arguments = tuple[tuple, dict]
+Builder = Callable[[int, Callable[[str], str]], Arguments]
+
+
+@dataclass(frozen=True)
+class Case:
+    """Call of one API method."""
+
+    method: str
+    """Facade attribute and method name, for example ``"parts.update_parts_locations"``."""
+    arguments: Builder
+    """Function building the positional and keyword arguments from a number of rows."""
+    sizes: tuple[str, ...] = ("small",)
+    """Payload sizes the method is benchmarked with."""
+    stream: Optional[str] = None
+    """RPC whose number of responses is the number of rows."""
+
+    def ids(self) -> list[str]:
+        """Return the identifier of the case for each payload size."""
+        return [f"{self.method}[{size}]" for size in self.sizes]
+
+
+SIZES = tuple(PAYLOAD_ROWS)
+
+
+def call(*args, **kwargs) -> Builder:
+    """Return a builder of fixed arguments."""
+    return lambda rows, path: (args, kwargs)
+
+
+def _ref_des(rows: int) -> list[str]:
+    return [f"R{i}" for i in range(rows)]
+
+
+def _polygon() -> PolygonalShape:
+    return PolygonalShape(points=[(0, 0), (0, 6.35), (9.77, 0)], rotation=87.8)
+
+
+def _potting_region(potting_id: str) -> PottingRegion:
+    return PottingRegion(
+        cca_name=CCA,
+        potting_id=potting_id,
+        potting_side="TOP",
+        potting_material="epoxyencapsulant",
+        potting_units="in",
+        potting_thickness=0.1,
+        potting_standoff=0.2,
+        shape=_polygon(),
+    )
+
+
+def _thermal_image() -> ImageFile:
+    return ImageFile(
+        board_bounds=BoardBounds([(1.0, 2.0), (3.0, 4.0), (1.0, 2.0), (1.0, 2.0)]),
+        coordinate_units="in",
+        image_bounds=ImageBounds(0.0, 0.0, 10.0, 8.0),
+        legend_bounds=LegendBounds(1.0, 2.0, 4.0, 2.0),
+        legend_orientation=LegendOrientation.VERTICAL,
+        min_temperature=20.0,
+        min_temperature_units="C",
+        max_temperature=50.0,
+        max_temperature_units="C",
+    )
+
+
+def _thermal_map(path) -> dict:
+    return {
+        "file_name": path("Thermal Image.jpg"),
+        "file_type": ThermalMapsFileType.IMAGE,
+        "file_comment": "Thermal map",
+        "thermal_board_side": ThermalBoardSide.TOP,
+        "file_data": _thermal_image(),
+        "thermal_profiles": ["Environmental/1 - Temp Cycle - Min"],
+        "cca_names": [CCA],
+    }
+
+
+def _parts_locations(rows, path):
+    locations = [(f"R{i}", "-2.7", "-1.65", "0", "in", "TOP", "False") for i in range(rows)]
+    return (PROJECT, CCA, locations), {}
+
+
+def _parts_list_properties(rows, path):
+    properties = [
+        {
+            "reference_designators": [f"R{i}"],
+            "properties": [
+                {"name": "partType", "value": "RESISTOR"},
+                {"name": "locX", "value": "1"},
+            ],
+        }
+        for i in range(rows)
+    ]
+    return (PROJECT, CCA, properties), {}
+
+
+def _thermal_profiles(rows, path):
+    profiles = [
+        (
+            "Phase 1",
+            "Thermal Event",
+            f"Profile{i}",
+            "sec",
+            "F",
+            [("Steady1", "HOLD", 40, 40), ("Steady", "HOLD", 20, 20), ("Back", "RAMP", 20, 40)],
+        )
+        for i in range(rows)
+    ]
+    return (PROJECT, profiles), {}
+
+
+def _random_vibe_profiles(rows, path):
+    profiles = [
+        ("Phase 1", "Random Event", f"Profile{i}", "HZ", "G2/Hz", [(4, 8), (5, 50)])
+        for i in range(rows)
+    ]
+    return (PROJECT, profiles), {}
+
+
+def _harmonic_vibe_profiles(rows, path):
+    profiles = [
+        ("Phase 1", "Harmonic Event", f"Profile{i}", "HZ", "G", [(10, 1), (1000, 1)], "")
+        for i in range(rows)
+    ]
+    return (PROJECT, profiles), {}
+
+
+def _shock_profiles(rows, path):
+    profiles = [
+        (
+            "Phase 1",
+            "Shock Event",
+            f"Profile{i}",
+            10.0,
+            "ms",
+            0.1,
+            "ms",
+            "G",
+            "HZ",
+            [("HalfSine", 100.0, 100.0, 0)],
+        )
+        for i in range(rows)
+    ]
+    return (PROJECT, profiles), {}
+
+
+def _mount_points(rows, path):
+    mount_points = [
+        MountPointProperties(
+            id=f"MP{i}",
+            type="Mount Pad",
+            shape="Rectangular",
+            units="mm",
+            side="BOTTOM",
+            height=1.0,
+            material="GOLD",
+            state="DISABLED",
+            x=0.3,
+            y=-0.4,
+            length=1.0,
+            width=0.2,
+            diameter=0.0,
+            nodes="",
+            rotation=45,
+            polygon="",
+            boundary="Outline",
+            constraints="X-axis translation|Z-axis translation",
+            chassis_material="SILVER",
+        )
+        for i in range(rows)
+    ]
+    request = UpdateMountPointsRequest(project=PROJECT, cca_name=CCA, mount_points=mount_points)
+    return (request,), {}
+
+
+def _test_points(rows, path):
+    test_points = [
+        TestPointProperties(
+            id=f"TP{i}",
+            side="BOTTOM",
+            units="in",
+            center_x=1.0,
+            center_y=0.5,
+            radius=0.2,
+            load_type=SherlockLayerService_pb2.TestPointProperties.LoadType.Force,
+            load_value=3.0,
+            load_units="ozf",
+        )
+        for i in range(rows)
+    ]
+    request = UpdateTestPointsRequest(project=PROJECT, cca_name=CCA, update_test_points=test_points)
+    return (request,), {}
+
+
+def _ict_fixtures(rows, path):
+    fixtures = [
+        ICTFixtureProperties(
+            id=f"F{i}",
+            type="Mount Hole",
+            units="in",
+            side="TOP",
+            height="0.0",
+            material="GOLD",
+            state="DISABLED",
+            shape="Slot",
+            x="0.3",
+            y="-0.4",
+            length="1.0",
+            width="0.2",
+            diameter="0.0",
+            nodes="10",
+            rotation="15",
+            polygon="",
+            boundary="Outline",
+            constraints="X-axis translation|Z-axis translation",
+            chassis_material="SILVER",
+        )
+        for i in range(rows)
+    ]
+    request = UpdateICTFixturesRequest(project=PROJECT, cca_name=CCA, update_fixtures=fixtures)
+    return (request,), {}
+
+
+def _export_layers(path) -> list[dict]:
+    return [
+        {
+            "components_enabled": True,
+            "labels_enabled": True,
+            "leads_enabled": True,
+            "axes_enabled": True,
+            "grid_enabled": True,
+            "layer_infos": [{"layer_folder": "Components", "layers": ["comp-top"]}],
+            "file_path": path("layer.jpg"),
+            "image_height": 600,
+            "image_width": 800,
+            "overwrite_existing_file": True,
+        }
+    ]
+
+
+def _modeling_region(path) -> dict:
+    return {
+        "cca_name": CCA,
+        "region_id": "Region001",
+        "region_units": "mm",
+        "model_mode": "Enabled",
+        "shape": _polygon(),
+        "pcb_model_props": {
+            "export_model_type": "Sherlock",
+            "elem_order": "First_Order",
+            "max_mesh_size": 0.5,
+            "max_mesh_size_units": "mm",
+            "quads_preferred": True,
+        },
+        "trace_model_props": {
+            "trace_model_type": "Enabled",
+            "elem_order": "Second_Order",
+            "trace_mesh_size": 0.3,
+            "trace_mesh_size_units": "mm",
+        },
+    }
+
+
+def _harmonic_vibe_props(rows, path):
+    properties = [
+        {
+            "cca_name": f"Card {i}",
+            "model_source": ModelSource.GENERATED,
+            "harmonic_vibe_count": 2,
+            "harmonic_vibe_damping": "0.01, 0.05",
+            "part_validation_enabled": False,
+            "require_material_assignment_enabled": False,
+            "analysis_temp": 20,
+            "analysis_temp_units": "C",
+            "force_model_rebuild": "AUTO",
+            "filter_by_event_frequency": False,
+            "natural_freq_min": 10,
+            "natural_freq_min_units": "Hz",
+            "natural_freq_max": 1000,
+            "natural_freq_max_units": "KHz",
+            "reuse_modal_analysis": True,
+        }
+        for i in range(rows)
+    ]
+    return (PROJECT, properties), {}
+
+
+def _add_cca(rows, path):
+    properties = [
+        {
+            "cca_name": f"Card {i}",
+            "description": "Second CCA",
+            "default_solder_type": "SAC305",
+            "default_stencil_thickness": 10,
+            "default_stencil_thickness_units": "mm",
+            "default_part_temp_rise": 20,
+            "default_part_temp_rise_units": "C",
+            "guess_part_properties_enabled": False,
+        }
+        for i in range(rows)
+    ]
+    return (PROJECT, properties), {}
+
+
+def _run_analysis(rows, path):
+    analyses = [
+        (RunAnalysisRequestAnalysisType.NATURAL_FREQ, [("Phase 1", ["Harmonic Event"])])
+        for _ in range(rows)
+    ]
+    return (PROJECT, CCA, analyses), {}
+
+
+def _export_trace_model(rows, path):
+    params = [
+        SherlockModelService_pb2.TraceModelExportParams(
+            project=PROJECT,
+            ccaName=CCA,
+            filePath=path(f"trace{i}.stp"),
+            copperLayerName="copper-01.odb",
+            coordUnits="mm",
+            geometryType=GeometryType.Step,
+        )
+        for i in range(rows)
+    ]
+    return (params,), {}
+
+
+PARTS_CASES = [
+    Case(
+        "parts.delete_parts_from_parts_list",
+        lambda rows, path: (
+            (
+                DeletePartsFromPartsListRequest(
+                    project=PROJECT, cca_name=CCA, reference_designators=_ref_des(rows)
+                ),
+            ),
+            {},
+        ),
+        SIZES,
+        stream="SherlockPartsService/deletePartsFromPartsList",
+    ),
+    Case("parts.enable_lead_modeling", call(PROJECT, CCA)),
+    Case(
+        "parts.export_net_list",
+        lambda rows, path: (
+            (PROJECT, CCA, path("Net List.csv")),
+            dict(col_delimiter=TableDelimiter.TAB, overwrite_existing=True, utf8_enabled=True),
+        ),
+    ),
+    Case(
+        "parts.export_parts_list", lambda rows, path: ((PROJECT, CCA, path("Parts List.csv")), {})
+    ),
+    Case(
+        "parts.get_parts_list_properties",
+        call(GetPartsListPropertiesRequest(project=PROJECT, cca_name=CCA)),
+        SIZES,
+        stream="SherlockPartsService/getPartsListProperties",
+    ),
+    Case(
+        "parts.get_parts_table",
+        call(GetPartsListPropertiesRequest(project=PROJECT, cca_name=CCA)),
+        SIZES,
+        stream="SherlockPartsService/getPartsListProperties",
+    ),
+    Case(
+        "parts.import_parts_list",
+        lambda rows, path: ((PROJECT, CCA, path("Parts List.csv"), False), {}),
+    ),
+    Case(
+        "parts.import_parts_to_avl",
+        lambda rows, path: (
+            (
+                ImportPartsToAVLRequest(
+                    import_file=path("AVL.csv"),
+                    import_type=SherlockPartsService_pb2.AVLImportType.Update,
+                ),
+            ),
+            {},
+        ),
+    ),
+    Case(
+        "parts.iter_delete_parts_from_parts_list",
+        lambda rows, path: (
+            (
+                DeletePartsFromPartsListRequest(
+                    project=PROJECT, cca_name=CCA, reference_designators=_ref_des(rows)
+                ),
+            ),
+            {},
+        ),
+        stream="SherlockPartsService/deletePartsFromPartsList",
+    ),
+    Case(
+        "parts.iter_parts_list_properties",
+        call(GetPartsListPropertiesRequest(project=PROJECT, cca_name=CCA)),
+        stream="SherlockPartsService/getPartsListProperties",
+    ),
+    Case(
+        "parts.iter_update_pad_properties",
+        lambda rows, path: (
+            (
+                UpdatePadPropertiesRequest(
+                    project=PROJECT, cca_name=CCA, reference_designators=_ref_des(rows)
+                ),
+            ),
+            {},
+        ),
+        stream="SherlockPartsService/updatePadProperties",
+    ),
+    Case(
+        "parts.update_pad_properties",
+        lambda rows, path: (
+            (
+                UpdatePadPropertiesRequest(
+                    project=PROJECT, cca_name=CCA, reference_designators=_ref_des(rows)
+                ),
+            ),
+            {},
+        ),
+        SIZES,
+        stream="SherlockPartsService/updatePadProperties",
+    ),
+    Case(
+        "parts.update_parts_from_AVL",
+        call(
+            project=PROJECT,
+            cca_name=CCA,
+            matching_mode="Both",
+            duplication_mode=PartsListSearchDuplicationMode.FIRST,
+            avl_part_num=AVLPartNum.ASSIGN_INTERNAL_PART_NUM,
+            avl_description=AVLDescription.ASSIGN_APPROVED_DESCRIPTION,
+        ),
+    ),
+    Case(
+        "parts.update_parts_list",
+        call(PROJECT, CCA, "Sherlock Part Library", "Both", PartsListSearchDuplicationMode.ERROR),
+    ),
+    Case("parts.update_parts_list_properties", _parts_list_properties, SIZES),
+    Case("parts.update_parts_locations", _parts_locations, SIZES),
+    Case(
+        "parts.update_parts_locations_by_file",
+        lambda rows, path: ((PROJECT, CCA, path("Parts Locations.csv")), {}),
+    ),
+]
+
+LIFECYCLE_CASES = [
+    Case(
+        "lifecycle.add_harmonic_event",
+        call(
+            PROJECT,
+            "Phase 1",
+            "Harmonic Event",
+            1.5,
+            "sec",
+            4.0,
+            "PER MIN",
+            5,
+            "45,45",
+            "Uniaxial",
+            "2,4,5",
+        ),
+    ),
+    Case("lifecycle.add_harmonic_vibe_profiles", _harmonic_vibe_profiles, SIZES),
+    Case(
+        "lifecycle.add_random_vibe_event",
+        call(
+            PROJECT,
+            "Phase 1",
+            "Random Event",
+            1.5,
+            "sec",
+            4.0,
+            "PER MIN",
+            "45,45",
+            "Uniaxial",
+            "2,4,5",
+        ),
+    ),
+    Case("lifecycle.add_random_vibe_profiles", _random_vibe_profiles, SIZES),
+    Case(
+        "lifecycle.add_shock_event",
+        call(PROJECT, "Phase 1", "Shock Event", 1.5, "sec", 4.0, "PER MIN", "45,45", "2,4,5"),
+    ),
+    Case("lifecycle.add_shock_profiles", _shock_profiles, SIZES),
+    Case(
+        "lifecycle.add_thermal_event",
+        call(PROJECT, "Phase 1", "Thermal Event", 4.0, "PER YEAR", "STORAGE"),
+    ),
+    Case("lifecycle.add_thermal_profiles", _thermal_profiles, SIZES),
+    Case("lifecycle.create_life_phase", call(PROJECT, "Phase 1", 1.5, "sec", 4.0, "COUNT")),
+    Case(
+        "lifecycle.delete_event",
+        call(DeleteEventRequest(project=PROJECT, phase_name="Phase 1", event_name="Thermal Event")),
+    ),
+    Case("lifecycle.delete_phase", call(DeletePhaseRequest(project=PROJECT, phase_name="Phase 1"))),
+    Case(
+        "lifecycle.import_thermal_signal",
+        lambda rows, path: (
+            (
+                ImportThermalSignalRequest(
+                    file_name=path("thermal_signal.csv"),
+                    project=PROJECT,
+                    thermal_signal_file_properties=ThermalSignalFileProperties(
+                        header_row_count=0,
+                        numeric_format="English",
+                        column_delimiter=",",
+                        time_column="Time",
+                        time_units="sec",
+                        temperature_column="Temperature",
+                        temperature_units="C",
+                    ),
+                    phase_name="Phase 1",
+                    time_removal=False,
+                    load_range_percentage=0.25,
+                    number_of_range_bins=10,
+                    number_of_mean_bins=10,
+                    number_of_dwell_bins=10,
+                    temperature_range_filtering_limit=0.0,
+                    time_filtering_limit=72.0,
+                    time_filtering_limit_units="hr",
+                    generated_cycles_label="Generated Cycles",
+                    allow_cycles_binning=True,
+                ),
+            ),
+            {},
+        ),
+    ),
+    Case("lifecycle.list_life_cycle_events", call(ListLifeCycleEventsRequest(project=PROJECT))),
+    Case(
+        "lifecycle.load_harmonic_profile",
+        lambda rows, path: (
+            (PROJECT, "Phase 1", "Harmonic Event", path("Harmonic.csv"), "x"),
+            dict(
+                csv_file_properties=HarmonicVibeProfileCsvFileProperties(
+                    profile_name="Profile",
+                    header_row_count=0,
+                    numeric_format="English",
+                    column_delimiter=",",
+                    frequency_column="Frequency",
+                    frequency_units="HZ",
+                    load_column="Load",
+                    load_units="G",
+                )
+            ),
+        ),
+    ),
+    Case(
+        "lifecycle.load_life_cycle",
+        lambda rows, path: (
+            (LoadLifeCycleRequest(project=PROJECT, file_path=path("lifecycle.dfr-lc")),),
+            {},
+        ),
+    ),
+    Case(
+        "lifecycle.load_random_vibe_profile",
+        lambda rows, path: (
+            (PROJECT, "Phase 1", "Random Event", path("RandomVibe.csv")),
+            dict(
+                csv_file_properties=RandomVibeProfileCsvFileProperties(
+                    profile_name="Profile",
+                    header_row_count=0,
+                    numeric_format="English",
+                    column_delimiter=",",
+                    frequency_column="Frequency",
+                    frequency_units="HZ",
+                    amplitude_column="Amplitude",
+                    amplitude_units="G2/Hz",
+                )
+            ),
+        ),
+    ),
+    Case(
+        "lifecycle.load_shock_profile_dataset",
+        lambda rows, path: (
+            (PROJECT, "Phase 1", "Shock Event", path("ShockDataset.csv")),
+            dict(
+                csv_file_properties=ShockProfileDatasetCsvFileProperties(
+                    profile_name="Profile",
+                    header_row_count=0,
+                    numeric_format="English",
+                    column_delimiter=",",
+                    time_column="Time",
+                    time_units="ms",
+                    load_column="Load",
+                    load_units="G",
+                )
+            ),
+        ),
+    ),
+    Case(
+        "lifecycle.load_shock_profile_pulses",
+        lambda rows, path: (
+            (PROJECT, "Phase 1", "Shock Event", path("ShockPulses.csv")),
+            dict(
+                csv_file_properties=ShockProfilePulsesCsvFileProperties(
+                    profile_name="Profile",
+                    header_row_count=0,
+                    numeric_format="English",
+                    column_delimiter=",",
+                    duration=25,
+                    duration_units="ms",
+                    sample_rate=0.1,
+                    sample_rate_units="ms",
+                    shape_column="Shape",
+                    load_column="Load",
+                    load_units="G",
+                    frequency_column="Frequency",
+                    frequency_units="HZ",
+                    decay_column="Decay",
+                )
+            ),
+        ),
+    ),
+    Case(
+        "lifecycle.load_thermal_profile",
+        lambda rows, path: (
+            (PROJECT, "Phase 1", "Thermal Event", path("Thermal.csv")),
+            dict(
+                csv_file_properties=ThermalProfileCsvFileProperties(
+                    profile_name="Profile",
+                    header_row_count=0,
+                    numeric_format="English",
+                    column_delimiter=",",
+                    step_column="Step",
+                    type_column="Type",
+                    time_column="Time (min)",
+                    time_units="min",
+                    temperature_column="Temp (C)",
+                    temperature_units="C",
+                )
+            ),
+        ),
+    ),
+    Case(
+        "lifecycle.save_harmonic_profile",
+        lambda rows, path: (
+            (
+                SaveHarmonicProfileRequest(
+                    project=PROJECT,
+                    phase_name="Phase 1",
+                    event_name="Harmonic Event",
+                    triaxial_axis="x",
+                    file_path=path("Harmonic.csv"),
+                ),
+            ),
+            {},
+        ),
+    ),
+    Case(
+        "lifecycle.save_life_cycle",
+        lambda rows, path: (
+            (
+                SaveLifeCycleRequest(
+                    project=PROJECT, file_path=path("lifecycle.dfr-lc"), overwrite_file=True
+                ),
+            ),
+            {},
+        ),
+    ),
+    Case(
+        "lifecycle.save_random_vibe_profile",
+        lambda rows, path: (
+            (
+                SaveRandomVibeProfileRequest(
+                    project=PROJECT,
+                    phase_name="Phase 1",
+                    event_name="Random Event",
+                    file_path=path("RandomVibe.dat"),
+                ),
+            ),
+            {},
+        ),
+    ),
+    Case(
+        "lifecycle.save_shock_pulse_profile",
+        lambda rows, path: (
+            (
+                SaveShockPulseProfileRequest(
+                    project=PROJECT,
+                    phase_name="Phase 1",
+                    event_name="Shock Event",
+                    file_path=path("ShockPulses.csv"),
+                ),
+            ),
+            {},
+        ),
+    ),
+    Case(
+        "lifecycle.save_thermal_profile",
+        lambda rows, path: (
+            (
+                SaveThermalProfileRequest(
+                    project=PROJECT,
+                    phase_name="Phase 1",
+                    event_name="Thermal Event",
+                    file_path=path("Thermal.dat"),
+                ),
+            ),
+            {},
+        ),
+    ),
+    Case(
+        "lifecycle.update_life_cycle",
+        call(
+            UpdateLifeCycleRequest(
+                project=PROJECT,
+                new_name="new name",
+                new_description="new description",
+                new_reliability_metric=60,
+                new_reliability_metric_units="year",
+                new_service_life=0,
+                new_service_life_units="sec",
+                result_archive_file_name="results",
+            )
+        ),
+    ),
+    Case(
+        "lifecycle.update_life_phase",
+        call(
+            UpdateLifePhaseRequest(
+                project=PROJECT,
+                phase_name="Phase 1",
+                new_phase_name="Environmental",
+                new_num_of_cycles=100,
+                new_cycle_type="PER DAY",
+                new_description="new description",
+                new_duration=24,
+                new_duration_units="hr",
+                result_archive_file_name="results",
+            )
+        ),
+    ),
+]
+
+LAYER_CASES = [
+    Case(
+        "layer.add_modeling_region",
+        lambda rows, path: ((PROJECT, [_modeling_region(path)]), {}),
+    ),
+    Case(
+        "layer.add_potting_region",
+        call(
+            PROJECT,
+            [
+                {
+                    "cca_name": CCA,
+                    "potting_id": "Region",
+                    "side": "TOP",
+                    "material": "epoxyencapsulant",
+                    "potting_units": "in",
+                    "thickness": 0.1,
+                    "standoff": 0.2,
+                    "shape": _polygon(),
+                }
+            ],
+        ),
+    ),
+    Case(
+        "layer.copy_modeling_region",
+        call(
+            PROJECT,
+            [
+                {
+                    "cca_name": CCA,
+                    "region_id": "Region001",
+                    "region_id_copy": "RegionCopy001",
+                    "center_x": 10.0,
+                    "center_y": 20.0,
+                }
+            ],
+        ),
+    ),
+    Case(
+        "layer.copy_potting_region",
+        call(
+            CopyPottingRegionRequest(
+                project=PROJECT,
+                potting_region_copy_data=[
+                    PottingRegionCopyData(
+                        cca_name=CCA,
+                        potting_id="Region",
+                        copy_potting_id="Region Copy",
+                        center_x=1.0,
+                        center_y=2.0,
+                    )
+                ],
+            )
+        ),
+        stream="SherlockLayerService/copyPottingRegion",
+    ),
+    Case("layer.delete_all_ict_fixtures", call(PROJECT, CCA)),
+    Case("layer.delete_all_mount_points", call(PROJECT, CCA)),
+    Case("layer.delete_all_test_points", call(PROJECT, CCA)),
+    Case(
+        "layer.delete_modeling_region", call(PROJECT, [{"cca_name": CCA, "region_id": "Region001"}])
+    ),
+    Case(
+        "layer.delete_potting_region",
+        call(
+            DeletePottingRegionRequest(
+                project=PROJECT,
+                potting_region_delete_data=[
+                    PottingRegionDeleteData(cca_name=CCA, potting_id="Region")
+                ],
+            )
+        ),
+        stream="SherlockLayerService/deletePottingRegion",
+    ),
+    Case(
+        "layer.export_all_mount_points",
+        lambda rows, path: ((PROJECT, CCA, path("MountPoints.csv"), "DEFAULT"), {}),
+    ),
+    Case(
+        "layer.export_all_test_fixtures",
+        lambda rows, path: ((PROJECT, CCA, path("TestFixtures.csv"), "DEFAULT"), {}),
+    ),
+    Case(
+        "layer.export_all_test_points",
+        lambda rows, path: (
+            (PROJECT, CCA, path("TestPoints.csv"), "DEFAULT", "DEFAULT", "DEFAULT"),
+            {},
+        ),
+    ),
+    Case(
+        "layer.export_layer_image",
+        lambda rows, path: ((PROJECT, CCA, _export_layers(path)), {}),
+        stream="SherlockLayerService/exportLayerImage",
+    ),
+    Case(
+        "layer.get_ict_fixtures_props",
+        call(
+            GetICTFixturesPropertiesRequest(project=PROJECT, cca_name=CCA, ict_fixtures_ids="F1,F2")
+        ),
+    ),
+    Case(
+        "layer.get_mount_point_props",
+        call(
+            GetMountPointsPropertiesRequest(
+                project=PROJECT, cca_name=CCA, mount_point_ids="MP1,MP2"
+            )
+        ),
+    ),
+    Case(
+        "layer.get_test_point_props",
+        call(GetTestPointPropertiesRequest(project=PROJECT, cca_name=CCA)),
+        SIZES,
+        stream="SherlockLayerService/getTestPointProperties",
+    ),
+    Case(
+        "layer.iter_export_layer_image",
+        lambda rows, path: ((PROJECT, CCA, _export_layers(path)), {}),
+        stream="SherlockLayerService/exportLayerImage",
+    ),
+    Case(
+        "layer.iter_test_point_props",
+        call(GetTestPointPropertiesRequest(project=PROJECT, cca_name=CCA)),
+        stream="SherlockLayerService/getTestPointProperties",
+    ),
+    Case("layer.list_layers", call(PROJECT, CCA)),
+    Case("layer.update_ict_fixtures", _ict_fixtures, SIZES),
+    Case(
+        "layer.update_modeling_region",
+        lambda rows, path: (
+            (PROJECT, [dict(_modeling_region(path), region_id_replacement="Region002")]),
+            {},
+        ),
+    ),
+    Case("layer.update_mount_points", _mount_points, SIZES),
+    Case(
+        "layer.update_mount_points_by_file",
+        lambda rows, path: ((PROJECT, CCA, path("MountPoints.csv")), {}),
+    ),
+    Case(
+        "layer.update_potting_region",
+        call(
+            UpdatePottingRegionRequest(
+                project=PROJECT,
+                update_potting_regions=[
+                    PottingRegionUpdateData(
+                        potting_region_id_to_update="Region",
+                        potting_region=_potting_region("Region"),
+                    )
+                ],
+            )
+        ),
+        stream="SherlockLayerService/updatePottingRegion",
+    ),
+    Case(
+        "layer.update_test_fixtures_by_file",
+        lambda rows, path: ((PROJECT, CCA, path("TestFixtures.csv")), {}),
+    ),
+    Case("layer.update_test_points", _test_points, SIZES),
+    Case(
+        "layer.update_test_points_by_file",
+        lambda rows, path: ((PROJECT, CCA, path("TestPoints.csv")), {}),
+    ),
+]
+
+ANALYSIS_CASES = [
+    Case("analysis.get_harmonic_vibe_input_fields", call(ModelSource.GENERATED)),
+    Case("analysis.get_ict_analysis_input_fields", call()),
+    Case("analysis.get_mechanical_shock_input_fields", call(ModelSource.GENERATED)),
+    Case("analysis.get_natural_frequency_input_fields", call()),
+    Case("analysis.get_parts_list_validation_analysis_props", call(PROJECT, CCA)),
+    Case("analysis.get_random_vibe_input_fields", call(ModelSource.STRAIN_MAP)),
+    Case("analysis.get_solder_fatigue_input_fields", call()),
+    Case("analysis.run_analysis", _run_analysis, SIZES),
+    Case(
+        "analysis.run_analysis_many",
+        lambda rows, path: (
+            (
+                [
+                    (
+                        PROJECT,
+                        f"Card {i}",
+                        [(RunAnalysisRequestAnalysisType.NATURAL_FREQ, [("Phase 1", ["Event"])])],
+                    )
+                    for i in range(min(rows, 100))
+                ],
+            ),
+            {},
+        ),
+        ("small", "medium"),
+    ),
+    Case(
+        "analysis.run_strain_map_analysis",
+        call(
+            PROJECT,
+            CCA,
+            [
+                [
+                    RunStrainMapAnalysisRequestAnalysisType.RANDOM_VIBE,
+                    [
+                        ["Phase 1", "Random Vibe", "TOP", "MainBoardStrain - Top"],
+                        ["Phase 1", "Random Vibe", "BOTTOM", "MainBoardStrain - Bottom"],
+                    ],
+                ]
+            ],
+        ),
+    ),
+    Case(
+        "analysis.update_PTH_fatigue_props",
+        call(
+            UpdatePTHFatiguePropsRequest(
+                project=PROJECT,
+                pth_fatigue_analysis_properties=[
+                    PTHFatiguePropsAnalysis(
+                        cca_name=CCA,
+                        qualification=UpdatePTHFatiguePropsRequestAnalysisType.SUPPLIER,
+                        pth_quality_factor="Good",
+                        pth_wall_thickness=0.1,
+                        pth_wall_thickness_units="mm",
+                        min_hole_size=0.5,
+                        min_hole_size_units="mm",
+                        max_hole_size=1.0,
+                        max_hole_size_units="mm",
+                    )
+                ],
+            )
+        ),
+        stream="SherlockAnalysisService/updatePTHFatigueProps",
+    ),
+    Case(
+        "analysis.update_component_failure_mechanism_analysis_props",
+        call(
+            UpdateComponentFailureMechanismPropsRequest(
+                project=PROJECT,
+                component_failure_mechanism_properties_per_cca=[
+                    ComponentFailureMechanism(
+                        cca_name=CCA,
+                        default_part_temp_rise=1.5,
+                        default_part_temp_rise_units="K",
+                        part_temp_rise_min_enabled=True,
+                        part_validation_enabled=False,
+                    )
+                ],
+            )
+        ),
+        stream="SherlockAnalysisService/updateComponentFailureMechanismProps",
+    ),
+    Case("analysis.update_harmonic_vibe_props", _harmonic_vibe_props, SIZES),
+    Case(
+        "analysis.update_ict_analysis_props",
+        call(
+            PROJECT,
+            [
+                {
+                    "cca_name": CCA,
+                    "ict_application_time": 2,
+                    "ict_application_time_units": "sec",
+                    "ict_number_of_events": 10,
+                    "part_validation_enabled": False,
+                    "require_material_assignment_enabled": False,
+                }
+            ],
+        ),
+    ),
+    Case(
+        "analysis.update_lead_modeling_props",
+        call(
+            UpdateLeadModelingPropsRequest(
+                project=PROJECT,
+                cca_names=[CCA],
+                analyses=[
+                    UpdateLeadModelingPropsAnalysis(
+                        analysis_type=(
+                            AnalysisService.UpdateLeadModelingPropsRequest.Analysis.ICTAnalysis
+                        ),
+                        model_leads=True,
+                        lead_element_order=QUADRATIC,
+                        lead_max_edge_length=0.1234,
+                        lead_max_edge_length_units="mm",
+                        lead_max_vertical=0.2345,
+                        lead_max_vertical_units="mm",
+                    )
+                ],
+            )
+        ),
+    ),
+    Case(
+        "analysis.update_mechanical_parts_props",
+        call(
+            UpdateMechanicalPartsPropsRequest(
+                project=PROJECT,
+                cca_names=[CCA],
+                analyses=[
+                    UpdateMechanicalPartsPropsAnalysis(
+                        analysis_type=MECHANICAL_PARTS_ANALYSIS.AnalysisType.ICTAnalysis,
+                        mechanical_parts_enabled=True,
+                        mechanical_parts_elem_order=QUADRATIC,
+                        mechanical_parts_max_edge_length=0.1234,
+                        mechanical_parts_max_edge_length_units="mm",
+                        mechanical_parts_max_vertical=0.2345,
+                        mechanical_parts_max_vertical_units="mm",
+                    )
+                ],
+            )
+        ),
+    ),
+    Case(
+        "analysis.update_mechanical_shock_props",
+        call(
+            PROJECT,
+            [
+                {
+                    "cca_name": CCA,
+                    "model_source": ModelSource.GENERATED,
+                    "shock_result_count": 2,
+                    "critical_shock_strain": 10,
+                    "critical_shock_strain_units": "strain",
+                    "part_validation_enabled": True,
+                    "require_material_assignment_enabled": False,
+                    "force_model_rebuild": "AUTO",
+                    "natural_freq_min": 10,
+                    "natural_freq_min_units": "Hz",
+                    "natural_freq_max": 100,
+                    "natural_freq_max_units": "KHz",
+                    "analysis_temp": 20,
+                    "analysis_temp_units": "F",
+                }
+            ],
+        ),
+    ),
+    Case(
+        "analysis.update_mount_points_props",
+        call(
+            UpdateMountPointsPropsRequest(
+                project=PROJECT,
+                cca_names=[CCA],
+                analyses=[
+                    UpdateMountPointsPropsAnalysis(
+                        analysis_type=(
+                            AnalysisService.UpdateMountPointsPropsRequest.Analysis.ICTAnalysis
+                        ),
+                        mount_points_element_order=QUADRATIC,
+                        mount_points_max_edge_length=0.1234,
+                        mount_points_max_edge_length_units="m",
+                        mount_points_max_vertical=0.2345,
+                        mount_points_max_vertical_units="m",
+                    )
+                ],
+            )
+        ),
+    ),
+    Case(
+        "analysis.update_natural_frequency_props",
+        call(
+            PROJECT,
+            CCA,
+            natural_freq_count=2,
+            natural_freq_min=10,
+            natural_freq_min_units="HZ",
+            natural_freq_max=100,
+            natural_freq_max_units="HZ",
+            part_validation_enabled=True,
+            require_material_assignment_enabled=False,
+            analysis_temp=25,
+            analysis_temp_units="C",
+        ),
+    ),
+    Case(
+        "analysis.update_part_list_validation_analysis_props",
+        call(
+            PROJECT,
+            [
+                {
+                    "cca_name": CCA,
+                    "process_use_avl": True,
+                    "process_use_wizard": False,
+                    "process_check_confirmed_properties": True,
+                    "process_check_part_numbers": True,
+                    "matching_mode": "Part",
+                    "avl_require_internal_part_number": True,
+                    "avl_require_approved_description": False,
+                    "avl_require_approved_manufacturer": True,
+                }
+            ],
+        ),
+    ),
+    Case(
+        "analysis.update_part_modeling_props",
+        call(
+            PROJECT,
+            {
+                "cca_name": CCA,
+                "part_enabled": True,
+                "part_min_size": 1,
+                "part_min_size_units": "in",
+                "part_elem_order": "First Order (Linear)",
+                "part_max_edge_length": 1,
+                "part_max_edge_length_units": "in",
+                "part_max_vertical": 1,
+                "part_max_vertical_units": "in",
+                "part_results_filtered": True,
+            },
+        ),
+    ),
+    Case(
+        "analysis.update_pcb_modeling_props",
+        call(
+            PROJECT,
+            [CCA],
+            [
+                (
+                    UpdatePcbModelingPropsRequestAnalysisType.HARMONIC_VIBE,
+                    UpdatePcbModelingPropsRequestPcbModelType.BONDED,
+                    True,
+                    UpdatePcbModelingPropsRequestPcbMaterialModel.UNIFORM,
+                    ElementOrder.SOLID_SHELL,
+                    6,
+                    "mm",
+                    3,
+                    "mm",
+                    True,
+                )
+            ],
+        ),
+    ),
+    Case(
+        "analysis.update_potting_regions_props",
+        call(
+            UpdatePottingRegionsPropsRequest(
+                project=PROJECT,
+                cca_names=[CCA],
+                analyses=[
+                    UpdatePottingRegionsPropsAnalysis(
+                        analysis_type=(
+                            AnalysisService.UpdatePottingRegionsPropsRequest.Analysis.ICTAnalysis
+                        ),
+                        potting_enabled=True,
+                        potting_elem_order=QUADRATIC,
+                        potting_max_edge_length=0.1234,
+                        potting_max_edge_length_units="mm",
+                        potting_max_vertical=0.2345,
+                        potting_max_vertical_units="mm",
+                    )
+                ],
+            )
+        ),
+    ),
+    Case(
+        "analysis.update_random_vibe_props",
+        call(
+            PROJECT,
+            CCA,
+            random_vibe_damping="0.01, 0.05",
+            analysis_temp=20,
+            analysis_temp_units="C",
+            model_source=ModelSource.STRAIN_MAP,
+            strain_map_natural_freqs="20, 40",
+        ),
+    ),
+    Case(
+        "analysis.update_semiconductor_wearout_props",
+        call(
+            UpdateSemiconductorWearoutAnalysisPropsRequest(
+                project=PROJECT,
+                semiconductor_wearout_analysis_properties=[
+                    SemiconductorWearoutAnalysis(
+                        cca_name=CCA,
+                        max_feature_size=1.5,
+                        max_feature_size_units="mm",
+                        part_temp_rise=10.0,
+                        part_temp_rise_units="C",
+                        part_temp_rise_min_enabled=True,
+                        part_validation_enabled=False,
+                    )
+                ],
+            )
+        ),
+        stream="SherlockAnalysisService/updateSemiconductorWearoutAnalysisProps",
+    ),
+    Case(
+        "analysis.update_solder_fatigue_props",
+        call(
+            PROJECT,
+            [
+                {
+                    "cca_name": CCA,
+                    "solder_material": "TIN-LEAD (63SN37PB)",
+                    "part_temp": 70,
+                    "part_temp_units": "F",
+                    "use_part_temp_rise_min": True,
+                    "part_validation_enabled": True,
+                }
+            ],
+        ),
+    ),
+    Case(
+        "analysis.update_trace_modeling_props",
+        call(
+            UpdateTraceModelingPropsRequest(
+                project=PROJECT,
+                cca_names=[CCA],
+                analyses=[
+                    UpdateTraceModelingPropsAnalysis(
+                        analysis_type=(
+                            AnalysisService.UpdateTraceModelingPropsRequest.Analysis.ICTAnalysis
+                        ),
+                        trace_enabled=True,
+                        trace_element_order=QUADRATIC,
+                        trace_max_edge_length=0.2,
+                        trace_max_edge_length_units="mm",
+                        trace_max_holes=5,
+                    )
+                ],
+            )
+        ),
+    ),
+]
+
+STACKUP_CASES = [
+    Case(
+        "stackup.gen_stackup",
+        call(
+            PROJECT,
+            CCA,
+            82.6,
+            "mil",
+            "Generic",
+            "FR-4",
+            "Generic FR-4",
+            6,
+            0.5,
+            "oz",
+            1.0,
+            "mil",
+            False,
+            1.0,
+            "mil",
+        ),
+    ),
+    Case("stackup.get_layer_count", call(PROJECT, CCA)),
+    Case("stackup.get_stackup_props", call(PROJECT, CCA)),
+    Case("stackup.get_total_conductor_thickness", call(PROJECT, CCA, "in")),
+    Case("stackup.list_conductor_layers", call(PROJECT)),
+    Case("stackup.list_laminate_layers", call(PROJECT)),
+    Case(
+        "stackup.update_conductor_layer",
+        call(PROJECT, CCA, "3", "POWER", "COPPER", 1.0, "oz", "94.2", "Generic FR-4 Generic FR-4"),
+    ),
+    Case(
+        "stackup.update_laminate_layer",
+        call(
+            PROJECT,
+            CCA,
+            "2",
+            "Generic",
+            "FR-4",
+            "Generic FR-4",
+            0.015,
+            "in",
+            "106",
+            [("106", 68.0, 0.015, "in")],
+            "E-GLASS",
+            "COPPER",
+            "0.0",
+        ),
+    ),
+]
+
+PROJECT_CASES = [
+    Case("project.add_cca", _add_cca, SIZES),
+    Case(
+        "project.add_outline_file",
+        lambda rows, path: (
+            (
+                AddOutlineFileRequest(
+                    project=PROJECT,
+                    outline_files=[
+                        OutlineFile(
+                            cca_names=[CCA],
+                            file_name=path("outline.csv"),
+                            file_type=OutlineFileType.CSV_EXCEL,
+                            outline_file_data=CsvExcelOutlineFile(
+                                header_row_count=0,
+                                location_units="mm",
+                                x_location_column="X",
+                                y_location_column="Y",
+                            ),
+                        )
+                    ],
+                ),
+            ),
+            {},
+        ),
+        stream="SherlockProjectService/addOutlineFiles",
+    ),
+    Case("project.add_project", call(PROJECT, "Demos", "Benchmark project")),
+    Case(
+        "project.add_strain_maps",
+        lambda rows, path: (
+            (
+                PROJECT,
+                [
+                    (
+                        path("StrainMap.csv"),
+                        "Strain map",
+                        StrainMapsFileType.CSV,
+                        0,
+                        "refDes",
+                        "strain",
+                        "µε",
+                        [CCA],
+                    )
+                ],
+            ),
+            {},
+        ),
+    ),
+    Case(
+        "project.add_thermal_maps",
+        lambda rows, path: (
+            (
+                PROJECT,
+                [
+                    {
+                        "thermal_map_file": path("Thermal Image.jpg"),
+                        "thermal_map_file_properties": [_thermal_map(path)],
+                    }
+                ],
+            ),
+            {},
+        ),
+    ),
+    Case(
+        "project.create_cca_from_modeling_region",
+        call(
+            PROJECT,
+            [
+                {
+                    "cca_name": CCA,
+                    "modeling_region_id": "MR1",
+                    "description": "Test",
+                    "default_solder_type": "SAC305",
+                    "default_stencil_thickness": 10,
+                    "default_stencil_thickness_units": "mm",
+                    "default_part_temp_rise": 20,
+                    "default_part_temp_rise_units": "C",
+                    "guess_part_properties": False,
+                    "generate_image_layers": False,
+                }
+            ],
+        ),
+    ),
+    Case("project.delete_project", call(PROJECT)),
+    Case(
+        "project.export_project",
+        lambda rows, path: (
+            (PROJECT, True, True, True, True, True, True, path(""), "Exported", True),
+            {},
+        ),
+    ),
+    Case(
+        "project.generate_project_report",
+        lambda rows, path: ((PROJECT, "John Doe", "Example", path("Report.pdf")), {}),
+    ),
+    Case(
+        "project.import_GDSII_file",
+        lambda rows, path: (
+            (
+                ImportGDSIIRequest(
+                    gdsii_file=path("design.gds"),
+                    technology_file=path("tech.xml"),
+                    layer_map_file=path("layer.map"),
+                    project=PROJECT,
+                    cca_name=CCA,
+                    guess_part_properties=True,
+                    polyline_simplification_enabled=True,
+                    polyline_tolerance=0.01,
+                    polyline_tolerance_units="mm",
+                ),
+            ),
+            {},
+        ),
+    ),
+    Case(
+        "project.import_copper_files",
+        lambda rows, path: (
+            (
+                ImportCopperFilesRequest(
+                    project=PROJECT,
+                    copper_files=[
+                        ImportCopperFile(
+                            copper_file=path("bottom_copper.gbr"),
+                            copper_file_properties=CopperFile(
+                                file_name="bottom_copper.gbr",
+                                file_type=SherlockProjectService_pb2.CopperFile.FileType.Gerber,
+                                file_comment="Gerber bottom layer",
+                                copper_layer="Bottom Layer",
+                                polarity=SherlockProjectService_pb2.CopperFile.Polarity.Positive,
+                                layer_snapshot_enabled=True,
+                                cca=[CCA],
+                                gerber_file=CopperGerberFile(parse_decimal_first_enabled=True),
+                            ),
+                        )
+                    ],
+                ),
+            ),
+            {},
+        ),
+        stream="SherlockProjectService/importCopperFiles",
+    ),
+    Case(
+        "project.import_ipc2581_archive",
+        lambda rows, path: (
+            (path("Tutorial.zip"), True, True),
+            dict(project=PROJECT, cca_name=CCA, polyline_simplification=True),
+        ),
+    ),
+    Case(
+        "project.import_odb_archive",
+        lambda rows, path: (
+            (path("ODB++ Tutorial.tgz"), True, True, True, True),
+            dict(ims_stackup=True, project=PROJECT, cca_name=CCA),
+        ),
+    ),
+    Case(
+        "project.import_project_zip_archive",
+        lambda rows, path: ((PROJECT, "Demos", path("Tutorial Project.zip")), {}),
+    ),
+    Case(
+        "project.import_project_zip_archive_single_mode",
+        lambda rows, path: ((PROJECT, "Demos", path("Tutorial Project.zip"), path("")), {}),
+    ),
+    Case("project.list_ccas", call(PROJECT, [CCA])),
+    Case("project.list_strain_maps", call(PROJECT, [CCA])),
+    Case("project.list_thermal_maps", call(PROJECT, [CCA])),
+    Case(
+        "project.update_thermal_maps",
+        lambda rows, path: ((PROJECT, [_thermal_map(path)]), {}),
+    ),
+]
+
+MODEL_CASES = [
+    Case(
+        "model.createExportTraceCopperLayerParams",
+        lambda rows, path: (
+            (PROJECT, CCA, path("trace.stp"), "copper-01.odb"),
+            dict(element_order=ElementOrder.LINEAR, geometry_type=GeometryType.Step),
+        ),
+    ),
+    Case("model.exportTraceModel", _export_trace_model, ("small", "medium")),
+    Case(
+        "model.export_FEA_model",
+        lambda rows, path: (
+            (),
+            dict(
+                project=PROJECT,
+                cca_name=CCA,
+                export_file=path("export.wbjn"),
+                analysis="NaturalFreq",
+                drill_hole_parameters=[
+                    {
+                        "drill_hole_modeling": "ENABLED",
+                        "min_hole_diameter": Measurement(value=0.5, unit="mm"),
+                        "max_edge_length": Measurement(value=1.0, unit="mm"),
+                    }
+                ],
+                detect_lead_modeling="ENABLED",
+                lead_model_parameters=[
+                    {
+                        "lead_modeling": "ENABLED",
+                        "lead_element_order": "First Order (Linear)",
+                        "max_mesh_size": Measurement(value=0.5, unit="mm"),
+                        "vertical_mesh_size": Measurement(value=0.1, unit="mm"),
+                        "thicknessCount": 3,
+                        "aspectRatio": 2,
+                    }
+                ],
+                display_model=True,
+                clear_FEA_database=True,
+                use_FEA_model_id=True,
+                coordinate_units="mm",
+                pcb_material_type=PcbMaterialType.Isotropic,
+                geometry_type=GeometryType.PartManager,
+            ),
+        ),
+    ),
+    Case(
+        "model.export_aedb",
+        lambda rows, path: ((PROJECT, CCA, path("export.aedb"), True, False), {}),
+    ),
+    Case(
+        "model.export_trace_reinforcement_model",
+        lambda rows, path: ((PROJECT, CCA, path("export.wbjn"), True, False, False), {}),
+    ),
+    Case("model.generate_trace_model", call(PROJECT, CCA, "copper-01.odb", 0.05, "mm")),
+]
+
+CASES: list[Case] = (
+    PARTS_CASES
+    + LIFECYCLE_CASES
+    + LAYER_CASES
+    + ANALYSIS_CASES
+    + STACKUP_CASES
+    + PROJECT_CASES
+    + MODEL_CASES
+)
+"""Every benchmarked call."""
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+import os
+import warnings
+
+import pytest
+
+from ansys.sherlock.core import launcher
+from ansys.sherlock.core.fake_server import FakeSherlockServer
+from ansys.sherlock.core.utils.enumeration_cache import ENUMERATIONS
+
+BASELINE_FILE = os.path.join(os.path.dirname(__file__), "baseline.json")
+"""Results of the benchmarks on this machine, written by ``--benchmark-save-baseline``. The
+file is not committed since the timings depend on the machine."""
+
+RELEASE_VERSION = "2027 R1"
+"""Release reported by the fake server, recent enough for every API method."""
+
+ENUMERATION_VALUES = {
+    "cycle_types": ["COUNT", "DURATION", "PER YEAR", "PER DAY", "PER HOUR", "PER MIN"],
+    "rv_profile_types": ["Uniaxial"],
+    "harmonic_profile_types": ["Uniaxial", "Triaxial"],
+    "ampl_units": ["G", "m/s2", "mm/s2", "in/s2", "ft/s2", "G2/Hz"],
+    "cycle_states": ["STEADY-STATE", "TRANSIENT", "STORAGE", "OPERATING"],
+    "load_units": ["G", "m/s2"],
+    "shock_shapes": ["HalfSine", "Triangle", "Sawtooth", "Square"],
+    "laminate_thickness_units": ["mil", "mm", "in", "oz"],
+    "laminate_material_manufacturers": ["Generic"],
+    "conductor_materials": ["COPPER", "ALUMINUM"],
+    "construction_styles": ["106", "1080", "2116"],
+    "fiber_materials": ["E-GLASS"],
+    "part_location_units": ["in", "mm", "mil"],
+    "board_sides": ["TOP", "BOTTOM"],
+}
+"""Values returned by the fake server for the enumeration lists used to validate arguments."""
+
+LAMINATE_MATERIALS = {
+    "manufacturerMaterials": [
+        {
+            "manufacturer": "Generic",
+            "gradeMaterials": [{"grade": "FR-4", "laminateMaterial": ["Generic FR-4"]}],
+        }
+    ]
+}
+"""Laminate materials returned by the fake server, used to validate stackup arguments."""
+
+
+@pytest.fixture(scope="session")
+def benchmark_server():
+    with FakeSherlockServer(release_version=RELEASE_VERSION) as server:
+        for name, enumeration in ENUMERATIONS.items():
+            server.set_response(
+                f"{enumeration.service}/{enumeration.method}",
+                {enumeration.field: ENUMERATION_VALUES[name]},
+            )
+        server.set_response("SherlockStackupService/listLaminateMaterials", LAMINATE_MATERIALS)
+        yield server
+
+
+@pytest.fixture(scope="session")
+def benchmark_sherlock(benchmark_server):
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        sherlock = launcher.connect(
+            port=benchmark_server.port,
+            timeout=10,
+            transport_mode="insecure",
+            prefetch_enumerations=True,
+            enable_metrics=True,
+        )
+    yield sherlock
+
+
+@pytest.fixture(scope="session")
+def benchmark_results(request):
+    """Collect the results of the benchmarks, and report and optionally store them."""
+    baseline = {}
+    if os.path.isfile(BASELINE_FILE):
+        with open(BASELINE_FILE) as f:
+            baseline = json.load(f)
+    results = {}
+    yield baseline, results
+
+    if not results:
+        return
+    reporter = request.config.pluginmanager.get_plugin("terminalreporter")
+    if reporter is not None:
+        reporter.write_sep("-", "client overhead per call")
+        reporter.write_line(f"{'case':<70} {'client us':>10} {'baseline':>10} {'alloc KiB':>10}")
+        for case_id, result in sorted(results.items()):
+            previous = baseline.get(case_id, {}).get("client_us")
+            reporter.write_line(
+                f"{case_id:<70} {result['client_us']:>10.1f} "
+                f"{previous if previous is not None else '-':>10} {result['alloc_kib']:>10.1f}"
+            )
+    if request.config.getoption("--benchmark-save-baseline"):
+        baseline.update(results)
+        with open(BASELINE_FILE, "w") as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+
+@pytest.fixture(scope="session")
+def benchmark_files(tmp_path_factory):
+    """Return a function creating an empty file and returning its path."""
+    directory = tmp_path_factory.mktemp("benchmark_files")
+
+    def path(name: str) -> str:
+        file_path = directory / name
+        if name and not file_path.exists():
+            file_path.touch()
+        return str(file_path)
+
+    return path
@@ -0,0 +1,137 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import time
+import tracemalloc
+
+import pytest
+
+from ansys.sherlock.core.analysis import Analysis
+from ansys.sherlock.core.layer import Layer
+from ansys.sherlock.core.lifecycle import Lifecycle
+from ansys.sherlock.core.model import Model
+from ansys.sherlock.core.parts import Parts
+from ansys.sherlock.core.project import Project
+from ansys.sherlock.core.stackup import Stackup
+from tests.benchmarks.cases import CASES, PAYLOAD_ROWS
+
+FACADES = {
+    "analysis": Analysis,
+    "layer": Layer,
+    "lifecycle": Lifecycle,
+    "model": Model,
+    "parts": Parts,
+    "project": Project,
+    "stackup": Stackup,
+}
+
+ROUNDS = 5
+"""Number of timed rounds of each case, whose fastest is reported."""
+ROUND_DURATION = 0.05
+"""Seconds each round calls the method for, up to ``ROUND_ITERATIONS`` calls."""
+ROUND_ITERATIONS = 50
+NOISE_FLOOR_US = 20.0
+"""Slowdown in microseconds per call below which a case is never reported as a regression."""
+
+
+def _parameters():
+    for case in CASES:
+        for size, case_id in zip(case.sizes, case.ids()):
+            yield pytest.param(case, size, id=case_id)
+
+
+def _method(sherlock, name):
+    facade, method = name.split(".")
+    return getattr(getattr(sherlock, facade), method)
+
+
+@pytest.mark.benchmark
+@pytest.mark.parametrize("case,size", list(_parameters()))
+def test_client_overhead(
+    case, size, request, benchmark_server, benchmark_sherlock, benchmark_results, benchmark_files
+):
+    baseline, results = benchmark_results
+    case_id = f"{case.method}[{size}]"
+    rows = PAYLOAD_ROWS[size]
+    method = _method(benchmark_sherlock, case.method)
+    args, kwargs = case.arguments(rows, benchmark_files)
+    if case.stream is not None:
+        benchmark_server.set_stream_size(case.stream, rows)
+    try:
+        _consume(method(*args, **kwargs))
+
+        client_us = min(
+            _time_round(benchmark_sherlock.metrics(), method, args, kwargs) for _ in range(ROUNDS)
+        )
+
+        tracemalloc.start()
+        try:
+            _consume(method(*args, **kwargs))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+    finally:
+        if case.stream is not None:
+            benchmark_server.set_stream_size(case.stream, 1)
+
+    results[case_id] = {"client_us": round(client_us, 1), "alloc_kib": round(peak / 1024, 1)}
+
+    previous = baseline.get(case_id, {}).get("client_us")
+    tolerance = request.config.getoption("--benchmark-tolerance")
+    if previous and not request.config.getoption("--benchmark-save-baseline"):
+        if client_us > max(previous * tolerance, previous + NOISE_FLOOR_US):
+            pytest.fail(
+                f"{case_id} regressed: {client_us:.1f} us per call, baseline {previous:.1f} us"
+            )
+
+
+def test_cases_cover_public_methods():
+    """Test that every public method of the benchmarked facades has a case."""
+    public = {
+        f"{name}.{method}"
+        for name, facade in FACADES.items()
+        for method in vars(facade)
+        if not method.startswith("_") and callable(getattr(facade, method))
+    }
+    assert sorted(public - {case.method for case in CASES}) == []
+
+
+def _time_round(metrics, method, args, kwargs) -> float:
+    """Return the client-side microseconds per call, excluding the time spent in RPCs."""
+    metrics.reset()
+    iterations = 0
+    start = time.perf_counter()
+    while iterations < ROUND_ITERATIONS and time.perf_counter() - start < ROUND_DURATION:
+        _consume(method(*args, **kwargs))
+        iterations += 1
+    elapsed = time.perf_counter() - start
+    rpc_seconds = sum(stats["latency"]["sum"] for stats in metrics.snapshot()["rpc"].values())
+    return max(elapsed - rpc_seconds, 0.0) / iterations * 1e6
+
+
+def _consume(result):
+    """Exhaust the iterators returned by the ``iter_*`` methods."""
+    if hasattr(result, "__next__"):
+        for _ in result:
+            pass
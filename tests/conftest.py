@@ -22,8 +22,13 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
+import warnings
+
 import pytest
 
+from ansys.sherlock.core import launcher
+from ansys.sherlock.core.fake_server import FakeSherlockServer
+
 
 def pytest_addoption(parser):
     parser.addoption(
@@ -32,18 +37,76 @@ def pytest_addoption(parser):
         default=False,
         help="Run behavioral tests that require Sherlock/real process launches.",
     )
+    parser.addoption(
+        "--run-benchmarks",
+        action="store_true",
+        default=False,
+        help="Run the client-overhead benchmarks against the fake Sherlock server.",
+    )
+    parser.addoption(
+        "--benchmark-save-baseline",
+        action="store_true",
+        default=False,
+        help="Store the results of the benchmarks as the baseline of this machine.",
+    )
+    parser.addoption(
+        "--benchmark-tolerance",
+        type=float,
+        default=2.0,
+        help="Ratio to the baseline of this machine above which a benchmark fails as a "
+        "regression.",
+    )
 
 
 def pytest_configure(config):
     config.addinivalue_line("markers", "behavioral: mark a test as behavioral/integration")
     config.addinivalue_line("markers", "requires_sherlock: test requires local Sherlock")
+    config.addinivalue_line("markers", "benchmark: client-overhead benchmark")
 
 
 def pytest_collection_modifyitems(config, items):
     run_behavioral = config.getoption("--run-behavioral")
     skip_behavioral = pytest.mark.skip(reason="skipped by default (need --run-behavioral)")
+    run_benchmarks = config.getoption("--run-benchmarks")
+    skip_benchmark = pytest.mark.skip(reason="skipped by default (need --run-benchmarks)")
 
     for item in items:
         if "behavioral" in item.keywords:
             if not run_behavioral:
                 item.add_marker(skip_behavioral)
+        if "benchmark" in item.keywords:
+            if not run_benchmarks:
+                item.add_marker(skip_benchmark)
+
+
+@pytest.fixture(autouse=True)
+def instance_registry_dir(tmp_path, monkeypatch):
+    """Keep the Sherlock instances recorded by the tests out of the user's registry."""
+    registry_dir = tmp_path / "instances"
+    monkeypatch.setenv("PYSHERLOCK_INSTANCE_REGISTRY", str(registry_dir))
+    return registry_dir
+
+
+@pytest.fixture
+def fake_server():
+    """Fake Sherlock server reporting a release recent enough for every API method."""
+    with FakeSherlockServer(release_version="2027 R1") as server:
+        yield server
+
+
+@pytest.fixture
+def fake_sherlock(fake_server):
+    """Return a function connecting to ``fake_server``.
+
+    The function takes the keyword arguments of :func:`ansys.sherlock.core.launcher.connect`,
+    such as ``enable_metrics`` or ``retry_policy``.
+    """
+
+    def connect(**kwargs):
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            return launcher.connect(
+                port=fake_server.port, timeout=10, transport_mode="insecure", **kwargs
+            )
+
+    return connect
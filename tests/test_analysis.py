@@ -22,9 +22,12 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
 # SOFTWARE.
 
-from unittest.mock import Mock
+import threading
+import time
+from unittest.mock import Mock, patch
 
 from ansys.api.sherlock.v0 import SherlockAnalysisService_pb2 as AnalysisService
+from ansys.api.sherlock.v0 import SherlockCommonService_pb2
 import grpc
 import pydantic
 import pytest
@@ -49,6 +52,7 @@ from ansys.sherlock.core.types.analysis_types import (
     ElementOrder,
     ModelSource,
     PTHFatiguePropsAnalysis,
+    RunAnalysisJob,
     RunAnalysisRequestAnalysisType,
     RunStrainMapAnalysisRequestAnalysisType,
     SemiconductorWearoutAnalysis,
@@ -107,6 +111,82 @@ def test_all():
     helper_test_update_potting_regions_props(analysis)
 
 
+def test_run_analysis_many():
+    """Test run_analysis_many API against a stub that records concurrent calls."""
+    analysis = Analysis(grpc.insecure_channel("127.0.0.1:9090"), SKIP_VERSION_CHECK)
+    lock = threading.Lock()
+    state = {"in_flight": 0, "max_in_flight": 0}
+
+    def run_analysis(request):
+        with lock:
+            state["in_flight"] += 1
+            state["max_in_flight"] = max(state["max_in_flight"], state["in_flight"])
+        time.sleep(0.05)
+        with lock:
+            state["in_flight"] -= 1
+        if request.ccaName == "Invalid CCA":
+            return SherlockCommonService_pb2.ReturnCode(value=-1, message="Cannot find CCA")
+        if request.ccaName == "Broken CCA":
+            raise RuntimeError("Unexpected failure")
+        return SherlockCommonService_pb2.ReturnCode(value=0, message="Done")
+
+    analysis.stub = Mock()
+    analysis.stub.runAnalysis.side_effect = run_analysis
+    analyses = [(RunAnalysisRequestAnalysisType.NATURAL_FREQ, [("Phase 1", ["Harmonic Vibe"])])]
+    jobs = [("Test", f"Card {i}", analyses) for i in range(5)]
+    jobs.append(RunAnalysisJob(project="Test", cca_name="Invalid CCA", analyses=analyses))
+    jobs.append(("Test", "", analyses))
+    jobs.append(("Test", "Broken CCA", analyses))
+
+    with patch.object(analysis, "_is_connection_up", return_value=True):
+        result = analysis.run_analysis_many(jobs, max_concurrency=3)
+
+        assert result.max_concurrency == 3
+        assert 1 < state["max_in_flight"] <= 3
+        assert [r.job.cca_name for r in result.results] == [
+            "Card 0",
+            "Card 1",
+            "Card 2",
+            "Card 3",
+            "Card 4",
+            "Invalid CCA",
+            "",
+            "Broken CCA",
+        ]
+        assert [r.return_code for r in result.succeeded] == [0, 0, 0, 0, 0]
+        assert [r.error for r in result.failed] == [
+            "Run analysis error: Cannot find CCA",
+            "Run analysis error: CCA name is invalid.",
+            "RuntimeError: Unexpected failure",
+        ]
+        assert not result.all_succeeded
+        assert all(r.elapsed >= 0 for r in result.results)
+
+        state["max_in_flight"] = 0
+        analysis.max_concurrent_analyses = 1
+        result = analysis.run_analysis_many(jobs[:3])
+        assert result.all_succeeded
+        assert state["max_in_flight"] == 1
+
+    try:
+        analysis.run_analysis_many("Not a list")
+        pytest.fail("No exception raised when using an invalid parameter")
+    except SherlockRunAnalysisError as e:
+        assert str(e) == "Run analysis error: Jobs argument is invalid."
+
+    try:
+        analysis.run_analysis_many([("Test", "Card")])
+        pytest.fail("No exception raised when using an invalid parameter")
+    except SherlockRunAnalysisError as e:
+        assert str(e) == "Run analysis error: Job 0 is invalid."
+
+    try:
+        analysis.run_analysis_many(jobs, max_concurrency=0)
+        pytest.fail("No exception raised when using an invalid parameter")
+    except SherlockRunAnalysisError as e:
+        assert str(e) == "Run analysis error: Maximum concurrency must be a positive integer."
+
+
 def helper_test_run_analysis(analysis: Analysis):
     """Test run_analysis API."""
     natural_frequency_analysis_type = RunAnalysisRequestAnalysisType.NATURAL_FREQ
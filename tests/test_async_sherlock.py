@@ -0,0 +1,201 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import asyncio
+from concurrent import futures
+import threading
+
+from ansys.api.sherlock.v0 import SherlockCommonService_pb2, SherlockCommonService_pb2_grpc
+import grpc
+import pytest
+
+from ansys.sherlock.core import launcher
+from ansys.sherlock.core.async_sherlock import ThreadedAsyncSherlock
+from ansys.sherlock.core.errors import SherlockCommonServiceError
+from ansys.sherlock.core.types.common_types import ListUnitsRequestUnitType
+from ansys.sherlock.core.types.parts_types import GetPartsListPropertiesRequest
+from ansys.sherlock.core.utils.aio_bridge import AioBridgeChannel
+from ansys.sherlock.core.utils.read_cache import ReadCache
+from ansys.sherlock.core.utils.retries import RetryPolicy
+from ansys.sherlock.core.utils.version_check import SKIP_VERSION_CHECK
+
+
+class CommonServicer(SherlockCommonService_pb2_grpc.SherlockCommonServiceServicer):
+    """Minimal Common service recording how many requests are in flight."""
+
+    def __init__(self):
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def check(self, request, context):
+        return SherlockCommonService_pb2.HealthCheckResponse()
+
+    def getSherlockInfo(self, request, context):
+        return SherlockCommonService_pb2.SherlockInfoResponse(releaseVersion="2025 R2")
+
+    def listUnits(self, request, context):
+        with self._lock:
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        threading.Event().wait(0.2)
+        with self._lock:
+            self.in_flight -= 1
+        return SherlockCommonService_pb2.ListUnitsResponse(units=["mm", "in"])
+
+
+@pytest.fixture
+def common_server():
+    servicer = CommonServicer()
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=8))
+    SherlockCommonService_pb2_grpc.add_SherlockCommonServiceServicer_to_server(servicer, server)
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    yield servicer, port
+    server.stop(None)
+
+
+def test_async_methods_run_concurrently(common_server):
+    servicer, port = common_server
+
+    async def run():
+        channel = grpc.aio.insecure_channel(f"127.0.0.1:{port}")
+        async with ThreadedAsyncSherlock(channel, SKIP_VERSION_CHECK) as sherlock:
+            assert await sherlock.common.check()
+            results = await asyncio.gather(
+                *[sherlock.common.list_units(ListUnitsRequestUnitType.LENGTH) for _ in range(4)]
+            )
+            assert all(list(units) == ["mm", "in"] for units in results)
+
+    asyncio.run(run())
+    assert servicer.max_in_flight > 1
+
+
+def test_async_methods_validate_arguments(common_server):
+    _, port = common_server
+
+    async def run():
+        channel = grpc.aio.insecure_channel(f"127.0.0.1:{port}")
+        async with ThreadedAsyncSherlock(channel, SKIP_VERSION_CHECK) as sherlock:
+            with pytest.raises(SherlockCommonServiceError):
+                await sherlock.common.list_units("")
+            assert sherlock.common.list_units.__doc__.startswith("List units")
+
+    asyncio.run(run())
+
+
+def test_blocking_call_on_event_loop_thread(common_server):
+    _, port = common_server
+
+    async def run():
+        channel = grpc.aio.insecure_channel(f"127.0.0.1:{port}")
+        async with ThreadedAsyncSherlock(channel, SKIP_VERSION_CHECK) as sherlock:
+            with pytest.raises(RuntimeError):
+                sherlock.common._facade.list_units(ListUnitsRequestUnitType.LENGTH)
+
+    asyncio.run(run())
+
+
+def test_connect_async(common_server):
+    _, port = common_server
+
+    async def run():
+        sherlock = await launcher.connect_async(port=port, timeout=10, transport_mode="insecure")
+        try:
+            assert isinstance(sherlock, ThreadedAsyncSherlock)
+            assert sherlock.common._facade._server_version == 252
+            assert await sherlock.common.get_sherlock_info() is not None
+        finally:
+            await sherlock.close()
+
+    asyncio.run(run())
+
+
+def test_connect_async_options(fake_server):
+    list_ccas = "SherlockProjectService/listCCAs"
+    fake_server.set_stream_size("SherlockPartsService/getPartsListProperties", 3)
+    fake_server.inject_failure(list_ccas, times=1)
+
+    async def run():
+        sherlock = await launcher.connect_async(
+            port=fake_server.port,
+            timeout=10,
+            transport_mode="insecure",
+            enable_metrics=True,
+            retry_policy=RetryPolicy(initial_backoff=0.01),
+            read_cache=ReadCache(),
+            default_deadline=10,
+        )
+        async with sherlock:
+            assert await sherlock.project.list_ccas("Test") == []
+            assert await sherlock.project.list_ccas("Test") == []
+            assert fake_server.call_count(list_ccas) == 2
+            stats = sherlock.metrics().snapshot()["rpc"][f"/{list_ccas}"]
+            assert stats["retries"] == 1
+
+            request = GetPartsListPropertiesRequest(project="Test", cca_name="Card")
+            responses = [r async for r in sherlock.parts.iter_parts_list_properties(request)]
+            assert len(responses) == 3
+
+    asyncio.run(run())
+
+
+def test_bridge_client_streaming():
+    def count(request_iterator, context):
+        return str(sum(1 for _ in request_iterator)).encode()
+
+    def echo(request_iterator, context):
+        for request in request_iterator:
+            yield request.upper()
+
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+    server.add_generic_rpc_handlers(
+        (
+            grpc.method_handlers_generic_handler(
+                "Test",
+                {
+                    "count": grpc.stream_unary_rpc_method_handler(count),
+                    "echo": grpc.stream_stream_rpc_method_handler(echo),
+                },
+            ),
+        )
+    )
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+
+    async def run():
+        channel = grpc.aio.insecure_channel(f"127.0.0.1:{port}")
+        bridge = AioBridgeChannel(channel, asyncio.get_running_loop())
+
+        def call():
+            assert bridge.stream_unary("/Test/count")(iter([b"a", b"b", b"c"])) == b"3"
+            return list(bridge.stream_stream("/Test/echo")(iter([b"a", b"b"])))
+
+        assert await asyncio.to_thread(call) == [b"A", b"B"]
+        await channel.close()
+
+    try:
+        asyncio.run(run())
+    finally:
+        server.stop(None)
@@ -0,0 +1,180 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import threading
+import time
+
+from ansys.api.sherlock.v0 import SherlockLifeCycleService_pb2, SherlockStackupService_pb2
+import pytest
+
+from ansys.sherlock.core.batch import _scope
+from ansys.sherlock.core.errors import SherlockCreateLifePhaseError
+from ansys.sherlock.core.utils.futures import DEFAULT_MAX_WORKERS
+
+CREATE_LIFE_PHASE = "SherlockLifeCycleService/createLifePhase"
+PROFILE = [("1", "HOLD", 40, 40), ("2", "RAMP", 20, 20)]
+
+
+@pytest.fixture
+def server(fake_server):
+    fake_server.set_response(
+        "SherlockLifeCycleService/listLifeCycleTypes", {"types": ["COUNT", "PER YEAR"]}
+    )
+    fake_server.set_response(
+        "SherlockLifeCycleService/listLifeCycleStates", {"states": ["OPERATING", "STORAGE"]}
+    )
+    return fake_server
+
+
+@pytest.fixture
+def sherlock(server, fake_sherlock):
+    return fake_sherlock()
+
+
+def _record_order(server) -> list[tuple[str, str]]:
+    order = []
+    lock = threading.Lock()
+
+    def recorder(response_class, phase):
+        def respond(request):
+            with lock:
+                order.append((type(request).__name__, phase(request)))
+            return response_class()
+
+        return respond
+
+    lifecycle = SherlockLifeCycleService_pb2
+    server.set_response(
+        CREATE_LIFE_PHASE,
+        recorder(lifecycle.CreateLifePhaseResponse, lambda request: request.phaseName),
+    )
+    server.set_response(
+        "SherlockLifeCycleService/addThermalEvent",
+        recorder(lifecycle.AddThermalEventResponse, lambda request: request.phaseName),
+    )
+    server.set_response(
+        "SherlockLifeCycleService/addThermalProfiles",
+        recorder(
+            lifecycle.AddThermalProfilesResponse,
+            lambda request: request.thermalProfiles[0].phaseName,
+        ),
+    )
+    return order
+
+
+def _set_up_phase(batch, phase):
+    batch.lifecycle.create_life_phase("Test", phase, 1.5, "sec", 4.0, "COUNT")
+    batch.lifecycle.add_thermal_event("Test", phase, "Event", 4.0, "PER YEAR", "STORAGE")
+    return batch.lifecycle.add_thermal_profiles(
+        "Test", [(phase, "Event", "Profile", "sec", "F", PROFILE)]
+    )
+
+
+def test_scope():
+    lifecycle = SherlockLifeCycleService_pb2
+    assert _scope(lifecycle.CreateLifePhaseRequest(project="P", phaseName="A")) == (
+        ("project", "P"),
+        ("phaseName", "A"),
+    )
+    request = lifecycle.AddThermalProfilesRequest(project="P")
+    for profile in ("X", "Y"):
+        request.thermalProfiles.add(phaseName="A", eventName="E", profileName=profile)
+    assert _scope(request) == (("project", "P"), ("phaseName", "A"), ("eventName", "E"))
+    request.thermalProfiles.add(phaseName="B", eventName="E")
+    assert _scope(request) == (("project", "P"),)
+
+    rename = lifecycle.UpdateLifePhaseRequest(project="P", phaseName="A", newPhaseName="B")
+    assert _scope(rename) == (("project", "P"),)
+    layer = SherlockStackupService_pb2.UpdateConductorLayerRequest(
+        project="P", ccaName="Card", layer="1"
+    )
+    assert _scope(layer) == (("project", "P"), ("ccaName", "Card"), ("layer", "1"))
+
+
+def test_dependent_calls_are_ordered_and_independent_ones_pipelined(server, sherlock):
+    order = _record_order(server)
+    server.set_latency("SherlockLifeCycleService/add*", 0.2)
+    server.set_latency(CREATE_LIFE_PHASE, 0.2)
+    with sherlock.batch() as batch:
+        futures = [_set_up_phase(batch, phase) for phase in ("A", "B")]
+        assert batch.pending == 6
+        # Calls reading data are sent at once
+        assert batch.project.list_ccas("Test") == []
+        assert batch.pending == 6
+
+    assert [result.succeeded for result in batch.results] == [True] * 6
+    assert [result.method for result in batch.results[:3]] == [
+        "Lifecycle.create_life_phase",
+        "Lifecycle.add_thermal_event",
+        "Lifecycle.add_thermal_profiles",
+    ]
+    assert futures[1].result() is batch.results[5]
+    assert server.max_in_flight == 2
+    for phase in ("A", "B"):
+        assert [name for name, p in order if p == phase] == [
+            "CreateLifePhaseRequest",
+            "AddThermalEventRequest",
+            "AddThermalProfilesRequest",
+        ]
+
+
+def test_invalid_call_raises_when_recorded(server, sherlock):
+    with pytest.raises(SherlockCreateLifePhaseError):
+        with sherlock.batch() as batch:
+            batch.lifecycle.create_life_phase("Test", "A", 1.5, "sec", 4.0, "COUNT")
+            batch.lifecycle.create_life_phase("Test", "B", 0.0, "sec", 4.0, "COUNT")
+    assert server.call_count(CREATE_LIFE_PHASE) == 0
+    assert batch.pending == 0
+
+
+def test_failed_call_skips_the_calls_depending_on_it(server, sherlock):
+    _record_order(server)
+    server.inject_failure(CREATE_LIFE_PHASE, code=None, message="Phase exists", times=1)
+    with sherlock.batch(max_in_flight=1) as batch:
+        for phase in ("A", "B"):
+            _set_up_phase(batch, phase)
+
+    results = batch.results
+    assert results[0].error == "Phase exists"
+    assert results[0].return_code == -1
+    assert [result.skipped for result in results] == [False, True, True, False, False, False]
+    assert all(result.succeeded for result in results[3:])
+
+
+def test_flush_does_not_use_the_background_workers(server, sherlock):
+    _record_order(server)
+    release = threading.Event()
+    # Occupy every worker running the calls of Sherlock.submit
+    blockers = [sherlock.submit(release.wait, 5) for _ in range(DEFAULT_MAX_WORKERS)]
+    try:
+        start = time.monotonic()
+        with sherlock.batch() as batch:
+            _set_up_phase(batch, "A")
+        assert time.monotonic() - start < 2
+        assert [result.succeeded for result in batch.results] == [True] * 3
+    finally:
+        release.set()
+    for blocker in blockers:
+        blocker.result()
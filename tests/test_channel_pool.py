@@ -0,0 +1,86 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from unittest.mock import Mock
+
+from ansys.api.sherlock.v0 import SherlockProjectService_pb2
+import pytest
+
+from ansys.sherlock.core.types.parts_types import GetPartsListPropertiesRequest
+from ansys.sherlock.core.utils.channel_pool import ChannelPool
+
+
+def _mock_channel():
+    channel = Mock()
+    callbacks = []
+    channel.unary_unary.return_value.future.side_effect = lambda *args, **kwargs: Mock(
+        add_done_callback=callbacks.append
+    )
+    return channel, callbacks
+
+
+def test_least_outstanding_picks_idle_channel():
+    channels, callbacks = zip(*[_mock_channel() for _ in range(3)])
+    pool = ChannelPool(list(channels))
+    method = pool.unary_unary("/SherlockCommonService/check")
+    for _ in range(3):
+        method.future(None)
+    assert pool.outstanding == [1, 1, 1]
+
+    callbacks[1][0](None)
+    assert pool.outstanding == [1, 0, 1]
+    method.future(None)
+    assert pool.calls == [1, 2, 1]
+
+    with pytest.raises(ValueError):
+        ChannelPool(list(channels), strategy="random")
+
+
+def test_round_robin_spreads_calls():
+    channels = [Mock() for _ in range(3)]
+    pool = ChannelPool(channels, strategy="round_robin")
+    method = pool.unary_unary("/SherlockCommonService/check")
+    for _ in range(6):
+        method(None, timeout=1)
+    assert pool.calls == [2, 2, 2]
+    assert pool.outstanding == [0, 0, 0]
+    channels[0].unary_unary.return_value.assert_called_with(None, timeout=1)
+
+
+def test_connection_spreads_rpcs_over_connections(fake_server, fake_sherlock):
+    sherlock = fake_sherlock(channel_pool_size=3, channel_pool_strategy="round_robin")
+    peers = set()
+
+    def list_ccas(request, context):
+        peers.add(context.peer())
+        return SherlockProjectService_pb2.ListCCAsResponse()
+
+    fake_server.set_handler("SherlockProjectService/listCCAs", list_ccas)
+    for _ in range(6):
+        sherlock.project.list_ccas("Test")
+    assert len(peers) == 3
+
+    fake_server.set_stream_size("SherlockPartsService/getPartsListProperties", 3)
+    request = GetPartsListPropertiesRequest(project="Test", cca_name="Card")
+    assert len(list(sherlock.parts.iter_parts_list_properties(request))) == 3
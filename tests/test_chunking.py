@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+
+from ansys.api.sherlock.v0 import (
+    SherlockAnalysisService_pb2,
+    SherlockCommonService_pb2,
+    SherlockLifeCycleService_pb2,
+    SherlockPartsService_pb2,
+)
+import pytest
+
+from ansys.sherlock.core.errors import SherlockRequestTooLargeError
+from ansys.sherlock.core.utils.chunking import merge_responses, send_chunked, split_request
+
+
+def make_request(count):
+    request = SherlockPartsService_pb2.UpdatePartsListPropertiesRequest(
+        project="Test", ccaName="Card"
+    )
+    for i in range(count):
+        prop = request.partProperties.add()
+        prop.refDes.append(f"C{i}")
+        prop.properties.add(name="description", value="x" * 100)
+    return request
+
+
+def test_small_request_not_split():
+    request = make_request(10)
+    assert split_request(request) == [request]
+
+
+def test_split_request():
+    request = make_request(100)
+    chunks = split_request(request, max_bytes=1000)
+    assert len(chunks) > 1
+    assert all(chunk.ByteSize() <= 1000 for chunk in chunks)
+    assert all(chunk.project == "Test" and chunk.ccaName == "Card" for chunk in chunks)
+    ref_des = [prop.refDes[0] for chunk in chunks for prop in chunk.partProperties]
+    assert ref_des == [f"C{i}" for i in range(100)]
+
+
+def test_item_too_large():
+    request = make_request(2)
+    with pytest.raises(SherlockRequestTooLargeError):
+        split_request(request, max_bytes=100)
+
+
+def test_merge_responses():
+    response_type = SherlockPartsService_pb2.UpdatePartsListPropertiesResponse
+    succeeded = response_type(returnCode=SherlockCommonService_pb2.ReturnCode(value=0))
+    failed = response_type(
+        returnCode=SherlockCommonService_pb2.ReturnCode(value=-1, message="Error"),
+        updateErrors=[{"refDes": "C5", "message": "Not found"}],
+    )
+    also_failed = response_type(
+        returnCode=SherlockCommonService_pb2.ReturnCode(value=-1, message="Other"),
+        updateErrors=[{"refDes": "C9", "message": "Not found"}],
+    )
+    merged = merge_responses([succeeded, failed, also_failed])
+    assert merged.returnCode.value == -1
+    assert merged.returnCode.message == "Error"
+    assert [error.refDes for error in merged.updateErrors] == ["C5", "C9"]
+
+    codes = [SherlockCommonService_pb2.ReturnCode(value=0, message=str(i)) for i in range(3)]
+    assert merge_responses(codes) == codes[-1]
+
+
+class FakeMethod:
+    """Unary-unary callable recording the requests and the number of calls in flight."""
+
+    def __init__(self):
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=8)
+
+    def __call__(self, request):
+        with self._lock:
+            self.requests.append(request)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        time.sleep(0.01)
+        with self._lock:
+            self.in_flight -= 1
+        return SherlockLifeCycleService_pb2.AddThermalProfilesResponse(
+            errors=[profile.profileName for profile in request.thermalProfiles]
+        )
+
+    def future(self, request):
+        return self._executor.submit(self, request)
+
+
+def test_send_chunked():
+    request = SherlockLifeCycleService_pb2.AddThermalProfilesRequest(project="Test")
+    for i in range(50):
+        request.thermalProfiles.add(phaseName="Phase 1", eventName="Event", profileName=f"P{i}")
+
+    method = FakeMethod()
+    response = send_chunked(method, request, max_bytes=200)
+    assert len(method.requests) > 4
+    assert method.max_in_flight == 1
+    assert list(response.errors) == [f"P{i}" for i in range(50)]
+
+    method = FakeMethod()
+    response = send_chunked(method, request, max_bytes=200, pipeline_depth=4)
+    assert 1 < method.max_in_flight <= 4
+    assert list(response.errors) == [f"P{i}" for i in range(50)]
+
+
+def test_unknown_request_type():
+    request = SherlockAnalysisService_pb2.RunAnalysisRequest(project="Test" * 100)
+    with pytest.raises(KeyError):
+        split_request(request, max_bytes=10)
@@ -0,0 +1,90 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from ansys.api.sherlock.v0 import SherlockProjectService_pb2
+import grpc
+import pytest
+
+from ansys.sherlock.core.utils.compression import (
+    CompressionInterceptor,
+    CompressionPolicy,
+    get_compression_policy,
+    measure_compression,
+)
+
+LIST_CCAS = "/SherlockProjectService/listCCAs"
+
+
+class _Details:
+    method = LIST_CCAS
+    timeout = None
+    metadata = None
+    credentials = None
+    wait_for_ready = None
+    compression = None
+
+
+def _list_ccas_request(count: int):
+    return SherlockProjectService_pb2.ListCCAsRequest(
+        project="Test", cca=[f"Main Board {i}" for i in range(count)]
+    )
+
+
+def test_only_large_requests_are_compressed():
+    interceptor = CompressionInterceptor(CompressionPolicy("deflate", threshold=1000))
+    sent = []
+
+    def continuation(details, request):
+        sent.append(details.compression)
+
+    interceptor.intercept_unary_unary(continuation, _Details(), _list_ccas_request(2))
+    interceptor.intercept_unary_stream(continuation, _Details(), _list_ccas_request(200))
+    assert sent == [None, grpc.Compression.Deflate]
+
+    assert get_compression_policy(None) is None
+    assert get_compression_policy("gzip").algorithm == "gzip"
+    with pytest.raises(ValueError):
+        CompressionPolicy("brotli")
+
+
+def test_measure_compression():
+    measurement = measure_compression(_list_ccas_request(1000))
+    assert measurement["bytes"] == _list_ccas_request(1000).ByteSize()
+    assert measurement["ratio"] < 0.25
+    assert measurement["seconds"] >= 0
+
+
+def test_compressed_requests_reach_the_server(fake_server, fake_sherlock):
+    sherlock = fake_sherlock(enable_metrics=True, compression=CompressionPolicy(threshold=1000))
+    received = []
+    fake_server.set_response(
+        LIST_CCAS[1:], lambda request: received.append(len(request.cca)) or None
+    )
+    sherlock.project.list_ccas("Test", [f"Main Board {i}" for i in range(500)])
+    sherlock.project.list_ccas("Test", ["Main Board"])
+    assert received == [500, 1]
+    stats = sherlock.metrics().snapshot()["rpc"][LIST_CCAS]
+    assert stats["calls"] == 2
+    assert stats["compressed_requests"] == 1
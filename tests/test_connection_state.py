@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import time
+
+import grpc
+
+from ansys.sherlock.core.common import Common
+from ansys.sherlock.core.utils.connection_state import (
+    ConnectionStateTracker,
+    get_connection_state_tracker,
+)
+from ansys.sherlock.core.utils.version_check import SKIP_VERSION_CHECK
+
+
+class FakeChannel:
+    """Channel that only records its connectivity subscriber."""
+
+    def __init__(self):
+        self.callback = None
+
+    def subscribe(self, callback, try_to_connect=False):
+        self.callback = callback
+
+
+def test_all():
+    test_probe_skipped_when_ready()
+    test_probe_when_state_unknown_or_failing()
+    test_probe_when_state_stale()
+    test_shutdown_channel()
+    test_tracker_shared_per_channel()
+    test_grpc_stub_uses_tracker()
+
+
+def test_probe_skipped_when_ready():
+    channel = FakeChannel()
+    tracker = ConnectionStateTracker(channel, ttl=60)
+    channel.callback(grpc.ChannelConnectivity.READY)
+
+    probes = []
+    assert tracker.is_connection_up(lambda: probes.append(1) or True)
+    assert tracker.is_connection_up(lambda: probes.append(1) or True)
+    assert len(probes) == 0
+    assert tracker.stats() == {"probes_performed": 0, "probes_skipped": 2, "probes_failed": 0}
+
+
+def test_probe_when_state_unknown_or_failing():
+    channel = FakeChannel()
+    tracker = ConnectionStateTracker(channel, ttl=60)
+
+    assert not tracker.is_connection_up(lambda: False)
+    channel.callback(grpc.ChannelConnectivity.TRANSIENT_FAILURE)
+    assert tracker.is_connection_up(lambda: True)
+    assert tracker.state == grpc.ChannelConnectivity.READY
+
+    # A successful probe is trusted until the TTL expires
+    assert tracker.is_connection_up(lambda: False)
+    assert tracker.stats() == {"probes_performed": 2, "probes_skipped": 1, "probes_failed": 1}
+
+
+def test_probe_when_state_stale():
+    channel = FakeChannel()
+    tracker = ConnectionStateTracker(channel, ttl=0)
+    channel.callback(grpc.ChannelConnectivity.READY)
+
+    assert not tracker.is_connection_up(lambda: False)
+    assert tracker.probes_performed == 1
+    assert tracker.probes_skipped == 0
+
+
+def test_shutdown_channel():
+    channel = FakeChannel()
+    tracker = ConnectionStateTracker(channel, ttl=60)
+    channel.callback(grpc.ChannelConnectivity.SHUTDOWN)
+
+    assert not tracker.is_connection_up(lambda: True)
+    assert tracker.probes_skipped == 1
+
+    tracker.invalidate()
+    assert tracker.state is None
+    assert tracker.is_connection_up(lambda: True)
+
+
+def test_tracker_shared_per_channel():
+    channel = FakeChannel()
+    tracker = get_connection_state_tracker(channel)
+    assert get_connection_state_tracker(channel) is tracker
+    assert get_connection_state_tracker(FakeChannel()) is not tracker
+
+    get_connection_state_tracker(channel, ttl=5)
+    assert tracker.ttl == 5
+
+
+def test_grpc_stub_uses_tracker():
+    channel = grpc.insecure_channel("127.0.0.1:9090")
+    common = Common(channel, SKIP_VERSION_CHECK)
+    tracker = get_connection_state_tracker(channel)
+    assert common.connection_state is tracker
+
+    # Wait for the initial connectivity callback, then force a known healthy state,
+    # which must skip the health-check RPC
+    deadline = time.monotonic() + 5
+    while tracker.state is None and time.monotonic() < deadline:
+        time.sleep(0.01)
+    tracker._on_state_change(grpc.ChannelConnectivity.READY)
+    skipped = tracker.probes_skipped
+    assert common._is_connection_up()
+    assert tracker.probes_skipped == skipped + 1
+
+
+if __name__ == "__main__":
+    test_all()
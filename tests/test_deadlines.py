@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import time
+
+from ansys.api.sherlock.v0 import SherlockPartsService_pb2
+import pytest
+
+from ansys.sherlock.core.errors import SherlockDeadlineExceededError
+from ansys.sherlock.core.types.parts_types import GetPartsListPropertiesRequest
+from ansys.sherlock.core.utils.deadlines import DeadlinePolicy, remaining_time
+
+INFO = "SherlockCommonService/getSherlockInfo"
+
+
+def test_policy_resolves_default_overrides_and_long_running_methods():
+    policy = DeadlinePolicy(
+        default=5, per_method={"SherlockPartsService/*": 20, "SherlockPartsService/get*": None}
+    )
+    assert policy.timeout_for("/SherlockCommonService/check") == 5
+    assert policy.timeout_for("/SherlockAnalysisService/runAnalysis") is None
+    assert policy.timeout_for("/SherlockProjectService/importODBArchive") is None
+    assert policy.timeout_for("/SherlockPartsService/updatePartsList") == 20
+    assert policy.timeout_for("/SherlockPartsService/getPartsListProperties") is None
+
+    policy.set_method_deadline("SherlockAnalysisService/runAnalysis", 3600)
+    policy.default = 1
+    assert policy.timeout_for("/SherlockAnalysisService/runAnalysis") == 3600
+    assert policy.timeout_for("/SherlockCommonService/check") == 1
+
+
+def test_session_default_deadline(fake_server, fake_sherlock):
+    sherlock = fake_sherlock(default_deadline=0.1)
+    fake_server.set_latency(INFO, 0.5)
+    with pytest.raises(SherlockDeadlineExceededError) as excinfo:
+        sherlock.common.get_sherlock_info()
+    assert excinfo.value.method == INFO
+    assert excinfo.value.timeout == 0.1
+    assert 0.1 <= excinfo.value.elapsed < 0.5
+    assert INFO in str(excinfo.value)
+
+    sherlock.deadlines.set_method_deadline(INFO, None)
+    assert sherlock.common.get_sherlock_info().releaseVersion == "2027 R1"
+
+
+def test_calls_in_a_block_share_the_remaining_budget(fake_server, fake_sherlock):
+    sherlock = fake_sherlock()
+    fake_server.set_latency(INFO, 0.15)
+    with sherlock.deadline(0.25):
+        sherlock.common.get_sherlock_info()
+        assert remaining_time() < 0.1
+        with sherlock.deadline(10):
+            assert remaining_time() < 0.1
+            with pytest.raises(SherlockDeadlineExceededError) as excinfo:
+                sherlock.common.get_sherlock_info()
+    assert excinfo.value.timeout == 0.25
+    assert excinfo.value.elapsed >= 0.25
+    assert remaining_time() is None
+
+    with sherlock.deadline(0.01):
+        time.sleep(0.02)
+        count = fake_server.call_count(INFO)
+        with pytest.raises(SherlockDeadlineExceededError):
+            sherlock.common.get_sherlock_info()
+        assert fake_server.call_count(INFO) == count
+
+
+def test_deadline_covers_streaming_rpcs(fake_server, fake_sherlock):
+    sherlock = fake_sherlock()
+
+    def slow_stream(request, context):
+        for _ in range(10):
+            time.sleep(0.05)
+            yield SherlockPartsService_pb2.GetPartsListPropertiesResponse()
+
+    fake_server.set_handler("SherlockPartsService/getPartsListProperties", slow_stream)
+    request = GetPartsListPropertiesRequest(project="Test", cca_name="Card")
+    with sherlock.deadline(0.2):
+        with pytest.raises(SherlockDeadlineExceededError) as excinfo:
+            list(sherlock.parts.iter_parts_list_properties(request))
+    assert excinfo.value.method == "SherlockPartsService/getPartsListProperties"
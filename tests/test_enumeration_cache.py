@@ -0,0 +1,161 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+from unittest.mock import patch
+
+import grpc
+
+from ansys.sherlock.core.stackup import Stackup
+from ansys.sherlock.core.utils.enumeration_cache import (
+    ENUMERATION_CACHE,
+    ENUMERATIONS,
+    EnumerationCache,
+)
+
+FETCH = "ansys.sherlock.core.utils.enumeration_cache._fetch"
+
+
+def fake_fetch(enumeration, channel):
+    return [enumeration.method, "value"]
+
+
+def test_shared_by_server_address_and_version():
+    cache = EnumerationCache()
+    channel1 = grpc.insecure_channel("127.0.0.1:9090")
+    channel2 = grpc.insecure_channel("127.0.0.1:9090")
+    cache.register_channel(channel1, "127.0.0.1:9090")
+    cache.register_channel(channel2, "127.0.0.1:9090")
+
+    with patch(FETCH, side_effect=fake_fetch) as mock_fetch:
+        assert cache.get("cycle_types", channel1, 252) == ["listLifeCycleTypes", "value"]
+        assert cache.get("cycle_types", channel2, 252) == ["listLifeCycleTypes", "value"]
+        assert mock_fetch.call_count == 1
+
+        # A different server version has its own lists
+        cache.get("cycle_types", channel2, 261)
+        assert mock_fetch.call_count == 2
+
+    assert cache.hits == 1
+    assert cache.misses == 2
+
+
+def test_unregistered_channels_not_shared():
+    cache = EnumerationCache()
+    channel1 = grpc.insecure_channel("127.0.0.1:9090")
+    channel2 = grpc.insecure_channel("127.0.0.1:9090")
+
+    with patch(FETCH, side_effect=fake_fetch) as mock_fetch:
+        cache.get("board_sides", channel1, 252)
+        cache.get("board_sides", channel1, 252)
+        cache.get("board_sides", channel2, 252)
+        assert mock_fetch.call_count == 2
+
+
+def test_failures_not_cached():
+    cache = EnumerationCache()
+    channel = grpc.insecure_channel("127.0.0.1:9090")
+
+    with patch(FETCH, return_value=None) as mock_fetch:
+        assert cache.get("fiber_materials", channel, 252) is None
+        assert cache.get("fiber_materials", channel, 252) is None
+        assert mock_fetch.call_count == 2
+
+
+def test_persisted_layer(tmp_path):
+    persist_dir = str(tmp_path)
+    channel = grpc.insecure_channel("127.0.0.1:9090")
+    cache = EnumerationCache(persist_dir=persist_dir)
+    cache.register_channel(channel, "127.0.0.1:9090")
+
+    with patch(FETCH, side_effect=fake_fetch):
+        cache.get("conductor_materials", channel, 252)
+    assert len(os.listdir(persist_dir)) == 1
+
+    # A new cache, as in a new process, loads the persisted lists
+    other_cache = EnumerationCache(persist_dir=persist_dir)
+    other_cache.register_channel(channel, "127.0.0.1:9090")
+    with patch(FETCH, side_effect=fake_fetch) as mock_fetch:
+        assert other_cache.get("conductor_materials", channel, 252) == [
+            "listConductorMaterials",
+            "value",
+        ]
+        assert mock_fetch.call_count == 0
+
+    other_cache.invalidate(address="127.0.0.1:9091")
+    assert len(os.listdir(persist_dir)) == 1
+    other_cache.invalidate(address="127.0.0.1:9090", server_version=252)
+    assert len(os.listdir(persist_dir)) == 0
+    with patch(FETCH, side_effect=fake_fetch) as mock_fetch:
+        other_cache.get("conductor_materials", channel, 252)
+        assert mock_fetch.call_count == 1
+
+
+def test_prefetch_all():
+    cache = EnumerationCache()
+    channel = grpc.insecure_channel("127.0.0.1:9090")
+
+    with patch(FETCH, side_effect=fake_fetch) as mock_fetch:
+        enumerations = cache.prefetch_all(channel, 252)
+        assert sorted(enumerations) == sorted(ENUMERATIONS)
+        assert mock_fetch.call_count == len(ENUMERATIONS)
+
+        cache.prefetch_all(channel, 252)
+        assert mock_fetch.call_count == len(ENUMERATIONS)
+
+
+def test_prefetch_all_persists_once(tmp_path):
+    cache = EnumerationCache()
+    channel = grpc.insecure_channel("127.0.0.1:9090")
+    cache.register_channel(channel, "127.0.0.1:9090", persist_dir=str(tmp_path))
+
+    with (
+        patch(FETCH, side_effect=fake_fetch),
+        patch.object(cache, "_save", wraps=cache._save) as save,
+    ):
+        cache.prefetch_all(channel, 252)
+        assert save.call_count == 1
+        cache.prefetch_all(channel, 252)
+        assert save.call_count == 1
+    assert os.listdir(tmp_path) == ["enumerations_127.0.0.1_9090_252.json"]
+
+
+def test_connect_persists_to_the_given_directory(fake_sherlock, tmp_path):
+    ENUMERATION_CACHE.invalidate()
+    fake_sherlock(prefetch_enumerations=True, enumeration_cache_dir=str(tmp_path))
+    assert len(os.listdir(tmp_path)) == 1
+
+
+def test_facades_use_cache():
+    channel = grpc.insecure_channel("127.0.0.1:9090")
+    stackup = Stackup(channel, 252)
+
+    with patch(FETCH, side_effect=fake_fetch):
+        stackup._init_fiber_materials()
+    assert stackup.FIBER_MATERIAL_LIST == ["listFiberMaterials", "value"]
+
+    # Without a server, the list stays unset
+    stackup = Stackup(channel, 261)
+    stackup._init_fiber_materials()
+    assert stackup.FIBER_MATERIAL_LIST is None
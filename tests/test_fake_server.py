@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from concurrent.futures import ThreadPoolExecutor
+
+from ansys.api.sherlock.v0 import SherlockPartsService_pb2, SherlockProjectService_pb2
+import grpc
+import pytest
+
+from ansys.sherlock.core import launcher
+from ansys.sherlock.core.errors import SherlockListCCAsError
+from ansys.sherlock.core.fake_server import FakeSherlockProcess, FakeSherlockServer
+from ansys.sherlock.core.types.parts_types import GetPartsListPropertiesRequest
+
+LIST_CCAS = "SherlockProjectService/listCCAs"
+
+
+@pytest.fixture
+def server():
+    with FakeSherlockServer(seed=0) as server:
+        yield server
+
+
+@pytest.fixture
+def sherlock(server):
+    return launcher.connect(port=server.port, timeout=10, transport_mode="insecure")
+
+
+def test_fake_server_connect(server, sherlock):
+    assert sherlock.common.check()
+    assert sherlock.project.list_ccas("Test") == []
+    assert server.call_count(LIST_CCAS) == 1
+    assert server.call_count("SherlockCommonService/getSherlockInfo") == 1
+
+    server.set_response(
+        LIST_CCAS,
+        lambda request: SherlockProjectService_pb2.ListCCAsResponse(
+            ccas=[{"ccaName": request.project}]
+        ),
+    )
+    assert [cca.ccaName for cca in sherlock.project.list_ccas("Test")] == ["Test"]
+
+
+def test_fake_server_streaming(server, sherlock):
+    server.set_stream_size("SherlockPartsService/getPartsListProperties", 5)
+    server.set_response(
+        "SherlockPartsService/getPartsListProperties",
+        SherlockPartsService_pb2.GetPartsListPropertiesResponse(refDes="C1"),
+    )
+    responses = sherlock.parts.get_parts_list_properties(
+        GetPartsListPropertiesRequest(project="Test", cca_name="Card")
+    )
+    assert [response.refDes for response in responses] == ["C1"] * 5
+
+    server.set_handler(
+        "SherlockPartsService/getPartsListProperties",
+        lambda request, context: (
+            SherlockPartsService_pb2.GetPartsListPropertiesResponse(refDes=ref_des)
+            for ref_des in request.refDes
+        ),
+    )
+    responses = sherlock.parts.get_parts_list_properties(
+        GetPartsListPropertiesRequest(
+            project="Test", cca_name="Card", reference_designators=["R1", "R2"]
+        )
+    )
+    assert [response.refDes for response in responses] == ["R1", "R2"]
+
+
+def test_fake_server_failures(server, sherlock):
+    server.inject_failure(LIST_CCAS, code=None, message="No project", times=1)
+    with pytest.raises(SherlockListCCAsError) as exc_info:
+        sherlock.project.list_ccas("Test")
+    assert exc_info.value.str_itr() == ["List CCAs error: No project"]
+    assert sherlock.project.list_ccas("Test") == []
+
+    server.inject_failure(LIST_CCAS, code=grpc.StatusCode.INTERNAL, times=2)
+    for _ in range(2):
+        with pytest.raises(grpc.RpcError) as exc_info:
+            sherlock.project.list_ccas("Test")
+        assert exc_info.value.code() == grpc.StatusCode.INTERNAL
+    assert sherlock.project.list_ccas("Test") == []
+
+    server.inject_failure(LIST_CCAS, probability=0.5)
+    failures = 0
+    for _ in range(40):
+        try:
+            sherlock.project.list_ccas("Test")
+        except grpc.RpcError:
+            failures += 1
+    assert 0 < failures < 40
+
+    server.clear_failures()
+    assert sherlock.project.list_ccas("Test") == []
+
+
+def test_fake_server_latency_and_concurrency(server, sherlock):
+    server.set_latency(LIST_CCAS, 0.2)
+    server.reset_counts()
+    with ThreadPoolExecutor(4) as executor:
+        results = list(executor.map(sherlock.project.list_ccas, ["Test"] * 4))
+    assert results == [[]] * 4
+    assert server.max_in_flight == 4
+    assert server.call_count(LIST_CCAS) == 4
+
+
+def test_fake_server_process():
+    with FakeSherlockProcess(release_version="2026 R1") as process:
+        sherlock = launcher.connect(port=process.port, timeout=10, transport_mode="insecure")
+        assert sherlock.common.get_sherlock_info().releaseVersion == "2026 R1"
+        assert sherlock.project.list_ccas("Test") == []
+    assert process.process.returncode == 0
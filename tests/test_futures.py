@@ -0,0 +1,69 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from concurrent.futures import wait
+
+import pytest
+
+from ansys.sherlock.core.errors import SherlockDeadlineExceededError, SherlockListCCAsError
+
+LIST_CCAS = "SherlockProjectService/listCCAs"
+
+
+@pytest.fixture
+def sherlock(fake_sherlock):
+    return fake_sherlock()
+
+
+def test_submitted_calls_run_concurrently(sherlock, fake_server):
+    fake_server.set_latency("SherlockProjectService/*", 0.1)
+    futures = [
+        sherlock.submit(sherlock.project.list_ccas, "Test"),
+        sherlock.submit(sherlock.project.list_thermal_maps, "Test"),
+        sherlock.submit(sherlock.project.list_strain_maps, "Test"),
+        sherlock.submit(sherlock.project.list_ccas, project="Test"),
+    ]
+    wait(futures, timeout=5)
+    assert fake_server.max_in_flight == 4
+    assert futures[0].result() == sherlock.project.list_ccas("Test")
+    assert futures[3].result() == futures[0].result()
+
+
+def test_submitted_calls_raise_the_errors_of_blocking_calls(sherlock, fake_server):
+    fake_server.inject_failure(LIST_CCAS, code=None, message="Project not found", times=2)
+    with pytest.raises(SherlockListCCAsError) as blocking:
+        sherlock.project.list_ccas("Test")
+    future = sherlock.submit(sherlock.project.list_ccas, "Test")
+    assert isinstance(future.exception(), SherlockListCCAsError)
+    assert str(future.exception()) == str(blocking.value)
+
+    fake_server.set_latency(LIST_CCAS, 0.5)
+    with sherlock.deadline(0.05):
+        future = sherlock.submit(sherlock.project.list_ccas, "Test")
+    assert isinstance(future.exception(timeout=5), SherlockDeadlineExceededError)
+
+
+def test_facades_have_no_submit_companions(sherlock):
+    with pytest.raises(AttributeError):
+        sherlock.project.submit_list_ccas
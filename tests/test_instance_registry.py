@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+import os
+import subprocess
+import sys
+from unittest.mock import Mock, patch
+
+import pytest
+
+from ansys.sherlock.core import launcher
+from ansys.sherlock.core.errors import SherlockConnectionError
+from ansys.sherlock.core.fake_server import FakeSherlockServer
+from ansys.sherlock.core.utils.instance_registry import InstanceRecord, InstanceRegistry
+
+
+def _exited_pid() -> int:
+    process = subprocess.Popen([sys.executable, "-c", "pass"])
+    process.wait()
+    return process.pid
+
+
+def test_records_removes_exited_processes(instance_registry_dir):
+    registry = InstanceRegistry()
+    running = InstanceRecord(pid=os.getpid(), transport_mode="insecure", port=9090)
+    exited = InstanceRecord(pid=_exited_pid(), transport_mode="insecure", port=9091)
+    registry.register(running)
+    registry.register(exited)
+    assert len(os.listdir(instance_registry_dir)) == 2
+
+    assert registry.records() == [running]
+    assert os.listdir(instance_registry_dir) == [f"instance_{running.key}.json"]
+
+    registry.unregister(running)
+    assert registry.records() == []
+
+
+def test_find_matches_version_transport_and_project(tmp_path):
+    registry = InstanceRegistry(str(tmp_path))
+    pid = os.getpid()
+    records = [
+        InstanceRecord(pid=pid, transport_mode="insecure", port=1, server_version=251),
+        InstanceRecord(pid=pid, transport_mode="insecure", port=2, server_version=261),
+        InstanceRecord(pid=pid, transport_mode="uds", uds_id="a", server_version=262),
+        InstanceRecord(
+            pid=pid,
+            transport_mode="insecure",
+            port=3,
+            server_version=262,
+            single_project_path=str(tmp_path / "Project"),
+        ),
+    ]
+    for record in records:
+        registry.register(record)
+
+    assert [r.port for r in registry.find("insecure")] == [2, 1]
+    assert [r.port for r in registry.find("insecure", 25)] == [1]
+    assert [r.uds_id for r in registry.find("uds", 262)] == ["a"]
+    assert registry.find("insecure", 262) == []
+    project = os.path.join(str(tmp_path), ".", "Project")
+    assert [r.port for r in registry.find("insecure", 26, project)] == [3]
+
+
+def test_acquire_attaches_to_running_instance():
+    with FakeSherlockServer(release_version="2026 R1") as server:
+        InstanceRegistry().register(
+            InstanceRecord(
+                pid=os.getpid(), transport_mode="insecure", port=server.port, server_version=261
+            )
+        )
+        with patch("ansys.sherlock.core.launcher.launch") as mock_launch:
+            sherlock = launcher.acquire(year=2026, transport_mode="insecure")
+        mock_launch.assert_not_called()
+        assert sherlock.common.check()
+        sherlock.common.channel.close()
+
+        with pytest.raises(SherlockConnectionError):
+            launcher.acquire(year=2025, transport_mode="insecure", launch_if_missing=False)
+
+
+@patch("ansys.sherlock.core.launcher.connect")
+@patch("ansys.sherlock.core.launcher.launch")
+def test_acquire_launches_when_no_instance_is_healthy(mock_launch, mock_connect):
+    InstanceRegistry().register(
+        InstanceRecord(pid=_exited_pid(), transport_mode="insecure", port=9090, server_version=261)
+    )
+    sherlock = launcher.acquire(year=2026, release_number=1, transport_mode="insecure")
+    assert sherlock is mock_connect.return_value
+    assert mock_launch.call_count == 1
+    port = mock_launch.call_args.kwargs["port"]
+    assert mock_launch.call_args.kwargs["year"] == 2026
+    mock_connect.assert_called_once_with(
+        port=port,
+        timeout=launcher.DEFAULT_CONNECT_TIMEOUT,
+        transport_mode="insecure",
+        certs_dir=None,
+        uds_dir=None,
+        uds_id=None,
+    )
+
+
+@patch("ansys.sherlock.core.launcher._is_port_available")
+@patch("ansys.sherlock.core.launcher._get_sherlock_exe_path")
+@patch("subprocess.Popen")
+def test_launch_registers_instance(
+    mock_popen, mock_exe_path, mock_port_available, instance_registry_dir
+):
+    mock_popen.return_value = Mock(pid=os.getpid())
+    mock_exe_path.return_value = ("runSherlock", 261, "/ansys_inc/v261")
+    launcher.launch(port=9095, transport_mode="insecure", single_project_path="Project")
+
+    (file_name,) = os.listdir(instance_registry_dir)
+    with open(instance_registry_dir / file_name) as file:
+        record = json.load(file)
+    assert record["pid"] == os.getpid()
+    assert record["port"] == 9095
+    assert record["server_version"] == 261
+    assert record["single_project_path"] == "Project"
+
+    launcher.launch(port=9096, transport_mode="insecure", register=False)
+    assert len(os.listdir(instance_registry_dir)) == 1
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+import subprocess
+import sys
+
+import grpc
+import pytest
+
+import ansys.sherlock.core
+from ansys.sherlock.core.parts import Parts
+from ansys.sherlock.core.sherlock import Sherlock
+from ansys.sherlock.core.utils.metrics import MetricsRegistry
+from ansys.sherlock.core.utils.version_check import SKIP_VERSION_CHECK
+
+IMPORT_TIME_RATIO = 2.0
+"""Times the duration of importing grpc allowed for importing the connection object.
+
+The connection object needs grpc, so the budget is relative to importing grpc alone in a
+new interpreter, which scales with the speed of the machine running the tests.
+"""
+
+FACADE_MODULES = [
+    f"ansys.sherlock.core.{name}"
+    for name in ("analysis", "layer", "lifecycle", "model", "parts", "project", "stackup")
+]
+
+IMPORT_SCRIPT = """
+import json, sys, time
+start = time.perf_counter()
+import {module}
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds, "modules": sorted(sys.modules)}}))
+"""
+
+
+def _import_in_new_interpreter(module: str) -> dict:
+    output = subprocess.check_output(
+        [sys.executable, "-c", IMPORT_SCRIPT.format(module=module)], text=True
+    )
+    return json.loads(output.splitlines()[-1])
+
+
+def test_import_sherlock_within_budget():
+    """Test that importing the connection object imports no service and meets the budget."""
+    imports, baselines = [], []
+    for _ in range(3):
+        imports.append(_import_in_new_interpreter("ansys.sherlock.core.sherlock"))
+        baselines.append(_import_in_new_interpreter("grpc"))
+    modules = imports[0]["modules"]
+    assert [m for m in modules if m.startswith("ansys.api.sherlock")] == []
+    assert [m for m in modules if m in FACADE_MODULES] == []
+    assert "ansys.sherlock.core.errors" not in modules
+    assert "ansys.sherlock.core.pysherlock_logging" not in modules
+    baseline = min(b["seconds"] for b in baselines)
+    assert min(i["seconds"] for i in imports) < IMPORT_TIME_RATIO * baseline
+
+
+def test_import_launcher_only_imports_common_service():
+    """Test that importing the launcher only imports the modules of the common service."""
+    modules = _import_in_new_interpreter("ansys.sherlock.core.launcher")["modules"]
+    assert [m for m in modules if m.startswith("ansys.api.sherlock.v0.")] == [
+        "ansys.api.sherlock.v0.SherlockCommonService_pb2",
+        "ansys.api.sherlock.v0.SherlockCommonService_pb2_grpc",
+    ]
+    assert [m for m in modules if m in FACADE_MODULES] == []
+
+
+def test_facades_constructed_on_first_access():
+    """Test that the facades are constructed once, on first access."""
+    metrics = MetricsRegistry()
+    channel = grpc.insecure_channel("127.0.0.1:1")
+    try:
+        sherlock = Sherlock(channel, SKIP_VERSION_CHECK, metrics=metrics)
+        assert "parts" not in vars(sherlock)
+        parts = sherlock.parts
+        assert isinstance(parts, Parts)
+        assert sherlock.parts is parts
+        assert parts.channel is channel
+        assert parts._metrics is metrics
+        assert "project" not in vars(sherlock)
+    finally:
+        channel.close()
+
+
+def test_lazy_submodules():
+    """Test that the submodules of the package and of the types are imported on access."""
+    assert ansys.sherlock.core.types.stackup_types.StackupProperties is not None
+    assert ansys.sherlock.core.errors.SherlockConnectionError is not None
+    assert isinstance(ansys.sherlock.core.__version__, str)
+    assert ansys.sherlock.core.LOG is ansys.sherlock.core.LOG
+    with pytest.raises(AttributeError):
+        ansys.sherlock.core.not_a_module
+    with pytest.raises(AttributeError):
+        ansys.sherlock.core.types.not_a_module
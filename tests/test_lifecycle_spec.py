@@ -0,0 +1,186 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from ansys.api.sherlock.v0 import SherlockLifeCycleService_pb2
+import pytest
+
+from ansys.sherlock.core.lifecycle_spec import LifecycleSpec
+
+SPEC = """
+project: Test
+phases:
+  - name: Keep
+    description: New description
+    events:
+      - name: Unchanged
+        type: thermal
+      - name: Changed
+        type: thermal
+        description: New description
+        properties: {num_of_cycles: 4.0, cycle_type: PER YEAR, cycle_state: STORAGE}
+  - name: New
+    duration: 1.5
+    duration_units: year
+    num_of_cycles: 4.0
+    cycle_type: COUNT
+    events:
+      - name: Cycling
+        type: thermal
+        properties: {num_of_cycles: 4.0, cycle_type: PER YEAR, cycle_state: OPERATING}
+        profiles:
+          - [Profile, sec, F, [[Step 1, HOLD, 40, 40], [Step 2, RAMP, 20, 20]]]
+"""
+
+
+@pytest.fixture
+def server(fake_server):
+    fake_server.set_response(
+        "SherlockLifeCycleService/listLifeCycleTypes", {"types": ["COUNT", "PER YEAR"]}
+    )
+    fake_server.set_response(
+        "SherlockLifeCycleService/listLifeCycleStates", {"states": ["OPERATING", "STORAGE"]}
+    )
+    response = SherlockLifeCycleService_pb2.ListLCEventsResponse()
+    keep = response.lcPhases.add(name="Keep", description="Old description")
+    keep.lcEvents.add(name="Unchanged", type="Thermal")
+    keep.lcEvents.add(name="Changed", type="Thermal", description="Old description")
+    keep.lcEvents.add(name="Removed", type="Mechanical Shock")
+    response.lcPhases.add(name="Removed")
+    fake_server.set_response("SherlockLifeCycleService/listLifeCycleEvents", response)
+    return fake_server
+
+
+@pytest.fixture
+def sherlock(server, fake_sherlock):
+    return fake_sherlock()
+
+
+@pytest.fixture
+def spec(tmp_path):
+    pytest.importorskip("yaml")
+    path = tmp_path / "life_cycle.yaml"
+    path.write_text(SPEC)
+    return LifecycleSpec.from_yaml(str(path))
+
+
+def test_read_back_from_server(sherlock):
+    current = LifecycleSpec.read(sherlock, "Test")
+    assert [phase.name for phase in current.phases] == ["Keep", "Removed"]
+    assert [(event.name, event.type) for event in current.phases[0].events] == [
+        ("Unchanged", "thermal"),
+        ("Changed", "thermal"),
+        ("Removed", "shock"),
+    ]
+
+
+def test_diff_only_plans_the_changes(sherlock, spec):
+    plan = spec.diff(LifecycleSpec.read(sherlock, "Test"))
+    assert [step.method for step in plan.steps] == [
+        "delete_phase",
+        "update_life_phase",
+        "delete_event",
+        "delete_event",
+        "add_thermal_event",
+        "create_life_phase",
+        "add_thermal_event",
+        "add_thermal_profiles",
+    ]
+    assert plan.steps[1].args[0].new_description == "New description"
+    assert [step.args[0].event_name for step in plan.steps[2:4]] == ["Changed", "Removed"]
+    assert spec.diff(spec).steps == []
+
+
+def test_dry_run_prints_the_plan(server, sherlock, spec, capsys):
+    plan = spec.apply(sherlock, dry_run=True)
+    output = capsys.readouterr().out
+    assert output.startswith("Life cycle of Test: 8 changes.")
+    assert "Delete phase Removed (delete_phase)" in output
+    assert plan.results == []
+    assert server.call_count("SherlockLifeCycleService/createLifePhase") == 0
+
+
+def test_apply_sends_the_plan(server, sherlock, spec):
+    plan = spec.apply(sherlock)
+    assert [result.succeeded for result in plan.results] == [True] * 8
+    for method, count in (
+        ("deletePhase", 1),
+        ("updateLifePhase", 1),
+        ("deleteEvent", 2),
+        ("createLifePhase", 1),
+        ("addThermalEvent", 2),
+        ("addThermalProfiles", 1),
+    ):
+        assert server.call_count(f"SherlockLifeCycleService/{method}") == count
+
+
+def test_diff_updates_the_duration_of_existing_phases(sherlock, spec):
+    spec.phases[0].duration = 2.0
+    spec.phases[0].duration_units = "year"
+    plan = spec.diff(LifecycleSpec.read(sherlock, "Test"))
+    request = plan.steps[1].args[0]
+    assert plan.steps[1].method == "update_life_phase"
+    assert (request.new_duration, request.new_duration_units) == (2.0, "year")
+    assert request.new_num_of_cycles is None
+    assert request.new_description == "New description"
+
+
+def test_diff_warns_about_properties_of_existing_events(sherlock, spec):
+    spec.phases[0].events[0].properties = {"num_of_cycles": 8.0}
+    with pytest.warns(UserWarning, match="Keep/Unchanged"):
+        plan = spec.diff(LifecycleSpec.read(sherlock, "Test"))
+    assert len(plan.steps) == 8
+
+
+def test_applying_the_same_spec_twice_sends_nothing(server, sherlock, spec, tmp_path, recwarn):
+    state_path = str(tmp_path / "life_cycle.state.json")
+    assert len(spec.apply(sherlock, state_path=state_path).steps) == 8
+
+    # The project now holds what the specification describes, as far as Sherlock reports.
+    response = SherlockLifeCycleService_pb2.ListLCEventsResponse()
+    for phase in spec.phases:
+        added = response.lcPhases.add(name=phase.name, description=phase.description)
+        for event in phase.events:
+            added.lcEvents.add(name=event.name, type="Thermal", description=event.description)
+    server.set_response("SherlockLifeCycleService/listLifeCycleEvents", response)
+
+    plan = spec.apply(sherlock, dry_run=True, state_path=state_path)
+    assert plan.steps == []
+    assert not recwarn.list
+
+    # Without the state, the durations are sent again and the properties are ignored.
+    with pytest.warns(UserWarning, match="New/Cycling"):
+        plan = spec.apply(sherlock, dry_run=True)
+    assert [step.method for step in plan.steps] == ["update_life_phase"]
+
+    spec.phases[1].duration = 2.0
+    plan = spec.apply(sherlock, dry_run=True, state_path=state_path)
+    assert [step.method for step in plan.steps] == ["update_life_phase"]
+    assert plan.steps[0].args[0].new_duration == 2.0
+    assert plan.steps[0].args[0].new_num_of_cycles is None
+
+
+def test_phase_without_creation_properties_is_rejected(spec):
+    spec.phases[1].duration = None
+    with pytest.raises(ValueError, match="duration"):
+        spec.diff(LifecycleSpec(project="Test"))
@@ -0,0 +1,145 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+from concurrent import futures
+import json
+
+from ansys.api.sherlock.v0 import SherlockCommonService_pb2, SherlockCommonService_pb2_grpc
+import grpc
+import pytest
+
+from ansys.sherlock.core.errors import SherlockCommonServiceError
+from ansys.sherlock.core.sherlock import Sherlock
+from ansys.sherlock.core.types.common_types import ListUnitsRequestUnitType
+from ansys.sherlock.core.utils.connection_state import get_connection_state_tracker
+from ansys.sherlock.core.utils.metrics import (
+    HEALTH_CHECK_METHOD,
+    MetricsInterceptor,
+    MetricsRegistry,
+    _MeteredResponseStream,
+)
+from ansys.sherlock.core.utils.version_check import SKIP_VERSION_CHECK
+
+LIST_UNITS_METHOD = "/SherlockCommonService/listUnits"
+
+
+class CommonServicer(SherlockCommonService_pb2_grpc.SherlockCommonServiceServicer):
+    def check(self, request, context):
+        return SherlockCommonService_pb2.HealthCheckResponse()
+
+    def listUnits(self, request, context):
+        return SherlockCommonService_pb2.ListUnitsResponse(units=["mm", "in"])
+
+
+@pytest.fixture
+def metered_sherlock():
+    server = grpc.server(futures.ThreadPoolExecutor(max_workers=2))
+    SherlockCommonService_pb2_grpc.add_SherlockCommonServiceServicer_to_server(
+        CommonServicer(), server
+    )
+    port = server.add_insecure_port("127.0.0.1:0")
+    server.start()
+    registry = MetricsRegistry()
+    channel = grpc.intercept_channel(
+        grpc.insecure_channel(f"127.0.0.1:{port}"), MetricsInterceptor(registry)
+    )
+    # Send a health-check request before every call
+    get_connection_state_tracker(channel, ttl=0)
+    yield Sherlock(channel, SKIP_VERSION_CHECK, metrics=registry)
+    channel.close()
+    server.stop(None)
+
+
+def test_metrics_record_rpc_and_api_calls(metered_sherlock):
+    sherlock = metered_sherlock
+    for _ in range(3):
+        assert sherlock.common.list_units(ListUnitsRequestUnitType.LENGTH) == ["mm", "in"]
+    with pytest.raises(SherlockCommonServiceError):
+        sherlock.common.list_units("")
+
+    snapshot = sherlock.metrics().snapshot()
+    rpc = snapshot["rpc"][LIST_UNITS_METHOD]
+    assert rpc["calls"] == 3
+    assert rpc["errors"] == 0
+    assert rpc["responses"] == 3
+    assert rpc["request_bytes"] > 0
+    assert (
+        rpc["response_bytes"]
+        == 3 * SherlockCommonService_pb2.ListUnitsResponse(units=["mm", "in"]).ByteSize()
+    )
+    assert rpc["latency"]["count"] == 3
+    assert sum(rpc["latency"]["counts"]) == 3
+
+    api = snapshot["api"]["Common.list_units"]
+    assert api["calls"] == 4
+    assert api["errors"] == 1
+
+    health_check = snapshot["health_check"]
+    assert health_check["calls"] == snapshot["rpc"][HEALTH_CHECK_METHOD]["calls"] == 3
+    assert 0 < health_check["share"] < 1
+
+    assert json.loads(sherlock.metrics().to_json()) == json.loads(json.dumps(snapshot))
+
+
+def test_metrics_prometheus_export(metered_sherlock):
+    sherlock = metered_sherlock
+    sherlock.common.list_units(ListUnitsRequestUnitType.LENGTH)
+
+    text = sherlock.metrics().to_prometheus()
+    label = f'method="{LIST_UNITS_METHOD}"'
+    assert "# TYPE pysherlock_rpc_latency_seconds histogram" in text
+    assert f"pysherlock_rpc_calls_total{{{label}}} 1" in text
+    assert f'pysherlock_rpc_latency_seconds_bucket{{{label},le="+Inf"}} 1' in text
+    assert f"pysherlock_rpc_latency_seconds_count{{{label}}} 1" in text
+    assert 'pysherlock_api_calls_total{method="Common.list_units"} 1' in text
+    assert text.endswith("\n")
+
+
+def test_metrics_disabled(metered_sherlock):
+    sherlock = metered_sherlock
+    sherlock.metrics().enabled = False
+    sherlock.common.list_units(ListUnitsRequestUnitType.LENGTH)
+    snapshot = sherlock.metrics().snapshot()
+    assert snapshot["rpc"] == {}
+    assert snapshot["api"] == {}
+
+    sherlock.metrics().enabled = True
+    sherlock.common.list_units(ListUnitsRequestUnitType.LENGTH)
+    sherlock.metrics().reset()
+    assert sherlock.metrics().snapshot()["api"] == {}
+
+    assert Sherlock(grpc.insecure_channel("127.0.0.1:0"), SKIP_VERSION_CHECK).metrics() is None
+
+
+def test_metered_response_stream():
+    registry = MetricsRegistry()
+    responses = [SherlockCommonService_pb2.ListUnitsResponse(units=["mm"]) for _ in range(2)]
+    stream = _MeteredResponseStream(iter(responses), registry, "/Service/stream", 0.0, 4)
+    assert list(stream) == responses
+
+    stats = registry.snapshot()["rpc"]["/Service/stream"]
+    assert stats["calls"] == 1
+    assert stats["responses"] == 2
+    assert stats["request_bytes"] == 4
+    assert stats["response_bytes"] == 2 * responses[0].ByteSize()
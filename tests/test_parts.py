@@ -1093,5 +1093,32 @@ def helper_test_import_parts_to_avl(parts: Parts):
         pytest.fail(f"Unexpected exception raised: {e}")
 
 
+def test_update_parts_locations_chunked(fake_server, fake_sherlock):
+    """Test that a large update_parts_locations request is sent in chunks."""
+    sent = []
+
+    def update_parts_locations(request, context):
+        sent.extend(location.refDes for location in request.partLoc)
+        return parts_service.UpdatePartsLocationsResponse()
+
+    fake_server.set_handler("SherlockPartsService/updatePartsLocations", update_parts_locations)
+    parts = fake_sherlock().parts
+    parts.max_request_bytes = 1000
+    parts.PART_LOCATION_UNITS = ["in", "mm", "mil"]
+    parts.BOARD_SIDES = ["TOP", "BOTTOM"]
+    locations = [(f"C{i}", "-2.7", "-1.65", "90", "in", "TOP", "False") for i in range(100)]
+
+    assert parts.update_parts_locations("Test", "Card", locations) == 0
+    assert fake_server.call_count("SherlockPartsService/updatePartsLocations") > 1
+    assert sent == [f"C{i}" for i in range(100)]
+
+    locations[50] = ("C50", "-2.7", "-1.65", "400", "in", "TOP", "False")
+    with pytest.raises(SherlockUpdatePartsLocationsError) as e:
+        parts.update_parts_locations("Test", "Card", locations)
+    assert e.value.str_itr() == [
+        "Update parts locations error: Invalid part location 50: Location rotation is invalid."
+    ]
+
+
 if __name__ == "__main__":
     test_all()
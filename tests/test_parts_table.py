@@ -0,0 +1,175 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import math
+
+from ansys.api.sherlock.v0 import SherlockCommonService_pb2, SherlockPartsService_pb2
+import pytest
+
+from ansys.sherlock.core.types import parts_table
+from ansys.sherlock.core.types.parts_table import PartsTable
+
+
+def make_response(ref_des, **properties):
+    response = SherlockPartsService_pb2.GetPartsListPropertiesResponse(refDes=ref_des)
+    for name, value in properties.items():
+        response.properties.add(name=name, value=value)
+    return response
+
+
+@pytest.fixture
+def table():
+    error = SherlockPartsService_pb2.GetPartsListPropertiesResponse(
+        returnCode=SherlockCommonService_pb2.ReturnCode(value=-1, message="Part X1 not found")
+    )
+    return PartsTable.from_responses(
+        [
+            make_response("C1", mass="0.5", package="0603", side="TOP"),
+            make_response("C2", mass="1.50", package="0603", side="BOTTOM"),
+            error,
+            make_response("U1", mass="2", package="BGA256", side="TOP", pins="256"),
+            make_response("U2", package="BGA256", side="TOP", pins="256"),
+        ]
+    )
+
+
+def test_columns(table):
+    assert table.num_rows == 4
+    assert len(table.errors) == 1
+    assert table.column_names == ["ref_des", "mass", "package", "side", "pins"]
+    assert table.column("ref_des") == ["C1", "C2", "U1", "U2"]
+
+    assert table.is_numeric("mass")
+    assert not table.is_numeric("package")
+    mass = table.column("mass")
+    assert mass.typecode == "d"
+    assert list(mass[:3]) == [0.5, 1.5, 2.0]
+    assert math.isnan(mass[3])
+
+    assert table.column("package") == ["0603", "0603", "BGA256", "BGA256"]
+    assert table.categories("package") == ["0603", "BGA256"]
+    assert list(table.codes("package")) == [0, 0, 1, 1]
+    assert math.isnan(table.column("pins")[0])
+
+    with pytest.raises(KeyError):
+        table.column("unknown")
+
+
+def test_column_becomes_categorical():
+    table = PartsTable.from_responses([make_response("C1", value="10")])
+    assert table.is_numeric("value")
+    table.append(make_response("C2", value="10uF"))
+    assert not table.is_numeric("value")
+    assert table.column("value") == ["10", "10uF"]
+
+
+def test_filter_and_groupby(table):
+    heavy = table.filter("mass", lambda mass: mass > 1.0)
+    assert heavy.column("ref_des") == ["C2", "U1"]
+
+    bga = table.filter("package", lambda package: package.startswith("BGA"))
+    assert bga.column("ref_des") == ["U1", "U2"]
+    assert list(bga.column("pins")) == [256.0, 256.0]
+
+    groups = table.groupby("side")
+    assert list(groups) == ["TOP", "BOTTOM"]
+    assert groups["TOP"].column("ref_des") == ["C1", "U1", "U2"]
+
+    groups = table.groupby("pins")
+    assert groups[None].column("ref_des") == ["C1", "C2"]
+    assert groups[256.0].num_rows == 2
+
+
+@pytest.mark.parametrize("use_numpy", [True, False])
+def test_groupby_many_groups(monkeypatch, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    else:
+        monkeypatch.setattr(parts_table, "_optional_numpy", lambda: None)
+    table = PartsTable.from_responses(
+        make_response(f"R{row}", package=f"P{row % 500}", mass=str(row % 7) if row % 3 else "")
+        for row in range(5000)
+    )
+
+    groups = table.groupby("package")
+    assert list(groups) == [f"P{index}" for index in range(500)]
+    assert groups["P3"].column("ref_des") == [f"R{row}" for row in range(3, 5000, 500)]
+    assert all(group.num_rows == 10 for group in groups.values())
+
+    groups = table.groupby("mass")
+    assert list(groups) == [None, 1.0, 2.0, 4.0, 5.0, 0.0, 3.0, 6.0]
+    assert groups[None].num_rows == 1667
+
+    light = table.filter("mass", lambda mass: mass < 2)
+    assert light.num_rows == sum(1 for row in range(5000) if row % 3 and row % 7 < 2)
+    assert light.filter("package", lambda package: package == "P1").column("ref_des") == [
+        f"R{row}" for row in range(1, 5000, 500) if row % 3 and row % 7 < 2
+    ]
+
+
+def test_split_tables_share_categories(table):
+    top = table.groupby("side")["TOP"]
+    top.append(make_response("Q1", package="SOT23", side="TOP"))
+    assert top.column("package") == ["0603", "BGA256", "BGA256", "SOT23"]
+    assert table.categories("package") == ["0603", "BGA256"]
+
+
+def test_to_numpy(table):
+    numpy = pytest.importorskip("numpy")
+
+    mass = table.column_array("mass")
+    assert mass.dtype == numpy.float64
+    assert numpy.shares_memory(mass, numpy.frombuffer(table.column("mass"), numpy.float64))
+    assert numpy.nansum(mass) == 4.0
+
+    records = table.to_numpy()
+    assert records.dtype.names == ("ref_des", "mass", "package", "side", "pins")
+    assert list(records["package"]) == ["0603", "0603", "BGA256", "BGA256"]
+    assert records["mass"][2] == 2.0
+
+    records = table.to_numpy(columns=["ref_des", "side"], decode_categories=False)
+    assert list(records["side"]) == [0, 1, 0, 0]
+
+
+def test_repeated_property_keeps_rows_aligned():
+    response = make_response("C1", mass="0.5", package="BGA256")
+    response.properties.add(name="mass", value="0.7")
+    table = PartsTable.from_responses([response, make_response("C2", mass="1.0")])
+
+    assert list(table.column("mass")) == [0.7, 1.0]
+    assert table.column("package") == ["BGA256", None]
+
+
+def test_append_after_column_array(table):
+    pytest.importorskip("numpy")
+
+    codes = table.column_array("package")
+    mass = table.column_array("mass")
+    assert not codes.flags.writeable
+    table.append(make_response("Q1", mass="3", package="SOT23"))
+
+    assert list(codes) == [0, 0, 1, 1]
+    assert list(table.column_array("package")) == [0, 0, 1, 1, 2]
+    assert len(mass) == 4
+    assert table.column("mass")[-1] == 3.0
@@ -0,0 +1,225 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import subprocess
+import sys
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import grpc
+import pytest
+
+from ansys.sherlock.core.errors import (
+    SherlockCannotUsePortError,
+    SherlockConnectionError,
+    SherlockNoGrpcConnectionException,
+)
+from ansys.sherlock.core.pool import SherlockPool
+from ansys.sherlock.core.utils.instance_registry import InstanceRecord, InstanceRegistry
+
+
+class FakeSherlock:
+    """Stand-in for a Sherlock connection whose health can be toggled."""
+
+    def __init__(self, port):
+        self.port = port
+        self.common = MagicMock()
+        self.common.check.return_value = True
+
+
+class FakeLauncher:
+    def __init__(self, busy_ports=()):
+        self.busy_ports = set(busy_ports)
+        self.launched = []
+        self.connections = []
+        self._lock = threading.Lock()
+
+    def is_port_available(self, host, port):
+        if port in self.busy_ports:
+            raise SherlockCannotUsePortError(port, "Port is already in use")
+        return True
+
+    def launch(self, port, **kwargs):
+        with self._lock:
+            self.launched.append(port)
+
+    def connect(self, port, **kwargs):
+        sherlock = FakeSherlock(port)
+        with self._lock:
+            self.connections.append(sherlock)
+        return sherlock
+
+
+@pytest.fixture
+def fake_launcher():
+    fake = FakeLauncher(busy_ports=[9091])
+    with (
+        patch("ansys.sherlock.core.launcher._is_port_available", fake.is_port_available),
+        patch("ansys.sherlock.core.launcher.launch", fake.launch),
+        patch("ansys.sherlock.core.launcher.connect", fake.connect),
+    ):
+        yield fake
+
+
+def test_launch_picks_available_ports(fake_launcher):
+    with SherlockPool(size=3, transport_mode="insecure") as pool:
+        assert [instance.port for instance in pool.instances] == [9090, 9092, 9093]
+        assert sorted(fake_launcher.launched) == [9090, 9092, 9093]
+
+
+def test_attach_does_not_launch(fake_launcher):
+    pool = SherlockPool(ports=[9100, 9101], launch=False, transport_mode="insecure")
+    assert fake_launcher.launched == []
+    assert len(fake_launcher.connections) == 2
+    pool.close()
+    for sherlock in fake_launcher.connections:
+        sherlock.common.exit.assert_not_called()
+
+    with pytest.raises(ValueError):
+        SherlockPool(launch=False, transport_mode="insecure")
+
+
+def test_lease_least_loaded(fake_launcher):
+    with SherlockPool(size=2, transport_mode="insecure", max_leases_per_instance=2) as pool:
+        with pool.lease() as first:
+            with pool.lease() as second:
+                assert first is not second
+                with pool.lease() as third:
+                    assert third in (first, second)
+        assert all(instance.active_leases == 0 for instance in pool.instances)
+
+
+def test_submit_distributes_jobs(fake_launcher):
+    def job(sherlock, value):
+        time.sleep(0.05)
+        return sherlock.port, value * 2
+
+    with SherlockPool(size=2, transport_mode="insecure") as pool:
+        futures = [pool.submit(job, value) for value in range(6)]
+        results = [future.result() for future in futures]
+
+    assert [value for _, value in results] == [0, 2, 4, 6, 8, 10]
+    assert {port for port, _ in results} == {9090, 9092}
+
+
+def test_unhealthy_instance_restarted(fake_launcher):
+    with SherlockPool(size=2, transport_mode="insecure") as pool:
+        dead = pool.instances[0].sherlock
+        dead.common.check.return_value = False
+
+        with pool.lease() as sherlock:
+            assert sherlock is not dead
+
+        deadline = time.monotonic() + 5
+        while pool.instances[0].restarting and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert pool.instances[0].restarts == 1
+        assert pool.instances[0].healthy
+        assert pool.instances[0].sherlock is not dead
+        assert fake_launcher.launched.count(9090) == 2
+
+
+def test_failed_job_evicts_dead_instance(fake_launcher):
+    with SherlockPool(ports=[9100], launch=False, transport_mode="insecure") as pool:
+        with pytest.raises(grpc.RpcError):
+            with pool.lease() as sherlock:
+                sherlock.common.check.return_value = False
+                raise grpc.RpcError()
+
+        # Attached instances are not restarted, so no instance is left
+        assert not pool.instances[0].healthy
+        with pytest.raises(SherlockConnectionError):
+            with pool.lease():
+                pass
+
+
+def test_evicted_connection_closed_after_last_lease(fake_launcher):
+    with SherlockPool(size=1, transport_mode="insecure", max_leases_per_instance=2) as pool:
+        with pool.lease() as other:
+            with pytest.raises(SherlockNoGrpcConnectionException):
+                with pool.lease() as sherlock:
+                    assert sherlock is other
+                    sherlock.common.check.return_value = False
+                    raise SherlockNoGrpcConnectionException()
+
+            assert pool.instances[0].restarts == 1
+            other.common.channel.close.assert_not_called()
+        other.common.channel.close.assert_called_once()
+
+
+def test_evicted_instance_process_terminated(fake_launcher):
+    processes = []
+
+    def launch(port, registry_dir, **kwargs):
+        process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+        processes.append(process)
+        InstanceRegistry(registry_dir).register(
+            InstanceRecord(pid=process.pid, transport_mode="insecure", port=port)
+        )
+
+    with patch("ansys.sherlock.core.launcher.launch", launch):
+        with SherlockPool(size=1, transport_mode="insecure") as pool:
+            pool.instances[0].sherlock.common.check.return_value = False
+            with pool.lease():
+                pass
+            assert len(processes) == 2
+            assert processes[0].wait(timeout=10) != 0
+            assert processes[1].poll() is None
+            registry_dir = pool._registry_dir
+
+    # The pool exits the instance through the fake connection, so terminate it here.
+    processes[1].kill()
+    processes[1].wait(timeout=10)
+    assert not os.path.exists(registry_dir)
+
+
+def test_close_waits_for_restart(fake_launcher):
+    launching = threading.Event()
+    release = threading.Event()
+
+    with SherlockPool(size=1, transport_mode="insecure") as pool:
+
+        def launch(port, **kwargs):
+            launching.set()
+            release.wait(10)
+
+        dead = pool.instances[0].sherlock
+        dead.common.check.return_value = False
+        with patch("ansys.sherlock.core.launcher.launch", launch):
+            pool._evict(pool.instances[0])
+            assert launching.wait(10)
+            closer = threading.Thread(target=pool.close)
+            closer.start()
+            time.sleep(0.1)
+            assert closer.is_alive()
+            release.set()
+            closer.join(10)
+            assert not closer.is_alive()
+
+    # The restart saw the pool closed after launching, so no instance was connected.
+    assert not pool.instances[0].healthy
+    assert pool.instances[0].sherlock is None
+    assert len(fake_launcher.connections) == 1
@@ -0,0 +1,133 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import logging
+from logging.handlers import QueueHandler
+import threading
+import uuid
+
+import pytest
+
+from ansys.sherlock.core import pysherlock_logging
+from ansys.sherlock.core.pysherlock_logging import Logger
+
+
+class Message:
+    """Message counting how many times it is formatted."""
+
+    def __init__(self):
+        self.formatted = 0
+
+    def __str__(self):
+        self.formatted += 1
+        return "message"
+
+
+@pytest.fixture
+def new_logger(tmp_path):
+    loggers = []
+
+    def create(**kwargs):
+        kwargs.setdefault("file_name", str(tmp_path / "PySherlock.log"))
+        logger = Logger(f"test-{uuid.uuid4()}", console=False, **kwargs)
+        loggers.append(logger)
+        return logger
+
+    yield create
+    for logger in loggers:
+        logger.close()
+
+
+def test_log_file_created_on_first_record(new_logger, tmp_path):
+    log = new_logger()
+    assert not (tmp_path / "PySherlock.log").exists()
+    log.info("first")
+    log.flush()
+    content = (tmp_path / "PySherlock.log").read_text()
+    assert "NEW SESSION" in content
+    assert content.endswith("first\n")
+
+
+def test_log_file_is_opt_in(monkeypatch, tmp_path):
+    monkeypatch.delenv(pysherlock_logging.LOG_FILE_ENV_VAR, raising=False)
+    monkeypatch.chdir(tmp_path)
+    log = Logger(f"test-{uuid.uuid4()}", console=False)
+    try:
+        log.info("not written")
+        assert log.logger.handlers == []
+    finally:
+        log.close()
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_disabled_level_skips_formatting(new_logger, tmp_path):
+    log = new_logger(level="WARNING")
+    message = Message()
+    log.info(message)
+    log.debug("%s", message)
+    assert message.formatted == 0
+    assert not log.is_enabled(logging.INFO)
+    log.warning(message)
+    assert message.formatted >= 1
+
+
+def test_queue_writes_in_background_thread(new_logger, tmp_path):
+    log = new_logger(use_queue=True)
+    assert [type(h) for h in log.logger.handlers] == [QueueHandler]
+    threads = []
+
+    class ThreadRecorder(logging.Handler):
+        def emit(self, record):
+            threads.append(threading.current_thread())
+
+    log._listener.handlers += (ThreadRecorder(),)
+    log.info("queued %d", 1)
+    log.flush()
+    assert threads and threads[0] is not threading.current_thread()
+    assert (tmp_path / "PySherlock.log").read_text().endswith("queued 1\n")
+
+
+def test_configure_changes_target(new_logger, tmp_path):
+    log = new_logger()
+    log.configure(file_name=str(tmp_path / "other.log"), use_queue=True)
+    log.configure(use_queue=False)
+    log.error("moved")
+    assert not (tmp_path / "PySherlock.log").exists()
+    assert (tmp_path / "other.log").read_text().endswith("moved\n")
+    log.configure(file_name="")
+    assert log.logger.handlers == []
+
+
+def test_environment_variables(monkeypatch, tmp_path):
+    monkeypatch.setenv(pysherlock_logging.LOG_LEVEL_ENV_VAR, "error")
+    monkeypatch.setenv(pysherlock_logging.LOG_FILE_ENV_VAR, str(tmp_path / "env.log"))
+    monkeypatch.setenv(pysherlock_logging.LOG_QUEUE_ENV_VAR, "1")
+    log = Logger(f"test-{uuid.uuid4()}", console=False)
+    try:
+        assert log.logger.level == logging.ERROR
+        assert log._listener is not None
+        log.error("from env")
+    finally:
+        log.close()
+    assert (tmp_path / "env.log").read_text().endswith("from env\n")
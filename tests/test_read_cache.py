@@ -0,0 +1,156 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import time
+
+from ansys.api.sherlock.v0 import (
+    SherlockProjectService_pb2,
+    SherlockProjectService_pb2_grpc,
+    SherlockStackupService_pb2,
+    SherlockStackupService_pb2_grpc,
+)
+import pytest
+
+from ansys.sherlock.core.errors import SherlockGetLayerCountError
+from ansys.sherlock.core.utils.read_cache import ReadCache
+
+GET_LAYER_COUNT = "SherlockStackupService/getLayerCount"
+LIST_CCAS = "SherlockProjectService/listCCAs"
+
+
+@pytest.fixture
+def server(fake_server):
+    fake_server.set_response(
+        GET_LAYER_COUNT,
+        lambda request: SherlockStackupService_pb2.GetLayerCountResponse(
+            count=len(request.ccaName)
+        ),
+    )
+    return fake_server
+
+
+def test_tables():
+    cache = ReadCache()
+    assert cache.family_of("/SherlockStackupService/getLayerCount") == "stackup"
+    assert cache.family_of("/SherlockAnalysisService/getICTAnalysisInputFields") == (
+        "analysis_props"
+    )
+    assert cache.family_of("/SherlockProjectService/addCCA") is None
+    assert cache.family_of("/SherlockStackupService/listConductorMaterials") is None
+
+    assert cache.changed_families("/SherlockProjectService/listCCAs") == ()
+    assert cache.changed_families("/SherlockProjectService/addCCA") == ("ccas",)
+    assert cache.changed_families("/SherlockStackupService/updateConductorLayer") == (
+        "stackup",
+        "layers",
+    )
+    assert cache.changed_families("/SherlockLayerService/exportAllTestPoints") == ()
+    assert cache.changed_families("/SherlockProjectService/importODBArchive") == tuple(
+        cache.query_families
+    )
+
+
+def test_repeated_queries_are_answered_from_the_cache(server, fake_sherlock):
+    cache = ReadCache()
+    sherlock = fake_sherlock(read_cache=cache)
+    assert sherlock.read_cache is cache
+    for _ in range(3):
+        assert sherlock.stackup.get_layer_count("Test", "Card") == 4
+    assert sherlock.stackup.get_layer_count("Test", "Main Board") == 10
+    assert server.call_count(GET_LAYER_COUNT) == 2
+    stats = cache.stats()
+    assert stats["entries"] == 2
+    assert (stats["hits"], stats["misses"]) == (2, 2)
+    assert stats["hit_ratio"] == 0.5
+
+
+def test_mutations_invalidate_the_families_they_change(server, fake_sherlock):
+    sherlock = fake_sherlock(read_cache=ReadCache())
+    project_stub = SherlockProjectService_pb2_grpc.SherlockProjectServiceStub(sherlock._channel)
+    stackup_stub = SherlockStackupService_pb2_grpc.SherlockStackupServiceStub(sherlock._channel)
+
+    def query():
+        sherlock.stackup.get_layer_count("Test", "Card")
+        sherlock.project.list_ccas("Test")
+
+    query()
+    stackup_stub.updateConductorLayer(
+        SherlockStackupService_pb2.UpdateConductorLayerRequest(project="Other")
+    )
+    query()
+    assert (server.call_count(GET_LAYER_COUNT), server.call_count(LIST_CCAS)) == (1, 1)
+
+    stackup_stub.updateConductorLayer(
+        SherlockStackupService_pb2.UpdateConductorLayerRequest(project="Test")
+    )
+    query()
+    assert (server.call_count(GET_LAYER_COUNT), server.call_count(LIST_CCAS)) == (2, 1)
+
+    project_stub.addCCA(SherlockProjectService_pb2.AddCcaRequest(project="Test"))
+    query()
+    assert (server.call_count(GET_LAYER_COUNT), server.call_count(LIST_CCAS)) == (2, 2)
+
+    # Mutations missing from the table change every family of their project
+    project_stub.importODBArchive(SherlockProjectService_pb2.ImportODBRequest(project="Test"))
+    query()
+    assert (server.call_count(GET_LAYER_COUNT), server.call_count(LIST_CCAS)) == (3, 3)
+    assert sherlock.read_cache.stats()["invalidated"] == 4
+
+
+def test_failures_are_not_cached(server, fake_sherlock):
+    sherlock = fake_sherlock(read_cache=ReadCache())
+    server.inject_failure(GET_LAYER_COUNT, code=None, message="CCA not found", times=1)
+    with pytest.raises(SherlockGetLayerCountError):
+        sherlock.stackup.get_layer_count("Test", "Card")
+    assert sherlock.stackup.get_layer_count("Test", "Card") == 4
+    assert sherlock.read_cache.stats()["entries"] == 1
+
+
+def test_lru_and_ttl_eviction():
+    def key(name):
+        return ("/SherlockProjectService/listCCAs", name.encode())
+
+    response = SherlockProjectService_pb2.ListCCAsResponse()
+    cache = ReadCache(max_entries=2, ttl=None)
+    for name in ("A", "B"):
+        cache.put(key(name), name, response, cache.generation)
+    assert cache.get(key("A")) == response
+    cache.put(key("C"), "C", response, cache.generation)
+    assert cache.get(key("B")) is None
+    assert cache.get(key("A")) is not None
+    assert cache.stats()["evictions"] == 1
+
+    # Responses of requests sent before an invalidation are dropped
+    generation = cache.generation
+    cache.invalidate("A")
+    cache.put(key("A"), "A", response, generation)
+    assert cache.get(key("A")) is None
+
+    cache = ReadCache(ttl=0.05)
+    cache.put(key("A"), "A", response, cache.generation)
+    assert cache.get(key("A")) is not None
+    time.sleep(0.1)
+    assert cache.get(key("A")) is None
+    assert cache.stats()["expirations"] == 1
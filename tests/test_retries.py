@@ -0,0 +1,139 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import time
+
+from ansys.api.sherlock.v0 import SherlockProjectService_pb2, SherlockProjectService_pb2_grpc
+import grpc
+import pytest
+
+from ansys.sherlock.core.types.parts_types import GetPartsListPropertiesRequest
+from ansys.sherlock.core.utils.read_cache import ReadCache
+from ansys.sherlock.core.utils.retries import RetryBudget, RetryPolicy
+
+LIST_CCAS = "SherlockProjectService/listCCAs"
+
+
+def test_policy_table_and_backoff():
+    policy = RetryPolicy(initial_backoff=0.1, max_backoff=0.3)
+    assert policy.is_retryable("/SherlockProjectService/listCCAs")
+    assert policy.is_retryable("/SherlockStackupService/getStackupProps")
+    assert policy.is_retryable("/SherlockCommonService/isSherlockClientLoading")
+    assert not policy.is_retryable("/SherlockProjectService/deleteProject")
+    assert not policy.is_retryable("/SherlockCommonService/check")
+    assert not RetryPolicy(max_attempts=1).is_retryable("/SherlockProjectService/listCCAs")
+
+    assert all(0 <= policy.backoff(1) <= 0.1 for _ in range(100))
+    assert all(0 <= policy.backoff(5) <= 0.3 for _ in range(100))
+
+
+def test_idempotent_rpc_is_retried(fake_server, fake_sherlock):
+    sherlock = fake_sherlock(enable_metrics=True, retry_policy=RetryPolicy(initial_backoff=0.01))
+    fake_server.inject_failure(LIST_CCAS, times=2)
+    sherlock.project.list_ccas("Test")
+    assert fake_server.call_count(LIST_CCAS) == 3
+    stats = sherlock.metrics().snapshot()["rpc"][f"/{LIST_CCAS}"]
+    assert stats["retries"] == 2
+    assert stats["errors"] == 2
+    assert "pysherlock_rpc_retries_total" in sherlock.metrics().to_prometheus()
+
+    fake_server.inject_failure(LIST_CCAS, code=grpc.StatusCode.INVALID_ARGUMENT, times=1)
+    with pytest.raises(grpc.RpcError):
+        sherlock.project.list_ccas("Test")
+    assert fake_server.call_count(LIST_CCAS) == 4
+
+
+def test_retries_are_opt_in(fake_server, fake_sherlock):
+    sherlock = fake_sherlock()
+    fake_server.inject_failure(LIST_CCAS, times=1)
+    with pytest.raises(grpc.RpcError):
+        sherlock.project.list_ccas("Test")
+    assert fake_server.call_count(LIST_CCAS) == 1
+
+
+def test_future_rpc_is_retried_without_blocking(fake_server, fake_sherlock):
+    sherlock = fake_sherlock(
+        retry_policy=RetryPolicy(initial_backoff=0.01),
+        coalesced_methods=("*",),
+        read_cache=ReadCache(),
+        enable_metrics=True,
+    )
+    fake_server.set_latency(LIST_CCAS, 0.3)
+    fake_server.inject_failure(LIST_CCAS, times=1)
+    stub = SherlockProjectService_pb2_grpc.SherlockProjectServiceStub(sherlock.common.channel)
+    request = SherlockProjectService_pb2.ListCCAsRequest(project="Test")
+
+    start = time.monotonic()
+    future = stub.listCCAs.future(request)
+    assert time.monotonic() - start < 0.2
+    assert not future.done()
+    done = []
+    future.add_done_callback(done.append)
+    assert future.result(timeout=10) == SherlockProjectService_pb2.ListCCAsResponse()
+    assert done == [future]
+    assert fake_server.call_count(LIST_CCAS) == 2
+    assert sherlock.metrics().snapshot()["rpc"][f"/{LIST_CCAS}"]["retries"] == 1
+
+    # The response was cached once it arrived
+    stub.listCCAs(request)
+    assert fake_server.call_count(LIST_CCAS) == 2
+
+
+def test_non_idempotent_rpc_is_not_retried(fake_server, fake_sherlock):
+    sherlock = fake_sherlock(retry_policy=RetryPolicy(initial_backoff=0.01))
+    fake_server.inject_failure("SherlockProjectService/deleteProject", times=1)
+    stub = SherlockProjectService_pb2_grpc.SherlockProjectServiceStub(sherlock.common.channel)
+    with pytest.raises(grpc.RpcError) as excinfo:
+        stub.deleteProject(SherlockProjectService_pb2.DeleteProjectRequest(project="Test"))
+    assert excinfo.value.code() == grpc.StatusCode.UNAVAILABLE
+    assert fake_server.call_count("SherlockProjectService/deleteProject") == 1
+
+
+def test_exhausted_budget_stops_retries(fake_server, fake_sherlock):
+    budget = RetryBudget(max_tokens=4, token_ratio=1)
+    sherlock = fake_sherlock(
+        enable_metrics=True, retry_policy=RetryPolicy(initial_backoff=0.01, budget=budget)
+    )
+    fake_server.inject_failure(LIST_CCAS)
+    with pytest.raises(grpc.RpcError):
+        sherlock.project.list_ccas("Test")
+    assert fake_server.call_count(LIST_CCAS) == 2
+    stats = sherlock.metrics().snapshot()["rpc"][f"/{LIST_CCAS}"]
+    assert stats["retries"] == 1
+    assert stats["throttled_retries"] == 1
+
+    fake_server.clear_failures()
+    for _ in range(2):
+        sherlock.project.list_ccas("Test")
+    assert budget.tokens == 4
+
+
+def test_streaming_rpc_is_retried_before_first_response(fake_server, fake_sherlock):
+    sherlock = fake_sherlock(retry_policy=RetryPolicy(initial_backoff=0.01))
+    fake_server.set_stream_size("SherlockPartsService/getPartsListProperties", 3)
+    fake_server.inject_failure("SherlockPartsService/getPartsListProperties", times=1)
+    request = GetPartsListPropertiesRequest(project="Test", cca_name="Card")
+    assert len(list(sherlock.parts.iter_parts_list_properties(request))) == 3
+    assert fake_server.call_count("SherlockPartsService/getPartsListProperties") == 2
@@ -0,0 +1,143 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from concurrent.futures import ThreadPoolExecutor
+import time
+
+from ansys.api.sherlock.v0 import SherlockProjectService_pb2, SherlockProjectService_pb2_grpc
+import grpc
+import pytest
+
+from ansys.sherlock.core.errors import SherlockDeadlineExceededError
+from ansys.sherlock.core.utils.single_flight import SingleFlightPolicy
+
+LIST_CCAS = "SherlockProjectService/listCCAs"
+
+
+def _concurrently(fn, count=4):
+    with ThreadPoolExecutor(max_workers=count) as executor:
+        futures = [executor.submit(fn) for _ in range(count)]
+    return futures
+
+
+def test_policy_never_coalesces_mutating_rpcs():
+    policy = SingleFlightPolicy(("*",))
+    assert policy.is_coalesced("/SherlockProjectService/listCCAs")
+    assert policy.is_coalesced("/SherlockStackupService/getStackupProps")
+    assert not policy.is_coalesced("/SherlockProjectService/deleteProject")
+    assert not policy.is_coalesced("/SherlockCommonService/check")
+
+    policy = SingleFlightPolicy(("SherlockStackupService/*",))
+    assert policy.is_coalesced("/SherlockStackupService/getStackupProps")
+    assert not policy.is_coalesced("/SherlockProjectService/listCCAs")
+    assert not SingleFlightPolicy(()).is_coalesced("/SherlockProjectService/listCCAs")
+
+
+def test_identical_reads_share_one_rpc(fake_server, fake_sherlock):
+    sherlock = fake_sherlock(enable_metrics=True, coalesced_methods=("*",))
+    fake_server.set_latency(LIST_CCAS, 0.5)
+    futures = _concurrently(lambda: sherlock.project.list_ccas("Test"))
+    results = [future.result() for future in futures]
+    assert fake_server.call_count(LIST_CCAS) == 1
+    assert all(result == results[0] for result in results)
+    stats = sherlock.metrics().snapshot()["rpc"][f"/{LIST_CCAS}"]
+    assert stats["coalesced"] == 3
+    assert "pysherlock_rpc_coalesced_total" in sherlock.metrics().to_prometheus()
+
+    # Once the RPC is done, the next request is sent again
+    sherlock.project.list_ccas("Test")
+    assert fake_server.call_count(LIST_CCAS) == 2
+
+
+def test_future_reads_share_one_rpc_without_blocking(fake_server, fake_sherlock):
+    sherlock = fake_sherlock(coalesced_methods=("*",))
+    fake_server.set_latency(LIST_CCAS, 0.3)
+    stub = SherlockProjectService_pb2_grpc.SherlockProjectServiceStub(sherlock.common.channel)
+    request = SherlockProjectService_pb2.ListCCAsRequest(project="Test")
+
+    start = time.monotonic()
+    futures = [stub.listCCAs.future(request) for _ in range(3)]
+    assert time.monotonic() - start < 0.2
+    done = []
+    futures[-1].add_done_callback(done.append)
+    results = [future.result(timeout=10) for future in futures]
+    assert all(result == results[0] for result in results)
+    assert done == [futures[-1]]
+    assert fake_server.call_count(LIST_CCAS) == 1
+
+
+def test_different_requests_are_not_coalesced(fake_server, fake_sherlock):
+    sherlock = fake_sherlock(coalesced_methods=("*",))
+    fake_server.set_latency(LIST_CCAS, 0.3)
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        futures = [executor.submit(sherlock.project.list_ccas, p) for p in ("A", "B")]
+    for future in futures:
+        future.result()
+    assert fake_server.call_count(LIST_CCAS) == 2
+
+
+def test_waiting_requests_share_the_error(fake_server, fake_sherlock):
+    sherlock = fake_sherlock(coalesced_methods=("*",))
+    fake_server.set_latency(LIST_CCAS, 0.5)
+    fake_server.inject_failure(LIST_CCAS, code=grpc.StatusCode.INVALID_ARGUMENT, times=1)
+    futures = _concurrently(lambda: sherlock.project.list_ccas("Test"))
+    for future in futures:
+        with pytest.raises(grpc.RpcError) as excinfo:
+            future.result()
+        assert excinfo.value.code() == grpc.StatusCode.INVALID_ARGUMENT
+    assert fake_server.call_count(LIST_CCAS) == 1
+
+
+def test_mutating_rpcs_are_never_coalesced(fake_server, fake_sherlock):
+    sherlock = fake_sherlock(coalesced_methods=("*",))
+    fake_server.set_latency("SherlockProjectService/deleteProject", 0.3)
+    stub = SherlockProjectService_pb2_grpc.SherlockProjectServiceStub(sherlock.common.channel)
+    request = SherlockProjectService_pb2.DeleteProjectRequest(project="Test")
+    for future in _concurrently(lambda: stub.deleteProject(request), count=2):
+        future.result()
+    assert fake_server.call_count("SherlockProjectService/deleteProject") == 2
+
+
+def test_waiting_requests_keep_their_deadline(fake_server, fake_sherlock):
+    sherlock = fake_sherlock(coalesced_methods=("*",))
+    fake_server.set_latency(LIST_CCAS, 2)
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        leader = executor.submit(sherlock.project.list_ccas, "Test")
+        time.sleep(0.2)
+        start = time.monotonic()
+        with pytest.raises(SherlockDeadlineExceededError):
+            with sherlock.deadline(0.3):
+                sherlock.project.list_ccas("Test")
+        assert time.monotonic() - start < 1
+        leader.result()
+    assert fake_server.call_count(LIST_CCAS) == 1
+
+
+def test_requests_are_not_coalesced_by_default(fake_server, fake_sherlock):
+    sherlock = fake_sherlock()
+    fake_server.set_latency(LIST_CCAS, 0.3)
+    for future in _concurrently(lambda: sherlock.project.list_ccas("Test"), count=2):
+        future.result()
+    assert fake_server.call_count(LIST_CCAS) == 2
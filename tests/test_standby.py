@@ -0,0 +1,200 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import json
+import os
+import socket
+import stat
+import subprocess
+import sys
+import time
+from unittest.mock import patch
+
+import pytest
+
+from ansys.sherlock.core import launcher
+from ansys.sherlock.core.errors import SherlockConnectionError
+from ansys.sherlock.core.fake_server import FakeSherlockServer
+from ansys.sherlock.core.standby import StandbyDaemon, connect_standby, request_instance
+from ansys.sherlock.core.utils.instance_registry import InstanceRecord, InstanceRegistry
+
+
+class _FakeLauncher:
+    """Stands in for launcher.launch by starting a fake server on the requested port."""
+
+    def __init__(self, failures: int = 0):
+        self.failures = failures
+        self.servers = []
+
+    def __call__(self, port, year, release_number, registry_dir, **kwargs):
+        if self.failures:
+            self.failures -= 1
+            raise RuntimeError("Sherlock did not start")
+        server = FakeSherlockServer(port=port, release_version=f"{year} R{release_number}")
+        server.start()
+        self.servers.append(server)
+        InstanceRegistry(registry_dir).register(
+            InstanceRecord(
+                pid=os.getpid(),
+                transport_mode="insecure",
+                port=port,
+                server_version=(year - 2000) * 10 + release_number,
+            )
+        )
+
+    def stop(self):
+        for server in self.servers:
+            server.stop()
+
+
+@pytest.fixture
+def fake_launch():
+    fake = _FakeLauncher()
+    with patch("ansys.sherlock.core.launcher.launch", fake):
+        yield fake
+    fake.stop()
+
+
+def _wait_for_idle(daemon: StandbyDaemon, version: int, count: int):
+    deadline = time.monotonic() + 10
+    while daemon.status()["versions"][str(version)]["idle"] < count:
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_hands_out_instances_and_launches_replacements(fake_launch):
+    with StandbyDaemon(
+        size=2, versions=[251, 261], transport_mode="insecure", first_port=9190, port=0
+    ) as daemon:
+        _wait_for_idle(daemon, 261, 2)
+        _wait_for_idle(daemon, 251, 2)
+        assert len(fake_launch.servers) == 4
+
+        record = request_instance(port=daemon.port, timeout=5)
+        assert record.server_version == 261
+        assert record.port in [server.port for server in fake_launch.servers]
+
+        sherlock = connect_standby(version=25, port=daemon.port, timeout=5)
+        assert sherlock.common.check()
+        sherlock.common.channel.close()
+
+        _wait_for_idle(daemon, 261, 2)
+        _wait_for_idle(daemon, 251, 2)
+        status = daemon.status()
+        assert status["handed_out"] == 2
+        assert len(fake_launch.servers) == 6
+        ports = [server.port for server in fake_launch.servers]
+        assert len(set(ports)) == len(ports)
+
+        with pytest.raises(SherlockConnectionError, match="not kept on standby"):
+            request_instance(version=242, port=daemon.port, timeout=5)
+
+    with pytest.raises(SherlockConnectionError):
+        request_instance(port=daemon.port, timeout=1)
+
+
+def test_rejects_requests_without_the_token(fake_launch, tmp_path):
+    with StandbyDaemon(
+        versions=[261], transport_mode="insecure", first_port=9190, port=0, token_dir=tmp_path
+    ) as daemon:
+        token_path = tmp_path / f"{daemon.port}.token"
+        if os.name == "posix":
+            assert stat.S_IMODE(os.stat(token_path).st_mode) == 0o600
+
+        for request in [{"command": "status"}, {"command": "status", "token": "guess"}]:
+            with socket.create_connection((launcher.LOCALHOST, daemon.port), 5) as connection:
+                connection.sendall(json.dumps(request).encode("utf-8") + b"\n")
+                with connection.makefile("rb") as reader:
+                    assert "token" in json.loads(reader.readline())["error"]
+
+        with pytest.raises(SherlockConnectionError, match="token"):
+            request_instance(port=daemon.port, timeout=5)
+        record = request_instance(port=daemon.port, timeout=5, token_dir=tmp_path)
+        assert record.server_version == 261
+
+    assert not token_path.exists()
+
+
+def test_retries_failed_launches(fake_launch):
+    fake_launch.failures = 1
+    with StandbyDaemon(
+        versions=[261], transport_mode="insecure", first_port=9190, port=0, retry_delay=0.01
+    ) as daemon:
+        record = daemon.acquire(timeout=10)
+        assert record.server_version == 261
+        assert daemon.status()["failures"] == 1
+
+
+def test_terminates_instances_that_fail_to_connect():
+    processes = []
+
+    def launch(port, registry_dir, **kwargs):
+        process = subprocess.Popen([sys.executable, "-c", "import time; time.sleep(60)"])
+        processes.append(process)
+        InstanceRegistry(registry_dir).register(
+            InstanceRecord(pid=process.pid, transport_mode="insecure", port=port)
+        )
+
+    def connect(**kwargs):
+        raise SherlockConnectionError(message="Sherlock did not answer in time")
+
+    with patch("ansys.sherlock.core.launcher.launch", launch):
+        with patch("ansys.sherlock.core.launcher.connect", connect):
+            with StandbyDaemon(
+                versions=[261], transport_mode="insecure", first_port=9190, port=0, retry_delay=10
+            ) as daemon:
+                deadline = time.monotonic() + 10
+                while daemon.status()["failures"] < 1:
+                    assert time.monotonic() < deadline
+                    time.sleep(0.01)
+                registry_dir = daemon._registry_dir
+                assert daemon._registry.records() == []
+
+    assert len(processes) == 1
+    assert processes[0].wait(timeout=10) != 0
+    # The registry is removed once the launch waiting to be retried sees the daemon stopped.
+    deadline = time.monotonic() + 10
+    while os.path.exists(registry_dir):
+        assert time.monotonic() < deadline
+        time.sleep(0.01)
+
+
+def test_acquire_times_out_without_ready_instance(fake_launch):
+    fake_launch.failures = 1
+    with StandbyDaemon(
+        versions=[261], transport_mode="insecure", first_port=9190, port=0, retry_delay=10
+    ) as daemon:
+        with pytest.raises(SherlockConnectionError, match="in time"):
+            daemon.acquire(timeout=0.2)
+
+
+def test_defaults_to_installed_versions(tmp_path):
+    for version in ["v251", "v261", "v202"]:
+        exe_path = launcher._get_sherlock_exe_file_path(str(tmp_path / version))
+        os.makedirs(os.path.dirname(exe_path))
+        open(exe_path, "w").close()
+    environment = {f"AWP_ROOT{v[1:]}": str(tmp_path / v) for v in ["v251", "v261", "v202"]}
+    with patch.dict(os.environ, environment):
+        assert launcher._get_installed_versions() == [261, 251]
+        assert StandbyDaemon().versions == [261, 251]
@@ -0,0 +1,164 @@
+# -*- coding: utf-8 -*-
+#
+# Copyright (C) 2021 - 2026 ANSYS, Inc. and/or its affiliates.
+# SPDX-License-Identifier: MIT
+#
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import threading
+from unittest.mock import Mock, patch
+
+from ansys.api.sherlock.v0 import SherlockPartsService_pb2
+import grpc
+import pytest
+
+from ansys.sherlock.core.errors import SherlockNoGrpcConnectionException
+from ansys.sherlock.core.parts import Parts
+from ansys.sherlock.core.types.parts_types import GetPartsListPropertiesRequest
+from ansys.sherlock.core.utils.streaming import ResponseStream
+from ansys.sherlock.core.utils.version_check import SKIP_VERSION_CHECK
+
+
+class FakeCall:
+    """Response iterator that records how many responses were pulled."""
+
+    def __init__(self, responses):
+        self._responses = iter(responses)
+        self.pulled = 0
+        self.cancelled = threading.Event()
+
+    def __iter__(self):
+        return self
+
+    def __next__(self):
+        if self.cancelled.is_set():
+            raise StopIteration
+        response = next(self._responses)
+        self.pulled += 1
+        return response
+
+    def cancel(self):
+        self.cancelled.set()
+        return True
+
+
+class CancelledError(grpc.RpcError, grpc.Call):
+    def code(self):
+        return grpc.StatusCode.CANCELLED
+
+    def details(self):
+        return "Cancelled"
+
+    def initial_metadata(self):
+        return None
+
+    def trailing_metadata(self):
+        return None
+
+    def is_active(self):
+        return False
+
+    def time_remaining(self):
+        return None
+
+    def add_callback(self, callback):
+        return False
+
+    def cancel(self):
+        return False
+
+
+def test_responses_pulled_on_demand():
+    call = FakeCall(range(1000))
+    stream = ResponseStream(call)
+    assert call.pulled == 0
+    assert next(stream) == 0
+    assert next(stream) == 1
+    assert call.pulled == 2
+    assert stream.count == 2
+    assert not stream.done
+
+
+def test_cancel():
+    call = FakeCall(range(1000))
+    with ResponseStream(call) as stream:
+        for response in stream:
+            if response == 9:
+                break
+    assert call.cancelled.is_set()
+    assert call.pulled == 10
+    assert stream.done
+    assert list(stream) == []
+    assert not stream.cancel()
+
+
+def test_exhausted_stream_not_cancelled():
+    call = FakeCall(range(3))
+    with ResponseStream(call) as stream:
+        assert list(stream) == [0, 1, 2]
+    assert stream.done
+    assert not call.cancelled.is_set()
+
+
+def test_cancelled_status_ends_iteration():
+    call = Mock()
+    stream = ResponseStream(call)
+
+    def cancel_and_fail():
+        # The call is cancelled from another thread while a response is awaited.
+        stream.cancel()
+        raise CancelledError()
+
+    call.__next__ = Mock(return_value=1)
+    assert next(stream) == 1
+    call.__next__.side_effect = cancel_and_fail
+    with pytest.raises(StopIteration):
+        stream.__next__()
+    assert stream.done
+
+
+def test_server_cancelled_status_raises():
+    call = Mock()
+    call.__next__ = Mock(side_effect=[1, CancelledError()])
+    stream = ResponseStream(call)
+    with pytest.raises(grpc.RpcError):
+        list(stream)
+    assert stream.done
+
+
+def test_list_method_wraps_iterator():
+    parts = Parts(grpc.insecure_channel("127.0.0.1:9090"), SKIP_VERSION_CHECK)
+    responses = [
+        SherlockPartsService_pb2.GetPartsListPropertiesResponse(refDes=ref_des)
+        for ref_des in ["C1", "U9"]
+    ]
+    parts.stub = Mock()
+    parts.stub.getPartsListProperties.side_effect = lambda request: FakeCall(responses)
+    request = GetPartsListPropertiesRequest(project="Test", cca_name="Card")
+
+    with patch.object(parts, "_is_connection_up", return_value=True):
+        stream = parts.iter_parts_list_properties(request)
+        assert isinstance(stream, ResponseStream)
+        assert [response.refDes for response in stream] == ["C1", "U9"]
+        assert parts.get_parts_list_properties(request) == responses
+
+    with patch.object(parts, "_is_connection_up", return_value=False):
+        with pytest.raises(SherlockNoGrpcConnectionException):
+            parts.iter_parts_list_properties(request)